@@ -0,0 +1,600 @@
+# ########################################################################
+#
+# Ricgraph - Research in context graph
+#
+# ########################################################################
+#
+# MIT License
+#
+# Copyright (c) 2026 Rik D.T. Janssen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# ########################################################################
+#
+# Benchmark Ricgraph using synthetic data.
+# This script generates a synthetic Ricgraph, inserts it in an empty
+# Ricgraph, and measures the time needed for:
+# - inserting persons (this includes the unification of their identifiers),
+#   research results and organizations from two synthetic source systems,
+#   with overlapping person identifiers and research results;
+# - merging nodes;
+# - the main queries, such as reading a node and getting its neighbors;
+# - optionally, the main Ricgraph Explorer pages and REST API calls.
+# The synthetic data is generated using a seed, so two runs with the same
+# parameters and seed use exactly the same data. That allows to compare
+# runs, e.g. before and after a change in Ricgraph, or between two
+# versions of Ricgraph.
+#
+# The results are written to a JSON file. Use
+# ricgraph_benchmark_compare.py to compare two of these files.
+#
+# Note that this script empties Ricgraph.
+#
+# Original version Rik D.T. Janssen, October 2026.
+#
+# ########################################################################
+#
+# Usage
+# ricgraph_benchmark.py [options]
+#
+# Options:
+#   --empty_ricgraph <yes>
+#           'yes': Ricgraph will be emptied before the benchmark.
+#           This script will only run with this option set to 'yes'.
+#   --nr_persons <number>
+#           The number of persons to generate, default 1000.
+#   --nr_organizations <number>
+#           The number of organizations to generate, default 50.
+#   --nr_resouts <number>
+#           The number of research results to generate, default 5000.
+#   --seed <number>
+#           The seed for the random generator, default 42.
+#   --explorer_url <url>
+#           The URL of a running Ricgraph Explorer that uses the same
+#           graph database backend as this script, e.g. http://localhost:3030.
+#           If this option is present, Ricgraph Explorer pages and REST API calls
+#           will also be benchmarked.
+#   --filename <filename>
+#           The JSON file to write the results to. If this option is not
+#           present, a filename with the Ricgraph version and a timestamp
+#           will be used.
+#
+# ########################################################################
+
+
+import sys
+import platform
+from json import dump
+from random import Random
+from itertools import accumulate
+from time import perf_counter
+from typing import Callable
+from pandas import DataFrame
+from requests import get
+import ricgraph as rcg
+
+
+BENCHMARK_FORMAT_VERSION = 1
+
+NR_PERSONS_DEFAULT = 1000
+NR_ORGANIZATIONS_DEFAULT = 50
+NR_RESOUTS_DEFAULT = 5000
+SEED_DEFAULT = 42
+
+# The number of nodes that is used to benchmark queries and merges.
+NR_SAMPLES = 100
+# The number of seconds to wait for a response from Ricgraph Explorer.
+EXPLORER_TIMEOUT = 300
+
+# The ratios determine how realistic the synthetic data is. They are
+# loosely based on the harvests of a number of Dutch universities.
+# The fraction of persons that have an ORCID, Scopus Author ID, or ISNI.
+RATIO_ORCID = 0.7
+RATIO_SCOPUS_AUTHOR_ID = 0.4
+RATIO_ISNI = 0.1
+# The fraction of persons that have an ORCID in source system A
+# (in source system B every person has an ORCID).
+RATIO_ORCID_IN_SOURCE_A = 0.8
+# The fraction of research results of a person with an ORCID that
+# is also in source system B.
+RATIO_RESOUTS_OVERLAP = 0.6
+# The fraction of research results that is only in source system B,
+# relative to the number of research results.
+RATIO_RESOUTS_ONLY_IN_SOURCE_B = 0.2
+# The fraction of persons in source system B that uses an abbreviated name.
+RATIO_ABBREVIATED_NAME = 0.5
+# The fraction of persons that works for two organizations.
+RATIO_TWO_ORGANIZATIONS = 0.2
+
+SOURCE_A = 'Synthetic CRIS'
+SOURCE_B = 'Synthetic open source'
+
+FIRST_NAMES = ['Anna', 'Bram', 'Chloe', 'Daan', 'Emma', 'Finn', 'Giulia', 'Hugo',
+               'Iris', 'Jesse', 'Julia', 'Lars', 'Lotte', 'Milan', 'Noor', 'Omar',
+               'Priya', 'Ruben', 'Sara', 'Thijs', 'Wei', 'Yara', 'Zoe', 'Ahmed']
+LAST_NAMES = ['Bakker', 'Chen', 'de Boer', 'de Jong', 'de Vries', 'Dekker',
+              'Garcia', 'Hendriks', 'Jansen', 'Kumar', 'Meijer', 'Mulder',
+              'Peters', 'Rossi', 'Smit', 'Smith', 'van Dijk', 'van den Berg',
+              'van der Meer', 'Visser', 'Wang', 'Willems', 'Yilmaz', 'Zhang']
+RESOUT_CATEGORIES = [(rcg.RESEARCHRESULT_CATEGORY_JOURNAL_ARTICLE, 60),
+                     (rcg.RESEARCHRESULT_CATEGORY_CONFERENCE_ARTICLE, 12),
+                     (rcg.RESEARCHRESULT_CATEGORY_BOOKCHAPTER, 8),
+                     (rcg.RESEARCHRESULT_CATEGORY_DATASET, 8),
+                     (rcg.RESEARCHRESULT_CATEGORY_SOFTWARE, 4),
+                     (rcg.RESEARCHRESULT_CATEGORY_PREPRINT, 4),
+                     (rcg.RESEARCHRESULT_CATEGORY_BOOK, 2),
+                     (rcg.RESEARCHRESULT_CATEGORY_PHDTHESIS, 2)]
+
+# The timings of all benchmarks, the key is the name of the benchmark,
+# the value a list of durations in seconds.
+benchmark_timings = {}
+
+
+# ######################################################
+# Generation of synthetic data.
+# ######################################################
+def generate_persons(rng: Random, nr_persons: int) -> list:
+    """Generate synthetic persons.
+
+    :param rng: the random generator.
+    :param nr_persons: the number of persons.
+    :return: a list of dicts, one for every person.
+    """
+    persons = []
+    for index in range(nr_persons):
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        person = {'EMPLOYEE_ID': 'E' + format(index, '07d'),
+                  'FULL_NAME': last_name + ', ' + first_name,
+                  'ABBREVIATED_NAME': last_name + ', ' + first_name[0] + '.',
+                  'ORCID': '',
+                  'SCOPUS_AUTHOR_ID': '',
+                  'ISNI': '',
+                  # Some researchers are much more productive than others.
+                  'productivity': rng.paretovariate(1.5)}
+        if rng.random() < RATIO_ORCID:
+            person['ORCID'] = '0000-0002-' + format(index // 10000, '04d') \
+                              + '-' + format(index % 10000, '04d')
+        if rng.random() < RATIO_SCOPUS_AUTHOR_ID:
+            person['SCOPUS_AUTHOR_ID'] = str(57000000000 + index)
+        if rng.random() < RATIO_ISNI:
+            person['ISNI'] = '0000 0004 ' + format(index // 10000, '04d') \
+                             + ' ' + format(index % 10000, '04d')
+        persons.append(person)
+    return persons
+
+
+def generate_organizations(rng: Random, persons: list, nr_organizations: int) -> list:
+    """Generate synthetic organizations, and assign persons to them.
+    Some organizations are much larger than others.
+
+    :param rng: the random generator.
+    :param persons: the persons.
+    :param nr_organizations: the number of organizations.
+    :return: a list of (EMPLOYEE_ID, ORGANIZATION_NAME) tuples.
+    """
+    organization_names = ['Synthetic organization ' + str(index)
+                          for index in range(nr_organizations)]
+    weights = [1 / (index + 1) for index in range(nr_organizations)]
+    person_organizations = []
+    for person in persons:
+        nr_orgs = 2 if rng.random() < RATIO_TWO_ORGANIZATIONS else 1
+        for organization_name in dict.fromkeys(rng.choices(organization_names, weights=weights, k=nr_orgs)):
+            person_organizations.append((person['EMPLOYEE_ID'], organization_name))
+    return person_organizations
+
+
+def generate_resout(rng: Random, seed: int, index: int, persons: list, cum_weights: list) -> dict:
+    """Generate one synthetic research result.
+
+    :param rng: the random generator.
+    :param seed: the seed, to make DOIs different for different seeds.
+    :param index: the number of this research result.
+    :param persons: the persons.
+    :param cum_weights: the cumulative weights to choose the authors from the persons.
+    :return: the research result.
+    """
+    categories = [category for category, _ in RESOUT_CATEGORIES]
+    category_weights = [weight for _, weight in RESOUT_CATEGORIES]
+    nr_authors = min(1 + int(rng.expovariate(0.4)), 25, len(persons))
+    authors = set(rng.choices(range(len(persons)), cum_weights=cum_weights, k=nr_authors))
+    resout = {'DOI': '10.99999/synthetic.' + str(seed) + '.' + str(index),
+              'TITLE': 'Synthetic research result ' + str(index),
+              'YEAR': str(rng.randint(2015, 2025)),
+              'CATEGORY': rng.choices(categories, weights=category_weights, k=1)[0],
+              'authors': sorted(authors)}
+    return resout
+
+
+def generate_synthetic_data(seed: int, nr_persons: int,
+                            nr_organizations: int, nr_resouts: int) -> dict:
+    """Generate synthetic data for two source systems. Source system A is
+    a CRIS with all persons, their organizations and their research results.
+    Source system B is an open source system with only persons that have
+    an ORCID, part of their research results, and research results
+    that are not in source system A.
+
+    :param seed: the seed for the random generator.
+    :param nr_persons: the number of persons.
+    :param nr_organizations: the number of organizations.
+    :param nr_resouts: the number of research results.
+    :return: a dict with DataFrames to insert in Ricgraph.
+    """
+    rng = Random(seed)
+    persons = generate_persons(rng=rng, nr_persons=nr_persons)
+    person_organizations = generate_organizations(rng=rng, persons=persons,
+                                                  nr_organizations=nr_organizations)
+    cum_weights = list(accumulate([person['productivity'] for person in persons]))
+
+    persons_a, persons_b = [], []
+    resouts_a, resouts_b = [], []
+    for person in persons:
+        orcid_a = person['ORCID'] if rng.random() < RATIO_ORCID_IN_SOURCE_A else ''
+        persons_a.append([person['EMPLOYEE_ID'], orcid_a, person['SCOPUS_AUTHOR_ID'],
+                          person['ISNI'], person['FULL_NAME']])
+        if person['ORCID'] != '':
+            if rng.random() < RATIO_ABBREVIATED_NAME:
+                persons_b.append([person['ORCID'], person['ABBREVIATED_NAME']])
+            else:
+                persons_b.append([person['ORCID'], person['FULL_NAME']])
+
+    nr_resouts_only_b = int(nr_resouts * RATIO_RESOUTS_ONLY_IN_SOURCE_B)
+    for index in range(nr_resouts + nr_resouts_only_b):
+        resout = generate_resout(rng=rng, seed=seed, index=index,
+                                 persons=persons, cum_weights=cum_weights)
+        in_source_a = index < nr_resouts
+        in_source_b = not in_source_a or rng.random() < RATIO_RESOUTS_OVERLAP
+        for author in resout['authors']:
+            person = persons[author]
+            values = [resout['DOI'], resout['TITLE'], resout['YEAR'], resout['CATEGORY']]
+            if in_source_a:
+                resouts_a.append([person['EMPLOYEE_ID']] + values)
+            if in_source_b and person['ORCID'] != '':
+                resouts_b.append([person['ORCID']] + values)
+
+    resout_columns = ['DOI', 'TITLE', 'YEAR', 'CATEGORY']
+    synthetic_data = {
+        'persons_a': DataFrame(data=persons_a,
+                               columns=['EMPLOYEE_ID', 'ORCID', 'SCOPUS_AUTHOR_ID',
+                                        'ISNI', 'FULL_NAME']),
+        'organizations_a': DataFrame(data=person_organizations,
+                                     columns=['EMPLOYEE_ID', 'ORGANIZATION_NAME']),
+        'resouts_a': DataFrame(data=resouts_a,
+                               columns=['EMPLOYEE_ID'] + resout_columns),
+        'persons_b': DataFrame(data=persons_b,
+                               columns=['ORCID', 'FULL_NAME']),
+        'resouts_b': DataFrame(data=resouts_b,
+                               columns=['ORCID'] + resout_columns),
+        'persons': persons
+    }
+    return synthetic_data
+
+
+# ######################################################
+# Timing functions.
+# ######################################################
+def benchmark_time(benchmark_name: str, function: Callable, **kwargs):
+    """Call a function, and record the time it takes.
+
+    :param benchmark_name: the name of the benchmark.
+    :param function: the function to call.
+    :param kwargs: the parameters of the function.
+    :return: the return value of the function.
+    """
+    start = perf_counter()
+    result = function(**kwargs)
+    duration = perf_counter() - start
+    if benchmark_name not in benchmark_timings:
+        benchmark_timings[benchmark_name] = []
+    benchmark_timings[benchmark_name].append(duration)
+    return result
+
+
+def summarize_timings(durations: list) -> dict:
+    """Summarize a list of durations.
+
+    :param durations: the durations in seconds.
+    :return: a dict with statistics in milliseconds.
+    """
+    durations_ms = sorted([duration * 1000 for duration in durations])
+    nr_calls = len(durations_ms)
+    summary = {'nr_calls': nr_calls,
+               'total_ms': round(sum(durations_ms), 3),
+               'mean_ms': round(sum(durations_ms) / nr_calls, 3),
+               'min_ms': round(durations_ms[0], 3),
+               'median_ms': round(durations_ms[nr_calls // 2], 3),
+               'p95_ms': round(durations_ms[min(int(nr_calls * 0.95), nr_calls - 1)], 3),
+               'max_ms': round(durations_ms[-1], 3)}
+    return summary
+
+
+def get_commandline_argument_number(argument: str, default: int) -> int:
+    """Get the value of a numeric command line argument.
+
+    :param argument: the command line argument name.
+    :param default: the value if the argument is not present.
+    :return: the value.
+    """
+    value = rcg.get_commandline_argument(argument=argument, argument_list=sys.argv)
+    if value == '':
+        return default
+    if not value.isdigit():
+        print('Error, the value "' + value + '" of ' + argument + ' is not a number, exiting.\n')
+        exit(1)
+    return int(value)
+
+
+# ######################################################
+# Benchmarks.
+# ######################################################
+def benchmark_ingest(synthetic_data: dict) -> None:
+    """Benchmark inserting the synthetic data in Ricgraph.
+    Note that the functions called modify the DataFrames passed,
+    therefore copies are passed.
+
+    :param synthetic_data: the synthetic data.
+    :return: None.
+    """
+    benchmark_time(benchmark_name='ingest_persons_source_a',
+                   function=rcg.create_parsed_persons_in_ricgraph,
+                   person_identifiers=synthetic_data['persons_a'].copy(deep=True),
+                   harvest_source=SOURCE_A)
+    benchmark_time(benchmark_name='ingest_resouts_source_a',
+                   function=rcg.create_parsed_dois_in_ricgraph,
+                   resouts=synthetic_data['resouts_a'].copy(deep=True),
+                   harvest_source=SOURCE_A)
+    benchmark_time(benchmark_name='ingest_organizations_source_a',
+                   function=rcg.create_parsed_entities_in_ricgraph,
+                   entities=synthetic_data['organizations_a'].copy(deep=True),
+                   harvest_source=SOURCE_A,
+                   what='organizations')
+    # The persons in source B have identifiers that are already in Ricgraph,
+    # so their person-roots will be unified.
+    benchmark_time(benchmark_name='ingest_persons_source_b',
+                   function=rcg.create_parsed_persons_in_ricgraph,
+                   person_identifiers=synthetic_data['persons_b'].copy(deep=True),
+                   harvest_source=SOURCE_B)
+    benchmark_time(benchmark_name='ingest_resouts_source_b',
+                   function=rcg.create_parsed_dois_in_ricgraph,
+                   resouts=synthetic_data['resouts_b'].copy(deep=True),
+                   harvest_source=SOURCE_B)
+    return
+
+
+def benchmark_merge(persons: list) -> None:
+    """Benchmark merging nodes, by merging abbreviated FULL_NAME nodes
+    (from source system B) into the FULL_NAME nodes from source system A.
+
+    :param persons: the persons.
+    :return: None.
+    """
+    nr_merged = 0
+    for person in persons:
+        if nr_merged >= NR_SAMPLES:
+            break
+        node_merge_from = rcg.read_node(name='FULL_NAME', value=person['ABBREVIATED_NAME'])
+        node_merge_to = rcg.read_node(name='FULL_NAME', value=person['FULL_NAME'])
+        if node_merge_from is None or node_merge_to is None:
+            continue
+        benchmark_time(benchmark_name='merge_two_nodes',
+                       function=rcg.merge_two_nodes,
+                       node_merge_from=node_merge_from,
+                       node_merge_to=node_merge_to)
+        nr_merged += 1
+    return
+
+
+def benchmark_queries(rng: Random, persons: list, nr_organizations: int) -> None:
+    """Benchmark the main queries.
+
+    :param rng: the random generator.
+    :param persons: the persons.
+    :param nr_organizations: the number of organizations.
+    :return: None.
+    """
+    for person in rng.sample(persons, k=min(NR_SAMPLES, len(persons))):
+        node = benchmark_time(benchmark_name='read_node',
+                              function=rcg.read_node,
+                              name='EMPLOYEE_ID', value=person['EMPLOYEE_ID'])
+        if node is None:
+            continue
+        personroot = benchmark_time(benchmark_name='get_personroot_node',
+                                    function=rcg.get_personroot_node,
+                                    node=node)
+        if personroot is None:
+            continue
+        benchmark_time(benchmark_name='get_all_neighbor_nodes_personroot',
+                       function=rcg.get_all_neighbor_nodes,
+                       node=personroot)
+        benchmark_time(benchmark_name='get_all_neighbor_nodes_personroot_category',
+                       function=rcg.get_all_neighbor_nodes,
+                       node=personroot,
+                       category_want=[rcg.RESEARCHRESULT_CATEGORY_JOURNAL_ARTICLE])
+
+    for index in range(min(NR_SAMPLES, nr_organizations)):
+        node = rcg.read_node(name='ORGANIZATION_NAME',
+                             value='Synthetic organization ' + str(index))
+        if node is None:
+            continue
+        benchmark_time(benchmark_name='get_all_neighbor_nodes_organization',
+                       function=rcg.get_all_neighbor_nodes,
+                       node=node)
+
+    for node_property in ['category', 'name']:
+        benchmark_time(benchmark_name='read_all_values_of_property',
+                       function=rcg.read_all_values_of_property,
+                       node_property=node_property)
+    return
+
+
+def benchmark_explorer_request(name: str, url: str, params: dict = None) -> None:
+    """Benchmark one request to Ricgraph Explorer.
+
+    :param name: the name of the benchmark.
+    :param url: the url.
+    :param params: the url parameters.
+    :return: None.
+    """
+    start = perf_counter()
+    try:
+        response = get(url=url, params=params, timeout=EXPLORER_TIMEOUT)
+    except Exception as error:
+        print('benchmark_explorer_request(): Error, ' + str(error) + '.')
+        return
+    duration = perf_counter() - start
+    if response.status_code >= 300:
+        print('benchmark_explorer_request(): Error, status code '
+              + str(response.status_code) + ' for ' + url + '.')
+        return
+    if name not in benchmark_timings:
+        benchmark_timings[name] = []
+    benchmark_timings[name].append(duration)
+    return
+
+
+def benchmark_explorer(rng: Random, persons: list, explorer_url: str) -> None:
+    """Benchmark the main Ricgraph Explorer pages and REST API calls.
+
+    :param rng: the random generator.
+    :param persons: the persons.
+    :param explorer_url: the url of Ricgraph Explorer.
+    :return: None.
+    """
+    explorer_url = explorer_url.rstrip('/')
+    api_url = explorer_url + '/api'
+    benchmark_explorer_request(name='explorer_homepage', url=explorer_url + '/')
+    organization_key = rcg.create_ricgraph_key(name='ORGANIZATION_NAME',
+                                               value='Synthetic organization 0')
+    for _ in range(min(10, NR_SAMPLES)):
+        benchmark_explorer_request(name='restapi_organization_information_persons_results',
+                                   url=api_url + '/organization/information_persons_results',
+                                   params={'key': organization_key})
+
+    for person in rng.sample(persons, k=min(NR_SAMPLES, len(persons))):
+        key = rcg.create_ricgraph_key(name='EMPLOYEE_ID', value=person['EMPLOYEE_ID'])
+        benchmark_explorer_request(name='restapi_person_search',
+                                   url=api_url + '/person/search',
+                                   params={'value': person['FULL_NAME']})
+        benchmark_explorer_request(name='restapi_person_all_information',
+                                   url=api_url + '/person/all_information',
+                                   params={'key': key})
+        benchmark_explorer_request(name='restapi_get_all_neighbor_nodes',
+                                   url=api_url + '/get_all_neighbor_nodes',
+                                   params={'key': key})
+        benchmark_explorer_request(name='explorer_optionspage',
+                                   url=explorer_url + '/optionspage/',
+                                   params={'key': key})
+        benchmark_explorer_request(name='explorer_resultspage_personal',
+                                   url=explorer_url + '/resultspage/',
+                                   params={'key': key,
+                                           'view_mode': 'view_regular_table_personal'})
+    return
+
+
+# ############################################
+# ################### main ###################
+# ############################################
+rcg.print_commandline_arguments(argument_list=sys.argv)
+if rcg.get_commandline_argument(argument='--empty_ricgraph',
+                                argument_list=sys.argv) != 'yes':
+    print('\nThis script empties Ricgraph, therefore you need to pass')
+    print('the option "--empty_ricgraph yes". Exiting.\n')
+    exit(1)
+
+nr_persons = get_commandline_argument_number(argument='--nr_persons',
+                                             default=NR_PERSONS_DEFAULT)
+nr_organizations = get_commandline_argument_number(argument='--nr_organizations',
+                                                   default=NR_ORGANIZATIONS_DEFAULT)
+nr_resouts = get_commandline_argument_number(argument='--nr_resouts',
+                                             default=NR_RESOUTS_DEFAULT)
+seed = get_commandline_argument_number(argument='--seed', default=SEED_DEFAULT)
+if nr_persons == 0 or nr_organizations == 0:
+    print('Error, the number of persons and organizations should be larger than 0, exiting.\n')
+    exit(1)
+explorer_url = rcg.get_commandline_argument(argument='--explorer_url',
+                                            argument_list=sys.argv)
+filename = rcg.get_commandline_argument(argument='--filename',
+                                        argument_list=sys.argv)
+if filename == '':
+    filename = 'ricgraph_benchmark_' + rcg.get_ricgraph_version() + '_' \
+               + rcg.datetimestamp().replace(' ', '_').replace(':', '') + '.json'
+
+start_datetime = rcg.datetimestamp(seconds=True)
+print('\nGenerating synthetic data with seed ' + str(seed) + ' for '
+      + str(nr_persons) + ' persons, ' + str(nr_organizations) + ' organizations and '
+      + str(nr_resouts) + ' research results...')
+data = benchmark_time(benchmark_name='generate_synthetic_data',
+                      function=generate_synthetic_data,
+                      seed=seed, nr_persons=nr_persons,
+                      nr_organizations=nr_organizations, nr_resouts=nr_resouts)
+
+print('\nPreparing graph...')
+rcg.open_ricgraph()
+rcg.empty_ricgraph(answer='yes')
+rcg.nodes_cache_key_id_empty()
+rcg.graphdb_nr_accesses_reset()
+rcg.querystats_reset()
+
+benchmark_ingest(synthetic_data=data)
+benchmark_merge(persons=data['persons'])
+# Use a separate random generator, so that the samples do not depend on
+# the number of random numbers used while generating the data.
+benchmark_queries(rng=Random(seed), persons=data['persons'],
+                  nr_organizations=nr_organizations)
+if explorer_url != '':
+    print('\nBenchmarking Ricgraph Explorer at ' + explorer_url + '...')
+    benchmark_explorer(rng=Random(seed), persons=data['persons'],
+                       explorer_url=explorer_url)
+
+results = {'benchmark_format_version': BENCHMARK_FORMAT_VERSION,
+           'ricgraph_version': rcg.get_ricgraph_version(),
+           'graphdb': rcg.ricgraph_database(),
+           'python_version': platform.python_version(),
+           'platform': platform.platform(),
+           'start': start_datetime,
+           'end': rcg.datetimestamp(seconds=True),
+           'parameters': {'seed': seed,
+                          'nr_persons': nr_persons,
+                          'nr_organizations': nr_organizations,
+                          'nr_resouts': nr_resouts,
+                          'nr_samples': NR_SAMPLES,
+                          'explorer_url': explorer_url},
+           'nr_nodes': rcg.ricgraph_nr_nodes(),
+           'nr_edges': rcg.ricgraph_nr_edges(),
+           'timings': {name: summarize_timings(durations=durations)
+                       for name, durations in benchmark_timings.items()},
+           'query_statistics': rcg.querystats_get()}
+
+print('\nThese are the results of the benchmark (in ms):')
+print('{:<50} {:>8} {:>12} {:>10} {:>10}'.format('benchmark', 'calls', 'total',
+                                                 'mean', 'p95'))
+for benchmark_name, timing in results['timings'].items():
+    print('{:<50} {:>8} {:>12.1f} {:>10.1f} {:>10.1f}'.format(benchmark_name,
+                                                              timing['nr_calls'],
+                                                              timing['total_ms'],
+                                                              timing['mean_ms'],
+                                                              timing['p95_ms']))
+rcg.querystats_print()
+
+print('Writing benchmark results to file ' + filename + '...')
+with open(filename, 'w') as fd:
+    dump(obj=results, fp=fd, ensure_ascii=False, indent=2)
+print('Done.\n')
+rcg.close_ricgraph()
@@ -0,0 +1,127 @@
+# ########################################################################
+#
+# Ricgraph - Research in context graph
+#
+# ########################################################################
+#
+# MIT License
+#
+# Copyright (c) 2026 Rik D.T. Janssen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# ########################################################################
+#
+# Compare the results of two runs of ricgraph_benchmark.py.
+# For every benchmark, the mean duration of both runs is printed, as
+# is the ratio new/old. Benchmarks that are more than REGRESSION_RATIO
+# slower in the new run are marked.
+# Results are only comparable if both runs used the same parameters
+# (seed, number of persons, etc.) and the same graph database backend.
+#
+# Original version Rik D.T. Janssen, October 2026.
+#
+# ########################################################################
+#
+# Usage
+# ricgraph_benchmark_compare.py [options]
+#
+# Options:
+#   --filename_old <filename>
+#           The JSON file with the results of the old run.
+#   --filename_new <filename>
+#           The JSON file with the results of the new run.
+#
+# ########################################################################
+
+
+import sys
+from json import load, JSONDecodeError
+import ricgraph as rcg
+
+
+# A benchmark that is this factor slower in the new run is marked as regression.
+REGRESSION_RATIO = 1.2
+
+
+def read_benchmark_results(filename: str) -> dict:
+    """Read the results of a benchmark run.
+
+    :param filename: the JSON file.
+    :return: the results, or an empty dict on error.
+    """
+    try:
+        with open(filename) as fd:
+            results = load(fp=fd)
+    except (OSError, JSONDecodeError):
+        print('read_benchmark_results(): Error, could not read file "' + filename + '".')
+        return {}
+    if 'timings' not in results:
+        print('read_benchmark_results(): Error, file "' + filename
+              + '" does not contain benchmark results.')
+        return {}
+    return results
+
+
+# ############################################
+# ################### main ###################
+# ############################################
+rcg.print_commandline_arguments(argument_list=sys.argv)
+filename_old = rcg.get_commandline_argument(argument='--filename_old',
+                                            argument_list=sys.argv)
+filename_new = rcg.get_commandline_argument(argument='--filename_new',
+                                            argument_list=sys.argv)
+if filename_old == '' or filename_new == '':
+    print('You need to specify both --filename_old and --filename_new, exiting.\n')
+    exit(1)
+
+results_old = read_benchmark_results(filename=filename_old)
+results_new = read_benchmark_results(filename=filename_new)
+if len(results_old) == 0 or len(results_new) == 0:
+    print('Exiting.\n')
+    exit(1)
+
+for item in ['parameters', 'graphdb']:
+    if results_old.get(item) != results_new.get(item):
+        print('\nWarning, the ' + item + ' of both runs differ, the results may not be comparable:')
+        print('- old: ' + str(results_old.get(item)))
+        print('- new: ' + str(results_new.get(item)))
+
+print('\nOld run: Ricgraph version ' + results_old.get('ricgraph_version', '')
+      + ', started at ' + results_old.get('start', '') + '.')
+print('New run: Ricgraph version ' + results_new.get('ricgraph_version', '')
+      + ', started at ' + results_new.get('start', '') + '.')
+print('\nMean duration per call (in ms):')
+print('{:<50} {:>12} {:>12} {:>8}'.format('benchmark', 'old', 'new', 'new/old'))
+nr_regressions = 0
+for name in results_new['timings']:
+    mean_new = results_new['timings'][name]['mean_ms']
+    if name not in results_old['timings']:
+        print('{:<50} {:>12} {:>12.1f} {:>8}'.format(name, '-', mean_new, '-'))
+        continue
+    mean_old = results_old['timings'][name]['mean_ms']
+    ratio = mean_new / mean_old if mean_old > 0 else 0
+    line = '{:<50} {:>12.1f} {:>12.1f} {:>8.2f}'.format(name, mean_old, mean_new, ratio)
+    if ratio > REGRESSION_RATIO:
+        line += '  <== regression'
+        nr_regressions += 1
+    print(line)
+
+print('\nThere are ' + str(nr_regressions) + ' benchmarks that are more than '
+      + str(REGRESSION_RATIO) + ' times slower in the new run.\n')
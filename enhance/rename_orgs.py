@@ -52,6 +52,12 @@
 #           any other value: This script will not run.
 #           If this option is not present, the script will prompt the user
 #           whether to run the script.
+#   --write_snapshot <yes|no>
+#           'yes' (default): write a Ricgraph snapshot at the end of this script,
+#           so that Ricgraph Explorer starts fast.
+#           'no': do not write it, e.g. if more scripts follow. Then the
+#           snapshot should be written after the last script, see
+#           harvest_multiple_sources/write_ricgraph_snapshot.py.
 #
 # ########################################################################
 
@@ -94,6 +100,7 @@ if not os.path.isfile(path=filename):
     exit(1)
 
 print('Filename used: "' + filename + '".')
+write_snapshot = rcg.get_commandline_argument_write_snapshot(argument_list=sys.argv)
 
 print('\nPreparing graph, starting script at ' + rcg.timestamp() + '...\n')
 graph = rcg.open_ricgraph()
@@ -115,4 +122,7 @@ for org in organizations.itertuples():
         print('    Finished rename at ' + rcg.timestamp(seconds=True) + '.')
 
 print('\nDone at ' + rcg.timestamp() + '.')
+if write_snapshot == 'yes':
+    rcg.write_ricgraph_snapshot()
+rcg.querystats_print()
 rcg.close_ricgraph()
@@ -49,10 +49,32 @@
 #           'no': Ricgraph will not be emptied before harvesting.
 #           If this option is not present, the script will prompt the user
 #           what to do.
+#           This option is not used if '--resume yes' is given.
+#   --resume <yes|no>
+#           'yes': resume an interrupted harvest, chunks of the harvest that
+#           have already been inserted in Ricgraph will be skipped.
+#           'no' (default): start the harvest from the beginning.
+#   --phase <all|fetch|insert>
+#           'all' (default): fetch, parse and insert in Ricgraph.
+#           'fetch': only fetch and parse, and write the results to file.
+#           Ricgraph will not be emptied or changed.
+#           'insert': only insert the results written to file in phase
+#           'fetch' in Ricgraph.
+#   --write_snapshot <yes|no>
+#           'yes' (default): write a Ricgraph snapshot at the end of the harvest,
+#           so that Ricgraph Explorer starts fast.
+#           'no': do not write it, e.g. if more harvests follow. Then the
+#           snapshot should be written after the last one, see
+#           harvest_multiple_sources/write_ricgraph_snapshot.py.
 #   --organization <organization abbreviation>
 #           Harvest data from organization <organization abbreviation>.
 #           The organization abbreviations are specified in the Ricgraph ini
 #           file.
+#           More than one organization can be given, separated by a comma
+#           (e.g. 'DUT,AUMC,VUA'). Then these organizations are harvested
+#           in one run. Persons and research results get source
+#           'OpenAlex-<organization abbreviation>' for every organization
+#           they have been found for.
 #           If this option is not present, the script will prompt the user
 #           what to do.
 #   --year_first <first year of harvest>
@@ -63,6 +85,7 @@
 # ########################################################################
 
 
+import os
 import sys
 import pandas
 from typing import Union
@@ -274,23 +297,25 @@ def parse_openalex(harvest: list,
 # ######################################################
 
 def harvest_and_parse_openalex(harvest_year: str,
+                               organization_ror: str,
                                headers: dict,
                                harvest_filename: str,
                                df_filename: str) -> Union[pandas.DataFrame, None]:
     """Harvest and parse data from OpenAlex.
 
     :param harvest_year: the year to harvest.
+    :param organization_ror: the ROR of the organization to harvest.
     :param headers: headers for OpenAlex.
     :param harvest_filename: filename to write harvest results to.
     :param df_filename: filename to write the DataFrame results to.
     :return: the DataFrame harvested, or None if nothing harvested.
     """
-    print('Harvesting persons and research results from ' + HARVEST_SOURCE + '...')
+    print('Harvesting persons and research results from OpenAlex for ROR ' + organization_ror + '...')
     if OPENALEX_READ_HARVEST_FROM_FILE:
         harvest_data = rcg.read_json_from_file(filename=harvest_filename)
     else:
         url = OPENALEX_URL + '/' + OPENALEX_ENDPOINT
-        url += '?filter=institutions.ror:' + ORGANIZATION_ROR
+        url += '?filter=institutions.ror:' + organization_ror
         url += ',publication_year:' + harvest_year + '&select=' + OPENALEX_FIELDS
         harvest_data = rcg.harvest_json(source=rcg.HARVEST_JSON_SOURCE_OPENALEX,
                                         url=url,
@@ -302,7 +327,7 @@ def harvest_and_parse_openalex(harvest_year: str,
     if (parse := parse_openalex(harvest=harvest_data, filename=df_filename)) is None:
         return None
 
-    print('The harvested persons and research results from ' + HARVEST_SOURCE + ' are:')
+    print('The harvested persons and research results from OpenAlex for ROR ' + organization_ror + ' are:')
     print(parse)
     return parse
 
@@ -311,10 +336,12 @@ def harvest_and_parse_openalex(harvest_year: str,
 # Parsed results to Ricgraph
 # ######################################################
 
-def parsed_persons_to_ricgraph(parsed_content: pandas.DataFrame) -> None:
+def parsed_persons_to_ricgraph(parsed_content: pandas.DataFrame,
+                               harvest_source: str) -> None:
     """Insert the parsed persons in Ricgraph.
 
     :param parsed_content: The records to insert in Ricgraph, if not present yet.
+    :param harvest_source: The source system we harvest from.
     :return: None.
     """
 
@@ -327,32 +354,34 @@ def parsed_persons_to_ricgraph(parsed_content: pandas.DataFrame) -> None:
     # If you have 2 of type (b), use these as the first 2 columns.
     person_identifiers = parsed_content[['OPENALEX_ID_PERS', 'ORCID', 'FULL_NAME']].copy(deep=True)
     rcg.create_parsed_persons_in_ricgraph(person_identifiers=person_identifiers,
-                                          harvest_source=HARVEST_SOURCE)
+                                          harvest_source=harvest_source)
 
     # Connect organizations to persons.
     organizations = parsed_content[['OPENALEX_ID_PERS', 'ORGANIZATION_NAME']].copy(deep=True)
     rcg.create_parsed_entities_in_ricgraph(entities=organizations,
-                                           harvest_source=HARVEST_SOURCE,
+                                           harvest_source=harvest_source,
                                            what='organizations')
 
     if 'ROR' in parsed_content.columns:
         # Connect organization name to organization ROR.
         organizations = parsed_content[['ROR', 'ORGANIZATION_NAME']].copy(deep=True)
         rcg.create_parsed_rors_in_ricgraph(organizations=organizations,
-                                           harvest_source=HARVEST_SOURCE)
+                                           harvest_source=harvest_source)
 
     return
 
 
-def parsed_resout_to_ricgraph(parsed_content: pandas.DataFrame) -> None:
+def parsed_resout_to_ricgraph(parsed_content: pandas.DataFrame,
+                              harvest_source: str) -> None:
     """Insert the parsed research results in Ricgraph.
 
     :param parsed_content: The records to insert in Ricgraph, if not present yet.
+    :param harvest_source: The source system we harvest from.
     :return: None.
     """
     resouts = parsed_content[['OPENALEX_ID_PERS', 'DOI', 'TITLE', 'YEAR',
                               'LICENSE', 'ACCESS', 'CATEGORY']].copy(deep=True)
-    rcg.create_parsed_dois_in_ricgraph(resouts=resouts, harvest_source=HARVEST_SOURCE)
+    rcg.create_parsed_dois_in_ricgraph(resouts=resouts, harvest_source=harvest_source)
     return
 
 
@@ -360,7 +389,7 @@ def parsed_resout_to_ricgraph(parsed_content: pandas.DataFrame) -> None:
 # ################### main ###################
 # ############################################
 rcg.print_commandline_arguments(argument_list=sys.argv)
-if (organization := rcg.get_commandline_argument_organization(argument_list=sys.argv)) == '':
+if len(organizations := rcg.get_commandline_argument_organizations(argument_list=sys.argv)) == 0:
     print('Exiting.\n')
     exit(1)
 
@@ -371,18 +400,23 @@ if year_first == '' or year_last == '':
     # in get_commandline_argument_year_first_last().
     exit(1)
 
-org_name = 'organization_name_' + organization
-org_ror = 'organization_ror_' + organization
-ORGANIZATION_NAME = rcg.get_configfile_key(section='Organization', key=org_name)
-ORGANIZATION_ROR = rcg.get_configfile_key(section='Organization', key=org_ror)
-if ORGANIZATION_NAME == '' or ORGANIZATION_ROR == '':
-    print('Ricgraph initialization: error, "' + org_name + '" or "' + org_ror + '"')
-    print('  not existing or empty in Ricgraph ini file, exiting.')
-    exit(1)
+# The ROR of every organization to harvest, the key is the organization.
+organization_rors = {}
+for organization in organizations:
+    org_name = 'organization_name_' + organization
+    org_ror = 'organization_ror_' + organization
+    organization_name = rcg.get_configfile_key(section='Organization', key=org_name)
+    organization_ror = rcg.get_configfile_key(section='Organization', key=org_ror)
+    if organization_name == '' or organization_ror == '':
+        print('Ricgraph initialization: error, "' + org_name + '" or "' + org_ror + '"')
+        print('  not existing or empty in Ricgraph ini file, exiting.')
+        exit(1)
+    organization_rors[organization] = organization_ror
 
-HARVEST_SOURCE = 'OpenAlex-' + organization
+# Every organization has its own source, also if more than one organization is harvested.
+HARVEST_SOURCES = {organization: 'OpenAlex-' + organization for organization in organizations}
 
-print('\nHarvesting ' + HARVEST_SOURCE + ', first year: ' + year_first + ', last year: ' + year_last + '.')
+print('\nHarvesting ' + ', '.join(HARVEST_SOURCES.values()) + ', first year: ' + year_first + ', last year: ' + year_last + '.')
 
 # The OpenAlex 'polite pool' has much faster and more consistent response times.
 # See https://docs.openalex.org/how-to-use-the-api/rate-limits-and-authentication#the-polite-pool.
@@ -396,49 +430,113 @@ if OPENALEX_URL == '' or email == '':
     exit(1)
 OPENALEX_HEADERS['User-Agent'] = 'mailto:' + email
 
-print('\nPreparing graph...')
-rcg.open_ricgraph()
-
-empty_graph = rcg.get_commandline_argument_empty_ricgraph(argument_list=sys.argv)
-if empty_graph == 'yes' or empty_graph == 'no':
-    rcg.empty_ricgraph(answer=empty_graph)
-else:
+phase = rcg.get_commandline_argument_phase(argument_list=sys.argv)
+if phase == '':
     print('Exiting.\n')
     exit(1)
+if phase != 'fetch':
+    # In phase 'fetch' Ricgraph is not used. Also, it should not be opened,
+    # since with the embedded graph database backend, closing it writes files.
+    print('\nPreparing graph...')
+    rcg.open_ricgraph()
+if phase == 'insert':
+    # Insert the data fetched and parsed in phase 'fetch'.
+    OPENALEX_READ_DATA_FROM_FILE = True
+
+resume = rcg.get_commandline_argument_resume(argument_list=sys.argv)
+write_snapshot = rcg.get_commandline_argument_write_snapshot(argument_list=sys.argv)
+if phase == 'fetch':
+    print('Only fetching and parsing, Ricgraph will not be emptied or changed.')
+elif resume == 'yes':
+    print('Resuming an interrupted harvest, Ricgraph will not be emptied.')
+else:
+    empty_graph = rcg.get_commandline_argument_empty_ricgraph(argument_list=sys.argv)
+    if empty_graph == 'yes' or empty_graph == 'no':
+        rcg.empty_ricgraph(answer=empty_graph)
+    else:
+        print('Exiting.\n')
+        exit(1)
+if phase != 'fetch':
+    rcg.resume_start(resume=(resume == 'yes'))
 
-rcg.graphdb_nr_accesses_print()
-print(rcg.nodes_cache_key_id_type_size() + '\n')
+if phase != 'fetch':
+    rcg.graphdb_nr_accesses_print()
+    print(rcg.nodes_cache_key_id_type_size() + '\n')
 
 for year_int in range(int(year_first), int(year_last) + 1):
     year = str(year_int)
-    data_file_year = rcg.construct_filename(base_filename=OPENALEX_DATA_FILENAME,
-                                            year=year, organization=organization)
-    if OPENALEX_READ_DATA_FROM_FILE:
-        error_message = 'There are no persons or research results from ' + HARVEST_SOURCE
-        error_message += ' for year ' + year + ' to read from file ' + data_file_year + '.\n'
-        print('Reading persons and research results from ' + HARVEST_SOURCE
-              + ' for year ' + year + ' from file ' + data_file_year + '.')
-        parse_persons_resout = rcg.read_dataframe_from_csv(filename=data_file_year,
-                                                           datatype=str)
-    else:
-        error_message = 'There are no persons or research results from ' + HARVEST_SOURCE
-        error_message += ' for year ' + year + ' to harvest.\n'
-        print('Harvesting persons and research results from ' + HARVEST_SOURCE
-              + ' for year ' + year + '.')
-        harvest_file_year = rcg.construct_filename(base_filename=OPENALEX_HARVEST_FILENAME,
-                                                   year=year, organization=organization)
-        parse_persons_resout = harvest_and_parse_openalex(harvest_year=year,
-                                                          headers=OPENALEX_HEADERS,
-                                                          harvest_filename=harvest_file_year,
-                                                          df_filename=data_file_year)
+    parsed_organizations = []
+    for organization in organizations:
+        data_file_year = rcg.construct_filename(base_filename=OPENALEX_DATA_FILENAME,
+                                                year=year, organization=organization)
+        if OPENALEX_READ_DATA_FROM_FILE:
+            print('Reading persons and research results from OpenAlex-' + organization
+                  + ' for year ' + year + ' from file ' + data_file_year + '.')
+            if phase == 'insert' and not os.path.isfile(data_file_year):
+                # Phase 'fetch' does not write a file if there was nothing to fetch.
+                parse_organization = None
+            else:
+                parse_organization = rcg.read_dataframe_from_csv(filename=data_file_year,
+                                                                 datatype=str)
+        else:
+            print('Harvesting persons and research results from OpenAlex-' + organization
+                  + ' for year ' + year + '.')
+            harvest_file_year = rcg.construct_filename(base_filename=OPENALEX_HARVEST_FILENAME,
+                                                       year=year, organization=organization)
+            parse_organization = harvest_and_parse_openalex(harvest_year=year,
+                                                            organization_ror=organization_rors[organization],
+                                                            headers=OPENALEX_HEADERS,
+                                                            harvest_filename=harvest_file_year,
+                                                            df_filename=data_file_year)
+        if parse_organization is None or parse_organization.empty:
+            print('There are no persons or research results from OpenAlex-' + organization
+                  + ' for year ' + year + '.')
+            continue
+        # Keep the organization a row has been found for, so that it gets the
+        # source of that organization.
+        parsed_organizations.append(parse_organization.assign(HARVEST_ORGANIZATION=organization))
+
+    error_message = 'There are no persons or research results from ' + ', '.join(HARVEST_SOURCES.values())
+    error_message += ' for year ' + year + '.\n'
+    parse_persons_resout = None
+    if len(parsed_organizations) == 1:
+        parse_persons_resout = parsed_organizations[0]
+    elif len(parsed_organizations) > 1:
+        # Merge the harvests of the organizations. Duplicate rows of one
+        # organization are removed, rows found for more than one organization are kept.
+        parse_persons_resout = pandas.concat(parsed_organizations, ignore_index=True)
+        parse_persons_resout = parse_persons_resout.fillna('').astype(str)
+        nr_rows = len(parse_persons_resout)
+        parse_persons_resout.drop_duplicates(keep='first', inplace=True, ignore_index=True)
+        nr_shared = parse_persons_resout.drop(columns=['HARVEST_ORGANIZATION']).duplicated().sum()
+        print('Merged the harvests of ' + ', '.join(HARVEST_SOURCES.values()) + ' for year ' + year
+              + ', removed ' + str(nr_rows - len(parse_persons_resout)) + ' duplicate rows of '
+              + str(nr_rows) + ' rows, ' + str(nr_shared)
+              + ' rows have been found for more than one organization.')
 
     if parse_persons_resout is None or parse_persons_resout.empty:
         print(error_message)
+    elif phase == 'fetch':
+        print('Phase "fetch": fetched and parsed, not inserted in Ricgraph.')
     else:
-        parsed_persons_to_ricgraph(parsed_content=parse_persons_resout)
-        parsed_resout_to_ricgraph(parsed_content=parse_persons_resout)
-
-    rcg.graphdb_nr_accesses_print()
-    print(rcg.nodes_cache_key_id_type_size() + '\n')
-
-rcg.close_ricgraph()
+        # A row that has been found for more than one organization is inserted
+        # for each of them, so that it gets the source of each of them.
+        for organization, parse_organization in parse_persons_resout.groupby('HARVEST_ORGANIZATION',
+                                                                             sort=False):
+            parse_organization = parse_organization.drop(columns=['HARVEST_ORGANIZATION'])
+            parsed_persons_to_ricgraph(parsed_content=parse_organization,
+                                       harvest_source=HARVEST_SOURCES[organization])
+            parsed_resout_to_ricgraph(parsed_content=parse_organization,
+                                      harvest_source=HARVEST_SOURCES[organization])
+
+    if phase != 'fetch':
+        rcg.graphdb_nr_accesses_print()
+        print(rcg.nodes_cache_key_id_type_size() + '\n')
+
+if phase != 'fetch':
+    rcg.resume_finish()
+    if write_snapshot == 'yes':
+        rcg.write_ricgraph_snapshot()
+rcg.querystats_print()
+if phase != 'fetch':
+    rcg.close_ricgraph()
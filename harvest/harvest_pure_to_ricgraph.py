@@ -80,6 +80,23 @@
 #           'no': Ricgraph will not be emptied before harvesting.
 #           If this option is not present, the script will prompt the user
 #           what to do.
+#           This option is not used if '--resume yes' is given.
+#   --resume <yes|no>
+#           'yes': resume an interrupted harvest, chunks of the harvest that
+#           have already been inserted in Ricgraph will be skipped.
+#           'no' (default): start the harvest from the beginning.
+#   --phase <all|fetch|insert>
+#           'all' (default): fetch, parse and insert in Ricgraph.
+#           'fetch': only fetch and parse, and write the results to file.
+#           Ricgraph will not be emptied or changed.
+#           'insert': only insert the results written to file in phase
+#           'fetch' in Ricgraph.
+#   --write_snapshot <yes|no>
+#           'yes' (default): write a Ricgraph snapshot at the end of the harvest,
+#           so that Ricgraph Explorer starts fast.
+#           'no': do not write it, e.g. if more harvests follow. Then the
+#           snapshot should be written after the last one, see
+#           harvest_multiple_sources/write_ricgraph_snapshot.py.
 #   --organization <organization abbreviation>
 #           Harvest data from organization <organization abbreviation>.
 #           The organization abbreviations are specified in the Ricgraph ini
@@ -99,6 +116,7 @@
 # ########################################################################
 
 
+import os
 import sys
 import pandas
 import numpy
@@ -2219,19 +2237,43 @@ HARVEST_SOURCE = 'Pure-' + organization
 
 print('\nHarvesting ' + HARVEST_SOURCE + ', first year: ' + year_first + ', last year: ' + year_last + '.')
 
-print('\nPreparing graph...')
-rcg.open_ricgraph()
-
-empty_graph = rcg.get_commandline_argument_empty_ricgraph(argument_list=sys.argv)
-if empty_graph == 'yes' or empty_graph == 'no':
-    rcg.empty_ricgraph(answer=empty_graph)
-else:
+phase = rcg.get_commandline_argument_phase(argument_list=sys.argv)
+if phase == '':
     print('Exiting.\n')
     exit(1)
+if phase != 'fetch':
+    # In phase 'fetch' Ricgraph is not used. Also, it should not be opened,
+    # since with the embedded graph database backend, closing it writes files.
+    print('\nPreparing graph...')
+    rcg.open_ricgraph()
+if phase == 'insert':
+    # Insert the data fetched and parsed in phase 'fetch'.
+    PURE_PERSONS_READ_DATA_FROM_FILE = True
+    PURE_ORGANIZATIONS_READ_DATA_FROM_FILE = True
+    PURE_RESOUTS_READ_DATA_FROM_FILE = True
+    PURE_DATASETS_READ_DATA_FROM_FILE = True
+    PURE_PRESS_MEDIA_READ_DATA_FROM_FILE = True
+    PURE_PROJECTS_READ_DATA_FROM_FILE = True
+
+resume = rcg.get_commandline_argument_resume(argument_list=sys.argv)
+write_snapshot = rcg.get_commandline_argument_write_snapshot(argument_list=sys.argv)
+if phase == 'fetch':
+    print('Only fetching and parsing, Ricgraph will not be emptied or changed.')
+elif resume == 'yes':
+    print('Resuming an interrupted harvest, Ricgraph will not be emptied.')
+else:
+    empty_graph = rcg.get_commandline_argument_empty_ricgraph(argument_list=sys.argv)
+    if empty_graph == 'yes' or empty_graph == 'no':
+        rcg.empty_ricgraph(answer=empty_graph)
+    else:
+        print('Exiting.\n')
+        exit(1)
+if phase != 'fetch':
+    rcg.resume_start(resume=(resume == 'yes'))
 
 resout_uuid_or_doi = {}
 
-if PURE_API_VERSION == PURE_CRUD_API_VERSION:
+if PURE_API_VERSION == PURE_CRUD_API_VERSION and phase != 'insert':
     # The Pure CRUD API still lacks important features,
     # see the comment at the beginning of this file.
     if HARVEST_PERSONS:
@@ -2284,8 +2326,9 @@ if PURE_API_VERSION == PURE_CRUD_API_VERSION:
         PURE_PRESS_MEDIA_READ_HARVEST_FROM_FILE = True
         print('Done pre-harvesting press media items.\n')
 
-rcg.graphdb_nr_accesses_print()
-print(rcg.nodes_cache_key_id_type_size() + '\n')
+if phase != 'fetch':
+    rcg.graphdb_nr_accesses_print()
+    print(rcg.nodes_cache_key_id_type_size() + '\n')
 
 # ########################################################################
 # You can use 'True' or 'False' depending on your needs to harvest
@@ -2303,7 +2346,11 @@ if HARVEST_PERSONS:
     if PURE_PERSONS_READ_DATA_FROM_FILE:
         error_message = 'There are no persons from ' + HARVEST_SOURCE + ' to read from file ' + data_file + '.\n'
         print('Reading persons from ' + HARVEST_SOURCE + ' from file ' + data_file + '.')
-        parse_persorgs = rcg.read_dataframe_from_csv(filename=data_file, datatype=str)
+        if phase == 'insert' and not os.path.isfile(data_file):
+            # Phase 'fetch' does not write a file if there was nothing to fetch.
+            parse_persorgs = None
+        else:
+            parse_persorgs = rcg.read_dataframe_from_csv(filename=data_file, datatype=str)
     else:
         error_message = 'There are no persons from ' + HARVEST_SOURCE + ' to harvest.\n'
         print('Harvesting persons from ' + HARVEST_SOURCE + '.')
@@ -2319,12 +2366,15 @@ if HARVEST_PERSONS:
 
     if parse_persorgs is None or parse_persorgs.empty:
         print(error_message)
+    elif phase == 'fetch':
+        print('Phase "fetch": fetched and parsed, not inserted in Ricgraph.')
     else:
         parsed_persons_to_ricgraph(parsed_content=parse_persorgs)
         parsed_organizations_to_ricgraph(parsed_content=parse_persorgs)
 
-    rcg.graphdb_nr_accesses_print()
-    print(rcg.nodes_cache_key_id_type_size() + '\n')
+    if phase != 'fetch':
+        rcg.graphdb_nr_accesses_print()
+        print(rcg.nodes_cache_key_id_type_size() + '\n')
 
 
 # ########################################################################
@@ -2339,8 +2389,12 @@ if HARVEST_RESOUTS:
             error_message += ' for year ' + year + ' to read from file ' + data_file_year + '.\n'
             print('Reading research results from ' + HARVEST_SOURCE + ' for year '
                   + year + ' from file ' + data_file_year + '.')
-            parse_resout = rcg.read_dataframe_from_csv(filename=data_file_year,
-                                                       datatype=str)
+            if phase == 'insert' and not os.path.isfile(data_file_year):
+                # Phase 'fetch' does not write a file if there was nothing to fetch.
+                parse_resout = None
+            else:
+                parse_resout = rcg.read_dataframe_from_csv(filename=data_file_year,
+                                                           datatype=str)
         else:
             error_message = 'There are no research results from ' + HARVEST_SOURCE
             error_message += ' for year ' + year + ' to harvest.\n'
@@ -2361,12 +2415,15 @@ if HARVEST_RESOUTS:
 
         if parse_resout is None or parse_resout.empty:
             print(error_message)
+        elif phase == 'fetch':
+            print('Phase "fetch": fetched and parsed, not inserted in Ricgraph.')
         else:
             parsed_entities_to_ricgraph(parsed_content=parse_resout,
                                         what='research results')
 
-        rcg.graphdb_nr_accesses_print()
-        print(rcg.nodes_cache_key_id_type_size() + '\n')
+        if phase != 'fetch':
+            rcg.graphdb_nr_accesses_print()
+            print(rcg.nodes_cache_key_id_type_size() + '\n')
 
 
 # ########################################################################
@@ -2380,8 +2437,12 @@ if HARVEST_DATASETS:
         error_message += ' to read from file ' + data_file + '.\n'
         print('Reading data sets from ' + HARVEST_SOURCE + ' for year '
               + year_first + ' to ' + year_last + ' from file ' + data_file + '.')
-        parse_datasets = rcg.read_dataframe_from_csv(filename=data_file,
-                                                        datatype=str)
+        if phase == 'insert' and not os.path.isfile(data_file):
+            # Phase 'fetch' does not write a file if there was nothing to fetch.
+            parse_datasets = None
+        else:
+            parse_datasets = rcg.read_dataframe_from_csv(filename=data_file,
+                                                         datatype=str)
     else:
         error_message = 'There are no data sets from ' + HARVEST_SOURCE
         error_message += ' for year ' + year_first + ' to ' + year_last
@@ -2401,12 +2462,15 @@ if HARVEST_DATASETS:
 
     if parse_datasets is None or parse_datasets.empty:
         print(error_message)
+    elif phase == 'fetch':
+        print('Phase "fetch": fetched and parsed, not inserted in Ricgraph.')
     else:
         parsed_entities_to_ricgraph(parsed_content=parse_datasets,
                                     what='data sets (from Pure datasets endpoint)')
 
-    rcg.graphdb_nr_accesses_print()
-    print(rcg.nodes_cache_key_id_type_size() + '\n')
+    if phase != 'fetch':
+        rcg.graphdb_nr_accesses_print()
+        print(rcg.nodes_cache_key_id_type_size() + '\n')
 
 # ########################################################################
 # Code for harvesting press media items.
@@ -2420,8 +2484,12 @@ if HARVEST_PRESS_MEDIA:
             error_message += ' for year ' + year + ' to read from file ' + data_file_year + '.\n'
             print('Reading press media items from ' + HARVEST_SOURCE + ' for year '
                   + year + ' from file ' + data_file_year + '.')
-            parse_press_media = rcg.read_dataframe_from_csv(filename=data_file_year,
-                                                            datatype=str)
+            if phase == 'insert' and not os.path.isfile(data_file_year):
+                # Phase 'fetch' does not write a file if there was nothing to fetch.
+                parse_press_media = None
+            else:
+                parse_press_media = rcg.read_dataframe_from_csv(filename=data_file_year,
+                                                                datatype=str)
         else:
             error_message = 'There are no press media items from ' + HARVEST_SOURCE
             error_message += ' for year ' + year + ' to harvest.\n'
@@ -2447,12 +2515,15 @@ if HARVEST_PRESS_MEDIA:
 
         if parse_press_media is None or parse_press_media.empty:
             print(error_message)
+        elif phase == 'fetch':
+            print('Phase "fetch": fetched and parsed, not inserted in Ricgraph.')
         else:
             parsed_entities_to_ricgraph(parsed_content=parse_press_media,
                                         what='press media items')
 
-        rcg.graphdb_nr_accesses_print()
-        print(rcg.nodes_cache_key_id_type_size() + '\n')
+        if phase != 'fetch':
+            rcg.graphdb_nr_accesses_print()
+            print(rcg.nodes_cache_key_id_type_size() + '\n')
 
 
 org_and_all_parents = {}
@@ -2473,8 +2544,12 @@ if HARVEST_PROJECTS:
     if PURE_PROJECTS_READ_DATA_FROM_FILE:
         error_message = 'There are no projects from ' + HARVEST_SOURCE + ' to read from file ' + data_file + '.\n'
         print('Reading projects from ' + HARVEST_SOURCE + ' from file ' + data_file + '.')
-        parse_projects = rcg.read_dataframe_from_csv(filename=data_file,
-                                                     datatype=str)
+        if phase == 'insert' and not os.path.isfile(data_file):
+            # Phase 'fetch' does not write a file if there was nothing to fetch.
+            parse_projects = None
+        else:
+            parse_projects = rcg.read_dataframe_from_csv(filename=data_file,
+                                                         datatype=str)
     else:
         error_message = 'There are no projects from ' + HARVEST_SOURCE + ' to harvest.\n'
         print('Harvesting projects from ' + HARVEST_SOURCE + '.')
@@ -2489,6 +2564,8 @@ if HARVEST_PROJECTS:
 
     if parse_projects is None or parse_projects.empty:
         print(error_message)
+    elif phase == 'fetch':
+        print('Phase "fetch": fetched and parsed, not inserted in Ricgraph.')
     else:
         # NOTE: org_and_all_parents is undefined now (27-2-2026),
         # after a full rewrite of the organization harvest.
@@ -2497,7 +2574,14 @@ if HARVEST_PROJECTS:
                                     organization_and_all_parents=org_and_all_parents)
 
     print('WARNING: Harvesting of projects may not work as expected. Use at your own risk.')
-    rcg.graphdb_nr_accesses_print()
-    print(rcg.nodes_cache_key_id_type_size() + '\n')
+    if phase != 'fetch':
+        rcg.graphdb_nr_accesses_print()
+        print(rcg.nodes_cache_key_id_type_size() + '\n')
 
-rcg.close_ricgraph()
+if phase != 'fetch':
+    rcg.resume_finish()
+    if write_snapshot == 'yes':
+        rcg.write_ricgraph_snapshot()
+rcg.querystats_print()
+if phase != 'fetch':
+    rcg.close_ricgraph()
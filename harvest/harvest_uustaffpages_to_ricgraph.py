@@ -49,6 +49,17 @@
 #           'no': Ricgraph will not be emptied before harvesting.
 #           If this option is not present, the script will prompt the user
 #           what to do.
+#           This option is not used if '--resume yes' is given.
+#   --resume <yes|no>
+#           'yes': resume an interrupted harvest, chunks of the harvest that
+#           have already been inserted in Ricgraph will be skipped.
+#           'no' (default): start the harvest from the beginning.
+#   --write_snapshot <yes|no>
+#           'yes' (default): write a Ricgraph snapshot at the end of the harvest,
+#           so that Ricgraph Explorer starts fast.
+#           'no': do not write it, e.g. if more harvests follow. Then the
+#           snapshot should be written after the last one, see
+#           harvest_multiple_sources/write_ricgraph_snapshot.py.
 #
 # ########################################################################
 
@@ -584,12 +595,18 @@ if UUSTAFF_URL == '':
 print('\nPreparing graph...')
 rcg.open_ricgraph()
 
-empty_graph = rcg.get_commandline_argument_empty_ricgraph(argument_list=sys.argv)
-if empty_graph == 'yes' or empty_graph == 'no':
-    rcg.empty_ricgraph(answer=empty_graph)
+resume = rcg.get_commandline_argument_resume(argument_list=sys.argv)
+write_snapshot = rcg.get_commandline_argument_write_snapshot(argument_list=sys.argv)
+if resume == 'yes':
+    print('Resuming an interrupted harvest, Ricgraph will not be emptied.')
 else:
-    print('Exiting.\n')
-    exit(1)
+    empty_graph = rcg.get_commandline_argument_empty_ricgraph(argument_list=sys.argv)
+    if empty_graph == 'yes' or empty_graph == 'no':
+        rcg.empty_ricgraph(answer=empty_graph)
+    else:
+        print('Exiting.\n')
+        exit(1)
+rcg.resume_start(resume=(resume == 'yes'))
 
 rcg.graphdb_nr_accesses_print()
 print(rcg.nodes_cache_key_id_type_size() + '\n')
@@ -657,4 +674,8 @@ if True:
     rcg.graphdb_nr_accesses_print()
     print(rcg.nodes_cache_key_id_type_size() + '\n')
 
+rcg.resume_finish()
+if write_snapshot == 'yes':
+    rcg.write_ricgraph_snapshot()
+rcg.querystats_print()
 rcg.close_ricgraph()
@@ -51,6 +51,23 @@
 #           'no': Ricgraph will not be emptied before harvesting.
 #           If this option is not present, the script will prompt the user
 #           what to do.
+#           This option is not used if '--resume yes' is given.
+#   --resume <yes|no>
+#           'yes': resume an interrupted harvest, chunks of the harvest that
+#           have already been inserted in Ricgraph will be skipped.
+#           'no' (default): start the harvest from the beginning.
+#   --phase <all|fetch|insert>
+#           'all' (default): fetch, parse and insert in Ricgraph.
+#           'fetch': only fetch and parse, and write the results to file.
+#           Ricgraph will not be emptied or changed.
+#           'insert': only insert the results written to file in phase
+#           'fetch' in Ricgraph.
+#   --write_snapshot <yes|no>
+#           'yes' (default): write a Ricgraph snapshot at the end of the harvest,
+#           so that Ricgraph Explorer starts fast.
+#           'no': do not write it, e.g. if more harvests follow. Then the
+#           snapshot should be written after the last one, see
+#           harvest_multiple_sources/write_ricgraph_snapshot.py.
 #   --organization <organization abbreviation>
 #           Harvest data from organization <organization abbreviation>.
 #           The organization abbreviations are specified in the Ricgraph ini
@@ -61,6 +78,7 @@
 # ########################################################################
 
 
+import os
 import sys
 import pandas
 from typing import Union
@@ -620,18 +638,38 @@ HARVEST_SOURCE = 'Yoda-DataCite-' + organization
 
 print('\nHarvesting ' + HARVEST_SOURCE + '.')
 
-print('\nPreparing graph...')
-rcg.open_ricgraph()
-
-empty_graph = rcg.get_commandline_argument_empty_ricgraph(argument_list=sys.argv)
-if empty_graph == 'yes' or empty_graph == 'no':
-    rcg.empty_ricgraph(answer=empty_graph)
-else:
+phase = rcg.get_commandline_argument_phase(argument_list=sys.argv)
+if phase == '':
     print('Exiting.\n')
     exit(1)
+if phase != 'fetch':
+    # In phase 'fetch' Ricgraph is not used. Also, it should not be opened,
+    # since with the embedded graph database backend, closing it writes files.
+    print('\nPreparing graph...')
+    rcg.open_ricgraph()
+if phase == 'insert':
+    # Insert the data fetched and parsed in phase 'fetch'.
+    YODA_READ_DATA_FROM_FILE = True
+
+resume = rcg.get_commandline_argument_resume(argument_list=sys.argv)
+write_snapshot = rcg.get_commandline_argument_write_snapshot(argument_list=sys.argv)
+if phase == 'fetch':
+    print('Only fetching and parsing, Ricgraph will not be emptied or changed.')
+elif resume == 'yes':
+    print('Resuming an interrupted harvest, Ricgraph will not be emptied.')
+else:
+    empty_graph = rcg.get_commandline_argument_empty_ricgraph(argument_list=sys.argv)
+    if empty_graph == 'yes' or empty_graph == 'no':
+        rcg.empty_ricgraph(answer=empty_graph)
+    else:
+        print('Exiting.\n')
+        exit(1)
+if phase != 'fetch':
+    rcg.resume_start(resume=(resume == 'yes'))
 
-rcg.graphdb_nr_accesses_print()
-print(rcg.nodes_cache_key_id_type_size() + '\n')
+if phase != 'fetch':
+    rcg.graphdb_nr_accesses_print()
+    print(rcg.nodes_cache_key_id_type_size() + '\n')
 
 data_file = rcg.construct_filename(base_filename=YODA_DATA_FILENAME,
                                    organization=organization)
@@ -639,7 +677,11 @@ data_file = rcg.construct_filename(base_filename=YODA_DATA_FILENAME,
 if YODA_READ_DATA_FROM_FILE:
     error_message = 'There are no data from ' + HARVEST_SOURCE + ' to read from file ' + data_file + '.\n'
     print('Reading data from ' + HARVEST_SOURCE + ' from file ' + data_file + '.')
-    parse_yoda_data = rcg.read_dataframe_from_csv(filename=data_file, datatype=str)
+    if phase == 'insert' and not os.path.isfile(data_file):
+        # Phase 'fetch' does not write a file if there was nothing to fetch.
+        parse_yoda_data = None
+    else:
+        parse_yoda_data = rcg.read_dataframe_from_csv(filename=data_file, datatype=str)
 else:
     error_message = 'There are no data from ' + HARVEST_SOURCE + ' to harvest.\n'
     print('Harvesting data from ' + HARVEST_SOURCE + '.')
@@ -652,9 +694,17 @@ else:
 
 if parse_yoda_data is None or parse_yoda_data.empty:
     print(error_message)
+elif phase == 'fetch':
+    print('Phase "fetch": fetched and parsed, not inserted in Ricgraph.')
 else:
     parsed_yoda_datacite_to_ricgraph(parsed_content=parse_yoda_data)
 
-rcg.graphdb_nr_accesses_print()
-print(rcg.nodes_cache_key_id_type_size() + '\n')
-rcg.close_ricgraph()
+if phase != 'fetch':
+    rcg.graphdb_nr_accesses_print()
+    print(rcg.nodes_cache_key_id_type_size() + '\n')
+    rcg.resume_finish()
+    if write_snapshot == 'yes':
+        rcg.write_ricgraph_snapshot()
+rcg.querystats_print()
+if phase != 'fetch':
+    rcg.close_ricgraph()
@@ -35,7 +35,7 @@
 
 harvest_rsd () {
   echo "Harvesting Research Software Directory for organization '$organization'."
-  PYTHONPATH=$python_path $python_cmd harvest_rsd_to_ricgraph.py --empty_ricgraph "$empty_ricgraph" --organization "$organization"
+  PYTHONPATH=$python_path $python_cmd harvest_rsd_to_ricgraph.py --write_snapshot no --empty_ricgraph "$empty_ricgraph" --organization "$organization"
   exit_code=$?
   if [ "$exit_code" = "0" ] ; then
     echo "Done with harvesting Research Software Directory-$organization."
@@ -61,18 +61,18 @@ harvest_yoda() {
       echo "Skipping harvesting Yoda, no value for Yoda set in ricgraph.ini file."
       echo "This is to be expected if your organization does not use the Yoda data repository."
       echo "Done with harvesting."
-      exit 0
+      return 0
     fi
   else
     # The key does not exist.
     echo "Skipping harvesting Yoda, key for Yoda in ricgraph.ini file does not exist."
     echo "This is to be expected if your organization does not use the Yoda data repository."
     echo "Done with harvesting."
-    exit 0
+    return 0
   fi
 
   echo "Harvesting Yoda for organization '$organization'."
-  PYTHONPATH=$python_path $python_cmd harvest_yoda_datacite_to_ricgraph.py --empty_ricgraph no --organization "$organization"
+  PYTHONPATH=$python_path $python_cmd harvest_yoda_datacite_to_ricgraph.py --write_snapshot no --empty_ricgraph no --organization "$organization"
   exit_code=$?
   if [ "$exit_code" = "0" ] ; then
     echo "Done with harvesting Yoda-$organization."
@@ -84,6 +84,18 @@ harvest_yoda() {
 }
 
 
+write_snapshot() {
+  # The harvest scripts have not written a Ricgraph snapshot, write it once for all sources.
+  PYTHONPATH=$python_path $python_cmd ../harvest_multiple_sources/write_ricgraph_snapshot.py
+  exit_code=$?
+  if [ "$exit_code" != "0" ] ; then
+    echo "--> $0: error while writing the Ricgraph snapshot, status: '$exit_code'."
+    exit $exit_code
+  fi
+  echo ""
+}
+
+
 echo "This script harvests the Research Software Directory and Yoda"
 echo "for Utrecht University."
 
@@ -98,4 +110,6 @@ harvest_rsd
 
 harvest_yoda
 
+write_snapshot
+
 echo "Done with harvesting."
@@ -23,7 +23,7 @@
 #   ./multiple_harvest_open_ricgraph_demo_server.sh
 #
 # Original version Rik D.T. Janssen, June 2025.
-# Updated Rik D.T. Janssen, February, April 2026.
+# Updated Rik D.T. Janssen, February, April, October 2026.
 #
 # ########################################################################
 
@@ -109,30 +109,15 @@ fi
 
 echo "$0 start at $(date)."
 
-./multiple_harvest_organization.sh --organization DUT --empty_ricgraph yes --year_first $year_first --year_last $year_last
-exit_on_error $?
-
-graphdb_backup=$graphdb_backup_dir/graphdb_backup-dut-$(date +%y%m%d-%H%M)
-sudo make -f ../Makefile graphdb_backup_dir="$graphdb_backup" ask_are_you_sure=no dump_graphdb_neo4j_community
-exit_on_error $?
-# Make sure neo4j is up and running.
-sleep 120
-
-./multiple_harvest_organization.sh --organization AUMC --empty_ricgraph no --year_first $year_first --year_last $year_last
+# Harvest DUT, AUMC and VUA in one pass.
+source ../library/get_cmdline_args.sh --organization DUT,AUMC,VUA --year_first $year_first --year_last $year_last
+PYTHONPATH=$python_path $python_cmd multiple_harvest_organization.py --organization "$organization" --empty_ricgraph yes --year_first $year_first --year_last $year_last
 exit_on_error $?
 
 # AUMC is twice in RSD, harvest the other one (the first one has already been harvested above).
 source ../library/get_cmdline_args.sh  --organization AUM2;  PYTHONPATH=$python_path $python_cmd ../harvest/harvest_rsd_to_ricgraph.py --empty_ricgraph no --organization "$organization"
 exit_on_error $?
 
-graphdb_backup=$graphdb_backup_dir/graphdb_backup-dut+aumc-$(date +%y%m%d-%H%M)
-sudo make -f ../Makefile graphdb_backup_dir="$graphdb_backup" ask_are_you_sure=no dump_graphdb_neo4j_community
-exit_on_error $?
-sleep 120
-
-./multiple_harvest_organization.sh --organization VUA --empty_ricgraph no --year_first $year_first --year_last $year_last
-exit_on_error $?
-
 graphdb_backup=$graphdb_backup_dir/graphdb_backup-dut+aumc+vua-$(date +%y%m%d-%H%M)
 sudo make -f ../Makefile graphdb_backup_dir="$graphdb_backup" ask_are_you_sure=no dump_graphdb_neo4j_community
 exit_on_error $?
@@ -208,6 +193,7 @@ mv ./*.log "$data_collect_dir"
 # The logfiles of the second RSD harvest for AUMC
 mv ./*.csv ./*.json "$harvest_result_dir"
 cd ../harvest || exit 1
+mv ./*.log "$data_collect_dir"
 mv ./*.xml ./*.csv ./*.json "$harvest_result_dir"
 tar -czf "$data_collect_dir.tar.gz" "$data_collect_dir"
 
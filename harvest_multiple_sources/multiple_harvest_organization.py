@@ -0,0 +1,265 @@
+# ########################################################################
+#
+# Ricgraph - Research in context graph
+#
+# ########################################################################
+#
+# MIT License
+#
+# Copyright (c) 2026 Rik D.T. Janssen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# ########################################################################
+#
+# This Python script is a wrapper around the Ricgraph harvest scripts.
+# It harvests the same sources as multiple_harvest_organization.sh:
+# - Pure, OpenAlex, and Research Software Directory;
+# - Yoda (but only if there is a set name for Yoda in ricgraph.ini);
+# - UU staff pages (but only if organization is UU and you have
+#   the correct settings in ricgraph.ini).
+#
+# Contrary to multiple_harvest_organization.sh, the harvest is done in two phases:
+# 1. The 'fetch' phase: all sources are fetched and parsed at the same time,
+#    each in its own process. The results are written to file. Ricgraph is
+#    not changed. The output of every source is written to a log file.
+# 2. The 'insert' phase: the results written to file are inserted in Ricgraph,
+#    one source after the other, in the same order as in
+#    multiple_harvest_organization.sh.
+# Since fetching a source is mostly waiting for its REST API, this takes much
+# less time than harvesting the sources one after the other.
+# The UU staff pages are not fetched in the 'fetch' phase, since that
+# harvest needs the persons from Pure-UU in Ricgraph. It is harvested
+# completely in the 'insert' phase, after Pure.
+#
+# You can run this script as follows:
+# - In directory .../ricgraph:
+#   make run_python_script python_script=harvest_multiple_sources/multiple_harvest_organization.py \
+#    cmd_args="--organization UU --empty_ricgraph yes --year_first 2020 --year_last 2026"
+# - In directory .../ricgraph/harvest_multiple_sources:
+#   PYTHONPATH=.. python multiple_harvest_organization.py --organization UU \
+#    --empty_ricgraph yes --year_first 2020 --year_last 2026
+#
+# Original version Rik D.T. Janssen, October 2026.
+#
+# ########################################################################
+#
+# Usage
+# multiple_harvest_organization.py [options]
+#
+# Options:
+#   --organization <organization abbreviation>
+#           Harvest data from organization <organization abbreviation>.
+#           More than one organization can be given, separated by a comma
+#           (e.g. 'DUT,AUMC,VUA'). Then Pure, Research Software Directory,
+#           Yoda and UU staff pages are harvested for every organization,
+#           and OpenAlex is harvested once for all organizations, in one run.
+#           Persons and research results get the OpenAlex source of every
+#           organization they have been found for.
+#           If this option is not present, the script will prompt the user
+#           what to do.
+#   --empty_ricgraph <yes|no>
+#           'yes': Ricgraph will be emptied before inserting the first source.
+#           'no': Ricgraph will not be emptied.
+#           If this option is not present, the script will prompt the user
+#           what to do.
+#   --year_first <first year of harvest>
+#           Start the harvest from this year on.
+#   --year_last <last year of harvest>
+#           End the harvest at this year.
+#   --max_nr_fetches <number>
+#           The maximum number of sources that are fetched at the same time.
+#           If this option is not present, all sources are fetched at the same time.
+#
+# ########################################################################
+
+
+import os
+import sys
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+import ricgraph as rcg
+
+
+# The directory with the harvest scripts, relative to this script.
+HARVEST_DIRECTORY = '../harvest'
+
+
+def get_harvest_sources(organizations: list, empty_ricgraph: str,
+                        year_first: str, year_last: str) -> list:
+    """Get the sources to harvest, in the order in which they are inserted
+    in Ricgraph.
+
+    :param organizations: the list of organization abbreviations.
+    :param empty_ricgraph: whether to empty Ricgraph before inserting the first source.
+    :param year_first: the first year of the harvest.
+    :param year_last: the last year of the harvest.
+    :return: a list of dicts, one for every source. 'fetch' is True if the
+      source can be fetched in the 'fetch' phase.
+    """
+    year_arguments = ['--year_first', year_first, '--year_last', year_last]
+    sources = []
+    for organization in organizations:
+        sources.append({'name': 'Pure-' + organization,
+                        'script': 'harvest_pure_to_ricgraph.py',
+                        'arguments': ['--organization', organization, '--harvest_projects', 'no'] + year_arguments,
+                        'fetch': True})
+        if organization == 'UU':
+            sources.append({'name': 'UU staff pages',
+                            'script': 'harvest_uustaffpages_to_ricgraph.py',
+                            'arguments': [],
+                            'fetch': False})
+        sources.append({'name': 'Research Software Directory-' + organization,
+                        'script': 'harvest_rsd_to_ricgraph.py',
+                        'arguments': ['--organization', organization],
+                        'fetch': True})
+        if rcg.get_configfile_key(section='Yoda_harvesting', key='yoda_set_' + organization) != '':
+            sources.append({'name': 'Yoda-' + organization,
+                            'script': 'harvest_yoda_datacite_to_ricgraph.py',
+                            'arguments': ['--organization', organization],
+                            'fetch': True})
+        else:
+            print('Skipping harvesting Yoda-' + organization + ', no value for Yoda set in ricgraph.ini file.')
+            print('This is to be expected if your organization does not use the Yoda data repository.')
+    # OpenAlex is harvested once for all organizations, in one run.
+    sources.append({'name': 'OpenAlex-' + '+'.join(organizations),
+                    'script': 'harvest_openalex_to_ricgraph.py',
+                    'arguments': ['--organization', ','.join(organizations)] + year_arguments,
+                    'fetch': True})
+
+    # Only the first source to insert may empty Ricgraph.
+    # The Ricgraph snapshot is written once, after the last source.
+    for index, source in enumerate(sources):
+        if index == 0:
+            source['arguments'] += ['--empty_ricgraph', empty_ricgraph]
+        else:
+            source['arguments'] += ['--empty_ricgraph', 'no']
+        source['arguments'] += ['--write_snapshot', 'no']
+    return sources
+
+
+def fetch_source(source: dict) -> int:
+    """Run the 'fetch' phase of a source. The output is written to a log file.
+
+    :param source: the source, see get_harvest_sources().
+    :return: the exit code of the harvest script.
+    """
+    # The name of a source ends with the organization(s), e.g. 'Pure-UU'.
+    log_filename = os.path.splitext(source['script'])[0] + '_' + source['name'].rsplit('-', 1)[-1]
+    log_filename += '_fetch_' + rcg.datestamp() + '.log'
+    print('Fetching ' + source['name'] + ' at ' + rcg.timestamp()
+          + ', output in file ' + os.path.join(HARVEST_DIRECTORY, log_filename) + '.')
+    with open(os.path.join(HARVEST_DIRECTORY, log_filename), 'w') as log_file:
+        process = subprocess.run([sys.executable, source['script']]
+                                 + source['arguments'] + ['--phase', 'fetch'],
+                                 cwd=HARVEST_DIRECTORY,
+                                 stdin=subprocess.DEVNULL,
+                                 stdout=log_file,
+                                 stderr=subprocess.STDOUT)
+    if process.returncode == 0:
+        print('Done with fetching ' + source['name'] + ' at ' + rcg.timestamp() + '.')
+    else:
+        print('--> Error while fetching ' + source['name'] + ', status: '
+              + str(process.returncode) + ', see file ' + log_filename + '.')
+    return process.returncode
+
+
+def insert_source(source: dict) -> int:
+    """Run the 'insert' phase of a source, or the complete harvest
+    if the source has not been fetched in the 'fetch' phase.
+
+    :param source: the source, see get_harvest_sources().
+    :return: the exit code of the harvest script.
+    """
+    if source['fetch']:
+        print('\nInserting ' + source['name'] + ' at ' + rcg.timestamp() + '.', flush=True)
+        phase_arguments = ['--phase', 'insert']
+    else:
+        print('\nHarvesting ' + source['name'] + ' at ' + rcg.timestamp() + '.', flush=True)
+        phase_arguments = []
+    process = subprocess.run([sys.executable, source['script']]
+                             + source['arguments'] + phase_arguments,
+                             cwd=HARVEST_DIRECTORY,
+                             stdin=subprocess.DEVNULL)
+    if process.returncode == 0:
+        print('Done with ' + source['name'] + ' at ' + rcg.timestamp() + '.\n')
+    else:
+        print('--> Error while inserting ' + source['name'] + ', status: '
+              + str(process.returncode) + '.')
+    return process.returncode
+
+
+# ############################################
+# ################### main ###################
+# ############################################
+rcg.print_commandline_arguments(argument_list=sys.argv)
+if len(organizations := rcg.get_commandline_argument_organizations(argument_list=sys.argv)) == 0:
+    print('Exiting.\n')
+    exit(1)
+empty_ricgraph = rcg.get_commandline_argument_empty_ricgraph(argument_list=sys.argv)
+if empty_ricgraph == '':
+    print('Exiting.\n')
+    exit(1)
+year_first, year_last = rcg.get_commandline_argument_year_first_last(argument_list=sys.argv)
+if year_first == '' or year_last == '':
+    print('Exiting.\n')
+    exit(1)
+max_nr_fetches = rcg.get_commandline_argument(argument='--max_nr_fetches',
+                                              argument_list=sys.argv)
+if max_nr_fetches != '' and not max_nr_fetches.isdigit():
+    print('Invalid value "' + max_nr_fetches + '" for option "--max_nr_fetches", exiting.\n')
+    exit(1)
+
+# Make sure the harvest scripts find the ricgraph package, also if this
+# script has not been started with PYTHONPATH set.
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+os.environ['PYTHONPATH'] = os.pathsep.join([os.path.abspath('..')]
+                                           + [item for item in [os.environ.get('PYTHONPATH', '')] if item != ''])
+
+harvest_sources = get_harvest_sources(organizations=organizations,
+                                      empty_ricgraph=empty_ricgraph,
+                                      year_first=year_first,
+                                      year_last=year_last)
+fetch_sources = [source for source in harvest_sources if source['fetch']]
+if max_nr_fetches == '' or int(max_nr_fetches) == 0:
+    max_nr_fetches = len(fetch_sources)
+else:
+    max_nr_fetches = int(max_nr_fetches)
+
+print('\nPhase "fetch": fetching ' + str(len(fetch_sources)) + ' sources, at most '
+      + str(max_nr_fetches) + ' at the same time, at ' + rcg.timestamp() + '.')
+with ThreadPoolExecutor(max_workers=max_nr_fetches) as executor:
+    exit_codes = list(executor.map(fetch_source, fetch_sources))
+if any(exit_code != 0 for exit_code in exit_codes):
+    print('\nError while fetching one or more sources, Ricgraph has not been changed, exiting.\n')
+    exit(1)
+print('Done with phase "fetch" at ' + rcg.timestamp() + '.')
+
+print('\nPhase "insert": inserting ' + str(len(harvest_sources)) + ' sources at ' + rcg.timestamp() + '.')
+for harvest_source in harvest_sources:
+    exit_code = insert_source(source=harvest_source)
+    if exit_code != 0:
+        exit(exit_code)
+
+# The harvest scripts have not written a Ricgraph snapshot, write it once for all sources.
+rcg.open_ricgraph()
+rcg.write_ricgraph_snapshot()
+rcg.close_ricgraph()
+
+print('Done with harvesting at ' + rcg.timestamp() + '.')
@@ -39,7 +39,7 @@
 harvest_pure() {
   echo "Harvesting Pure for organization '$organization', first year: '$year_first', last year: '$year_last'."
   echo "Emptying Ricgraph: '$empty_ricgraph'."
-  PYTHONPATH=$python_path $python_cmd harvest_pure_to_ricgraph.py --empty_ricgraph "$empty_ricgraph" --organization "$organization" --harvest_projects no --year_first "$year_first" --year_last "$year_last"
+  PYTHONPATH=$python_path $python_cmd harvest_pure_to_ricgraph.py --write_snapshot no --empty_ricgraph "$empty_ricgraph" --organization "$organization" --harvest_projects no --year_first "$year_first" --year_last "$year_last"
   exit_code=$?
   if [ "$exit_code" = "0" ] ; then
     echo "Done with harvesting Pure-$organization."
@@ -53,7 +53,7 @@ harvest_pure() {
 
 harvest_openalex() {
   echo "Harvesting OpenAlex for organization '$organization', first year: '$year_first', last year: '$year_last'."
-  PYTHONPATH=$python_path $python_cmd harvest_openalex_to_ricgraph.py --empty_ricgraph no --organization "$organization" --year_first "$year_first" --year_last "$year_last"
+  PYTHONPATH=$python_path $python_cmd harvest_openalex_to_ricgraph.py --write_snapshot no --empty_ricgraph no --organization "$organization" --year_first "$year_first" --year_last "$year_last"
   exit_code=$?
   if [ "$exit_code" = "0" ] ; then
     echo "Done with harvesting OpenAlex-$organization."
@@ -67,7 +67,7 @@ harvest_openalex() {
 
 harvest_rsd () {
   echo "Harvesting Research Software Directory for organization '$organization'."
-  PYTHONPATH=$python_path $python_cmd harvest_rsd_to_ricgraph.py --empty_ricgraph no --organization "$organization"
+  PYTHONPATH=$python_path $python_cmd harvest_rsd_to_ricgraph.py --write_snapshot no --empty_ricgraph no --organization "$organization"
   exit_code=$?
   if [ "$exit_code" = "0" ] ; then
     echo "Done with harvesting Research Software Directory-$organization."
@@ -104,7 +104,7 @@ harvest_yoda() {
   fi
 
   echo "Harvesting Yoda for organization '$organization'."
-  PYTHONPATH=$python_path $python_cmd harvest_yoda_datacite_to_ricgraph.py --empty_ricgraph no --organization "$organization"
+  PYTHONPATH=$python_path $python_cmd harvest_yoda_datacite_to_ricgraph.py --write_snapshot no --empty_ricgraph no --organization "$organization"
   exit_code=$?
   if [ "$exit_code" = "0" ] ; then
     echo "Done with harvesting Yoda-$organization."
@@ -118,7 +118,7 @@ harvest_yoda() {
 
 harvest_uustaffpages() {
   echo "Harvesting UU staff pages."
-  PYTHONPATH=$python_path $python_cmd harvest_uustaffpages_to_ricgraph.py --empty_ricgraph no
+  PYTHONPATH=$python_path $python_cmd harvest_uustaffpages_to_ricgraph.py --write_snapshot no --empty_ricgraph no
   exit_code=$?
   if [ "$exit_code" = "0" ] ; then
     echo "Done with harvesting UU staff pages."
@@ -130,6 +130,18 @@ harvest_uustaffpages() {
 }
 
 
+write_snapshot() {
+  # The harvest scripts have not written a Ricgraph snapshot, write it once for all sources.
+  PYTHONPATH=$python_path $python_cmd ../harvest_multiple_sources/write_ricgraph_snapshot.py
+  exit_code=$?
+  if [ "$exit_code" != "0" ] ; then
+    echo "--> $0: error while writing the Ricgraph snapshot, status: '$exit_code'."
+    exit $exit_code
+  fi
+  echo ""
+}
+
+
 echo "This script harvests Pure, OpenAlex, and the Research Software Directory."
 echo "It also harvests Yoda if your organization uses it,"
 echo "and UU staff pages if your organization is UU."
@@ -152,4 +164,6 @@ harvest_yoda
 
 harvest_openalex
 
+write_snapshot
+
 echo "Done with harvesting."
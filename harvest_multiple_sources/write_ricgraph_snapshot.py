@@ -0,0 +1,57 @@
+# ########################################################################
+#
+# Ricgraph - Research in context graph
+#
+# ########################################################################
+#
+# MIT License
+#
+# Copyright (c) 2026 Rik D.T. Janssen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# ########################################################################
+#
+# This script writes a Ricgraph snapshot, see write_ricgraph_snapshot()
+# in ricgraph_snapshot.py. It is meant to be run once at the end of a
+# chain of harvest or enhance scripts that have been started with
+# '--write_snapshot no', so that the (slow) full scan of Ricgraph for the
+# snapshot is done only once.
+#
+# You can run this script as follows:
+# - In directory .../ricgraph:
+#   make run_python_script python_script=harvest_multiple_sources/write_ricgraph_snapshot.py
+# - In directory .../ricgraph/harvest_multiple_sources:
+#   PYTHONPATH=.. python write_ricgraph_snapshot.py
+#
+# Original version Rik D.T. Janssen, October 2026.
+#
+# ########################################################################
+
+
+import ricgraph as rcg
+
+
+# ############################################
+# ################### main ###################
+# ############################################
+print('\nPreparing graph...')
+rcg.open_ricgraph()
+rcg.write_ricgraph_snapshot()
+rcg.close_ricgraph()
@@ -179,4 +179,6 @@ print(result)
 rcg.create_nodepairs_and_edges_df(left_and_right_nodepairs=result)
 print('\nDone at ' + rcg.timestamp() + '.\n')
 
+rcg.write_ricgraph_snapshot()
+rcg.querystats_print()
 rcg.close_ricgraph()
@@ -38,13 +38,20 @@
 # not consistent with the Ricgraph model. Due to this, Ricgraph Explorer
 # may not work as expected.
 #
-# If you export a large number of nodes or edges, this script may crash due
-# to shortage of memory. In that case, you may want to set the limit
-# MAX_NR_ITEMS_TO_EXPORT.
+# Nodes and edges are read from the graph database backend in chunks of
+# EXPORT_CHUNK_SIZE nodes, ordered on property '_key' (keyset pagination),
+# and every chunk is written as soon as it has been read. Therefore,
+# the memory used does not depend on the size of Ricgraph.
+# Nodes without property '_key' (these should not exist, but they might
+# after e.g. an import) are exported after that, ordered on their
+# element id.
+# The export can be written as csv file (optionally compressed), or as
+# Parquet file. For Parquet, package 'pyarrow' needs to be installed.
 #
 # This script forms a pair with ricgraph_import_raw_from_csv.py.
 #
 # Original version Rik D.T. Janssen, October 2024.
+# Updated Rik D.T. Janssen, October 2026.
 #
 # ########################################################################
 #
@@ -55,19 +62,111 @@
 #   --filename <filename>
 #           Export all nodes and edges in Ricgraph
 #           to a csv file starting with <filename>.
+#   --format <csv|parquet>
+#           The format of the export files, default 'csv'.
+#   --compression <compression>
+#           The compression of the export files.
+#           For csv: 'none' (default), 'gzip', 'bz2', or 'xz'.
+#           For parquet: 'none', 'snappy' (default), 'gzip', 'zstd', or 'brotli'.
 #
 # ########################################################################
 
 import sys
+import gzip
+import bz2
+import lzma
 import pandas
 import ricgraph as rcg
 
 
 MAX_NR_ITEMS_TO_EXPORT = 0               # 0 = all records
+EXPORT_CHUNK_SIZE = 50000                # The number of nodes read in one chunk.
 
 # Extension of nodes and edges filename.
-FILENAME_NODES_EXTENSION = '-nodes.csv'
-FILENAME_EDGES_EXTENSION = '-edges.csv'
+FILENAME_NODES_EXTENSION = '-nodes'
+FILENAME_EDGES_EXTENSION = '-edges'
+EXPORT_FORMATS = ['csv', 'parquet']
+EXPORT_COMPRESSIONS = {'csv': {'none': '', 'gzip': '.gz', 'bz2': '.bz2', 'xz': '.xz'},
+                       'parquet': {'none': '', 'snappy': '', 'gzip': '',
+                                   'zstd': '', 'brotli': ''}}
+EXPORT_COMPRESSION_DEFAULT = {'csv': 'none', 'parquet': 'snappy'}
+
+
+class ChunkWriter:
+    """Write a DataFrame to a file in chunks, as csv (optionally
+    compressed) or as Parquet file. The first chunk determines the columns.
+    """
+    def __init__(self, filename: str, export_format: str, compression: str):
+        self.filename = filename
+        self.export_format = export_format
+        self.compression = compression
+        self.nr_rows = 0
+        self._fd = None
+        self._parquet_writer = None
+        self._columns = None
+
+    def write(self, df: pandas.DataFrame) -> None:
+        """Write a chunk.
+
+        :param df: the chunk.
+        :return: None.
+        """
+        if df.empty:
+            return
+        if self._columns is None:
+            self._columns = list(df.columns)
+        df = df.reindex(columns=self._columns)
+        if self.export_format == 'parquet':
+            # Lists (e.g. in property '_history') are written as their string
+            # representation, as in a csv file, so that every column is a string.
+            df = df.map(lambda cell: str(cell) if isinstance(cell, list) else cell)
+            table = pyarrow.Table.from_pandas(df=df,
+                                              schema=pyarrow.schema([(column, pyarrow.string())
+                                                                     for column in self._columns]),
+                                              preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pyarrow.parquet.ParquetWriter(where=self.filename,
+                                                                     schema=table.schema,
+                                                                     compression=self.compression)
+            self._parquet_writer.write_table(table=table)
+        else:
+            if self._fd is None:
+                if self.compression == 'gzip':
+                    self._fd = gzip.open(self.filename, 'wt', newline='')
+                elif self.compression == 'bz2':
+                    self._fd = bz2.open(self.filename, 'wt', newline='')
+                elif self.compression == 'xz':
+                    self._fd = lzma.open(self.filename, 'wt', newline='')
+                else:
+                    self._fd = open(self.filename, 'w', newline='')
+                header = True
+            else:
+                header = False
+            df.to_csv(self._fd, index=False, header=header)
+        self.nr_rows += len(df)
+        return
+
+    def close(self) -> None:
+        """Close the file.
+
+        :return: None.
+        """
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        if self._fd is not None:
+            self._fd.close()
+        return
+
+
+def print_progress(count: int, nr_items: int) -> None:
+    """Print the progress of the export.
+
+    :param count: the number of items exported.
+    :param nr_items: the total number of items.
+    :return: None.
+    """
+    print('Exported ' + str(count) + ' of ' + str(nr_items) + ' at ' + rcg.timestamp() + '.', flush=True)
+    return
 
 
 # ############################################
@@ -83,8 +182,35 @@ if filename == '':
     print('Exiting.\n')
     exit(1)
 
-filename_nodes = filename + FILENAME_NODES_EXTENSION
-filename_edges = filename + FILENAME_EDGES_EXTENSION
+export_format = rcg.get_commandline_argument(argument='--format',
+                                             argument_list=sys.argv)
+if export_format == '':
+    export_format = 'csv'
+if export_format not in EXPORT_FORMATS:
+    print('Error: unknown format "' + export_format + '", use one of: '
+          + ', '.join(EXPORT_FORMATS) + '. Exiting.\n')
+    exit(1)
+compression = rcg.get_commandline_argument(argument='--compression',
+                                           argument_list=sys.argv)
+if compression == '':
+    compression = EXPORT_COMPRESSION_DEFAULT[export_format]
+if compression not in EXPORT_COMPRESSIONS[export_format]:
+    print('Error: unknown compression "' + compression + '" for format "' + export_format
+          + '", use one of: ' + ', '.join(EXPORT_COMPRESSIONS[export_format]) + '. Exiting.\n')
+    exit(1)
+if export_format == 'parquet':
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        print('Error: for format "parquet" you need to install package "pyarrow". Exiting.\n')
+        exit(1)
+    if compression == 'none':
+        compression = None
+
+filename_extension = '.' + export_format + EXPORT_COMPRESSIONS[export_format].get(compression, '')
+filename_nodes = filename + FILENAME_NODES_EXTENSION + filename_extension
+filename_edges = filename + FILENAME_EDGES_EXTENSION + filename_extension
 print('Filename used for nodes: "' + filename_nodes + '", for edges: "'
       + filename_edges + '".')
 
@@ -94,8 +220,11 @@ graph = rcg.open_ricgraph()
 nr_nodes = rcg.ricgraph_nr_nodes()
 nr_edges = rcg.ricgraph_nr_edges()
 print('\nThere are ' + str(nr_nodes) + ' nodes and ' + str(nr_edges) + ' edges.')
-print('If you export a large number of nodes or edges, this script may crash due to')
-print('shortage of memory. In that case, you may want to set a limit in this script.\n')
+
+if MAX_NR_ITEMS_TO_EXPORT == 0:
+    max_items = rcg.A_LARGE_NUMBER
+else:
+    max_items = MAX_NR_ITEMS_TO_EXPORT
 
 # ### Start with exporting nodes.
 all_properties = rcg.get_ricgraph_properties_standard() \
@@ -103,47 +232,92 @@ all_properties = rcg.get_ricgraph_properties_standard() \
                  + rcg.get_ricgraph_properties_hidden()
 as_phrase = ', '.join(str('node.' + prop + ' AS ' + prop) for prop in all_properties)
 
-# Construct Cypher query to get all nodes.
-if int(MAX_NR_ITEMS_TO_EXPORT) > 0:
-    print('Getting properties for ' + str(MAX_NR_ITEMS_TO_EXPORT) + ' nodes...\n')
+# Nodes are exported in two passes. First all nodes with property '_key',
+# ordered on '_key', which uses the index on '_key'. Then all nodes without
+# '_key', ordered on their element id. The element id is not indexed, but
+# there should be none or only a few of these nodes.
+# Memgraph does not have elementId() but only id(), see ricgraph_cypher.py.
+if rcg.ricgraph_database() == 'neo4j':
+    node_element_id = 'elementId(node)'
+    first_element_id = ''
 else:
-    print('Getting properties for ' + str(nr_nodes) + ' nodes...\n')
-cypher_query = 'MATCH (node:RicgraphNode) '
-cypher_query += 'RETURN '
-cypher_query += as_phrase
-if int(MAX_NR_ITEMS_TO_EXPORT) > 0:
-    cypher_query += ' LIMIT ' + str(MAX_NR_ITEMS_TO_EXPORT)
-# print (cypher_query)
-result_nodes, _, _ = graph.execute_query(query_=cypher_query,
-                                         database_=rcg.ricgraph_databasename())
-data_nodes = [record.data() for record in result_nodes]  # Extract data from records.
-df_nodes = pandas.DataFrame(data_nodes)                  # Create Dataframe.
-print(df_nodes)
-rcg.write_dataframe_to_csv(filename=filename_nodes, df=df_nodes)
-print('Done.\n')
+    node_element_id = 'id(node)'
+    first_element_id = -1
+export_passes = [{'where': '', 'page_key': 'node._key', 'first_page_key': ''},
+                 {'where': 'node._key IS NULL AND ', 'page_key': node_element_id,
+                  'first_page_key': first_element_id}]
+
+# Construct Cypher query to get a chunk of nodes, starting after the
+# node with page key equal to $last_page_key.
+print('Exporting ' + str(min(nr_nodes, max_items)) + ' nodes in chunks of '
+      + str(EXPORT_CHUNK_SIZE) + ' nodes at ' + rcg.timestamp() + '...')
+writer = ChunkWriter(filename=filename_nodes, export_format=export_format, compression=compression)
+for export_pass in export_passes:
+    cypher_query = 'MATCH (node:RicgraphNode) '
+    cypher_query += 'WHERE ' + export_pass['where'] + export_pass['page_key'] + ' > $last_page_key '
+    cypher_query += 'RETURN '
+    cypher_query += as_phrase + ', '
+    cypher_query += export_pass['page_key'] + ' AS page_key '
+    cypher_query += 'ORDER BY page_key '
+    cypher_query += 'LIMIT $chunk_size'
+    # print (cypher_query)
+    last_page_key = export_pass['first_page_key']
+    while writer.nr_rows < max_items:
+        chunk_size = min(EXPORT_CHUNK_SIZE, max_items - writer.nr_rows)
+        result_nodes, _, _ = rcg.cypher_execute_query(graph=graph,
+                                                      query_=cypher_query,
+                                                      last_page_key=last_page_key,
+                                                      chunk_size=chunk_size,
+                                                      database_=rcg.ricgraph_databasename())
+        if len(result_nodes) == 0:
+            break
+        data_nodes = [record.data() for record in result_nodes]  # Extract data from records.
+        last_page_key = data_nodes[-1]['page_key']
+        writer.write(df=pandas.DataFrame(data_nodes, columns=all_properties))
+        print_progress(count=writer.nr_rows, nr_items=nr_nodes)
+writer.close()
+print('Done, exported ' + str(writer.nr_rows) + ' nodes.\n')
 
 # ### Then export edges.
-# Construct Cypher query to get all edges.
-if int(MAX_NR_ITEMS_TO_EXPORT) > 0:
-    print('Getting start and end nodes for ' + str(MAX_NR_ITEMS_TO_EXPORT) + ' edges...\n')
-else:
-    print('Getting start and end nodes for ' + str(nr_edges) + ' edges...\n')
-cypher_query = 'MATCH (node_from:RicgraphNode)-[]->(node_to:RicgraphNode) '
-cypher_query += 'RETURN '
-cypher_query += 'node_from.name AS name_from, '
-cypher_query += 'node_from.value AS value_from, '
-cypher_query += 'node_to.name AS name_to, '
-cypher_query += 'node_to.value AS value_to '
-if int(MAX_NR_ITEMS_TO_EXPORT) > 0:
-    cypher_query += ' LIMIT ' + str(MAX_NR_ITEMS_TO_EXPORT)
-# print (cypher_query)
-print('Getting start and end nodes for ' + str(nr_edges) + ' edges...\n')
-result_edges, _, _ = graph.execute_query(query_=cypher_query,
-                                         database_=rcg.ricgraph_databasename())
-data_edges = [record.data() for record in result_edges]  # Extract data from records.
-df_edges = pandas.DataFrame(data_edges)                  # Create Dataframe.
-print(df_edges)
-rcg.write_dataframe_to_csv(filename=filename_edges, df=df_edges)
-print('Done.\n')
+# Construct Cypher query to get the edges of a chunk of nodes, starting after
+# the node with page key equal to $last_page_key. The OPTIONAL MATCH makes
+# sure every node in the chunk is returned, also if it has no edges, so that
+# we know where the next chunk starts.
+print('Exporting ' + str(min(nr_edges, max_items)) + ' edges of chunks of '
+      + str(EXPORT_CHUNK_SIZE) + ' nodes at ' + rcg.timestamp() + '...')
+writer = ChunkWriter(filename=filename_edges, export_format=export_format, compression=compression)
+for export_pass in export_passes:
+    cypher_query = 'MATCH (node:RicgraphNode) '
+    cypher_query += 'WHERE ' + export_pass['where'] + export_pass['page_key'] + ' > $last_page_key '
+    cypher_query += 'WITH node, ' + export_pass['page_key'] + ' AS page_key '
+    cypher_query += 'ORDER BY page_key LIMIT $chunk_size '
+    cypher_query += 'OPTIONAL MATCH (node)-[]->(node_to:RicgraphNode) '
+    cypher_query += 'RETURN '
+    cypher_query += 'page_key, '
+    cypher_query += 'node.name AS name_from, '
+    cypher_query += 'node.value AS value_from, '
+    cypher_query += 'node_to.name AS name_to, '
+    cypher_query += 'node_to.value AS value_to '
+    # print (cypher_query)
+    last_page_key = export_pass['first_page_key']
+    while writer.nr_rows < max_items:
+        result_edges, _, _ = rcg.cypher_execute_query(graph=graph,
+                                                      query_=cypher_query,
+                                                      last_page_key=last_page_key,
+                                                      chunk_size=EXPORT_CHUNK_SIZE,
+                                                      database_=rcg.ricgraph_databasename())
+        if len(result_edges) == 0:
+            break
+        data_edges = [record.data() for record in result_edges]  # Extract data from records.
+        last_page_key = max(edge['page_key'] for edge in data_edges)
+        df_edges = pandas.DataFrame(data_edges,
+                                    columns=['page_key', 'name_from', 'value_from', 'name_to', 'value_to'])
+        df_edges = df_edges[df_edges['name_to'].notna()]
+        df_edges = df_edges.drop(columns=['page_key']).head(max_items - writer.nr_rows)
+        writer.write(df=df_edges)
+        print_progress(count=writer.nr_rows, nr_items=nr_edges)
+writer.close()
+print('Done, exported ' + str(writer.nr_rows) + ' edges.\n')
 
+rcg.querystats_print()
 rcg.close_ricgraph()
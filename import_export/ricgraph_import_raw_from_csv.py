@@ -38,13 +38,19 @@
 # not consistent with the Ricgraph model. Due to this, Ricgraph Explorer
 # may not work as expected.
 #
-# If you import a large number of nodes or edges, this script may crash due
-# to shortage of memory. In that case, you may want to set the limit
-# MAX_NR_ITEMS_TO_IMPORT.
+# The files are read in chunks of IMPORT_CHUNK_SIZE rows, and every chunk
+# is imported with one Cypher query using UNWIND, in one transaction.
+# After every chunk, the number of chunks imported is written to a
+# checkpoint file. If the import is interrupted, it can be resumed with
+# option '--resume yes', it will then continue after the last chunk imported.
+# The files can be csv files (optionally compressed), or Parquet files as
+# written by ricgraph_export_raw_to_csv.py. For Parquet, package 'pyarrow'
+# needs to be installed.
 #
 # This script forms a pair with ricgraph_export_raw_to_csv.py.
 #
 # Original version Rik D.T. Janssen, October 2024.
+# Updated Rik D.T. Janssen, October 2026.
 #
 # ########################################################################
 #
@@ -57,23 +63,33 @@
 #           'no': Ricgraph will not be emptied before importing.
 #           If this option is not present, the script will prompt the user
 #           what to do.
+#           This option is not used if '--resume yes' is given.
 #   --filename <filename>
 #           Import nodes and edges from a csv file starting with <filename>.
+#   --resume <yes|no>
+#           'yes': resume an interrupted import, using the checkpoint file.
+#           'no' (default): start the import from the beginning.
 #
 # ########################################################################
 
 import os.path
 import sys
-import numpy
+import json
+import pandas
 import ricgraph as rcg
 import ast
+from typing import Tuple
 
 
 MAX_NR_ITEMS_TO_IMPORT = 0               # 0 = all records
+IMPORT_CHUNK_SIZE = 10000                # The number of rows imported in one transaction.
 
 # Extension of nodes and edges filename.
-FILENAME_NODES_EXTENSION = '-nodes.csv'
-FILENAME_EDGES_EXTENSION = '-edges.csv'
+FILENAME_NODES_EXTENSION = '-nodes'
+FILENAME_EDGES_EXTENSION = '-edges'
+# Possible file extensions, in the order in which they are tried.
+FILENAME_EXTENSIONS = ['.csv', '.csv.gz', '.csv.bz2', '.csv.xz', '.parquet']
+FILENAME_CHECKPOINT_EXTENSION = '-import-checkpoint.json'
 
 
 def convert_string_to_list(cell):
@@ -91,6 +107,166 @@ def convert_string_to_list(cell):
     return cell
 
 
+def find_import_file(filename_start: str) -> str:
+    """Find the file to import, it may have any of the extensions
+    in FILENAME_EXTENSIONS.
+
+    :param filename_start: the filename without extension.
+    :return: the filename, or '' if not found.
+    """
+    for extension in FILENAME_EXTENSIONS:
+        if os.path.isfile(path=filename_start + extension):
+            return filename_start + extension
+    return ''
+
+
+def read_chunks(filename: str):
+    """Read a csv or Parquet file in chunks of IMPORT_CHUNK_SIZE rows.
+    All values are read as string (i.e., also the year which might otherwise be
+    read as an int).
+
+    :param filename: the file to read.
+    :return: a generator of DataFrames.
+    """
+    if filename.endswith('.parquet'):
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            print('Error: for file "' + filename + '" you need to install package "pyarrow". Exiting.\n')
+            exit(1)
+        parquet_file = pyarrow.parquet.ParquetFile(source=filename)
+        for batch in parquet_file.iter_batches(batch_size=IMPORT_CHUNK_SIZE):
+            # The Parquet files written by ricgraph_export_raw_to_csv.py only have string columns.
+            yield batch.to_pandas()
+        return
+    # Compression is inferred from the extension of the filename.
+    for chunk in pandas.read_csv(filename,
+                                 sep=',',
+                                 dtype=str,
+                                 keep_default_na=False,
+                                 quotechar='"',
+                                 chunksize=IMPORT_CHUNK_SIZE):
+        yield chunk
+    return
+
+
+def read_checkpoint(filename: str) -> dict:
+    """Read the checkpoint file.
+
+    :param filename: the checkpoint file.
+    :return: the checkpoint, or a checkpoint to start from the beginning.
+    """
+    checkpoint = {'chunk_size': IMPORT_CHUNK_SIZE,
+                  'nr_node_chunks_done': 0,
+                  'nr_edge_chunks_done': 0}
+    if not os.path.isfile(path=filename):
+        return checkpoint
+    try:
+        with open(filename) as fd:
+            checkpoint_read = json.load(fp=fd)
+    except (OSError, json.JSONDecodeError):
+        print('Error: could not read checkpoint file "' + filename + '", exiting.')
+        exit(1)
+    if checkpoint_read.get('chunk_size', 0) != IMPORT_CHUNK_SIZE:
+        print('Error: checkpoint file "' + filename + '" has been written with another')
+        print('IMPORT_CHUNK_SIZE, cannot resume, exiting.')
+        exit(1)
+    checkpoint.update(checkpoint_read)
+    return checkpoint
+
+
+def write_checkpoint(filename: str, checkpoint: dict) -> None:
+    """Write the checkpoint file.
+
+    :param filename: the checkpoint file.
+    :param checkpoint: the checkpoint.
+    :return: None.
+    """
+    temp_filename = filename + '.tmp'
+    with open(temp_filename, 'w') as fd:
+        json.dump(obj=checkpoint, fp=fd)
+    os.replace(temp_filename, filename)
+    return
+
+
+def import_chunks(filename: str, cypher_query: str, prepare_chunk,
+                  checkpoint_file: str, checkpoint: dict, checkpoint_item: str) -> Tuple[int, int]:
+    """Import a file in chunks. Every chunk is imported with one Cypher query,
+    with the rows in the chunk as parameter 'rows'. After every chunk the
+    checkpoint is written. Chunks that have been imported according to the
+    checkpoint are skipped.
+    If the Cypher query returns 'nr_rows_imported', the rows of a chunk
+    that have not been imported are counted.
+
+    :param filename: the file to import.
+    :param cypher_query: the Cypher query.
+    :param prepare_chunk: a function that converts a chunk DataFrame into a list of dicts.
+    :param checkpoint_file: the checkpoint file.
+    :param checkpoint: the checkpoint.
+    :param checkpoint_item: the item in the checkpoint that counts the chunks imported.
+    :return: the number of rows read, and the number of rows that have not been imported.
+    """
+    if MAX_NR_ITEMS_TO_IMPORT == 0:
+        max_items = rcg.A_LARGE_NUMBER
+    else:
+        max_items = MAX_NR_ITEMS_TO_IMPORT
+
+    count = 0
+    nr_not_imported = 0
+    for chunk_nr, chunk in enumerate(read_chunks(filename=filename)):
+        if count >= max_items:
+            break
+        chunk = chunk.head(max_items - count)
+        count += len(chunk)
+        if chunk_nr < checkpoint[checkpoint_item]:
+            continue
+        rows = prepare_chunk(chunk)
+        result, _, keys = rcg.cypher_execute_query(graph=graph,
+                                                   query_=cypher_query,
+                                                   rows=rows,
+                                                   database_=rcg.ricgraph_databasename())
+        if 'nr_rows_imported' in keys and len(result) > 0:
+            nr_not_imported += max(0, len(rows) - result[0]['nr_rows_imported'])
+        checkpoint[checkpoint_item] = chunk_nr + 1
+        write_checkpoint(filename=checkpoint_file, checkpoint=checkpoint)
+        print('Imported ' + str(count) + ' rows at ' + rcg.timestamp() + '.', flush=True)
+    return count, nr_not_imported
+
+
+def prepare_nodes_chunk(chunk: pandas.DataFrame) -> list:
+    """Convert a chunk of nodes to a list of dicts for the Cypher query.
+
+    :param chunk: the chunk.
+    :return: the list of dicts.
+    """
+    # Make sure every column we expect is in the chunk.
+    chunk = chunk.reindex(columns=all_properties)
+    # Cleanup.
+    chunk = chunk.fillna(value='')
+    chunk = chunk[(chunk != '').any(axis=1)]
+    chunk = chunk.drop_duplicates(keep='first', ignore_index=True)
+    chunk = chunk.map(convert_string_to_list)
+    return chunk.to_dict(orient='records')
+
+
+def prepare_edges_chunk(chunk: pandas.DataFrame) -> list:
+    """Convert a chunk of edges to a list of dicts for the Cypher query.
+
+    :param chunk: the chunk.
+    :return: the list of dicts.
+    """
+    chunk = chunk.fillna(value='')
+    chunk = chunk[(chunk != '').any(axis=1)]
+    chunk = chunk.drop_duplicates(keep='first', ignore_index=True)
+    rows = []
+    for row in chunk.to_dict(orient='records'):
+        rows.append({'left_name': row['name_from'],
+                     'left_value': row['value_from'],
+                     'right_name': row['name_to'],
+                     'right_value': row['value_to']})
+    return rows
+
+
 # ############################################
 # ################### main ###################
 # ############################################
@@ -104,35 +280,46 @@ if filename == '':
     print('Exiting.\n')
     exit(1)
 
-filename_nodes = filename + FILENAME_NODES_EXTENSION
-filename_edges = filename + FILENAME_EDGES_EXTENSION
+filename_nodes = find_import_file(filename_start=filename + FILENAME_NODES_EXTENSION)
+filename_edges = find_import_file(filename_start=filename + FILENAME_EDGES_EXTENSION)
+filename_checkpoint = filename + FILENAME_CHECKPOINT_EXTENSION
 
-if not os.path.isfile(path=filename_nodes):
-    print('Error: import filename for nodes "' + filename_nodes + '" not found, exiting.')
+if filename_nodes == '':
+    print('Error: import filename for nodes "' + filename + FILENAME_NODES_EXTENSION
+          + '[' + '|'.join(FILENAME_EXTENSIONS) + ']" not found, exiting.')
     exit(1)
-if not os.path.isfile(path=filename_edges):
-    print('Error: import filename for edges "' + filename_edges + '" not found, exiting.')
+if filename_edges == '':
+    print('Error: import filename for edges "' + filename + FILENAME_EDGES_EXTENSION
+          + '[' + '|'.join(FILENAME_EXTENSIONS) + ']" not found, exiting.')
     exit(1)
 
 print('Filename used for nodes: "' + filename_nodes + '", for edges: "'
       + filename_edges + '".')
 
-print('\nPreparing graph...')
-graph = rcg.open_ricgraph()
-
-empty_graph = rcg.get_commandline_argument_empty_ricgraph(argument_list=sys.argv)
-if empty_graph == 'yes' or empty_graph == 'no':
-    rcg.empty_ricgraph(answer=empty_graph)
+resume = rcg.get_commandline_argument(argument='--resume',
+                                      argument_list=sys.argv)
+if resume == 'yes':
+    if not os.path.isfile(path=filename_checkpoint):
+        print('Error: checkpoint file "' + filename_checkpoint + '" not found, cannot resume, exiting.')
+        exit(1)
+    checkpoint = read_checkpoint(filename=filename_checkpoint)
+    print('Resuming import using checkpoint file "' + filename_checkpoint + '": '
+          + str(checkpoint['nr_node_chunks_done']) + ' chunks of nodes and '
+          + str(checkpoint['nr_edge_chunks_done']) + ' chunks of edges have been imported.')
 else:
-    print('Exiting.\n')
-    exit(1)
+    checkpoint = read_checkpoint(filename='')
 
-print('If you import a large number of nodes or edges, this script may crash due to')
-print('shortage of memory. In that case, you may want to set a limit in this script.\n')
+print('\nPreparing graph...')
+graph = rcg.open_ricgraph()
 
-# Import all values as string (i.e., also the year which might otherwise be read as an int).
-df_nodes = rcg.read_dataframe_from_csv(filename=filename_nodes, datatype=str)
-df_edges = rcg.read_dataframe_from_csv(filename=filename_edges, datatype=str)
+if resume != 'yes':
+    empty_graph = rcg.get_commandline_argument_empty_ricgraph(argument_list=sys.argv)
+    if empty_graph == 'yes' or empty_graph == 'no':
+        rcg.empty_ricgraph(answer=empty_graph)
+    else:
+        print('Exiting.\n')
+        exit(1)
+    write_checkpoint(filename=filename_checkpoint, checkpoint=checkpoint)
 
 all_properties = list(rcg.get_ricgraph_properties_standard()
                       + rcg.get_ricgraph_properties_additional()
@@ -141,85 +328,51 @@ all_properties = list(rcg.get_ricgraph_properties_standard()
 all_properties.remove('source_event')
 all_properties.remove('history_event')
 
-if MAX_NR_ITEMS_TO_IMPORT == 0:
-    max_items = rcg.A_LARGE_NUMBER
-else:
-    max_items = MAX_NR_ITEMS_TO_IMPORT
-
-# Make sure every column we expect is in df_nodes.
-for prop in all_properties:
-    if prop not in df_nodes.columns:
-        df_nodes[prop] = numpy.nan
-
-# Cleanup.
-# dropna(how='all'): drop row if all row values contain NaN
-df_nodes.dropna(axis=0, how='all', inplace=True)
-df_nodes.drop_duplicates(keep='first', inplace=True, ignore_index=True)
-df_nodes.fillna(value='', inplace=True)
-df_nodes = df_nodes.map(convert_string_to_list)
-
-df_edges.dropna(axis=0, how='all', inplace=True)
-df_edges.drop_duplicates(keep='first', inplace=True, ignore_index=True)
-df_edges.fillna(value='', inplace=True)
-
-# Construct Cypher query to import all nodes.
+# Construct Cypher query to import a chunk of nodes.
 prop_string = '{'
-prop_string += ', '.join(str(prop + ': $' + prop) for prop in all_properties)
+prop_string += ', '.join(str(prop + ': row.' + prop) for prop in all_properties)
 prop_string += '}'
-cypher_query = 'MERGE (node:RicgraphNode ' + prop_string + ') RETURN node'
-count = 0
-if int(MAX_NR_ITEMS_TO_IMPORT) > 0:
-    print('Importing ' + str(MAX_NR_ITEMS_TO_IMPORT) + ' nodes...')
-else:
-    print('Importing ' + str(len(df_nodes)) + ' nodes...')
-for index, row in df_nodes.iterrows():
-    if count >= max_items:
-        break
-    count += 1
-    if count % 500 == 0:
-        print(count, ' ', end='', flush=True)
-    if count % 5000 == 0:
-        print('\n', end='', flush=True)
-    graph.execute_query(query_=cypher_query,
-                        name=row['name'],
-                        category=row['category'],
-                        value=row['value'],
-                        _key=row['_key'],
-                        comment=row['comment'],
-                        year=row['year'],
-                        license=row['license'],
-                        access=row['access'],
-                        url_main=row['url_main'],
-                        url_other=row['url_other'],
-                        _source=row['_source'],
-                        _history=row['_history'],
-                        database_=rcg.ricgraph_databasename())
-print(count, ' Done.\n\n', end='', flush=True)
-
-# Construct Cypher query to import all edges.
-cypher_query = 'MATCH (left_node:RicgraphNode {name: $left_name, value: $left_value}) '
-cypher_query += 'MATCH (right_node:RicgraphNode {name: $right_name, value: $right_value}) '
+cypher_query = 'UNWIND $rows AS row '
+cypher_query += 'MERGE (node:RicgraphNode ' + prop_string + ')'
+# print(cypher_query)
+print('Importing nodes in chunks of ' + str(IMPORT_CHUNK_SIZE) + ' at ' + rcg.timestamp() + '...')
+count, _ = import_chunks(filename=filename_nodes,
+                         cypher_query=cypher_query,
+                         prepare_chunk=prepare_nodes_chunk,
+                         checkpoint_file=filename_checkpoint,
+                         checkpoint=checkpoint,
+                         checkpoint_item='nr_node_chunks_done')
+print('Done, read ' + str(count) + ' nodes.\n')
+
+# Construct Cypher query to import a chunk of edges.
+# Match on 'name' and 'value', not on '_key', since not every node has
+# a '_key' (e.g. it has been exported without one), or it may not be in the
+# form create_ricgraph_key() makes. Matching on 'value' uses the index on 'value'.
+# The number of rows that matched is returned, so that rows that matched
+# no node can be counted.
+cypher_query = 'UNWIND $rows AS row '
+cypher_query += 'MATCH (left_node:RicgraphNode {name: row.left_name, value: row.left_value}) '
+cypher_query += 'MATCH (right_node:RicgraphNode {name: row.right_name, value: row.right_value}) '
 cypher_query += 'MERGE (left_node)-[:LINKS_TO]->(right_node) '
 cypher_query += 'MERGE (left_node)<-[:LINKS_TO]-(right_node) '
-count = 0
-if int(MAX_NR_ITEMS_TO_IMPORT) > 0:
-    print('Importing ' + str(MAX_NR_ITEMS_TO_IMPORT) + ' edges...')
-else:
-    print('Importing ' + str(len(df_edges)) + ' edges...')
-for index, row in df_edges.iterrows():
-    if count >= max_items:
-        break
-    count += 1
-    if count % 500 == 0:
-        print(count, ' ', end='', flush=True)
-    if count % 5000 == 0:
-        print('\n', end='', flush=True)
-    graph.execute_query(query_=cypher_query,
-                        left_name=row['name_from'],
-                        left_value=row['value_from'],
-                        right_name=row['name_to'],
-                        right_value=row['value_to'],
-                        database_=rcg.ricgraph_databasename())
-print(count, ' Done.\n\n', end='', flush=True)
+cypher_query += 'RETURN COUNT(DISTINCT row) AS nr_rows_imported'
+# print(cypher_query)
+print('Importing edges in chunks of ' + str(IMPORT_CHUNK_SIZE) + ' at ' + rcg.timestamp() + '...')
+count, nr_not_imported = import_chunks(filename=filename_edges,
+                                       cypher_query=cypher_query,
+                                       prepare_chunk=prepare_edges_chunk,
+                                       checkpoint_file=filename_checkpoint,
+                                       checkpoint=checkpoint,
+                                       checkpoint_item='nr_edge_chunks_done')
+print('Done, read ' + str(count) + ' edges.')
+if nr_not_imported > 0:
+    print('Warning: ' + str(nr_not_imported) + ' edges have not been imported, since '
+          + 'one of their nodes could not be found.')
+print('')
+
+# The import has finished, so the checkpoint is not needed anymore.
+os.remove(filename_checkpoint)
 
+rcg.write_ricgraph_snapshot()
+rcg.querystats_print()
 rcg.close_ricgraph()
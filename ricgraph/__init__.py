@@ -43,8 +43,14 @@ from .ricgraph_constants import *
 from .ricgraph_cache import *
 from .ricgraph_utils import *
 from .ricgraph_file import *
+from .ricgraph_querystats import *
+from .ricgraph_cypher_session import *
+from .ricgraph_embedded import *
 from .ricgraph_cypher import *
+from .ricgraph_resume import *
 from .ricgraph_graphdb import *
+from .ricgraph_orghierarchy import *
+from .ricgraph_snapshot import *
 from .ricgraph_researchinfo import *
 from .ricgraph_harvest import *
 from .ricgraph_restapi import *
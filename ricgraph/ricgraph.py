@@ -101,7 +101,7 @@ In the default configuration of Ricgraph, the following properties are included:
 from numpy import nan
 from pandas import DataFrame, concat, set_option
 
-from .ricgraph_constants import PERSON_CATEGORY_PERSON
+from .ricgraph_constants import PERSON_CATEGORY_PERSON, RESUME_CHUNK_SIZE
 from .ricgraph_utils import (timestamp, timestamp_posix,
                              print_records_per_minute,
                              print_progress)
@@ -109,6 +109,9 @@ from .ricgraph_graphdb import (create_update_node, create_two_nodes_and_edge,
                                get_ricgraph_nodeadd_mode,
                                get_ricgraph_properties_standard,
                                get_ricgraph_properties_additional)
+from .ricgraph_resume import (resume_get_dataframe_key,
+                              resume_get_nr_chunks_done,
+                              resume_set_nr_chunks_done)
 
 
 __author__ = 'Rik D.T. Janssen'
@@ -185,32 +188,47 @@ def create_nodepairs_and_edges_df(left_and_right_nodepairs: DataFrame | None) ->
     The row value of that column specify the property value of that property.
     All 'left' nodes end with '1', all right nodes end with '2'.
 
+    The rows are inserted in chunks of RESUME_CHUNK_SIZE rows. After every chunk,
+    the progress is recorded, so that an interrupted harvest can be resumed
+    (see ricgraph_resume.py). Chunks that have already been inserted are skipped.
+
     :param left_and_right_nodepairs: the node pairs in a DataFrame.
     :return: None.
     """
     if left_and_right_nodepairs is None or left_and_right_nodepairs.empty:
         return
-    print('There are ' + str(len(left_and_right_nodepairs)) + ' rows ('
+    df_key = resume_get_dataframe_key(df=left_and_right_nodepairs)
+    nr_chunks_done = resume_get_nr_chunks_done(df_key=df_key)
+    nr_rows = len(left_and_right_nodepairs)
+    print('There are ' + str(nr_rows) + ' rows ('
           + timestamp() + '), creating nodes and edges for row:')
+    if nr_chunks_done > 0:
+        print('Resuming: skipping the first ' + str(min(nr_chunks_done * RESUME_CHUNK_SIZE, nr_rows))
+              + ' rows, they have already been inserted.')
     count = 0
     start_ts = timestamp_posix()
     columns = left_and_right_nodepairs.columns
-    for row in left_and_right_nodepairs.itertuples():
-        count = print_progress(count=count, interval=250)
-        node_properties = {}
-        for prop_name in get_ricgraph_properties_additional():
-            for other_name in columns:
-                if prop_name + '1' == other_name:
-                    node_properties[prop_name + '1'] = getattr(row, other_name)
-            for other_name in columns:
-                if prop_name + '2' == other_name:
-                    node_properties[prop_name + '2'] = getattr(row, other_name)
-
-        create_two_nodes_and_edge(name1=str(row.name1), category1=str(row.category1),
-                                  value1=str(row.value1),
-                                  name2=str(row.name2), category2=str(row.category2),
-                                  value2=str(row.value2),
-                                  **node_properties)
+    for chunk_nr, chunk_start in enumerate(range(0, nr_rows, RESUME_CHUNK_SIZE)):
+        if chunk_nr < nr_chunks_done:
+            continue
+        chunk = left_and_right_nodepairs.iloc[chunk_start:chunk_start + RESUME_CHUNK_SIZE]
+        for row in chunk.itertuples():
+            count = print_progress(count=count, interval=250)
+            node_properties = {}
+            for prop_name in get_ricgraph_properties_additional():
+                for other_name in columns:
+                    if prop_name + '1' == other_name:
+                        node_properties[prop_name + '1'] = getattr(row, other_name)
+                for other_name in columns:
+                    if prop_name + '2' == other_name:
+                        node_properties[prop_name + '2'] = getattr(row, other_name)
+
+            create_two_nodes_and_edge(name1=str(row.name1), category1=str(row.category1),
+                                      value1=str(row.value1),
+                                      name2=str(row.name2), category2=str(row.category2),
+                                      value2=str(row.value2),
+                                      **node_properties)
+        resume_set_nr_chunks_done(df_key=df_key, nr_chunks_done=chunk_nr + 1)
     print_progress(count=count, now=True)
     end_ts = timestamp_posix()
     print_records_per_minute(start_ts=start_ts, end_ts=end_ts,
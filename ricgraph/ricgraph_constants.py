@@ -86,6 +86,54 @@ class PageParams(TypedDict):
 
 RICGRAPH_INI_FILENAME = 'ricgraph.ini'
 
+# The snapshot of Ricgraph, see ricgraph_snapshot.py. If the format of the
+# snapshot changes, increase RICGRAPH_SNAPSHOT_FORMAT_VERSION, so that
+# older snapshots will not be used.
+RICGRAPH_SNAPSHOT_FILENAME = 'ricgraph_snapshot.json'
+RICGRAPH_SNAPSHOT_FORMAT_VERSION = 2
+# These properties are in the snapshot, for each of them
+# read_all_values_of_property() is called.
+RICGRAPH_SNAPSHOT_PROPERTIES = ['name', 'person_name', 'category', 'year',
+                                'access', 'license', '_source']
+# Only one process creates and writes a snapshot at the same time, see
+# create_ricgraph_snapshot_once(). The others wait for it, checking every
+# RICGRAPH_SNAPSHOT_LOCK_POLL seconds. A lock file that is older than
+# RICGRAPH_SNAPSHOT_LOCK_STALE seconds is left over from a crashed process.
+RICGRAPH_SNAPSHOT_LOCK_POLL = 5
+RICGRAPH_SNAPSHOT_LOCK_STALE = 3600
+
+# The resume file of a harvest, see ricgraph_resume.py, and the number of
+# rows of a DataFrame that are inserted in Ricgraph between two updates of it.
+RICGRAPH_RESUME_FILENAME = 'ricgraph_resume.json'
+RESUME_CHUNK_SIZE = 5000
+
+# The formats that can be used for the intermediate files of harvests,
+# see get_configfile_key_intermediate_format() in ricgraph_utils.py.
+INTERMEDIATE_FORMATS = ['parquet', 'feather']
+
+# Query statistics, see ricgraph_querystats.py.
+# Queries that take longer than this number of milliseconds are printed
+# in the slow query log. It can be changed in the Ricgraph ini file with
+# 'ricgraph_slow_query_threshold'.
+SLOW_QUERY_THRESHOLD_DEFAULT = 1000
+# The upper bounds (in milliseconds) of the buckets of the histogram of query
+# durations. The last bucket contains all queries slower than the last bound.
+QUERYSTATS_HISTOGRAM_BOUNDS = [1, 10, 100, 1000, 10000]
+
+# The format of the file of the embedded graph database backend, see
+# ricgraph_embedded.py. If it changes, increase this number, so that
+# older files will not be used.
+RICGRAPH_EMBEDDED_FORMAT_VERSION = 1
+
+# The filenames of the files for the offline importer 'neo4j-admin database import',
+# see write_neo4j_admin_import_files() in ricgraph_embedded.py.
+NEO4J_ADMIN_IMPORT_NODES_FILENAME = 'ricgraph-import-nodes.csv'
+NEO4J_ADMIN_IMPORT_EDGES_FILENAME = 'ricgraph-import-edges.csv'
+# The character that separates the elements of an array (e.g. the labels
+# of a node, or property '_history') in these files. It should not be present
+# in any value. Pass it to 'neo4j-admin database import' with --array-delimiter.
+NEO4J_ADMIN_IMPORT_ARRAY_DELIMITER = '\u001f'
+
 # This one separates value & name in property _key of a node.
 RICGRAPH_KEY_SEPARATOR = '|'
 # If we find RICGRAPH_KEY_SEPARATOR in a string, replace it with this one.
@@ -113,6 +161,11 @@ HTTP_RESPONSE_OK = 200
 # which may be freely used.
 HTTP_RESPONSE_NOTHING_FOUND = 250
 HTTP_RESPONSE_INVALID_SEARCH = 251
+# We use this if a query takes too long, i.e. if the query is too large.
+HTTP_RESPONSE_QUERY_TOO_LARGE = 252
+# We use this if Ricgraph Explorer is too busy to handle a request, see
+# https://www.rfc-editor.org/rfc/rfc9110.html#name-503-service-unavailable.
+HTTP_RESPONSE_SERVICE_UNAVAILABLE = 503
 
 # The dict '_nodes_cache_key_id' is used to cache IDs to nodes. This is the cache size.
 # The dict itself is defined in ricgraph_cache.py.
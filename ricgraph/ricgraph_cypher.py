@@ -47,7 +47,7 @@ from pandas import DataFrame
 from typing import Optional
 from re import split, fullmatch, sub, IGNORECASE
 from json import dumps
-from neo4j import GraphDatabase, Driver, ResultSummary
+from neo4j import GraphDatabase, Driver, Session, ResultSummary, READ_ACCESS
 from neo4j.graph import Node
 from .ricgraph_constants import (A_LARGE_NUMBER,
                                  PERSON_CATEGORY_PERSON,
@@ -55,22 +55,28 @@ from .ricgraph_constants import (A_LARGE_NUMBER,
                                  CYPHER_QUERY_SPLITTER,
                                  CYPHER_KEYWORDS,
                                  CYPHER_KEYWORDS_OPERATORS)
-from .ricgraph_utils import (get_ricgraph_ini_file,
+from .ricgraph_utils import (get_ricgraph_ini_file, get_configfile_key,
                              get_configfile_key_graphdb_parameters,
+                             get_configfile_key_graphdb_driver_settings,
                              create_ricgraph_key, datetimestamp,
                              check_valid_year)
 from .ricgraph_cache import (nodes_cache_key_id_create, nodes_cache_key_id_read,
                              nodes_cache_key_id_delete_key)
+from .ricgraph_cypher_session import (cypher_execute_query,
+                                      set_cypher_session, get_cypher_session)
+from .ricgraph_embedded import EmbeddedGraph
 
 
 # The graph.
 # Global for connection to Memcached.
 # Type hint necessary to avoid PyCharm warning.
 # March 21, 2026: but still PyCharm warns.
-_graph: Optional[Driver] = None
+_graph: Optional[Driver | EmbeddedGraph] = None
 
 _GRAPHDB = ''
 _GRAPHDB_DATABASENAME = ''
+# The fetch size for sessions, see get_configfile_key_graphdb_driver_settings().
+_GRAPHDB_FETCH_SIZE = 0
 
 # These counters are used to count the number of accesses to the
 # graph database backend.
@@ -122,12 +128,12 @@ Node.__eq__ = node_eq
 # [May 6, 2024] Note however, that memgraph on does not have elementId() but only id():
 # https://memgraph.com/docs/querying/differences-in-cypher-implementations.
 # ##############################################################################
-def open_ricgraph() -> Driver | None:
+def open_ricgraph() -> Driver | EmbeddedGraph | None:
     """Open Ricgraph.
 
     :return: graph that has been opened.
     """
-    global _graph, _GRAPHDB, _GRAPHDB_DATABASENAME
+    global _graph, _GRAPHDB, _GRAPHDB_DATABASENAME, _GRAPHDB_FETCH_SIZE
 
     if _graph is not None:
         # We have already opened the graph.
@@ -138,9 +144,23 @@ def open_ricgraph() -> Driver | None:
      graphdb_user, graphdb_password) = get_configfile_key_graphdb_parameters()
     _GRAPHDB = graphdb
     _GRAPHDB_DATABASENAME = graphdb_databasename
+    if graphdb == 'embedded':
+        # See ricgraph_embedded.py.
+        graphdb_embedded_file = get_configfile_key(section='GraphDB',
+                                                   key='graphdb_embedded_file')
+        graphdb_bulk_import_directory = get_configfile_key(section='GraphDB',
+                                                           key='graphdb_bulk_import_directory')
+        _graph = EmbeddedGraph(filename=graphdb_embedded_file,
+                               bulk_import_directory=graphdb_bulk_import_directory)
+        return _graph
+
+    driver_settings = get_configfile_key_graphdb_driver_settings()
+    # The fetch size is a setting for sessions, not for the driver.
+    _GRAPHDB_FETCH_SIZE = driver_settings.pop('fetch_size', 0)
     try:
         _graph = GraphDatabase.driver(graphdb_url,
-                                      auth=(graphdb_user, graphdb_password))
+                                      auth=(graphdb_user, graphdb_password),
+                                      **driver_settings)
         if _graph is None:
             raise Exception('Error: could not get GraphDatabase.')
         _graph.verify_connectivity()
@@ -170,10 +190,68 @@ def close_ricgraph() -> None:
         return
 
     print('Closing Ricgraph at ' + datetimestamp() + '.\n')
+    # For the embedded graph database backend, this writes the graph to its file.
     _graph.close()
     return
 
 
+def create_ricgraph_read_session() -> Session | None:
+    """Create a session to read from Ricgraph. Read queries in this session
+    are explicitly routed to a server that can read, and use the fetch size
+    from the Ricgraph ini file.
+
+    :return: the session, or None for the embedded graph database backend.
+    """
+    global _graph
+
+    if _graph is None:
+        print('\ncreate_ricgraph_read_session(): Error: graph has not been initialized or opened.')
+        return None
+    if not isinstance(_graph, Driver):
+        return None
+    session_settings = {'database': ricgraph_databasename(),
+                        'default_access_mode': READ_ACCESS}
+    if _GRAPHDB_FETCH_SIZE > 0:
+        session_settings['fetch_size'] = _GRAPHDB_FETCH_SIZE
+    return _graph.session(**session_settings)
+
+
+def open_ricgraph_request_session() -> None:
+    """Open a read session for the current thread, e.g. for a request in
+    Ricgraph Explorer. All queries that are done with cypher_execute_query()
+    in this thread will use this session, until close_ricgraph_request_session()
+    is called. This avoids the setup of a session for every query. Since it is
+    a read session, it should only be used for code that only reads.
+
+    :return: None.
+    """
+    # If the previous session of this thread has not been closed, close it now.
+    close_ricgraph_request_session()
+    session = create_ricgraph_read_session()
+    if session is None:
+        return
+    set_cypher_session(session=session, database=ricgraph_databasename())
+    return
+
+
+def close_ricgraph_request_session() -> None:
+    """Close the read session for the current thread, see
+    open_ricgraph_request_session().
+
+    :return: None.
+    """
+    session = get_cypher_session()
+    if session is None:
+        return
+    set_cypher_session(session=None)
+    try:
+        session.close()
+    except Exception as error:
+        # The session is not used anymore, so we only report it.
+        print('close_ricgraph_request_session(): Error, ' + str(error) + '.')
+    return
+
+
 def ricgraph_database() -> str:
     """Return the name of the Ricgraph database backend.
     """
@@ -221,27 +299,36 @@ def ricgraph_create_indexes() -> None:
         # https://neo4j.com/docs/cypher-manual/current/indexes/search-performance-indexes/managing-indexes
         # [Jan. 2023] The graph database backend Neo4j can have at most 3 indexes.
         # [June 5, 2024] This is not true anymore. I use 4 indexes.
-        _graph.execute_query(query_='DROP INDEX KeyIndex IF EXISTS',
+        cypher_execute_query(graph=_graph,
+                             query_='DROP INDEX KeyIndex IF EXISTS',
                              database_=graphdb_databasename)
-        _graph.execute_query(query_='DROP INDEX NameIndex IF EXISTS',
+        cypher_execute_query(graph=_graph,
+                             query_='DROP INDEX NameIndex IF EXISTS',
                              database_=graphdb_databasename)
-        _graph.execute_query(query_='DROP INDEX CategoryIndex IF EXISTS',
+        cypher_execute_query(graph=_graph,
+                             query_='DROP INDEX CategoryIndex IF EXISTS',
                              database_=graphdb_databasename)
-        _graph.execute_query(query_='DROP INDEX ValueIndex IF EXISTS',
+        cypher_execute_query(graph=_graph,
+                             query_='DROP INDEX ValueIndex IF EXISTS',
                              database_=graphdb_databasename)
 
         print('Creating indexes...')
-        _graph.execute_query(query_='CREATE INDEX KeyIndex IF NOT EXISTS FOR (node:RicgraphNode) ON (node._key)',
+        cypher_execute_query(graph=_graph,
+                             query_='CREATE INDEX KeyIndex IF NOT EXISTS FOR (node:RicgraphNode) ON (node._key)',
                              database_=graphdb_databasename)
-        _graph.execute_query(query_='CREATE INDEX NameIndex IF NOT EXISTS FOR (node:RicgraphNode) ON (node.name)',
+        cypher_execute_query(graph=_graph,
+                             query_='CREATE INDEX NameIndex IF NOT EXISTS FOR (node:RicgraphNode) ON (node.name)',
                              database_=graphdb_databasename)
-        _graph.execute_query(query_='CREATE INDEX CategoryIndex IF NOT EXISTS FOR (node:RicgraphNode) ON (node.category)',
+        cypher_execute_query(graph=_graph,
+                             query_='CREATE INDEX CategoryIndex IF NOT EXISTS FOR (node:RicgraphNode) ON (node.category)',
                              database_=graphdb_databasename)
-        _graph.execute_query(query_='CREATE INDEX ValueIndex IF NOT EXISTS FOR (node:RicgraphNode) ON (node.value)',
+        cypher_execute_query(graph=_graph,
+                             query_='CREATE INDEX ValueIndex IF NOT EXISTS FOR (node:RicgraphNode) ON (node.value)',
                              database_=graphdb_databasename)
 
         print('These indexes have been created:')
-        records, _, keys = _graph.execute_query(query_='SHOW INDEXES',
+        records, _, keys = cypher_execute_query(graph=_graph,
+                                                query_='SHOW INDEXES',
                                                 database_=graphdb_databasename)
         index_table = DataFrame(data=records, columns=keys)
         print(index_table.to_string(index=False))
@@ -271,6 +358,9 @@ def ricgraph_create_indexes() -> None:
                 print(index_line)
             print('')
         # session.close() is done automatically because of 'with'.
+    elif graphdb_name == 'embedded':
+        # The embedded graph database backend always has an index on '_key'.
+        print('The embedded graph database backend does not need indexes.\n')
     else:
         print('ricgraph_create_indexes(): Unknown graph database backend "'
               + graphdb_name + '".')
@@ -313,8 +403,12 @@ def empty_ricgraph(answer: str = '') -> None:
     # Apparently, the community edition of Neo4j does not have a
     # "CREATE OR REPLACE DATABASE customers" command.
     print('Deleting all nodes and edges in Ricgraph...\n')
-    _graph.execute_query(query_='MATCH (node) DETACH DELETE node',
-                         database_=ricgraph_databasename())
+    if ricgraph_database() == 'embedded':
+        _graph.empty()
+    else:
+        cypher_execute_query(graph=_graph,
+                             query_='MATCH (node) DETACH DELETE node',
+                             database_=ricgraph_databasename())
     ricgraph_create_indexes()
     return
 
@@ -329,9 +423,12 @@ def ricgraph_nr_nodes() -> int:
     if _graph is None:
         print('\nricgraph_nr_nodes(): Error: graph has not been initialized or opened.\n\n')
         return -1
+    if ricgraph_database() == 'embedded':
+        return _graph.nr_nodes()
 
     cypher_query = 'MATCH () RETURN COUNT(*) AS count'
-    records, _, _ = _graph.execute_query(query_=cypher_query,
+    records, _, _ = cypher_execute_query(graph=_graph,
+                                         query_=cypher_query,
                                          database_=ricgraph_databasename())
     try:
         nr_nodes = records[0]['count']
@@ -350,9 +447,12 @@ def ricgraph_nr_edges() -> int:
     if _graph is None:
         print('\nricgraph_nr_edges(): Error: graph has not been initialized or opened.\n\n')
         return -1
+    if ricgraph_database() == 'embedded':
+        return _graph.nr_edges()
 
     cypher_query = 'MATCH ()-[r]->() RETURN COUNT(r) AS count'
-    records, _, _ = _graph.execute_query(query_=cypher_query,
+    records, _, _ = cypher_execute_query(graph=_graph,
+                                         query_=cypher_query,
                                          database_=ricgraph_databasename())
     try:
         nr_edges = records[0]['count']
@@ -372,6 +472,8 @@ def ricgraph_nr_edges_of_node(node_element_id: str) -> int:
     if _graph is None:
         print('\nricgraph_nr_edges_of_node(): Error: graph has not been initialized or opened.\n\n')
         return -1
+    if ricgraph_database() == 'embedded':
+        return _graph.nr_edges_of_node(element_id=node_element_id)
 
     cypher_query = 'MATCH (node:RicgraphNode)-[r]->() '
     if ricgraph_database() == 'neo4j':
@@ -380,7 +482,8 @@ def ricgraph_nr_edges_of_node(node_element_id: str) -> int:
         cypher_query += 'WHERE id(node)=toInteger($node_element_id) '
     cypher_query += 'RETURN COUNT(r) AS count'
 
-    records, _, _ = _graph.execute_query(query_=cypher_query,
+    records, _, _ = cypher_execute_query(graph=_graph,
+                                         query_=cypher_query,
                                          node_element_id=node_element_id,
                                          database_=ricgraph_databasename())
     try:
@@ -410,13 +513,19 @@ def ricgraph_get_harvest_date() -> str:
         print('\nricgraph_get_harvest_date(): Error: graph has not been initialized or opened.\n\n')
         return ''
 
-    cypher_query = 'MATCH (node:RicgraphNode) '
-    cypher_query += 'WHERE node._history <> "" '
-    cypher_query += 'RETURN node._history as history '
-    cypher_query += 'LIMIT 10'
-    records, _, _ = _graph.execute_query(query_=cypher_query,
-                                         database_=ricgraph_databasename())
-    result = [record['history'] for record in records]
+    if ricgraph_database() == 'embedded':
+        nodes = _graph.find_nodes(condition=lambda properties: properties.get('_history', '') != '',
+                                  max_nr_nodes=10)
+        result = [node['_history'] for node in nodes]
+    else:
+        cypher_query = 'MATCH (node:RicgraphNode) '
+        cypher_query += 'WHERE node._history <> "" '
+        cypher_query += 'RETURN node._history as history '
+        cypher_query += 'LIMIT 10'
+        records, _, _ = cypher_execute_query(graph=_graph,
+                                             query_=cypher_query,
+                                             database_=ricgraph_databasename())
+        result = [record['history'] for record in records]
     harvest_date = ''
     for item in result:
         if len(item) == 0:
@@ -477,10 +586,15 @@ def cypher_create_node(node_properties: dict) -> Node | None:
     # print('cypher_create_node(): cypher_query: ' + cypher_query)
     # print('                      node_properties: ' + str(node_properties))
 
-    records, _, _ = _graph.execute_query(query_=cypher_query,
-                                         node_properties=node_properties,
-                                         database_=ricgraph_databasename())
-    nodes = [record['node'] for record in records]
+    if ricgraph_database() == 'embedded':
+        nodes = [_graph.create_node(labels=node_labels.split(':'),
+                                    properties=node_properties)]
+    else:
+        records, _, _ = cypher_execute_query(graph=_graph,
+                                             query_=cypher_query,
+                                             node_properties=node_properties,
+                                             database_=ricgraph_databasename())
+        nodes = [record['node'] for record in records]
     _graphdb_nr_creates += 1
     if len(nodes) == 0:
         return None
@@ -503,13 +617,19 @@ def cypher_read_node_elementid(node_element_id: str) -> Node | None:
         print('\ncypher_read_node_elementid(): Error: graph has not been initialized or opened.\n\n')
         return None
 
+    if ricgraph_database() == 'embedded':
+        node = _graph.read_node(element_id=node_element_id)
+        _graphdb_nr_reads += 1
+        return node
+
     cypher_query = 'MATCH (node:RicgraphNode) '
     if ricgraph_database() == 'neo4j':
         cypher_query += 'WHERE elementId(node)=$node_element_id '
     else:
         cypher_query += 'WHERE id(node)=toInteger($node_element_id) '
     cypher_query += 'RETURN node'
-    records, _, _ = _graph.execute_query(query_=cypher_query,
+    records, _, _ = cypher_execute_query(graph=_graph,
+                                         query_=cypher_query,
                                          node_element_id=node_element_id,
                                          database_=ricgraph_databasename())
     nodes = [record['node'] for record in records]
@@ -541,13 +661,17 @@ def cypher_read_node(name: str, value: str) -> Node | None:
         node = cypher_read_node_elementid(node_element_id=node_element_id)
         return node
 
-    cypher_query = 'MATCH (node:RicgraphNode) '
-    cypher_query += 'WHERE (node._key=$node_key) '
-    cypher_query += 'RETURN node'
-    records, _, _ = _graph.execute_query(query_=cypher_query,
-                                         node_key=key,
-                                         database_=ricgraph_databasename())
-    nodes = [record['node'] for record in records]
+    if ricgraph_database() == 'embedded':
+        nodes = _graph.read_nodes_key(key=key)
+    else:
+        cypher_query = 'MATCH (node:RicgraphNode) '
+        cypher_query += 'WHERE (node._key=$node_key) '
+        cypher_query += 'RETURN node'
+        records, _, _ = cypher_execute_query(graph=_graph,
+                                             query_=cypher_query,
+                                             node_key=key,
+                                             database_=ricgraph_databasename())
+        nodes = [record['node'] for record in records]
     _graphdb_nr_reads += 1
     if len(nodes) == 0:
         return None
@@ -582,6 +706,28 @@ def cypher_find_nodes(name: str, category: str, value: str,
         print('\ncypher_find_nodes(): Error: graph has not been initialized or opened.\n\n')
         return []
 
+    if ricgraph_database() == 'embedded':
+        def condition(properties: dict) -> bool:
+            if name != '':
+                if name_is_exact_match and properties.get('name') != name:
+                    return False
+                if not name_is_exact_match \
+                   and name.lower() not in str(properties.get('name', '')).lower():
+                    return False
+            if category != '' and properties.get('category') != category:
+                return False
+            if value != '':
+                if value_is_exact_match and properties.get('value') != value:
+                    return False
+                if not value_is_exact_match \
+                   and value.lower() not in str(properties.get('value', '')).lower():
+                    return False
+            return True
+
+        nodes = _graph.find_nodes(condition=condition, max_nr_nodes=max_nr_nodes)
+        _graphdb_nr_reads += len(nodes) + 1
+        return nodes
+
     clauses = []
     cypher_query = 'MATCH (node:RicgraphNode) '
     if name != '':
@@ -608,7 +754,8 @@ def cypher_find_nodes(name: str, category: str, value: str,
         cypher_query += 'LIMIT $max_nr_nodes '
     # print(cypher_query)
 
-    records, _, _ = _graph.execute_query(query_=cypher_query,
+    records, _, _ = cypher_execute_query(graph=_graph,
+                                         query_=cypher_query,
                                          node_name=name,
                                          node_name_lowercase=name.lower(),
                                          node_category=category,
@@ -647,13 +794,18 @@ def cypher_delete_node(node_element_id: str) -> None:
     nodes_cache_key_id_delete_key(key=node_key)
 
     # Then delete it from the graph database.
+    if ricgraph_database() == 'embedded':
+        _graph.delete_node(element_id=node_element_id)
+        _graphdb_nr_deletes += 1
+        return
     cypher_query = 'MATCH (node:RicgraphNode) '
     if ricgraph_database() == 'neo4j':
         cypher_query += 'WHERE elementId(node)=$node_element_id '
     else:
         cypher_query += 'WHERE id(node)=toInteger($node_element_id) '
     cypher_query += 'DETACH DELETE node'
-    _graph.execute_query(query_=cypher_query,
+    cypher_execute_query(graph=_graph,
+                         query_=cypher_query,
                          node_element_id=node_element_id,
                          database_=ricgraph_databasename())
 
@@ -690,18 +842,24 @@ def cypher_update_node_properties(node_element_id: str, node_properties: dict) -
         old_node_key = old_node['_key']
         nodes_cache_key_id_delete_key(key=old_node_key)
 
-    cypher_query = 'MATCH (node:RicgraphNode) '
-    if ricgraph_database() == 'neo4j':
-        cypher_query += 'WHERE elementId(node)=$node_element_id '
+    if ricgraph_database() == 'embedded':
+        node = _graph.update_node(element_id=node_element_id,
+                                  properties=node_properties)
+        nodes = [] if node is None else [node]
     else:
-        cypher_query += 'WHERE id(node)=toInteger($node_element_id) '
-    cypher_query += 'SET node+=$node_properties RETURN node'
-
-    records, _, _ = _graph.execute_query(query_=cypher_query,
-                                         node_element_id=node_element_id,
-                                         node_properties=node_properties,
-                                         database_=ricgraph_databasename())
-    nodes = [record['node'] for record in records]
+        cypher_query = 'MATCH (node:RicgraphNode) '
+        if ricgraph_database() == 'neo4j':
+            cypher_query += 'WHERE elementId(node)=$node_element_id '
+        else:
+            cypher_query += 'WHERE id(node)=toInteger($node_element_id) '
+        cypher_query += 'SET node+=$node_properties RETURN node'
+
+        records, _, _ = cypher_execute_query(graph=_graph,
+                                             query_=cypher_query,
+                                             node_element_id=node_element_id,
+                                             node_properties=node_properties,
+                                             database_=ricgraph_databasename())
+        nodes = [record['node'] for record in records]
     _graphdb_nr_reads += 1
     _graphdb_nr_updates += 1
     if len(nodes) == 0:
@@ -763,6 +921,18 @@ def cypher_merge_nodes(node_merge_from_element_id: str,
     old_node_key = old_node['_key']
     nodes_cache_key_id_delete_key(key=old_node_key)
 
+    if graphdb_name == 'embedded':
+        nr_edges = ricgraph_nr_edges_of_node(node_element_id=node_merge_from_element_id)
+        node = _graph.merge_nodes(from_element_id=node_merge_from_element_id,
+                                  to_element_id=node_merge_to_element_id,
+                                  to_properties=node_merge_to_properties)
+        if node is None:
+            return None
+        _graphdb_nr_reads += 2 * nr_edges
+        _graphdb_nr_updates += 2 * nr_edges
+        nodes_cache_key_id_create(key=node['_key'], elementid=node.element_id)
+        return node
+
     cypher_query = 'MATCH (node_from:RicgraphNode) '
     if graphdb_name == 'neo4j':
         cypher_query += 'WHERE elementId(node_from)=$node_merge_from_element_id '
@@ -785,7 +955,8 @@ def cypher_merge_nodes(node_merge_from_element_id: str,
     cypher_query += 'DETACH DELETE node_from '
     cypher_query += 'RETURN node_to'
 
-    records, _, _ = _graph.execute_query(query_=cypher_query,
+    records, _, _ = cypher_execute_query(graph=_graph,
+                                         query_=cypher_query,
                                          node_merge_from_element_id=node_merge_from_element_id,
                                          node_merge_to_element_id=node_merge_to_element_id,
                                          node_merge_to_properties=node_merge_to_properties,
@@ -825,6 +996,14 @@ def cypher_create_edge_if_not_exists(left_node_element_id: str, right_node_eleme
         return
 
     graphdb_name = ricgraph_database()
+    if graphdb_name == 'embedded':
+        _graph.create_edge(from_element_id=left_node_element_id,
+                           to_element_id=right_node_element_id)
+        _graph.create_edge(from_element_id=right_node_element_id,
+                           to_element_id=left_node_element_id)
+        _graphdb_nr_reads += 2
+        _graphdb_nr_updates += 2
+        return
 
     # There are several methods for getting the nodes in the graph database.
     # This one takes the most time.
@@ -852,7 +1031,8 @@ def cypher_create_edge_if_not_exists(left_node_element_id: str, right_node_eleme
     cypher_query += 'MERGE (left_node)-[:LINKS_TO]->(right_node) '
     cypher_query += 'MERGE (left_node)<-[:LINKS_TO]-(right_node) '
 
-    _graph.execute_query(query_=cypher_query,
+    cypher_execute_query(graph=_graph,
+                         query_=cypher_query,
                          left_node_element_id=left_node_element_id,
                          right_node_element_id=right_node_element_id,
                          database_=ricgraph_databasename())
@@ -943,6 +1123,18 @@ def read_all_values_of_property(node_property: str = '') -> list:
               + node_property + '".\n\n')
         return []
 
+    if ricgraph_database() == 'embedded':
+        result_set = set()
+        for node in _graph.find_nodes(condition=lambda properties: True):
+            if node_property == 'person_name':
+                if node.get('category') == PERSON_CATEGORY_PERSON:
+                    result_set.add(node['name'])
+            elif node_property == '_source':
+                result_set.update(node.get('_source', []))
+            elif node.get(node_property) is not None:
+                result_set.add(node[node_property])
+        return sorted(result_set, key=lambda x: x.lower())
+
     cypher_query = 'MATCH (node:RicgraphNode) '
     if node_property == 'person_name':
         # Note that the comment property of 'person-root' contains FULL_NAMEs,
@@ -957,7 +1149,8 @@ def read_all_values_of_property(node_property: str = '') -> list:
     else:
         cypher_query += 'RETURN DISTINCT node[$node_property] AS entry '
 
-    result, _, _ = _graph.execute_query(query_=cypher_query,
+    result, _, _ = cypher_execute_query(graph=_graph,
+                                        query_=cypher_query,
                                         node_property=node_property,
                                         database_=ricgraph_databasename())
     if len(result) == 0:
@@ -969,6 +1162,42 @@ def read_all_values_of_property(node_property: str = '') -> list:
     return result_list_sorted
 
 
+def read_all_organization_names(starts_with: str = '') -> list:
+    """Read all the values of the nodes with name 'ORGANIZATION_NAME'
+    that start with a certain string, and return the sorted list.
+
+    :param starts_with: the string the values start with,
+      if '', return all values.
+    :return: a sorted list with all the values, or empty list on error.
+    """
+    global _graph
+
+    if _graph is None:
+        print('\nread_all_organization_names(): Error: graph has not been initialized or opened.')
+        return []
+
+    if ricgraph_database() == 'embedded':
+        result_set = set()
+        for node in _graph.find_nodes(condition=lambda properties: True):
+            if node.get('name') == 'ORGANIZATION_NAME' \
+               and str(node.get('value', '')).startswith(starts_with):
+                result_set.add(node['value'])
+        return sorted(result_set, key=lambda x: x.lower())
+
+    cypher_query = 'MATCH (node:RicgraphNode) '
+    cypher_query += 'WHERE node.name="ORGANIZATION_NAME" '
+    cypher_query += 'AND node.value STARTS WITH $starts_with '
+    cypher_query += 'RETURN DISTINCT node.value AS entry '
+    result, _, _ = cypher_execute_query(graph=_graph,
+                                        query_=cypher_query,
+                                        starts_with=starts_with,
+                                        database_=ricgraph_databasename())
+    if len(result) == 0:
+        return []
+    result_list = [record['entry'] for record in result]
+    return sorted(result_list, key=lambda x: x.lower())
+
+
 def get_all_neighbor_nodes(node: Node = None,
                            name_want: list = None,
                            name_dontwant: list = None,
@@ -1052,6 +1281,30 @@ def get_all_neighbor_nodes(node: Node = None,
                                                      max_nr_neighbor_nodes=max_nr_neighbor_nodes)
         return neighbor_nodes
 
+    if ricgraph_database() == 'embedded':
+        def condition(properties: dict) -> bool:
+            if len(name_want) > 0 and properties.get('name') not in name_want:
+                return False
+            if len(name_dontwant) > 0 and properties.get('name') in name_dontwant:
+                return False
+            if len(category_want) > 0 and properties.get('category') not in category_want:
+                return False
+            if len(category_dontwant) > 0 and properties.get('category') in category_dontwant:
+                return False
+            # As in Cypher, a node without a year does not satisfy a condition on year.
+            if year_first != '' and not properties.get('year', '') >= year_first:
+                return False
+            if year_last != '' and (properties.get('year') is None
+                                    or not properties['year'] <= year_last):
+                return False
+            return True
+
+        neighbor_nodes = _graph.neighbor_nodes(element_id=node.element_id,
+                                               condition=condition,
+                                               max_nr_nodes=max_nr_neighbor_nodes)
+        _graphdb_nr_reads += len(neighbor_nodes) + 1
+        return neighbor_nodes
+
     if year_first != '':
         cypher_query += 'AND neighbor.year >= $year_first '
     if year_last != '':
@@ -1062,7 +1315,8 @@ def get_all_neighbor_nodes(node: Node = None,
         cypher_query += 'LIMIT $max_nr_neighbor_nodes '
     # print(cypher_query)
 
-    records, _, _ = _graph.execute_query(query_=cypher_query,
+    records, _, _ = cypher_execute_query(graph=_graph,
+                                         query_=cypher_query,
                                          node_element_id=node.element_id,
                                          name_want=name_want,
                                          name_dontwant=name_dontwant,
@@ -0,0 +1,253 @@
+# ########################################################################
+#
+# Ricgraph - Research in context graph
+#
+# ########################################################################
+#
+# MIT License
+#
+# Copyright (c) 2026 Rik D.T. Janssen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# ########################################################################
+#
+# Ricgraph Cypher session functions.
+# Every query to the graph database backend is done with cypher_execute_query(),
+# which records its statistics, see ricgraph_querystats.py.
+# If a session has been set for the current thread (e.g. for a request
+# in Ricgraph Explorer), read queries are run in that session, instead of in a
+# new session for every query.
+# If a time budget has been set for the current thread, every query gets
+# a transaction timeout, so that the graph database backend stops a query
+# that takes too long. Then RicgraphQueryTimeout is raised.
+#
+# ########################################################################
+#
+# Original version Rik D.T. Janssen, October 2026.
+#
+# ########################################################################
+
+
+from time import perf_counter, monotonic
+from inspect import currentframe
+from threading import local
+from re import search, findall, IGNORECASE
+from neo4j import Driver, EagerResult, Session, RoutingControl, Query
+from neo4j.exceptions import ServiceUnavailable, SessionExpired, Neo4jError
+from .ricgraph_querystats import querystats_record
+
+
+# The session of the current thread, the name of its database,
+# and its time budget, see set_cypher_session() and set_cypher_time_budget().
+_cypher_session = local()
+# The graph database backend needs at least some time to do a query.
+# If less time is left in the time budget, the query is not started.
+_CYPHER_MIN_QUERY_TIMEOUT = 0.1
+# The session for the current thread is a read session. A query that contains
+# one of these clauses writes, so it is not run in that session. This also
+# holds if the clause is in a CALL { ... } subquery.
+_CYPHER_WRITE_CLAUSES = r'\b(CREATE|MERGE|SET|DELETE|REMOVE|FOREACH|LOAD\s+CSV|IN\s+TRANSACTIONS)\b'
+# A query that calls a procedure that starts with one of these (in lowercase)
+# may write, so it is not run in that session either.
+_CYPHER_PROCEDURE_CALL = r'\bCALL\s+([A-Za-z_][\w.]*)'
+_CYPHER_WRITE_PROCEDURES = ('apoc.create.', 'apoc.merge.', 'apoc.refactor.',
+                            'apoc.periodic.', 'apoc.do.', 'apoc.nodes.delete',
+                            'apoc.cypher.dowrite', 'apoc.cypher.runwrite',
+                            'apoc.load.', 'apoc.import.', 'apoc.trigger.',
+                            'db.create', 'db.index.fulltext.create', 'db.clear',
+                            'dbms.')
+
+
+class RicgraphQueryTimeout(Exception):
+    """Raised if a query does not finish within the time budget of the
+    current thread, see set_cypher_time_budget().
+    """
+    def __init__(self, message: str = 'this query takes too long because it is too large, '
+                                      + 'please narrow your query'):
+        super().__init__(message)
+
+
+def set_cypher_session(session: Session | None, database: str = '') -> None:
+    """Set the session for the current thread. Until it is set to None,
+    cypher_execute_query() runs the queries for 'database' in this session.
+    It should be a read session, since it is only used for reading.
+    The caller is responsible for closing the session.
+
+    :param session: the session, or None to stop using it.
+    :param database: the name of the database of the session.
+    :return: None.
+    """
+    _cypher_session.session = session
+    _cypher_session.database = database
+    return
+
+
+def get_cypher_session() -> Session | None:
+    """Get the session for the current thread.
+
+    :return: the session, or None if it has not been set.
+    """
+    return getattr(_cypher_session, 'session', None)
+
+
+def set_cypher_time_budget(query_timeout: float = 0, page_timeout: float = 0) -> None:
+    """Set the time budget for the current thread. Until it is set again,
+    every query done with cypher_execute_query() in this thread should finish
+    within 'query_timeout' seconds, and all these queries together should
+    finish within 'page_timeout' seconds from now. Both are passed to the
+    graph database backend as a transaction timeout, so the backend stops
+    a query that takes too long, also if nobody waits for its result anymore.
+
+    :param query_timeout: the maximum number of seconds of one query, 0 means no maximum.
+    :param page_timeout: the maximum number of seconds of all queries from now,
+      0 means no maximum.
+    :return: None.
+    """
+    _cypher_session.query_timeout = query_timeout
+    if page_timeout > 0:
+        _cypher_session.deadline = monotonic() + page_timeout
+    else:
+        _cypher_session.deadline = 0
+    return
+
+
+def get_cypher_query_timeout() -> float | None:
+    """Get the transaction timeout for the next query in the current thread,
+    see set_cypher_time_budget().
+
+    :return: the timeout in seconds, or None if there is no time budget.
+    """
+    query_timeout = getattr(_cypher_session, 'query_timeout', 0)
+    deadline = getattr(_cypher_session, 'deadline', 0)
+    if deadline == 0:
+        if query_timeout == 0:
+            return None
+        return query_timeout
+    remaining = deadline - monotonic()
+    if remaining < _CYPHER_MIN_QUERY_TIMEOUT:
+        raise RicgraphQueryTimeout()
+    if query_timeout == 0:
+        return remaining
+    return min(query_timeout, remaining)
+
+
+def cypher_session_execute_query(session: Session, query_: str | Query, **kwargs) -> EagerResult:
+    """Execute a Cypher query in a session, in an auto-commit transaction.
+    This avoids the setup of a session and a transaction for every query.
+
+    :param session: the session.
+    :param query_: the Cypher query, or a Query with the Cypher query and its timeout.
+    :param kwargs: the other parameters for graph.execute_query(), the ones
+      that do not end with '_' are the parameters of the Cypher query.
+    :return: the result, in the same format as graph.execute_query().
+    """
+    parameters = dict(kwargs.get('parameters_', {}))
+    for key, value in kwargs.items():
+        if not key.endswith('_'):
+            parameters[key] = value
+    return session.run(query_, parameters).to_eager_result()
+
+
+def cypher_query_is_read(query_: str, routing: RoutingControl | None = None) -> bool:
+    """Determine if a Cypher query only reads, so that it can be run in
+    the (read) session for the current thread.
+    If the routing is given, that decides. Otherwise, a query is
+    considered to be a read query if it does not contain a clause that
+    writes (also not in a CALL { ... } subquery), does not run in
+    separate transactions, and does not call a procedure that writes.
+    That may be too strict (e.g. if a string in the query contains
+    one of these words), but then the query is only run in a new session.
+
+    :param query_: the Cypher query.
+    :param routing: the routing_ parameter for graph.execute_query(), if any.
+    :return: True if it is a read query, otherwise False.
+    """
+    if routing is not None:
+        return routing == RoutingControl.READ
+    if search(_CYPHER_WRITE_CLAUSES, query_, IGNORECASE) is not None:
+        return False
+    for procedure in findall(_CYPHER_PROCEDURE_CALL, query_, IGNORECASE):
+        if procedure.lower().startswith(_CYPHER_WRITE_PROCEDURES):
+            return False
+    return True
+
+
+def cypher_execute_query(graph: Driver, query_: str, **kwargs) -> EagerResult:
+    """Execute a Cypher query using graph.execute_query(), and record
+    its duration, the number of rows it returns, and the function that called it.
+    Use it exactly as graph.execute_query(), e.g.:
+    records, summary, keys = cypher_execute_query(graph=graph, query_=..., ...).
+    If a session has been set for the current thread with set_cypher_session(),
+    and the query is for its database and only reads (see cypher_query_is_read()),
+    the query is run in that session. Queries that may write never use that
+    session, since it is a read session.
+    If a time budget has been set for the current thread with set_cypher_time_budget(),
+    the query gets a transaction timeout.
+
+    :param graph: the graph.
+    :param query_: the Cypher query.
+    :param kwargs: the other parameters for graph.execute_query().
+    :return: the result of graph.execute_query().
+    :raises RicgraphQueryTimeout: if the query does not finish within the time budget.
+    """
+    caller = currentframe().f_back.f_code.co_name
+    start = perf_counter()
+    timeout = get_cypher_query_timeout()
+    if timeout is None:
+        query = query_
+    else:
+        # graph.execute_query() accepts a Query from neo4j 5.15.
+        query = Query(text=query_, timeout=timeout)
+    session = get_cypher_session()
+    try:
+        if session is not None and kwargs.get('database_') == _cypher_session.database \
+           and cypher_query_is_read(query_=query_, routing=kwargs.get('routing_')):
+            try:
+                result = cypher_session_execute_query(session=session, query_=query, **kwargs)
+            except (ServiceUnavailable, SessionExpired):
+                # E.g. the graph database backend has been restarted. Do not use this
+                # session anymore, and retry with execute_query(), which retries itself.
+                # The session was a read session, so this query is a read query.
+                set_cypher_session(session=None)
+                try:
+                    session.close()
+                except (ServiceUnavailable, SessionExpired):
+                    pass
+                result = graph.execute_query(query_=query,
+                                             **({'routing_': RoutingControl.READ} | kwargs))
+        else:
+            result = graph.execute_query(query_=query, **kwargs)
+    except Neo4jError as error:
+        if error.code is None or 'TransactionTimedOut' not in error.code:
+            raise
+        querystats_record(cypher_query=query_,
+                          caller=caller,
+                          duration=perf_counter() - start,
+                          nr_rows=0)
+        # The timeout may also have been set in the graph database backend configuration.
+        print('cypher_execute_query(): Error, query called from ' + caller
+              + '() has been stopped after ' + '{:.1f}'.format(perf_counter() - start)
+              + ' seconds, it took too long.')
+        raise RicgraphQueryTimeout() from error
+    querystats_record(cypher_query=query_,
+                      caller=caller,
+                      duration=perf_counter() - start,
+                      nr_rows=len(result.records))
+    return result
@@ -0,0 +1,515 @@
+# ########################################################################
+#
+# Ricgraph - Research in context graph
+#
+# ########################################################################
+#
+# MIT License
+#
+# Copyright (c) 2026 Rik D.T. Janssen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# ########################################################################
+#
+#
+# Ricgraph embedded graph database backend.
+# This is an in-memory graph database backend that runs in the same process
+# as Ricgraph, so there is no need to run a Neo4j or Memgraph server.
+# It implements the operations on nodes and edges that are used by
+# ricgraph_cypher.py, it does not implement Cypher.
+# The graph can be written to and read from a file, so it can be used
+# in more than one script, e.g. a harvest script followed by Ricgraph Explorer.
+# It is intended for small graphs, unit tests, one-off harvests and
+# benchmarks. For large graphs, use Neo4j or Memgraph.
+# Note that Ricgraph Explorer functions that use Cypher queries directly
+# (in ricgraph_explorer_cypher.py) do not work with this backend.
+#
+# This backend can also be used for an initial full harvest of a large
+# organization. Since all nodes and edges are in memory, this is much
+# faster than a harvest in Neo4j, where every node and edge is a separate
+# transaction. All unification of nodes and assignment of person-root nodes
+# is done by Ricgraph as usual. When the graph is closed, it is written
+# in the format of the Neo4j offline importer 'neo4j-admin database import',
+# so that an empty Neo4j database can be built in minutes.
+#
+# ########################################################################
+#
+# Original version Rik D.T. Janssen, October 2026.
+#
+# ########################################################################
+
+
+from os import path, replace, getpid, makedirs
+from json import load, dump, JSONDecodeError
+from csv import writer, QUOTE_ALL
+from threading import RLock
+from typing import Callable
+from .ricgraph_constants import (RICGRAPH_EMBEDDED_FORMAT_VERSION,
+                                 NEO4J_ADMIN_IMPORT_NODES_FILENAME,
+                                 NEO4J_ADMIN_IMPORT_EDGES_FILENAME,
+                                 NEO4J_ADMIN_IMPORT_ARRAY_DELIMITER)
+
+
+class EmbeddedNode:
+    """A node in the embedded graph database backend.
+    It behaves like a neo4j.graph.Node, as far as it is used by Ricgraph:
+    it has an 'element_id' and 'labels', and its properties can be
+    accessed like a dict, e.g. node['name'] or node.get('name').
+    Like a neo4j.graph.Node, it is a copy of the node in the graph at
+    the moment it was read, it does not change if the graph changes.
+    """
+    def __init__(self, element_id: str, labels: frozenset, properties: dict):
+        self.element_id = element_id
+        self.labels = labels
+        self._properties = properties
+
+    def __getitem__(self, key: str):
+        return self._properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._properties
+
+    def __iter__(self):
+        return iter(self._properties)
+
+    def __len__(self) -> int:
+        return len(self._properties)
+
+    def __eq__(self, other) -> bool:
+        # Two nodes are equal if their element_id's are equal, see also
+        # node_eq() in ricgraph_cypher.py.
+        return isinstance(other, EmbeddedNode) and self.element_id == other.element_id
+
+    def __hash__(self) -> int:
+        return hash(self.element_id)
+
+    def __repr__(self) -> str:
+        return '<EmbeddedNode element_id=' + repr(self.element_id) \
+               + ' labels=' + repr(set(self.labels)) \
+               + ' properties=' + repr(self._properties) + '>'
+
+    def get(self, key: str, default=None):
+        return self._properties.get(key, default)
+
+    def keys(self):
+        return self._properties.keys()
+
+    def values(self):
+        return self._properties.values()
+
+    def items(self):
+        return self._properties.items()
+
+
+class EmbeddedGraph:
+    """The embedded graph database backend.
+    Nodes are stored in a dict with their element_id as key. Edges are
+    stored as adjacency sets: for every node the set of element_ids of the
+    nodes it has an edge to, and the set of element_ids of the nodes that
+    have an edge to it. There is an index on property '_key'.
+    All operations are protected by a lock, since Ricgraph Explorer
+    handles requests in more than one thread.
+    """
+    def __init__(self, filename: str = '', bulk_import_directory: str = ''):
+        """Create an embedded graph. If 'filename' exists, the graph is read from it.
+
+        :param filename: the file to persist the graph in, or '' to keep it in memory only.
+        :param bulk_import_directory: the directory to write the files for
+          'neo4j-admin database import' to when the graph is closed,
+          or '' to not write them.
+        """
+        self.filename = filename
+        self.bulk_import_directory = bulk_import_directory
+        self._lock = RLock()
+        self._nodes = {}
+        self._labels = {}
+        self._edges = {}
+        self._edges_in = {}
+        self._key_index = {}
+        self._next_id = 0
+        self._changed = False
+        if self.filename != '' and path.isfile(self.filename):
+            self.read_file()
+
+    # ##############################################################################
+    # Functions to persist the graph.
+    # ##############################################################################
+    def read_file(self) -> None:
+        """Read the graph from its file.
+
+        :return: None.
+        """
+        try:
+            with open(self.filename) as fd:
+                contents = load(fp=fd)
+        except (OSError, JSONDecodeError):
+            print('EmbeddedGraph.read_file(): Error, could not read file "' + self.filename + '".')
+            return
+        if contents.get('format_version', 0) != RICGRAPH_EMBEDDED_FORMAT_VERSION:
+            print('EmbeddedGraph.read_file(): Error, file "' + self.filename
+                  + '" has an unknown format, ignoring it.')
+            return
+        with self._lock:
+            self.empty()
+            self._next_id = contents['next_id']
+            for element_id, labels, properties in contents['nodes']:
+                self._nodes[element_id] = properties
+                self._labels[element_id] = frozenset(labels)
+                self._edges[element_id] = set()
+                self._edges_in[element_id] = set()
+                self._key_index_add(element_id=element_id)
+            for element_id, neighbor_ids in contents['edges']:
+                self._edges[element_id] = set(neighbor_ids)
+                for neighbor_id in neighbor_ids:
+                    self._edges_in[neighbor_id].add(element_id)
+            self._changed = False
+        print('Read embedded graph with ' + str(self.nr_nodes()) + ' nodes and '
+              + str(self.nr_edges()) + ' edges from file "' + self.filename + '".')
+        return
+
+    def write_file(self) -> None:
+        """Write the graph to its file, if it has been changed.
+        The file is written to a temporary file first, and then renamed,
+        so that other scripts never read a partially written graph.
+
+        :return: None.
+        """
+        if self.filename == '' or not self._changed:
+            return
+        with self._lock:
+            contents = {'format_version': RICGRAPH_EMBEDDED_FORMAT_VERSION,
+                        'next_id': self._next_id,
+                        'nodes': [[element_id, sorted(self._labels[element_id]), properties]
+                                  for element_id, properties in self._nodes.items()],
+                        'edges': [[element_id, sorted(neighbor_ids)]
+                                  for element_id, neighbor_ids in self._edges.items()
+                                  if len(neighbor_ids) > 0]}
+            temp_filename = self.filename + '.' + str(getpid()) + '.tmp'
+            try:
+                with open(temp_filename, 'w') as fd:
+                    dump(obj=contents, fp=fd, ensure_ascii=False)
+                replace(temp_filename, self.filename)
+            except OSError:
+                print('EmbeddedGraph.write_file(): Error, could not write file "'
+                      + self.filename + '".')
+                return
+            self._changed = False
+        print('Written embedded graph to file "' + self.filename + '".')
+        return
+
+    def write_neo4j_admin_import_files(self, directory: str) -> None:
+        """Write the graph in the format of the Neo4j offline importer
+        'neo4j-admin database import': one file with nodes and one with edges.
+        Properties that have a list as value (e.g. '_history') are written as
+        arrays, their elements separated by NEO4J_ADMIN_IMPORT_ARRAY_DELIMITER.
+        All values are quoted, so that empty strings are imported as empty
+        strings, and not as absent properties.
+
+        :param directory: the directory to write the files to.
+        :return: None.
+        """
+        filename_nodes = path.join(directory, NEO4J_ADMIN_IMPORT_NODES_FILENAME)
+        filename_edges = path.join(directory, NEO4J_ADMIN_IMPORT_EDGES_FILENAME)
+        print('Writing files for neo4j-admin database import to directory "'
+              + directory + '"...', end=' ', flush=True)
+        with self._lock:
+            # Determine the properties, and which of them are arrays.
+            property_names = []
+            array_properties = set()
+            for properties in self._nodes.values():
+                for name, value in properties.items():
+                    if name not in property_names:
+                        property_names.append(name)
+                    if isinstance(value, list):
+                        array_properties.add(name)
+            header = [':ID', ':LABEL']
+            for name in property_names:
+                if name in array_properties:
+                    header.append(name + ':string[]')
+                else:
+                    header.append(name)
+
+            try:
+                makedirs(name=directory, exist_ok=True)
+                with open(filename_nodes, 'w', newline='') as fd:
+                    csv_writer = writer(fd, quoting=QUOTE_ALL, lineterminator='\n')
+                    csv_writer.writerow(header)
+                    for element_id, properties in self._nodes.items():
+                        row = [element_id,
+                               NEO4J_ADMIN_IMPORT_ARRAY_DELIMITER.join(sorted(self._labels[element_id]))]
+                        for name in property_names:
+                            value = properties.get(name, '')
+                            if value is None:
+                                value = ''
+                            if isinstance(value, list):
+                                row.append(NEO4J_ADMIN_IMPORT_ARRAY_DELIMITER.join(str(item) for item in value))
+                            else:
+                                row.append(str(value))
+                        csv_writer.writerow(row)
+
+                with open(filename_edges, 'w', newline='') as fd:
+                    csv_writer = writer(fd, quoting=QUOTE_ALL, lineterminator='\n')
+                    csv_writer.writerow([':START_ID', ':END_ID', ':TYPE'])
+                    for element_id, neighbor_ids in self._edges.items():
+                        for neighbor_id in sorted(neighbor_ids, key=int):
+                            csv_writer.writerow([element_id, neighbor_id, 'LINKS_TO'])
+            except OSError:
+                print('\nEmbeddedGraph.write_neo4j_admin_import_files(): Error, could not write files in directory "'
+                      + directory + '".')
+                return
+        print('Done.')
+        return
+
+    def close(self) -> None:
+        """Close the graph, this writes it to its file, and, if
+        'bulk_import_directory' is set, the files for 'neo4j-admin database import'.
+
+        :return: None.
+        """
+        self.write_file()
+        if self.bulk_import_directory != '':
+            self.write_neo4j_admin_import_files(directory=self.bulk_import_directory)
+        return
+
+    # ##############################################################################
+    # Internal functions.
+    # ##############################################################################
+    def _key_index_add(self, element_id: str) -> None:
+        key = self._nodes[element_id].get('_key')
+        if key is None:
+            return
+        if key not in self._key_index:
+            self._key_index[key] = []
+        self._key_index[key].append(element_id)
+        return
+
+    def _key_index_delete(self, element_id: str) -> None:
+        key = self._nodes[element_id].get('_key')
+        if key is None or key not in self._key_index:
+            return
+        if element_id in self._key_index[key]:
+            self._key_index[key].remove(element_id)
+        if len(self._key_index[key]) == 0:
+            del self._key_index[key]
+        return
+
+    def _create_embedded_node(self, element_id: str) -> EmbeddedNode:
+        return EmbeddedNode(element_id=element_id,
+                            labels=self._labels[element_id],
+                            properties=self._nodes[element_id].copy())
+
+    # ##############################################################################
+    # Node and edge functions.
+    # ##############################################################################
+    def empty(self) -> None:
+        """Delete all nodes and edges.
+
+        :return: None.
+        """
+        with self._lock:
+            self._nodes = {}
+            self._labels = {}
+            self._edges = {}
+            self._edges_in = {}
+            self._key_index = {}
+            self._changed = True
+        return
+
+    def nr_nodes(self) -> int:
+        """Count the number of nodes.
+
+        :return: the number of nodes.
+        """
+        return len(self._nodes)
+
+    def nr_edges(self) -> int:
+        """Count the number of edges.
+
+        :return: the number of edges.
+        """
+        with self._lock:
+            return sum(len(neighbor_ids) for neighbor_ids in self._edges.values())
+
+    def nr_edges_of_node(self, element_id: str) -> int:
+        """Count the number of edges from a node.
+
+        :param element_id: the element_id of the node.
+        :return: the number of edges.
+        """
+        with self._lock:
+            return len(self._edges.get(element_id, set()))
+
+    def create_node(self, labels: list, properties: dict) -> EmbeddedNode:
+        """Create a node.
+
+        :param labels: the labels of the node.
+        :param properties: the properties of the node.
+        :return: the node created.
+        """
+        with self._lock:
+            element_id = str(self._next_id)
+            self._next_id += 1
+            self._nodes[element_id] = properties.copy()
+            self._labels[element_id] = frozenset(labels)
+            self._edges[element_id] = set()
+            self._edges_in[element_id] = set()
+            self._key_index_add(element_id=element_id)
+            self._changed = True
+            return self._create_embedded_node(element_id=element_id)
+
+    def read_node(self, element_id: str) -> EmbeddedNode | None:
+        """Read a node.
+
+        :param element_id: the element_id of the node.
+        :return: the node, or None if it does not exist.
+        """
+        with self._lock:
+            if element_id not in self._nodes:
+                return None
+            return self._create_embedded_node(element_id=element_id)
+
+    def read_nodes_key(self, key: str) -> list:
+        """Read the nodes with a certain value for property '_key'.
+
+        :param key: the key.
+        :return: a list with the nodes found.
+        """
+        with self._lock:
+            return [self._create_embedded_node(element_id=element_id)
+                    for element_id in self._key_index.get(key, [])]
+
+    def find_nodes(self, condition: Callable[[dict], bool],
+                   max_nr_nodes: int = 0) -> list:
+        """Find the nodes for which 'condition' is True.
+        This is a scan of all nodes.
+
+        :param condition: a function with the properties of a node as parameter.
+        :param max_nr_nodes: return at most this number of nodes, 0 = all nodes.
+        :return: a list with the nodes found.
+        """
+        nodes = []
+        with self._lock:
+            for element_id, properties in self._nodes.items():
+                if not condition(properties):
+                    continue
+                nodes.append(self._create_embedded_node(element_id=element_id))
+                if 0 < max_nr_nodes <= len(nodes):
+                    break
+        return nodes
+
+    def update_node(self, element_id: str, properties: dict) -> EmbeddedNode | None:
+        """Update the properties of a node, like 'SET node+=$properties' in Cypher.
+
+        :param element_id: the element_id of the node.
+        :param properties: the properties to change or add.
+        :return: the node updated, or None if it does not exist.
+        """
+        with self._lock:
+            if element_id not in self._nodes:
+                return None
+            self._key_index_delete(element_id=element_id)
+            self._nodes[element_id].update(properties)
+            self._key_index_add(element_id=element_id)
+            self._changed = True
+            return self._create_embedded_node(element_id=element_id)
+
+    def delete_node(self, element_id: str) -> None:
+        """Delete a node and all of its edges.
+
+        :param element_id: the element_id of the node.
+        :return: None.
+        """
+        with self._lock:
+            if element_id not in self._nodes:
+                return
+            for neighbor_id in self._edges[element_id]:
+                self._edges_in[neighbor_id].discard(element_id)
+            for neighbor_id in self._edges_in[element_id]:
+                self._edges[neighbor_id].discard(element_id)
+            self._key_index_delete(element_id=element_id)
+            del self._nodes[element_id]
+            del self._labels[element_id]
+            del self._edges[element_id]
+            del self._edges_in[element_id]
+            self._changed = True
+        return
+
+    def create_edge(self, from_element_id: str, to_element_id: str) -> bool:
+        """Create an edge from one node to another node, if it does not exist,
+        like 'MERGE (from)-[:LINKS_TO]->(to)' in Cypher.
+
+        :param from_element_id: the element_id of the from node.
+        :param to_element_id: the element_id of the to node.
+        :return: True if both nodes exist, otherwise False.
+        """
+        with self._lock:
+            if from_element_id not in self._nodes or to_element_id not in self._nodes:
+                return False
+            if to_element_id not in self._edges[from_element_id]:
+                self._edges[from_element_id].add(to_element_id)
+                self._edges_in[to_element_id].add(from_element_id)
+                self._changed = True
+            return True
+
+    def neighbor_nodes(self, element_id: str,
+                       condition: Callable[[dict], bool] = None,
+                       max_nr_nodes: int = 0) -> list:
+        """Get the neighbors of a node (the nodes it has an edge to)
+        for which 'condition' is True.
+
+        :param element_id: the element_id of the node.
+        :param condition: a function with the properties of a node as parameter,
+          or None for all neighbors.
+        :param max_nr_nodes: return at most this number of nodes, 0 = all nodes.
+        :return: a list with the nodes found.
+        """
+        nodes = []
+        with self._lock:
+            # Sort to make the order of the neighbors deterministic.
+            for neighbor_id in sorted(self._edges.get(element_id, set()), key=int):
+                if condition is not None and not condition(self._nodes[neighbor_id]):
+                    continue
+                nodes.append(self._create_embedded_node(element_id=neighbor_id))
+                if 0 < max_nr_nodes <= len(nodes):
+                    break
+        return nodes
+
+    def merge_nodes(self, from_element_id: str, to_element_id: str,
+                    to_properties: dict) -> EmbeddedNode | None:
+        """Merge two nodes. The neighbors of the from node will become
+        neighbors of the to node, and the from node will be deleted.
+
+        :param from_element_id: the element_id of the from node.
+        :param to_element_id: the element_id of the to node.
+        :param to_properties: the properties to change or add in the to node.
+        :return: the to node, or None if one of the nodes does not exist.
+        """
+        with self._lock:
+            if from_element_id not in self._nodes or to_element_id not in self._nodes:
+                return None
+            for neighbor_id in list(self._edges[from_element_id]):
+                if neighbor_id == to_element_id:
+                    # Prevent creating a self-relationship on the to node.
+                    continue
+                self.create_edge(from_element_id=to_element_id, to_element_id=neighbor_id)
+                self.create_edge(from_element_id=neighbor_id, to_element_id=to_element_id)
+            self.delete_node(element_id=from_element_id)
+            return self.update_node(element_id=to_element_id,
+                                    properties=to_properties)
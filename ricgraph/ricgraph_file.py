@@ -44,9 +44,10 @@
 
 from os import makedirs
 from os.path import isfile, dirname, exists
-from pandas import DataFrame, read_csv
+from pandas import DataFrame, read_csv, read_parquet, read_feather
 from csv import QUOTE_ALL
 from json import load, dump
+import gzip
 
 
 def write_json_to_file(filename:str,
@@ -84,8 +85,14 @@ def write_json_to_file(filename:str,
         print('write_json_to_file(): Error, filename "' + filename + '" is not writable, exiting.')
         exit(1)
 
-    with open(filename, 'w') as fd:
-        dump(obj=json_data, fp=fd, ensure_ascii=False, indent=2)
+    if filename.endswith('.gz'):
+        # A compressed file, see construct_filename(). Do not indent,
+        # this file is not meant to be read by humans.
+        with gzip.open(filename, 'wt', encoding='utf-8') as fd:
+            dump(obj=json_data, fp=fd, ensure_ascii=False)
+    else:
+        with open(filename, 'w') as fd:
+            dump(obj=json_data, fp=fd, ensure_ascii=False, indent=2)
     print('Done.')
     return
 
@@ -107,8 +114,12 @@ def read_json_from_file(filename: str,
             print('\nread_json_from_file(): Warning, file "' + filename + '" does not exist, continuing...\n')
             return []
 
-    with open(filename) as fd:
-        json_data = load(fp=fd)
+    if filename.endswith('.gz'):
+        with gzip.open(filename, 'rt', encoding='utf-8') as fd:
+            json_data = load(fp=fd)
+    else:
+        with open(filename) as fd:
+            json_data = load(fp=fd)
     print('Done.')
     if json_data is None:
         return []
@@ -215,8 +226,10 @@ def write_dataframe_to_csv(filename: str,
                            df: DataFrame | None,
                            write_index: bool = False) -> None:
     """Write a DataFrame to file.
+    If the extension of 'filename' is '.parquet' or '.feather', the DataFrame
+    is written in that columnar and compressed format, otherwise as csv file.
 
-    :param filename: csv file to write.
+    :param filename: csv (or parquet or feather) file to write.
       It will also work if you specify a directory and filename.
     :param df: dataframe to write.
     :param write_index: whether to write the index of the DataFrame
@@ -251,6 +264,11 @@ def write_dataframe_to_csv(filename: str,
         print('write_dataframe_to_csv(): Error, filename "' + filename + '" is not writable, exiting.')
         exit(1)
 
+    if filename.endswith('.parquet') or filename.endswith('.feather'):
+        write_dataframe_to_columnar_file(filename=filename, df=df, write_index=write_index)
+        print('Done.')
+        return
+
     # PyCharm generates a warning
     # "Unexpected type(s): (str, str, bool, str, int, str) [etc.]...".
     df.to_csv(filename,
@@ -269,13 +287,17 @@ def read_dataframe_from_csv(filename: str,
                             datatype=str,
                             read_index: bool = False) -> DataFrame:
     """Read a DataFrame from csv file.
+    If the extension of 'filename' is '.parquet' or '.feather', the DataFrame
+    is read from that columnar format. Then only the columns in 'columns' are
+    read from file, and with datatype=None the types of the columns are kept.
 
-    :param filename: csv file to read.
+    :param filename: csv (or parquet or feather) file to read.
     :param columns: which columns to read.
     :param nr_rows: how many rows to read (default: all).
     :param datatype: type of (some) columns to read.
     :param read_index: whether to use the first column
       from the csv file (True) or not (False) for index in the DataFrame.
+      For parquet and feather files, the index is read if it has been written.
     :return: dataframe read.
     """
     print('Reading DataFrame from csv file ' + filename + '...', end=' ')
@@ -283,6 +305,14 @@ def read_dataframe_from_csv(filename: str,
         print('read_dataframe_from_csv(): Error, file "' + filename + '" does not exist, exiting...')
         exit(1)
 
+    if filename.endswith('.parquet') or filename.endswith('.feather'):
+        columnar_data = read_dataframe_from_columnar_file(filename=filename,
+                                                          columns=columns,
+                                                          nr_rows=nr_rows,
+                                                          datatype=datatype)
+        print('Done.')
+        return columnar_data
+
     # Note the inconsistent type of 'index_col'.
     if read_index:
         index_col = 0
@@ -325,3 +355,87 @@ def read_dataframe_from_csv(filename: str,
     # PyCharm generates a warning
     # "Expected type 'DataFrame', got 'TextFileReader | DataFrame' instead".
     return csv_data
+
+
+def write_dataframe_to_columnar_file(filename: str,
+                                     df: DataFrame,
+                                     write_index: bool = False) -> None:
+    """Write a DataFrame to a parquet or feather file, compressed with zstd.
+    Use write_dataframe_to_csv(), it calls this function depending on
+    the extension of 'filename'.
+
+    :param filename: parquet or feather file to write.
+    :param df: dataframe to write.
+    :param write_index: whether to write the index of the DataFrame (True) or not (False).
+    :return: None.
+    """
+    try:
+        from pyarrow import ArrowInvalid, ArrowTypeError
+    except ImportError:
+        print('write_dataframe_to_columnar_file(): Error, package "pyarrow" is not installed, exiting.')
+        exit(1)
+
+    if filename.endswith('.feather'):
+        # A feather file cannot store a non-default index.
+        if write_index:
+            df = df.reset_index()
+        else:
+            df = df.reset_index(drop=True)
+    try:
+        if filename.endswith('.feather'):
+            df.to_feather(filename, compression='zstd')
+        else:
+            df.to_parquet(filename, compression='zstd', index=write_index)
+        return
+    except (ArrowInvalid, ArrowTypeError) as error:
+        # A column of type 'object' may contain values of different types,
+        # e.g. strings and numbers, which cannot be stored in a column
+        # of a parquet or feather file. Convert them to string and try again.
+        print('write_dataframe_to_columnar_file(): Warning, cannot write "' + filename + '": '
+              + str(error) + ',')
+        print('  converting the values in the columns of type "object" to string.')
+
+    df = df.copy()
+    for column in df.columns:
+        if df[column].dtype == object:
+            df[column] = df[column].where(df[column].isna(), df[column].astype(str))
+    if filename.endswith('.feather'):
+        df.to_feather(filename, compression='zstd')
+    else:
+        df.to_parquet(filename, compression='zstd', index=write_index)
+    return
+
+
+def read_dataframe_from_columnar_file(filename: str,
+                                      columns: dict = None,
+                                      nr_rows: int = None,
+                                      datatype=str) -> DataFrame:
+    """Read a DataFrame from a parquet or feather file.
+    Use read_dataframe_from_csv(), it calls this function depending on
+    the extension of 'filename'.
+
+    :param filename: parquet or feather file to read.
+    :param columns: which columns to read.
+    :param nr_rows: how many rows to read (default: all).
+    :param datatype: type of (some) columns, if str, empty values are
+      converted to '', as read_dataframe_from_csv() does for a csv file.
+      If None, the types of the columns in the file are kept.
+    :return: dataframe read.
+    """
+    if columns is not None:
+        columns = list(columns)
+    try:
+        if filename.endswith('.feather'):
+            columnar_data = read_feather(filename, columns=columns)
+        else:
+            columnar_data = read_parquet(filename, columns=columns)
+    except ImportError:
+        print('read_dataframe_from_columnar_file(): Error, package "pyarrow" is not installed, exiting.')
+        exit(1)
+    if nr_rows is not None:
+        columnar_data = columnar_data.head(nr_rows)
+    if datatype is str:
+        columnar_data = columnar_data.fillna(value='').astype(str)
+    elif datatype is not None:
+        columnar_data = columnar_data.astype(datatype)
+    return columnar_data
@@ -0,0 +1,127 @@
+# ########################################################################
+#
+# Ricgraph - Research in context graph
+#
+# ########################################################################
+#
+# MIT License
+#
+# Copyright (c) 2026 Rik D.T. Janssen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# ########################################################################
+#
+# Ricgraph organization hierarchy functions.
+# The organization hierarchy maps every organization that is part of an
+# organization with a hierarchy (as specified in 'organizations_with_hierarchies'
+# in the Ricgraph ini file) to its ancestors and its descendants. It is
+# created at the end of a harvest and stored in the Ricgraph snapshot,
+# so that Ricgraph Explorer can find the descendants of an organization
+# with a lookup, instead of matching on organization names in a query
+# (this is used for collaborations, see find_collabs_cypher()).
+# Organizations that are not in it have no ancestors and no descendants.
+#
+# ########################################################################
+#
+# Original version Rik D.T. Janssen, October 2026.
+#
+# ########################################################################
+
+
+from .ricgraph_utils import (get_configfile_key_organizations_with_hierarchies,
+                             extract_organization_abbreviation)
+from .ricgraph_cypher import read_all_organization_names
+
+
+def get_organizations_with_hierarchies() -> dict:
+    """Get the top level organizations of the organizations that have
+    a hierarchy, from 'organizations_with_hierarchies' in the Ricgraph ini file.
+
+    :return: a dict with the organization abbreviation as key, and
+      the name of its top level organization as value.
+    """
+    orgs_with_hierarchies = get_configfile_key_organizations_with_hierarchies()
+    top_level_organizations = {}
+    if orgs_with_hierarchies is None:
+        return top_level_organizations
+    for row in orgs_with_hierarchies.itertuples(index=False):
+        top_level_organizations[str(row.org_abbreviation)] = str(row.org_fullname)
+    return top_level_organizations
+
+
+def create_organization_hierarchy() -> dict:
+    """Create the organization hierarchy. In Ricgraph, every person is
+    connected to its organization and to all its parent organizations,
+    so there are no edges between organizations. Therefore, the hierarchy is
+    determined using the organization abbreviation: every organization that
+    has the same abbreviation as a top level organization is a
+    descendant of it.
+
+    :return: the organization hierarchy, a dict with keys
+      'top_level_organizations' (see get_organizations_with_hierarchies())
+      and 'organizations'. The value of the latter is a dict with the organization
+      name as key, and a dict with keys 'ancestors' (ordered from nearest to
+      top level) and 'descendants' as value.
+    """
+    top_level_organizations = get_organizations_with_hierarchies()
+    organizations = {}
+    for org_abbr, top_level_org in top_level_organizations.items():
+        descendants = []
+        for org_name in read_all_organization_names(starts_with=org_abbr):
+            if org_name == top_level_org \
+               or extract_organization_abbreviation(org_name=org_name) != org_abbr:
+                continue
+            descendants.append(org_name)
+            organizations[org_name] = {'ancestors': [top_level_org],
+                                       'descendants': []}
+        organizations[top_level_org] = {'ancestors': [],
+                                        'descendants': descendants}
+
+    organization_hierarchy = {'top_level_organizations': top_level_organizations,
+                              'organizations': organizations}
+    return organization_hierarchy
+
+
+def organization_hierarchy_is_current(organization_hierarchy: dict) -> bool:
+    """Determine if an organization hierarchy has been created for the
+    'organizations_with_hierarchies' that are in the Ricgraph ini file now.
+    The data in Ricgraph is checked by ricgraph_snapshot_is_current().
+
+    :param organization_hierarchy: the organization hierarchy.
+    :return: True if it is current, otherwise False.
+    """
+    if 'organizations' not in organization_hierarchy:
+        return False
+    return organization_hierarchy.get('top_level_organizations') \
+        == get_organizations_with_hierarchies()
+
+
+def get_organization_descendants(organization_hierarchy: dict,
+                                 org_name: str) -> list:
+    """Get the descendants of an organization.
+
+    :param organization_hierarchy: the organization hierarchy.
+    :param org_name: the organization name.
+    :return: the list of descendants, or [] if there are none.
+    """
+    organizations = organization_hierarchy.get('organizations', {})
+    if org_name not in organizations:
+        return []
+    return organizations[org_name]['descendants']
@@ -0,0 +1,222 @@
+# ########################################################################
+#
+# Ricgraph - Research in context graph
+#
+# ########################################################################
+#
+# MIT License
+#
+# Copyright (c) 2026 Rik D.T. Janssen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# ########################################################################
+#
+# Ricgraph query statistics functions.
+# Every query to the graph database backend is timed. For every query shape
+# (the query with its literal values removed) we keep the number of calls,
+# the number of rows returned, the calling functions, and a histogram of
+# the durations. Queries that are slower than a threshold are printed in
+# the slow query log.
+# Note that the statistics are per process, so every Ricgraph Explorer
+# worker has its own statistics.
+# The queries are recorded by cypher_execute_query() in ricgraph_cypher_session.py.
+#
+# ########################################################################
+#
+# Original version Rik D.T. Janssen, October 2026.
+#
+# ########################################################################
+
+
+from threading import Lock
+from re import sub
+from .ricgraph_constants import (SLOW_QUERY_THRESHOLD_DEFAULT,
+                                 QUERYSTATS_HISTOGRAM_BOUNDS)
+from .ricgraph_utils import get_configfile_key, datetimestamp
+
+
+# The statistics, the key is the query shape, the value a dict
+# with the statistics of that query shape.
+_querystats = {}
+# The statistics are updated from more than one thread in Ricgraph Explorer.
+_querystats_lock = Lock()
+# The threshold in milliseconds for the slow query log, read once from the ini file.
+_slow_query_threshold = None
+
+
+def get_slow_query_threshold() -> int:
+    """Get the threshold in milliseconds for the slow query log.
+    It is read from the Ricgraph ini file, or, if it is not there,
+    SLOW_QUERY_THRESHOLD_DEFAULT.
+
+    :return: the threshold, 0 means: no slow query log.
+    """
+    global _slow_query_threshold
+
+    if _slow_query_threshold is not None:
+        return _slow_query_threshold
+    threshold = get_configfile_key(section='Ricgraph',
+                                   key='ricgraph_slow_query_threshold')
+    if threshold == '':
+        _slow_query_threshold = SLOW_QUERY_THRESHOLD_DEFAULT
+    elif not threshold.isdigit():
+        print('get_slow_query_threshold(): Error, invalid value "' + threshold + '"')
+        print('  for "ricgraph_slow_query_threshold" in Ricgraph ini file,')
+        print('  using default value ' + str(SLOW_QUERY_THRESHOLD_DEFAULT) + '.')
+        _slow_query_threshold = SLOW_QUERY_THRESHOLD_DEFAULT
+    else:
+        _slow_query_threshold = int(threshold)
+    return _slow_query_threshold
+
+
+def get_query_shape(cypher_query: str) -> str:
+    """Get the shape of a Cypher query. That is the query with its
+    string and number literals replaced by '?', and with normalized whitespace.
+    Most queries in Ricgraph use parameters, so their shape is the query itself,
+    but some have values in the query text, e.g. lists of categories.
+
+    :param cypher_query: the Cypher query.
+    :return: the shape of the query.
+    """
+    shape = sub(pattern=r"'(?:[^'\\]|\\.)*'", repl='?', string=cypher_query)
+    shape = sub(pattern=r'"(?:[^"\\]|\\.)*"', repl='?', string=shape)
+    shape = sub(pattern=r'\b\d+\b', repl='?', string=shape)
+    shape = ' '.join(shape.split())
+    return shape
+
+
+def querystats_record(cypher_query: str, caller: str,
+                      duration: float, nr_rows: int) -> None:
+    """Record the statistics of one query, and print it in the slow query log
+    if it is slower than the threshold.
+
+    :param cypher_query: the Cypher query.
+    :param caller: the name of the function that did the query.
+    :param duration: the duration of the query in seconds.
+    :param nr_rows: the number of rows returned by the query.
+    :return: None.
+    """
+    duration_ms = duration * 1000
+    shape = get_query_shape(cypher_query=cypher_query)
+    bucket = len(QUERYSTATS_HISTOGRAM_BOUNDS)
+    for index, bound in enumerate(QUERYSTATS_HISTOGRAM_BOUNDS):
+        if duration_ms <= bound:
+            bucket = index
+            break
+
+    with _querystats_lock:
+        if shape not in _querystats:
+            _querystats[shape] = {'nr_calls': 0,
+                                  'nr_rows': 0,
+                                  'total_ms': 0.0,
+                                  'max_ms': 0.0,
+                                  'nr_slow': 0,
+                                  'histogram': [0] * (len(QUERYSTATS_HISTOGRAM_BOUNDS) + 1),
+                                  'callers': {}}
+        stats = _querystats[shape]
+        stats['nr_calls'] += 1
+        stats['nr_rows'] += nr_rows
+        stats['total_ms'] += duration_ms
+        stats['max_ms'] = max(stats['max_ms'], duration_ms)
+        stats['histogram'][bucket] += 1
+        stats['callers'][caller] = stats['callers'].get(caller, 0) + 1
+
+    threshold = get_slow_query_threshold()
+    if threshold == 0 or duration_ms < threshold:
+        return
+    with _querystats_lock:
+        stats['nr_slow'] += 1
+    print('\nSlow query at ' + datetimestamp(seconds=True) + ': '
+          + '{:.0f}'.format(duration_ms) + ' ms, ' + str(nr_rows) + ' rows, '
+          + 'called from ' + caller + '():')
+    print('  ' + shape + '\n')
+    return
+
+
+def querystats_reset() -> None:
+    """Reset the query statistics.
+
+    :return: None.
+    """
+    global _querystats
+
+    with _querystats_lock:
+        _querystats = {}
+    return
+
+
+def querystats_get() -> list:
+    """Get the query statistics, sorted on total duration, slowest first.
+
+    :return: a list of dicts, one for every query shape.
+    """
+    with _querystats_lock:
+        result = []
+        for shape, stats in _querystats.items():
+            result.append({'query_shape': shape,
+                           'callers': ', '.join(sorted(stats['callers'].keys())),
+                           'nr_calls': stats['nr_calls'],
+                           'nr_rows': stats['nr_rows'],
+                           'nr_slow': stats['nr_slow'],
+                           'total_ms': round(stats['total_ms'], 1),
+                           'mean_ms': round(stats['total_ms'] / stats['nr_calls'], 1),
+                           'max_ms': round(stats['max_ms'], 1),
+                           'histogram': stats['histogram'].copy()})
+    result.sort(key=lambda item: item['total_ms'], reverse=True)
+    return result
+
+
+def querystats_print(max_nr_shapes: int = 25) -> None:
+    """Print a summary table of the query statistics.
+
+    :param max_nr_shapes: print at most this number of query shapes,
+      the ones with the largest total duration.
+    :return: None.
+    """
+    querystats = querystats_get()
+    if len(querystats) == 0:
+        return
+    histogram_header = ''
+    for bound in QUERYSTATS_HISTOGRAM_BOUNDS:
+        histogram_header += '{:>8}'.format('<=' + str(bound))
+    histogram_header += '{:>8}'.format('>' + str(QUERYSTATS_HISTOGRAM_BOUNDS[-1]))
+
+    print('\n')
+    print('These are the query statistics of the graph database backend at ' + datetimestamp() + ',')
+    print('sorted on total duration (in ms), the histogram columns are in ms:')
+    print('{:>10} {:>10} {:>10} {:>8} {:>8} {:>6}'.format('total', 'calls', 'rows',
+                                                          'mean', 'max', 'slow')
+          + histogram_header + '  callers')
+    for stats in querystats[:max_nr_shapes]:
+        line = '{:>10.0f} {:>10} {:>10} {:>8.1f} {:>8.0f} {:>6}'.format(stats['total_ms'],
+                                                                       stats['nr_calls'],
+                                                                       stats['nr_rows'],
+                                                                       stats['mean_ms'],
+                                                                       stats['max_ms'],
+                                                                       stats['nr_slow'])
+        for count in stats['histogram']:
+            line += '{:>8}'.format(count)
+        line += '  ' + stats['callers']
+        print(line)
+        print('           query: ' + stats['query_shape'][:150])
+    if len(querystats) > max_nr_shapes:
+        print('(' + str(len(querystats) - max_nr_shapes) + ' more query shapes not shown)')
+    print('\n')
+    return
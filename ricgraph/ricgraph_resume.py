@@ -0,0 +1,200 @@
+# ########################################################################
+#
+# Ricgraph - Research in context graph
+#
+# ########################################################################
+#
+# MIT License
+#
+# Copyright (c) 2026 Rik D.T. Janssen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# ########################################################################
+#
+# Ricgraph resume functions.
+# Inserting the results of a large harvest in Ricgraph may take hours.
+# If the harvest script is interrupted (e.g. because the graph database
+# backend has been restarted), it can be resumed with option '--resume yes'.
+# To make this possible, create_nodepairs_and_edges_df() inserts its
+# DataFrame in chunks of RESUME_CHUNK_SIZE rows. After every chunk, the
+# number of chunks inserted is written to the resume file. Every DataFrame
+# is identified by a hash of its contents (without the history events,
+# since they contain a timestamp), so a resumed harvest skips the chunks
+# of a DataFrame that have already been inserted, provided that the
+# harvest results in the same DataFrame.
+#
+# ########################################################################
+#
+# Original version Rik D.T. Janssen, October 2026.
+#
+# ########################################################################
+
+
+from os import path, replace, remove, getpid
+from json import load, dump, JSONDecodeError
+from hashlib import sha1
+from pandas import DataFrame
+from pandas.util import hash_pandas_object
+from .ricgraph_constants import RICGRAPH_RESUME_FILENAME
+from .ricgraph_utils import get_ricgraph_ini_file, get_configfile_key, datetimestamp
+from .ricgraph_cypher import ricgraph_database
+
+
+# The number of chunks inserted for every DataFrame, the key is the hash
+# of the DataFrame. None means: do not record progress.
+_resume_progress = None
+
+
+def get_resume_filename() -> str:
+    """Get the filename of the resume file.
+    It is read from the Ricgraph ini file, or, if it is not there,
+    it is RICGRAPH_RESUME_FILENAME in the same directory as the Ricgraph ini file.
+
+    :return: the filename.
+    """
+    resume_file = get_configfile_key(section='Ricgraph',
+                                     key='ricgraph_resume_file')
+    if resume_file != '':
+        return resume_file
+    return path.join(path.dirname(get_ricgraph_ini_file()), RICGRAPH_RESUME_FILENAME)
+
+
+def resume_start(resume: bool) -> None:
+    """Start recording progress. This should be done at the start of
+    a harvest, after Ricgraph has been opened.
+
+    :param resume: if True, read the progress of a previous harvest
+      from the resume file, so that chunks already inserted will be skipped.
+      If False, start with no progress.
+    :return: None.
+    """
+    global _resume_progress
+
+    if ricgraph_database() == 'embedded':
+        # The embedded graph database backend writes the graph to file
+        # only when Ricgraph is closed, so progress cannot be recorded.
+        if resume:
+            print('resume_start(): Error, resuming a harvest is not possible with the')
+            print('  embedded graph database backend, exiting.')
+            exit(1)
+        _resume_progress = None
+        return
+
+    _resume_progress = {}
+    filename = get_resume_filename()
+    if not resume:
+        write_resume_file()
+        return
+    if not path.isfile(filename):
+        print('resume_start(): Warning, there is no resume file "' + filename + '",')
+        print('  nothing to resume, starting from the beginning.')
+        write_resume_file()
+        return
+    try:
+        with open(filename) as fd:
+            contents = load(fp=fd)
+    except (OSError, JSONDecodeError):
+        print('resume_start(): Error, could not read resume file "' + filename + '", exiting.')
+        exit(1)
+    _resume_progress = contents.get('progress', {})
+    print('Resuming harvest using resume file "' + filename + '", last updated at '
+          + contents.get('updated', '') + '.')
+    return
+
+
+def write_resume_file() -> None:
+    """Write the progress to the resume file.
+    The file is written to a temporary file first, and then renamed,
+    so that it is never partially written.
+
+    :return: None.
+    """
+    if _resume_progress is None:
+        return
+    filename = get_resume_filename()
+    temp_filename = filename + '.' + str(getpid()) + '.tmp'
+    try:
+        with open(temp_filename, 'w') as fd:
+            dump(obj={'updated': datetimestamp(seconds=True),
+                      'progress': _resume_progress}, fp=fd)
+        replace(temp_filename, filename)
+    except OSError:
+        print('write_resume_file(): Error, could not write resume file "' + filename + '".')
+    return
+
+
+def resume_get_dataframe_key(df: DataFrame) -> str:
+    """Get the key that identifies a DataFrame in the resume file.
+    It is a hash of the column names and the contents of the DataFrame, without
+    the columns with history events, since they contain a timestamp.
+
+    :param df: the DataFrame.
+    :return: the key.
+    """
+    columns = [column for column in df.columns if not str(column).startswith('history_event')]
+    hash_value = sha1(','.join(str(column) for column in columns).encode())
+    hash_value.update(hash_pandas_object(df[columns].astype(str), index=False).values.tobytes())
+    return hash_value.hexdigest()
+
+
+def resume_get_nr_chunks_done(df_key: str) -> int:
+    """Get the number of chunks of a DataFrame that have been inserted.
+
+    :param df_key: the key of the DataFrame, see resume_get_dataframe_key().
+    :return: the number of chunks.
+    """
+    if _resume_progress is None:
+        return 0
+    return _resume_progress.get(df_key, 0)
+
+
+def resume_set_nr_chunks_done(df_key: str, nr_chunks_done: int) -> None:
+    """Record the number of chunks of a DataFrame that have been inserted,
+    and write it to the resume file.
+
+    :param df_key: the key of the DataFrame, see resume_get_dataframe_key().
+    :param nr_chunks_done: the number of chunks.
+    :return: None.
+    """
+    if _resume_progress is None:
+        return
+    _resume_progress[df_key] = nr_chunks_done
+    write_resume_file()
+    return
+
+
+def resume_finish() -> None:
+    """Stop recording progress, and remove the resume file.
+    This should be done when a harvest has finished successfully.
+
+    :return: None.
+    """
+    global _resume_progress
+
+    if _resume_progress is None:
+        return
+    _resume_progress = None
+    filename = get_resume_filename()
+    if path.isfile(filename):
+        try:
+            remove(filename)
+        except OSError:
+            print('resume_finish(): Error, could not remove resume file "' + filename + '".')
+    return
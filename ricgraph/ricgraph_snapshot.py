@@ -0,0 +1,261 @@
+# ########################################################################
+#
+# Ricgraph - Research in context graph
+#
+# ########################################################################
+#
+# MIT License
+#
+# Copyright (c) 2026 Rik D.T. Janssen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# ########################################################################
+#
+# Ricgraph snapshot functions.
+# A snapshot contains information about Ricgraph that is expensive to
+# compute, since every item requires a full scan of the graph database
+# (e.g. all values of the property 'category'), and the organization
+# hierarchy (see ricgraph_orghierarchy.py). It is written at the end
+# of a harvest, so that Ricgraph Explorer can read it at startup, instead
+# of computing it again for every worker.
+#
+# ########################################################################
+#
+# Original version Rik D.T. Janssen, October 2026.
+#
+# ########################################################################
+
+
+from os import (path, replace, getpid, remove, close,
+                open as os_open, O_CREAT, O_EXCL, O_WRONLY)
+from time import time, sleep
+from json import load, dump, JSONDecodeError
+from .ricgraph_constants import (RICGRAPH_SNAPSHOT_FILENAME,
+                                 RICGRAPH_SNAPSHOT_FORMAT_VERSION,
+                                 RICGRAPH_SNAPSHOT_PROPERTIES,
+                                 RICGRAPH_SNAPSHOT_LOCK_POLL,
+                                 RICGRAPH_SNAPSHOT_LOCK_STALE)
+from .ricgraph_utils import (get_ricgraph_ini_file, get_configfile_key,
+                             datetimestamp, timestamp)
+from .ricgraph_cypher import (read_all_values_of_property,
+                              ricgraph_get_harvest_date,
+                              ricgraph_nr_nodes, ricgraph_nr_edges)
+from .ricgraph_orghierarchy import create_organization_hierarchy
+
+
+def get_ricgraph_snapshot_filename() -> str:
+    """Get the filename of the Ricgraph snapshot.
+    It is read from the Ricgraph ini file, or, if it is not there,
+    it is RICGRAPH_SNAPSHOT_FILENAME in the same directory as the Ricgraph ini file.
+
+    :return: the filename.
+    """
+    snapshot_file = get_configfile_key(section='Ricgraph',
+                                       key='ricgraph_snapshot_file')
+    if snapshot_file != '':
+        return snapshot_file
+    return path.join(path.dirname(get_ricgraph_ini_file()), RICGRAPH_SNAPSHOT_FILENAME)
+
+
+def get_ricgraph_snapshot_fingerprint() -> dict:
+    """Get the information that is used to determine if a snapshot is
+    current. These are cheap queries that do not scan the graph database.
+
+    :return: a dict with the harvest date, number of nodes and number of edges.
+    """
+    fingerprint = {'harvest_date': ricgraph_get_harvest_date(),
+                   'nr_nodes': ricgraph_nr_nodes(),
+                   'nr_edges': ricgraph_nr_edges()}
+    return fingerprint
+
+
+def create_ricgraph_snapshot() -> dict:
+    """Create a snapshot of Ricgraph. This does a full scan of the graph
+    database for every property in RICGRAPH_SNAPSHOT_PROPERTIES, and it
+    creates the organization hierarchy.
+
+    :return: the snapshot.
+    """
+    property_values = {}
+    for node_property in RICGRAPH_SNAPSHOT_PROPERTIES:
+        property_values[node_property] = read_all_values_of_property(node_property)
+
+    snapshot = {'snapshot_format_version': RICGRAPH_SNAPSHOT_FORMAT_VERSION,
+                'snapshot_version': datetimestamp(seconds=True),
+                **get_ricgraph_snapshot_fingerprint(),
+                'property_values': property_values,
+                'organization_hierarchy': create_organization_hierarchy()}
+    return snapshot
+
+
+def store_ricgraph_snapshot(snapshot: dict) -> bool:
+    """Write a snapshot of Ricgraph to the snapshot file.
+    The file is written to a temporary file first, and then renamed,
+    so that Ricgraph Explorer never reads a partially written snapshot.
+
+    :param snapshot: the snapshot.
+    :return: True if it has been written, otherwise False.
+    """
+    filename = get_ricgraph_snapshot_filename()
+    print('Writing Ricgraph snapshot to file ' + filename + '...', end=' ')
+    temp_filename = filename + '.' + str(getpid()) + '.tmp'
+    try:
+        with open(temp_filename, 'w') as fd:
+            dump(obj=snapshot, fp=fd, ensure_ascii=False, indent=2)
+        replace(temp_filename, filename)
+    except OSError:
+        try:
+            remove(temp_filename)
+        except FileNotFoundError:
+            pass
+        print('\nstore_ricgraph_snapshot(): Error, could not write file "' + filename + '".')
+        print('Ricgraph Explorer will compute the information in the snapshot at startup.')
+        return False
+    print('Done.')
+    return True
+
+
+def write_ricgraph_snapshot() -> None:
+    """Create a snapshot of Ricgraph and write it to the snapshot file.
+    This should be done at the end of a harvest.
+
+    :return: None.
+    """
+    print('\nCreating Ricgraph snapshot at ' + timestamp() + '...')
+    snapshot = create_ricgraph_snapshot()
+    store_ricgraph_snapshot(snapshot=snapshot)
+    return
+
+
+def create_ricgraph_snapshot_once(fingerprint: dict = None) -> dict:
+    """Create a snapshot of Ricgraph and write it to the snapshot file,
+    but only in one process at the same time. This is for e.g. the
+    gunicorn workers of Ricgraph Explorer, which otherwise would all do a
+    full scan of the graph database at the same time.
+    The process that creates the lock file (with O_EXCL) creates and
+    writes the snapshot. The other processes wait until the lock file has
+    been removed, and then read the snapshot that has been written.
+    If that snapshot is not current (e.g. because it could not be written),
+    they create it themselves in memory.
+
+    :param fingerprint: the fingerprint of Ricgraph now, as returned by
+      get_ricgraph_snapshot_fingerprint(). If None, it will be determined.
+    :return: the snapshot.
+    """
+    lock_filename = get_ricgraph_snapshot_filename() + '.lock'
+    while True:
+        try:
+            close(os_open(lock_filename, O_CREAT | O_EXCL | O_WRONLY))
+        except FileExistsError:
+            try:
+                lock_age = time() - path.getmtime(lock_filename)
+            except OSError:
+                # The lock file has just been removed, try again.
+                continue
+            if lock_age > RICGRAPH_SNAPSHOT_LOCK_STALE:
+                print('create_ricgraph_snapshot_once(): Warning, removing stale lock file "'
+                      + lock_filename + '".')
+                try:
+                    remove(lock_filename)
+                except OSError:
+                    pass
+                continue
+            sleep(RICGRAPH_SNAPSHOT_LOCK_POLL)
+            if path.isfile(lock_filename):
+                continue
+            # Another process has created the snapshot.
+            snapshot = read_ricgraph_snapshot()
+            if ricgraph_snapshot_is_current(snapshot=snapshot, fingerprint=fingerprint):
+                return snapshot
+            return create_ricgraph_snapshot()
+        except OSError:
+            # E.g. we are not allowed to write in the directory of the snapshot file.
+            return create_ricgraph_snapshot()
+        break
+
+    try:
+        snapshot = create_ricgraph_snapshot()
+        store_ricgraph_snapshot(snapshot=snapshot)
+    finally:
+        try:
+            remove(lock_filename)
+        except OSError:
+            pass
+    return snapshot
+
+
+def read_ricgraph_snapshot() -> dict:
+    """Read the Ricgraph snapshot from the snapshot file.
+
+    :return: the snapshot, or an empty dict if there is no (valid) snapshot.
+    """
+    filename = get_ricgraph_snapshot_filename()
+    if not path.isfile(filename):
+        return {}
+    try:
+        with open(filename) as fd:
+            snapshot = load(fp=fd)
+    except (OSError, JSONDecodeError):
+        print('read_ricgraph_snapshot(): Warning, could not read file "' + filename + '".')
+        return {}
+    if not isinstance(snapshot, dict):
+        return {}
+    if snapshot.get('snapshot_format_version', 0) != RICGRAPH_SNAPSHOT_FORMAT_VERSION:
+        return {}
+    return snapshot
+
+
+def ricgraph_snapshot_is_current(snapshot: dict,
+                                 fingerprint: dict = None) -> bool:
+    """Determine if a snapshot is current, that is, if it has been
+    created for the data that is in Ricgraph now.
+
+    :param snapshot: the snapshot.
+    :param fingerprint: the fingerprint of Ricgraph now, as returned by
+      get_ricgraph_snapshot_fingerprint(). If None, it will be determined.
+    :return: True if it is current, otherwise False.
+    """
+    if len(snapshot) == 0:
+        return False
+    if fingerprint is None:
+        fingerprint = get_ricgraph_snapshot_fingerprint()
+    for item in fingerprint:
+        if snapshot.get(item) != fingerprint[item]:
+            return False
+    return True
+
+
+def read_current_ricgraph_snapshot() -> dict:
+    """Read the Ricgraph snapshot, and check if it is current.
+    If it is not current, create a new one (this is slow), see
+    create_ricgraph_snapshot_once().
+
+    :return: the snapshot.
+    """
+    fingerprint = get_ricgraph_snapshot_fingerprint()
+    snapshot = read_ricgraph_snapshot()
+    if ricgraph_snapshot_is_current(snapshot=snapshot, fingerprint=fingerprint):
+        print('Using Ricgraph snapshot from file ' + get_ricgraph_snapshot_filename()
+              + ', created at ' + snapshot['snapshot_version'] + '.')
+        return snapshot
+
+    print('There is no current Ricgraph snapshot, creating it, this may take a while...')
+    snapshot = create_ricgraph_snapshot_once(fingerprint=fingerprint)
+    return snapshot
@@ -53,6 +53,7 @@ from random import choice
 from string import ascii_lowercase
 from datetime import datetime
 from uuid import uuid4
+from importlib.util import find_spec
 from collections import defaultdict
 from configparser import ConfigParser
 from unidecode import unidecode
@@ -61,10 +62,14 @@ from .ricgraph_constants import (RICGRAPH_INI_FILENAME,
                                  RICGRAPH_KEY_SEPARATOR, RICGRAPH_KEY_SEPARATOR_REPLACEMENT,
                                  RICGRAPH_VALUE_SEPARATOR, RICGRAPH_VALUE_SEPARATOR_REPLACEMENT,
                                  MAX_ORG_ABBREVIATION_LENGTH,
-                                 A_LARGE_NUMBER,
+                                 A_LARGE_NUMBER, INTERMEDIATE_FORMATS,
                                  PageParams, QueryParams)
 
 
+# The format of the intermediate files of harvests, read once from the ini file.
+_intermediate_format = None
+
+
 def get_ricgraph_ini_file() -> str:
     """Get the location of the ricgraph ini file.
 
@@ -493,7 +498,16 @@ def construct_filename(base_filename: str,
         filename += '-' + year
     if organization != '':
         filename += '-' + organization
-    filename += '.' + base_filename.split('.')[1]
+    extension = base_filename.split('.')[1]
+    intermediate_format = get_configfile_key_intermediate_format()
+    if intermediate_format != '':
+        # Use a compressed, and for DataFrames columnar, format
+        # for the intermediate files of harvests.
+        if extension == 'csv':
+            extension = intermediate_format
+        elif extension == 'json':
+            extension = 'json.gz'
+    filename += '.' + extension
     return filename
 
 
@@ -570,6 +584,24 @@ def get_commandline_argument_organization(argument_list: list) -> str:
     return answer
 
 
+def get_commandline_argument_organizations(argument_list: list) -> list:
+    """Get the value of a command line argument '--organization' that may
+    contain more than one organization, separated by a comma, e.g. 'DUT,AUMC,VUA'.
+    Prompt if no argument is given.
+
+    :param argument_list: the argument list.
+    :return: a list of organizations, without duplicates, or an empty list
+      if no answer is given.
+    """
+    answer = get_commandline_argument_organization(argument_list=argument_list)
+    organizations = []
+    for organization in answer.split(','):
+        organization = organization.strip()
+        if organization != '' and organization not in organizations:
+            organizations.append(organization)
+    return organizations
+
+
 def get_commandline_argument_empty_ricgraph(argument_list: list) -> str:
     """Get the value of a command line argument '--empty_ricgraph'.
     Prompt if no argument is given.
@@ -596,6 +628,57 @@ def get_commandline_argument_empty_ricgraph(argument_list: list) -> str:
     return answer
 
 
+def get_commandline_argument_resume(argument_list: list) -> str:
+    """Get the value of a command line argument '--resume'.
+    Do not prompt if no argument is given.
+
+    :param argument_list: the argument list.
+    :return: 'yes' or 'no', the answer whether to resume an interrupted harvest.
+    """
+    answer = get_commandline_argument(argument='--resume',
+                                      argument_list=argument_list)
+    answer = answer.lower()
+    if answer == 'yes':
+        return 'yes'
+    return 'no'
+
+
+def get_commandline_argument_write_snapshot(argument_list: list) -> str:
+    """Get the value of a command line argument '--write_snapshot'.
+    Do not prompt if no argument is given.
+
+    :param argument_list: the argument list.
+    :return: 'yes' (the default) or 'no', the answer whether to write a
+      Ricgraph snapshot at the end of the script, see write_ricgraph_snapshot().
+    """
+    answer = get_commandline_argument(argument='--write_snapshot',
+                                      argument_list=argument_list)
+    answer = answer.lower()
+    if answer == 'no':
+        return 'no'
+    return 'yes'
+
+
+def get_commandline_argument_phase(argument_list: list) -> str:
+    """Get the value of a command line argument '--phase'.
+    Do not prompt if no argument is given.
+
+    :param argument_list: the argument list.
+    :return: 'all' (the default), 'fetch' or 'insert', the phase of the harvest
+      to run, or '' if an invalid phase is given.
+    """
+    answer = get_commandline_argument(argument='--phase',
+                                      argument_list=argument_list)
+    answer = answer.lower()
+    if answer == '':
+        return 'all'
+    if answer != 'all' and answer != 'fetch' and answer != 'insert':
+        print('\nInvalid value "' + answer + '" for option "--phase",')
+        print('use "all", "fetch", or "insert".')
+        return ''
+    return answer
+
+
 def get_commandline_argument_harvest_projects(argument_list: list) -> str:
     """Get the value of a command line argument '--harvest_projects'.
     Prompt if no argument is given.
@@ -786,6 +869,9 @@ def get_configfile_key_graphdb_parameters() -> tuple[str, str, str, str, str]:
     :return: the value of the graph database parameters, as a python tuple.
     """
     graphdb = get_configfile_key(section='GraphDB', key='graphdb')
+    if graphdb == 'embedded':
+        # The embedded graph database backend does not need the other parameters.
+        return graphdb, '', '', '', ''
     graphdb_hostname = get_configfile_key(section='GraphDB', key='graphdb_hostname')
     graphdb_databasename = get_configfile_key(section='GraphDB', key='graphdb_databasename')
     graphdb_user = get_configfile_key(section='GraphDB', key='graphdb_user')
@@ -806,6 +892,31 @@ def get_configfile_key_graphdb_parameters() -> tuple[str, str, str, str, str]:
     return graphdb, graphdb_url, graphdb_databasename, graphdb_user, graphdb_password
 
 
+def get_configfile_key_graphdb_driver_settings() -> dict:
+    """Get the value of multiple keys in the Ricgraph config file
+    that relate to the connection pool of the graph database driver.
+    Keys that are absent or empty are not returned, so the driver
+    uses its default value for them.
+
+    :return: a dict with the parameter of the driver as key, and
+      its value as value.
+    """
+    settings = {}
+    for key, setting in [('graphdb_max_connection_pool_size', 'max_connection_pool_size'),
+                         ('graphdb_connection_acquisition_timeout', 'connection_acquisition_timeout'),
+                         ('graphdb_max_connection_lifetime', 'max_connection_lifetime'),
+                         ('graphdb_fetch_size', 'fetch_size')]:
+        value = get_configfile_key(section='GraphDB', key=key)
+        if value == '':
+            continue
+        if not value.isdigit() or int(value) == 0:
+            print('get_configfile_key_graphdb_driver_settings(): Error, invalid value "' + value + '"')
+            print('  for "' + key + '" in Ricgraph ini file, using the default value of the driver.')
+            continue
+        settings[setting] = int(value)
+    return settings
+
+
 def get_configfile_key_memcached_parameters() -> tuple[bool, str, int]:
     """Get the value of multiple keys in the Ricgraph config file
     that relate to the Memcached cache.
@@ -827,6 +938,38 @@ def get_configfile_key_memcached_parameters() -> tuple[bool, str, int]:
     return memcached_to_be_used, memcached_host, memcached_port
 
 
+def get_configfile_key_intermediate_format() -> str:
+    """Get the format of the intermediate files of harvests from the Ricgraph
+    config file. If it is 'parquet' or 'feather', DataFrames are written in
+    that (columnar and compressed) format, and JSON data is written compressed.
+    Both formats require package 'pyarrow'.
+
+    :return: one of INTERMEDIATE_FORMATS, or '' for csv and JSON files.
+    """
+    global _intermediate_format
+
+    if _intermediate_format is not None:
+        return _intermediate_format
+    intermediate_format = get_configfile_key(section='Ricgraph',
+                                             key='ricgraph_intermediate_format')
+    _intermediate_format = ''
+    if intermediate_format == '' or intermediate_format == 'csv':
+        return _intermediate_format
+    if intermediate_format not in INTERMEDIATE_FORMATS:
+        print('get_configfile_key_intermediate_format(): Error, invalid value "'
+              + intermediate_format + '"')
+        print('  for "ricgraph_intermediate_format" in Ricgraph ini file,')
+        print('  using csv and JSON files.')
+        return _intermediate_format
+    if find_spec('pyarrow') is None:
+        print('get_configfile_key_intermediate_format(): Error, "ricgraph_intermediate_format"')
+        print('  in Ricgraph ini file is "' + intermediate_format + '", but package "pyarrow"')
+        print('  is not installed, using csv and JSON files.')
+        return _intermediate_format
+    _intermediate_format = intermediate_format
+    return _intermediate_format
+
+
 def _json_item_get(json_item: dict, json_path: str,
                    verbose: bool = False) -> str | list | dict | None:
     """Safely retrieve a nested value from a JSON-like structure
@@ -41,6 +41,7 @@
 from .ricgraph_explorer_constants import *
 from .ricgraph_explorer_init import *
 from .ricgraph_explorer_utils import *
+from .ricgraph_explorer_http import *
 from .ricgraph_explorer_cypher import *
 from .ricgraph_explorer_graphdb import *
 from .ricgraph_explorer_javascript import *
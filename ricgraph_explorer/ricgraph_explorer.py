@@ -86,8 +86,16 @@ from ricgraph_explorer_constants import (RICGRAPH_EXPLORER_DEBUG_PORT,
                                          SEARCH_STRING_MIN_LENGTH,
                                          ORIGIN_OPEN_SCIENCE_PROFILE_BUTTON,
                                          ORIGIN_OPEN_SCIENCE_DASHBOARD_BUTTON,
-                                         OVERLAP_MODE_NEIGHBORNODE)
-from ricgraph_explorer_init import initialize_ricgraph_explorer
+                                         OVERLAP_MODE_NEIGHBORNODE,
+                                         JOBS_VIEW_MODES,
+                                         ADMISSION_EXPENSIVE_VIEW_MODES,
+                                         TABLE_STREAM_MIN_ROWS)
+from ricgraph_explorer_init import initialize_ricgraph_explorer, register_request_session
+from ricgraph_explorer_http import (register_http_cache, register_http_compression,
+                                    register_query_timeout)
+from ricgraph_explorer_jobs import _jobstatus_bp, run_as_job
+from ricgraph_explorer_admission import limit_concurrency
+from ricgraph_explorer_templates import stream_html_page, cache_fragment
 from ricgraph_explorer_graphdb import (find_overlap_in_source_systems,
                                        find_overlap_in_source_systems_records,
                                        find_person_share_resouts,
@@ -103,7 +111,7 @@ from ricgraph_explorer_html import (get_html_for_cardstart, get_html_for_cardend
                                     get_you_searched_for_card, get_page_title,
                                     get_page_footer,
                                     get_html_for_radiobuttoncomponent)
-from ricgraph_explorer_table import (get_regular_table,
+from ricgraph_explorer_table import (get_regular_table, stream_regular_table,
                                      view_personal_information,
                                      get_faceted_table, get_tabbed_table)
 from ricgraph_explorer_osl import (_oslpage_bp, _osprofileresultpage_bp,
@@ -123,6 +131,10 @@ from ricgraph_explorer_restapi import (_restapidocpage_bp,
                                        api_explore_collaborations,
                                        api_broad_search, api_advanced_search,
                                        api_get_all_personroot_nodes, api_get_all_neighbor_nodes,
+                                       api_bulk_all_information,
+                                       api_stream_get_all_neighbor_nodes,
+                                       api_stream_organization_information_persons_results,
+                                       api_stream_enrich,
                                        api_get_ricgraph_info)
 
 
@@ -149,6 +161,18 @@ _ricgraph_explorer.app.register_blueprint(blueprint=_collabspage_bp)
 _ricgraph_explorer.app.register_blueprint(blueprint=_collabsresultpage_bp)
 _ricgraph_explorer.app.register_blueprint(blueprint=_topicspage_bp)
 _ricgraph_explorer.app.register_blueprint(blueprint=_restapidocpage_bp)
+_ricgraph_explorer.app.register_blueprint(blueprint=_jobstatus_bp)
+
+# Compress pages, REST API calls and static files. This is registered before
+# register_http_cache(), so that it is called after it.
+register_http_compression(ricgraph_explorer_app=_ricgraph_explorer)
+# Add ETags and Cache-Control headers to pages and REST API calls.
+register_http_cache(ricgraph_explorer_app=_ricgraph_explorer)
+# Use one session for all queries of a request. This is registered after
+# register_http_cache(), so that a '304 Not Modified' does not open a session.
+register_request_session(ricgraph_explorer_app=_ricgraph_explorer)
+# Show a "too large, please narrow your query" result if a query takes too long.
+register_query_timeout(ricgraph_explorer_app=_ricgraph_explorer)
 
 
 # ##############################################################################
@@ -186,7 +210,53 @@ def homepage() -> str:
     :return: HTML to be rendered.
     """
     html = html_body_start
-    html += get_page_title(title='Ricgraph - Research in context graph')
+    html += create_homepage_harvest_html()
+    # The cache information changes with every query, so it cannot be cached.
+    html += '<li>'
+    html += 'Ricgraph uses a '
+    html += get_global_str(ricgraph_info=RICGRAPH_CACHEINFO,
+                           item='cache_name')
+    html += '. This cache has '
+    html += get_global_str(ricgraph_info=RICGRAPH_CACHEINFO,
+                           item='nr_items')
+    html += ' elements, and its size is '
+    html += get_global_str(ricgraph_info=RICGRAPH_CACHEINFO,
+                           item='size_kb')
+    html += ' kB.'
+    html += '</li>'
+    html += '<li>'
+    html += 'This Ricgraph Explorer worker did '
+    html += get_global_str(ricgraph_info=RICGRAPH_CACHEINFO,
+                           item='nr_queries')
+    html += ' queries to the graph database backend, '
+    html += get_global_str(ricgraph_info=RICGRAPH_CACHEINFO,
+                           item='nr_slow_queries')
+    html += ' of them took longer than '
+    html += get_global_str(ricgraph_info=RICGRAPH_CACHEINFO,
+                           item='slow_query_threshold')
+    html += ' ms. Use the REST API call <code>/api/get_ricgraph_info</code> '
+    html += 'with <code>ricgraph_info=' + RICGRAPH_CACHEINFO + '</code> '
+    html += 'for the statistics per query.'
+    html += '</li>'
+    html += '</ul>'
+
+    html += get_global_str(ricgraph_info=RICGRAPH_SYSTEMINFO,
+                           item='homepage_outro_html')
+
+    html += get_html_for_cardend()
+    html += get_page_footer() + html_body_end
+    return html
+
+
+@cache_fragment
+def create_homepage_harvest_html() -> str:
+    """Create the part of the home page that only depends on the harvest.
+    It is stored in the fragment cache. It ends in the list in the card
+    'About Ricgraph', homepage() adds the rest of that card.
+
+    :return: HTML to be rendered.
+    """
+    html = get_page_title(title='Ricgraph - Research in context graph')
     html += get_html_for_cardstart()
     html += 'Ricgraph, also known as '
     html += '<a href="https://www.ricgraph.eu" target="_blank">'
@@ -336,25 +406,6 @@ def homepage() -> str:
     else:
         html += 'harvested on ' + harvest_date + '.'
     html += '</li>'
-    html += '<li>'
-    html += 'Ricgraph uses a '
-    html += get_global_str(ricgraph_info=RICGRAPH_CACHEINFO,
-                           item='cache_name')
-    html += '. This cache has '
-    html += get_global_str(ricgraph_info=RICGRAPH_CACHEINFO,
-                           item='nr_items')
-    html += ' elements, and its size is '
-    html += get_global_str(ricgraph_info=RICGRAPH_CACHEINFO,
-                           item='size_kb')
-    html += ' kB.'
-    html += '</li>'
-    html += '</ul>'
-
-    html += get_global_str(ricgraph_info=RICGRAPH_SYSTEMINFO,
-                           item='homepage_outro_html')
-
-    html += get_html_for_cardend()
-    html += get_page_footer() + html_body_end
     return html
 
 
@@ -377,8 +428,52 @@ def searchpage() -> str:
     """
     page_params = get_url_page_params()
     query_params = get_url_query_params()
-    form = '<form method="get" action="' + url_for(endpoint='optionspage') + '">'
+    form = create_search_form(search_mode=page_params['search_mode'],
+                              discoverer_mode=page_params['discoverer_mode'],
+                              origin=page_params['origin'],
+                              name=query_params['name'],
+                              category=query_params['category'],
+                              max_nr_items=query_params['max_nr_items'],
+                              max_nr_table_rows=page_params['max_nr_table_rows'])
+
+    html = html_body_start
     if page_params['search_mode'] == SEARCH_MODE_EXACT_MATCH:
+        html += get_page_title(title='Advanced search page')
+    else:
+        if query_params['category'] == '':
+            html += get_page_title(title='Search page')
+        else:
+            html += get_page_title(title='Search page for ' + query_params['category'])
+    html += get_html_for_cardstart()
+    html += form
+    html += get_html_for_cardend()
+    html += get_page_footer() + html_body_end
+    return html
+
+
+@cache_fragment
+def create_search_form(search_mode: str,
+                       discoverer_mode: str,
+                       origin: str,
+                       name: str,
+                       category: str,
+                       max_nr_items: int,
+                       max_nr_table_rows: int) -> str:
+    """Create the search form for searchpage().
+    The form only depends on its parameters and on the harvest,
+    so it is stored in the fragment cache.
+
+    :param search_mode: the search_mode to use, 'exact_match' or 'value_search'.
+    :param discoverer_mode: the discoverer_mode that is checked in the form.
+    :param origin: optional, specifies where the request for this page originates from.
+    :param name: name of the nodes to find.
+    :param category: category of the nodes to find.
+    :param max_nr_items: the maximum number of items to return in the form.
+    :param max_nr_table_rows: the maximum number of rows in a table in the form.
+    :return: HTML for the form.
+    """
+    form = '<form method="get" action="' + url_for(endpoint='optionspage') + '">'
+    if search_mode == SEARCH_MODE_EXACT_MATCH:
         form += '<label for="name">Search for a value in Ricgraph field <em>name</em>:</label>'
         form += '<input id="name" class="w3-input w3-border" list="name_active_datalist"'
         form += 'name=name autocomplete=off>'
@@ -394,20 +489,20 @@ def searchpage() -> str:
         form += get_global_str(ricgraph_info=RICGRAPH_NODEINFO_INTERNAL,
                                item='category_active_datalist')
         form += '<br/>'
-    if page_params['search_mode'] == SEARCH_MODE_VALUE and query_params['name'] != '':
-        form += '<input id="name" type="hidden" name="name" value="' + query_params['name'] + '">'
-    if page_params['search_mode'] == SEARCH_MODE_VALUE and query_params['category'] != '':
-        form += '<input id="category" type="hidden" name="category" value="' + query_params['category'] + '">'
-    if page_params['search_mode'] == SEARCH_MODE_EXACT_MATCH:
+    if search_mode == SEARCH_MODE_VALUE and name != '':
+        form += '<input id="name" type="hidden" name="name" value="' + name + '">'
+    if search_mode == SEARCH_MODE_VALUE and category != '':
+        form += '<input id="category" type="hidden" name="category" value="' + category + '">'
+    if search_mode == SEARCH_MODE_EXACT_MATCH:
         form += '<label for="value">Search for a value in Ricgraph field <em>value</em>:</label>'
     else:
         form += '<label for="value">Type your search string:</label>'
     form += '<input id="value" class="w3-input w3-border" type=text name=value>'
-    form += '<input type="hidden" name="search_mode" value="' + page_params['search_mode'] + '">'
-    if page_params['origin'] != '':
-        form += '<input type="hidden" name="origin" value="' + page_params['origin'] + '">'
+    form += '<input type="hidden" name="search_mode" value="' + search_mode + '">'
+    if origin != '':
+        form += '<input type="hidden" name="origin" value="' + origin + '">'
 
-    if page_params['search_mode'] == SEARCH_MODE_EXACT_MATCH:
+    if search_mode == SEARCH_MODE_EXACT_MATCH:
         form += 'These fields are case-sensitive and use exact match search. '
         form += 'If you enter values in more than one field, these fields are combined using AND.</br>'
 
@@ -422,7 +517,7 @@ def searchpage() -> str:
 
     # The first radio button in 'radiobuttons' will be checked. So,
     # depending on the default discover mode, change the order in that list.
-    if page_params['discoverer_mode'] == DISCOVERER_MODE_DETAILS:
+    if discoverer_mode == DISCOVERER_MODE_DETAILS:
         radiobuttons = [{'button_id': 'details_view',
                          'button_label': radio_details_text},
                         {'button_id': 'person_view',
@@ -446,7 +541,7 @@ def searchpage() -> str:
     form += 'or 0 to return all items (the more items, the more time it will take): '
     form += '<label for="max_nr_items" class="w3-tooltip">' + tooltip + '</label><br/>'
     form += '<input id="max_nr_items" class="w3-input w3-border" type=text value='
-    form += str(query_params['max_nr_items']) + ' name=max_nr_items>'
+    form += str(max_nr_items) + ' name=max_nr_items>'
 
     form += '</br>'
     tooltip = '<img src="/static/images/circle_info_solid_uuyellow.svg" alt="Click for more information">'
@@ -460,24 +555,11 @@ def searchpage() -> str:
     form += 'or 0 to return all rows (the more rows, the more time it will take): '
     form += '<label for="max_nr_table_rows" class="w3-tooltip">' + tooltip + '</label><br/>'
     form += '<input id="max_nr_table_rows" class="w3-input w3-border" type=text value='
-    form += str(page_params['max_nr_table_rows']) + ' name=max_nr_table_rows>'
+    form += str(max_nr_table_rows) + ' name=max_nr_table_rows>'
 
     form += '<br/><input class="' + button_style + '" ' + button_width + ' type=submit value=search>'
     form += '</form>'
-
-    html = html_body_start
-    if page_params['search_mode'] == SEARCH_MODE_EXACT_MATCH:
-        html += get_page_title(title='Advanced search page')
-    else:
-        if query_params['category'] == '':
-            html += get_page_title(title='Search page')
-        else:
-            html += get_page_title(title='Search page for ' + query_params['category'])
-    html += get_html_for_cardstart()
-    html += form
-    html += get_html_for_cardend()
-    html += get_page_footer() + html_body_end
-    return html
+    return form
 
 
 @_ricgraph_explorer.route(rule='/optionspage/', methods=['GET'])
@@ -559,6 +641,14 @@ def optionspage() -> str | Response:
                                               query_params=query_params)
         html += get_page_title(title='Selection page')
         table_header = 'Your search resulted in more than one item. Please choose one item to continue:'
+        if len(result) >= TABLE_STREAM_MIN_ROWS:
+            # A large table, send it to the browser while it is being rendered.
+            table = stream_regular_table(nodes_list=result,
+                                         page_params=page_params | {'search_mode': ''},
+                                         query_params=query_params,
+                                         table_header=table_header)
+            return stream_html_page(fragments=[html, table,
+                                               get_page_footer() + html_body_end])
         html += get_regular_table(nodes_list=result,
                                   page_params=page_params | {'search_mode': ''},
                                   query_params=query_params,
@@ -596,6 +686,8 @@ def optionspage() -> str | Response:
 
 
 @_ricgraph_explorer.route(rule='/resultspage/', methods=['GET'])
+@run_as_job(view_modes=JOBS_VIEW_MODES)
+@limit_concurrency(cost_class='expensive', view_modes=ADMISSION_EXPENSIVE_VIEW_MODES)
 def resultspage() -> str:
     """Ricgraph Explorer entry, this 'page' only uses URL parameters.
     View the results based on the values passed.
@@ -623,6 +715,8 @@ def resultspage() -> str:
     - max_nr_items: the maximum number of items to return, or 0 to return all items.
     - max_nr_table_rows: the maximum number of rows in a table to return (the page
       size of the table), or 0 to return all rows.
+    For the view_modes in JOBS_VIEW_MODES, this page is run as a background
+    job, see run_as_job().
 
     :return: HTML to be rendered.
     """
@@ -0,0 +1,205 @@
+# ########################################################################
+#
+# Ricgraph - Research in context graph
+#
+# ########################################################################
+#
+# MIT License
+#
+# Copyright (c) 2026 Rik D.T. Janssen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# ########################################################################
+#
+# Ricgraph Explorer admission control functions.
+# Some pages and REST API calls (e.g. collaborations of a large organization)
+# do long traversals in the graph database backend. If many of them run at
+# the same time, they slow down the backend for everybody, also for cheap
+# pages. Therefore, these requests are in a cost class with a bounded number
+# of slots. A request that does not get a slot quickly gets a
+# '503 Service Unavailable' with a 'Retry-After' header, so that the worker
+# is free again for other requests.
+# Note that the slots are per Ricgraph Explorer worker, so the number of
+# these requests the backend gets is the number of slots times the number
+# of workers.
+# For more information about Ricgraph and Ricgraph Explorer,
+# go to https://www.ricgraph.eu and https://docs.ricgraph.eu.
+#
+# ########################################################################
+#
+# Original version Rik D.T. Janssen, October 2026.
+#
+# ########################################################################
+
+
+from functools import wraps
+from threading import Lock, BoundedSemaphore
+from typing import Callable
+from flask import request, g, Response
+from ricgraph import (get_configfile_key, create_http_response,
+                      HTTP_RESPONSE_SERVICE_UNAVAILABLE)
+from ricgraph_explorer_constants import (html_body_start, html_body_end,
+                                         ADMISSION_COST_CLASSES)
+from ricgraph_explorer_html import get_message, get_page_footer
+
+
+# The slots for every cost class, created once, see get_admission_slots().
+_admission_slots = {}
+_admission_lock = Lock()
+
+
+def get_admission_slots(cost_class: str) -> dict | None:
+    """Get the slots for a cost class. The number of slots is read
+    from the Ricgraph ini file, or, if it is not there, it is the
+    default from ADMISSION_COST_CLASSES. These slots are only for
+    this worker, every worker has its own slots.
+
+    :param cost_class: the cost class, a key in ADMISSION_COST_CLASSES.
+    :return: a dict with the slots of this cost class, or None if it has no limit.
+    """
+    global _admission_slots
+
+    with _admission_lock:
+        if cost_class in _admission_slots:
+            return _admission_slots[cost_class]
+        settings = ADMISSION_COST_CLASSES[cost_class]
+        key = 'ricgraph_explorer_max_nr_' + cost_class + '_requests_per_worker'
+        max_nr_running = get_configfile_key(section='Ricgraph_explorer', key=key)
+        if max_nr_running == '':
+            max_nr_running = settings['max_nr_running_default']
+        elif not max_nr_running.isdigit():
+            print('get_admission_slots(): Error, invalid value "' + max_nr_running + '"')
+            print('  for "' + key + '" in Ricgraph ini file,')
+            print('  using default value ' + str(settings['max_nr_running_default']) + '.')
+            max_nr_running = settings['max_nr_running_default']
+        else:
+            max_nr_running = int(max_nr_running)
+
+        if max_nr_running == 0:
+            _admission_slots[cost_class] = None
+        else:
+            _admission_slots[cost_class] = {'semaphore': BoundedSemaphore(value=max_nr_running),
+                                            'nr_waiting': 0,
+                                            'lock': Lock()}
+        return _admission_slots[cost_class]
+
+
+def acquire_admission_slot(cost_class: str) -> bool:
+    """Get a slot of a cost class. If there is no free slot, wait at most
+    'max_wait' seconds for one, but only if there are less than
+    'max_nr_waiting' other requests waiting.
+
+    :param cost_class: the cost class.
+    :return: True if a slot has been acquired (or there is no limit), False otherwise.
+    """
+    slots = get_admission_slots(cost_class=cost_class)
+    if slots is None:
+        return True
+    if slots['semaphore'].acquire(blocking=False):
+        return True
+
+    settings = ADMISSION_COST_CLASSES[cost_class]
+    with slots['lock']:
+        if slots['nr_waiting'] >= settings['max_nr_waiting']:
+            return False
+        slots['nr_waiting'] += 1
+    try:
+        return slots['semaphore'].acquire(timeout=settings['max_wait'])
+    finally:
+        with slots['lock']:
+            slots['nr_waiting'] -= 1
+
+
+def release_admission_slot(cost_class: str) -> None:
+    """Release a slot of a cost class, acquired with acquire_admission_slot().
+
+    :param cost_class: the cost class.
+    :return: None.
+    """
+    slots = get_admission_slots(cost_class=cost_class)
+    if slots is None:
+        return
+    slots['semaphore'].release()
+    return
+
+
+def get_too_busy_response(cost_class: str) -> Response | tuple:
+    """Get the response for a request that did not get a slot.
+
+    :param cost_class: the cost class.
+    :return: a REST API response for a REST API call, otherwise an HTML page.
+    """
+    retry_after = str(ADMISSION_COST_CLASSES[cost_class]['retry_after'])
+    message = 'Ricgraph Explorer is too busy to handle this request. '
+    message += 'Please try again in ' + retry_after + ' seconds.'
+    # This response should not be cached.
+    g.ricgraph_etag = ''
+    if request.path.startswith('/api/'):
+        response, status = create_http_response(message=message,
+                                                http_status=HTTP_RESPONSE_SERVICE_UNAVAILABLE)
+        return response, status, {'Retry-After': retry_after, 'Cache-Control': 'no-store'}
+    html = html_body_start + get_message(message=message) + get_page_footer() + html_body_end
+    response = Response(response=html, status=HTTP_RESPONSE_SERVICE_UNAVAILABLE, mimetype='text/html')
+    response.headers['Retry-After'] = retry_after
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+def limit_concurrency(cost_class: str, view_modes: list = None) -> Callable:
+    """Decorator for a page or REST API function that is in a cost class.
+    The function is only called if it gets a slot of that cost class,
+    otherwise a '503 Service Unavailable' response is returned.
+    The slot is released when the function returns, or, for a streaming
+    response, when all of it has been sent (or the client has disconnected).
+    Pages that are run as a background job do not need a slot, since
+    the number of jobs is already bounded, see ricgraph_explorer_jobs.py.
+    Use it after run_as_job(), e.g.:
+    @_collabsresultpage_bp.route(rule='/collabsresultpage/', methods=['GET'])
+    @run_as_job()
+    @limit_concurrency(cost_class='expensive')
+    def collabsresultpage() -> str:
+
+    :param cost_class: the cost class, a key in ADMISSION_COST_CLASSES.
+    :param view_modes: if specified, the function is only in the cost class
+      if the url parameter 'view_mode' is one of these.
+    :return: the decorator.
+    """
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if view_modes is not None and request.args.get('view_mode', '') not in view_modes:
+                return function(*args, **kwargs)
+            if g.get('ricgraph_job_id', '') != '':
+                return function(*args, **kwargs)
+            if not acquire_admission_slot(cost_class=cost_class):
+                return get_too_busy_response(cost_class=cost_class)
+
+            release_on_close = False
+            try:
+                result = function(*args, **kwargs)
+                if isinstance(result, Response) and result.is_streamed:
+                    result.call_on_close(lambda: release_admission_slot(cost_class=cost_class))
+                    release_on_close = True
+                return result
+            finally:
+                if not release_on_close:
+                    release_admission_slot(cost_class=cost_class)
+        return wrapper
+    return decorator
@@ -65,6 +65,8 @@ from ricgraph_explorer_html import (get_html_for_cardstart, get_html_for_cardend
                                     get_html_for_checkboxcomponent)
 from ricgraph_explorer_datavis import (org_collaborations_diagram,
                                        org_collaborations_persons_results)
+from ricgraph_explorer_jobs import run_as_job
+from ricgraph_explorer_admission import limit_concurrency
 
 
 
@@ -216,6 +218,8 @@ def collabspage() -> str:
 
 
 @_collabsresultpage_bp.route(rule='/collabsresultpage/', methods=['GET'])
+@run_as_job()
+@limit_concurrency(cost_class='expensive')
 def collabsresultpage() -> str:
     """Ricgraph Explorer entry, this 'page' only uses URL parameters.
     Find collaborations based on URL parameters passed.
@@ -242,6 +246,7 @@ def collabsresultpage() -> str:
     - max_nr_items: the maximum number of items to return, or 0 to return all items.
     - max_nr_table_rows: the maximum number of rows in a table to return (the page
       size of the table), or 0 to return all rows.
+    This page is run as a background job, see run_as_job().
 
     :return: HTML to be rendered.
     """
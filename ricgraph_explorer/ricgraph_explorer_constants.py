@@ -41,6 +41,10 @@
 # ########################################################################
 
 
+from os import path
+from hashlib import sha256
+
+
 # The name of the global Ricgraph lists.
 RICGRAPH_CACHEINFO = 'ricgraph_cacheinfo'
 RICGRAPH_HARVESTINFO = 'ricgraph_harvestinfo'
@@ -137,6 +141,8 @@ TABLE_ID_COLUMNS = [
 MAX_ITEMS_TO_RETURN = 1000
 # In the RESTAPI, we return at most this maximum.
 MAX_ITEMS_TO_RETURN_RESTAPI = 250
+# In a bulk REST API call, at most this number of keys can be passed.
+MAX_KEYS_BULK_RESTAPI = 1000
 
 # If we render a table, we return at most this number of rows in that table.
 MAX_ROWS_IN_TABLE = 50
@@ -145,10 +151,84 @@ MAX_ROWS_IN_TABLE = 50
 # Note that this number must be equal or smaller than MAX_ITEMS_TO_RETURN.
 MAX_ROWS_TO_EXPORT = 1000
 
-# It is possible to find enrichments for all nodes in Ricgraph. However, that
-# will take a long time. This is the maximum number of nodes Ricgraph Explorer
-# is going to enrich in find_enrich_candidates().
-MAX_NR_NODES_TO_ENRICH = 20
+# If enrichments are found for all person-root nodes in Ricgraph, the
+# person-root nodes are read in pages of this number of nodes, see
+# stream_enrich_candidates_cypher().
+ENRICH_CANDIDATES_PAGE_SIZE = 1000
+
+# Responses of Ricgraph Explorer get an ETag and may be cached by clients and
+# reverse proxies for this number of seconds. It can be changed in the
+# Ricgraph ini file with 'ricgraph_explorer_http_cache_max_age'.
+HTTP_CACHE_MAX_AGE_DEFAULT = 3600
+# These paths do not get an ETag, since their content changes while
+# Ricgraph Explorer is running (e.g. because they show cache information).
+HTTP_CACHE_EXCLUDED_PATHS = ['/', '/api/get_ricgraph_info', '/jobstatus/']
+
+# Pages that may take long are run as a background job, see ricgraph_explorer_jobs.py.
+# Every Ricgraph Explorer worker runs at most this number of jobs at the same
+# time. It can be changed in the Ricgraph ini file with
+# 'ricgraph_explorer_max_nr_jobs', 0 means: do not use background jobs.
+JOBS_MAX_NR_JOBS_DEFAULT = 2
+# The results of jobs are stored in this directory, in the same directory as
+# the Ricgraph ini file. It can be changed in the Ricgraph ini file with
+# 'ricgraph_explorer_jobs_directory'.
+JOBS_DIRECTORY_DEFAULT = 'ricgraph_explorer_jobs'
+# Results of jobs older than this number of seconds are removed.
+JOBS_MAX_AGE = 7 * 24 * 3600
+# The page of a job that has not finished checks every this number of
+# milliseconds if it has finished.
+JOBS_POLL_INTERVAL = 2000
+# These view_modes of the results page are run as a background job.
+JOBS_VIEW_MODES = ['view_regular_table_organization_addinfo',
+                   'view_regular_table_person_enrich_source_system']
+
+# Admission control for pages and REST API calls that are expensive for the
+# graph database backend, see ricgraph_explorer_admission.py. Every cost class
+# has a number of slots: the number of requests of that class that every
+# Ricgraph Explorer worker handles at the same time. It can be changed in
+# the Ricgraph ini file with 'ricgraph_explorer_max_nr_<cost class>_requests_per_worker'.
+# If all slots are in use, at most 'max_nr_waiting' requests wait at most
+# 'max_wait' seconds for a slot. Other requests get a '503 Service Unavailable'
+# with a 'Retry-After' of 'retry_after' seconds. Requests that are not in a
+# cost class (the cheap ones) are not limited.
+# 'expensive' is for pages and REST API calls that may do long traversals
+# (e.g. collaborations), 'export' for the streaming REST API calls, which
+# use a slot until all results have been sent.
+ADMISSION_COST_CLASSES = {'expensive': {'max_nr_running_default': 2,
+                                        'max_nr_waiting': 4,
+                                        'max_wait': 10,
+                                        'retry_after': 30},
+                          'export': {'max_nr_running_default': 2,
+                                     'max_nr_waiting': 2,
+                                     'max_wait': 5,
+                                     'retry_after': 60}}
+# These view_modes of the results page are in the cost class 'expensive'.
+ADMISSION_EXPENSIVE_VIEW_MODES = JOBS_VIEW_MODES + ['view_regular_table_persons_of_org',
+                                                   'view_regular_table_overlap',
+                                                   'view_regular_table_overlap_records',
+                                                   'view_regular_table_person_organization_collaborations']
+
+# Ricgraph Explorer checks every this number of seconds if Ricgraph has been
+# harvested, and if so, reloads its globals. It can be changed in the
+# Ricgraph ini file with 'ricgraph_explorer_reload_interval'.
+RELOAD_INTERVAL_DEFAULT = 300
+
+# The time budgets in seconds for the queries to the graph database backend.
+# A query that takes longer is stopped by the graph database backend, and
+# a "too large, please narrow your query" result is returned.
+# QUERY_TIMEOUT_DEFAULT is the maximum for one query, PAGE_TIMEOUT_DEFAULT for
+# all queries of one page or REST API call, and JOB_TIMEOUT_DEFAULT for all
+# queries of one background job (see ricgraph_explorer_jobs.py).
+# They can be changed in the Ricgraph ini file with 'ricgraph_explorer_query_timeout',
+# 'ricgraph_explorer_page_timeout' and 'ricgraph_explorer_job_timeout', 0 means no maximum.
+QUERY_TIMEOUT_DEFAULT = 60
+PAGE_TIMEOUT_DEFAULT = 120
+JOB_TIMEOUT_DEFAULT = 1800
+# Requests for paths that start with one of these only get a time budget for
+# every query, not for all queries together. These are the streaming REST API
+# calls, the query that produces their results is stopped if the client
+# disconnects, see stream_cypher_query().
+QUERY_TIMEOUT_STREAM_PATHS = ['/api/stream/']
 
 # The location of the home page intro text, if present.
 # If it exists, it should be in the 'static' folder.
@@ -225,6 +305,7 @@ HISTOGRAM_MODE_ALL = [
 # HTML button constants.
 # ########################################################################
 # The HTML 'width' of input fields or 'min-width' of buttons.
+# If you change it, also change '.w3-input' in static/ricgraph_explorer.css.
 field_button_width = '30em'
 field_button_width_half = '15em'
 # The style for the buttons, note the space before and after the text.
@@ -252,74 +333,57 @@ form_button_on_one_line_width = ' style="width:16em !important;" '
 
 
 # ########################################################################
-# The HTML stylesheet.
+# Static files (JavaScript, CSS) in the 'static' folder.
+# Their url contains a version (a hash of their contents), so browsers and
+# reverse proxies may cache them for a long time: if a file changes, its url
+# changes. See http_cache_after_request() in ricgraph_explorer_http.py.
+# ########################################################################
+STATIC_DIRECTORY = path.join(path.dirname(path.abspath(__file__)), 'static')
+# The 'max-age' in the 'Cache-Control' header for static files with a version.
+STATIC_VERSIONED_MAX_AGE = 365 * 24 * 3600
+# Responses with one of these mimetypes are compressed with brotli (if package
+# 'brotli' is installed) or gzip, if the client accepts it, and if they are
+# at least HTTP_COMPRESS_MIN_SIZE bytes. See ricgraph_explorer_http.py.
+HTTP_COMPRESS_MIMETYPES = ['text/html', 'text/css', 'text/javascript',
+                           'application/javascript', 'application/json']
+HTTP_COMPRESS_MIN_SIZE = 500
+
+# ########################################################################
+# Templates and fragment caching, see ricgraph_explorer_templates.py.
+# ########################################################################
+TEMPLATES_DIRECTORY = path.join(path.dirname(path.abspath(__file__)), 'templates')
+# The maximum number of HTML fragments in the fragment cache. If it is
+# full, the least recently used fragment is removed. The cache is emptied
+# after a new harvest.
+FRAGMENT_CACHE_MAX_SIZE = 256
+# Tables with at least this number of rows are sent to the browser
+# while they are being rendered (a streaming response), see optionspage().
+TABLE_STREAM_MIN_ROWS = 1000
+# A streamed template is sent to the browser in parts of this number of
+# rendered template parts, so that not every small part is sent separately.
+TEMPLATE_STREAM_BUFFER_SIZE = 100
+
+
+def get_static_url(filename: str) -> str:
+    """Get the url of a file in the 'static' folder, with a version
+    that changes if the file changes.
+
+    :param filename: the name of the file, relative to the 'static' folder.
+    :return: the url.
+    """
+    try:
+        with open(path.join(STATIC_DIRECTORY, filename), 'rb') as fd:
+            version = sha256(fd.read()).hexdigest()[:12]
+    except OSError:
+        print('get_static_url(): Error, cannot read static file "' + filename + '".')
+        return '/static/' + filename
+    return '/static/' + filename + '?v=' + version
+
+
+# ########################################################################
+# The HTML stylesheet, see static/ricgraph_explorer.css.
 # ########################################################################
-stylesheet = '<style>'
-# Scrollbar colors, see https://www.w3schools.com/howto/howto_css_custom_scrollbar.asp.
-# Note that this is not supported in Firefox.
-# Scrollbar width.
-stylesheet += '::-webkit-scrollbar {width:10px;}'
-# Scrollbar track.
-stylesheet += '::-webkit-scrollbar-track {background-color:#e1e1e1;}'
-# Scrollbar handle.
-stylesheet += '::-webkit-scrollbar-thumb {background-color:#999;}'
-# Scrollbar handle on hover.
-stylesheet += '::-webkit-scrollbar-thumb:hover {background-color:#555;}'
-
-stylesheet += '.w3-container {padding:16px;}'
-#stylesheet += '.w3-container {padding-left:16px; padding-right:16px; padding-bottom:8px; padding-top:8px}'
-# Note: #ffcd00 is 'uu-yellow' below.
-stylesheet += '.w3-check {width:15px; height:15px; position:relative; top:3px; accent-color:#ffcd00;}'
-stylesheet += '.w3-radio {accent-color: #ffcd00;}'
-# Restrict the width of the input fields.
-stylesheet += '.w3-input {width:' + field_button_width + ';}'
-# Define UU colors. We do not need to define "black" and "white" (they do exist).
-# See https://www.uu.nl/organisatie/huisstijl/huisstijlelementen/kleur.
-stylesheet += '.uu-yellow, .uu-hover-yellow:hover '
-stylesheet += '{color:#000!important; background-color:#ffcd00!important;}'
-stylesheet += '.uu-red, .uu-hover-red:hover '
-stylesheet += '{color:#000!important; background-color:#c00a35!important;}'
-stylesheet += '.uu-orange, .uu-hover-orange:hover '
-stylesheet += '{color:#000!important; background-color:#f3965e!important;}'
-stylesheet += '.uu-blue, .uu-hover-blue:hover '
-stylesheet += '{color:#000!important; background-color:#5287c6!important;}'
-stylesheet += '.rj-gray, .rj-hover-gray:hover '
-stylesheet += '{color:#000!important; background-color:#cecece!important;}'
-stylesheet += '.rj-border-black, .rj-hover-border-black:hover {border-color:#000!important;}'
-stylesheet += 'body {background-color:white;}'
-stylesheet += 'body, h1, h2, h3, h4, h5, h6 {font-family:"Open Sans",sans-serif;}'
-stylesheet += 'h1, h2, h3, h4, h5, h6 {font-weight:600;}'
-stylesheet += 'h1 {font-size:24px;}'
-stylesheet += 'h2 {font-size:20px;}'
-stylesheet += 'h3 {font-size:16px;}'
-stylesheet += 'h4 {font-size:12px;}'
-stylesheet += 'ul, ol {padding-left:2em; margin:0px}'
-stylesheet += 'a:link, a:visited {color:blue;}'
-stylesheet += 'a:hover {color:darkblue;}'
-stylesheet += 'table {font-size:85%;}'
-stylesheet += 'table, th, td {border-collapse:collapse; border:1px solid black}'
-stylesheet += 'th {text-align:left;}'
-# Style for tabbed HTML table header.
-stylesheet += '.tablink {font-size:85%;}'
-# Style for faceted box.
-stylesheet += '.boxedcard {font-size:90%;}'
-# For table sorting. \u00a0 is a non-breaking space.
-stylesheet += 'table.sortable th:not(.sorttable_sorted):not(.sorttable_sorted_reverse)'
-stylesheet += ':not(.sorttable_nosort):after{content:"\u00a0\u25b4\u00a0\u25be"}'
-
-# In Firefox, dropdown lists do not have a downward triangle, as Brave, Chrome and Edge have.
-# To give the user a clue that there is a dropdown list, we show additional text.
-# This is done as follows:
-# <div class="firefox-only">Click twice to get a dropdown list.</div>
-# We need the following CSS to make this happen:
-# To hide by default in any browser.
-stylesheet += '.firefox-only {display: none;}'
-# To show only in Firefox.
-stylesheet += '@-moz-document url-prefix() {.firefox-only'
-stylesheet += '{display:block; font-size:80%; font-style:italic;}}'
-# End of Firefox dropdown list CSS.
-
-stylesheet += '</style>'
+stylesheet = '<link rel="stylesheet" href="' + get_static_url(filename='ricgraph_explorer.css') + '">'
 
 
 # ########################################################################
@@ -362,7 +426,7 @@ html_preamble += 'research results, and (sub-)organizations with a graph">'
 
 # The W3.css style file is at https://www.w3schools.com/w3css/4/w3.css. I use the "pro" version.
 # The pro version is identical to the standard version except for it has no colors defined.
-html_preamble += '<link rel="stylesheet" href="/static/w3pro.css">'
+html_preamble += '<link rel="stylesheet" href="' + get_static_url(filename='w3pro.css') + '">'
 html_preamble += '<link rel="stylesheet" href="https://fonts.googleapis.com/css?family=Open+Sans">'
 
 
@@ -418,6 +482,9 @@ html_body_start += html_preamble
 html_body_start += stylesheet
 # Define two global JavaScript arrays to be used in get_regular_table().
 html_body_start += '<script>let currentPage = []; let totalPages = [];</script>'
+# The JavaScript functions that are the same on every page.
+# 'defer' runs it after the page has been parsed, but before 'DOMContentLoaded'.
+html_body_start += '<script defer src="' + get_static_url(filename='ricgraph_explorer.js') + '"></script>'
 html_body_start += '</head>'
 html_body_start += '<body>'
 html_body_start += page_header
@@ -426,7 +493,7 @@ html_body_start += page_header
 # ########################################################################
 # The last part of the HTML page, from page_footer (not included) to script inclusion.
 # ########################################################################
-html_body_end = '<script src="/static/ricgraph_sorttable.js"></script>'
+html_body_end = '<script src="' + get_static_url(filename='ricgraph_sorttable.js') + '"></script>'
 html_body_end += '</body>'
 html_body_end += '</html>'
 
@@ -450,8 +517,8 @@ SoftwareX, 26(101736). https://doi.org/10.1016/j.softx.2024.101736.
 # For the histograms. Sources:
 # https://d3js.org/d3.v7.min.js
 # https://observablehq.com/plot/plot.min.js
-observable_plot = '<script src="/static/d3.v7.min.js"></script>'
-observable_plot += '<script src="/static/plot.v0.6.17.min.js"></script>'
+observable_plot = '<script src="' + get_static_url(filename='d3.v7.min.js') + '"></script>'
+observable_plot += '<script src="' + get_static_url(filename='plot.v0.6.17.min.js') + '"></script>'
 
 # Required for Observable D3 framework, https://d3js.org.
 # For the Sankey and Chord diagrams. Sources:
@@ -459,10 +526,10 @@ observable_plot += '<script src="/static/plot.v0.6.17.min.js"></script>'
 # https://d3js.org/d3-chord.v3.min.js
 # https://d3js.org/d3-scale-chromatic.v1.min.js
 # https://cdn.jsdelivr.net/npm/d3-sankey/dist/d3-sankey.min.js
-observable_d3 = '<script src="/static/d3.v7.min.js"></script>'
-observable_d3 += '<script src="/static/d3-chord.v3.min.js"></script>'
-observable_d3 += '<script src="/static/d3-scale-chromatic.v1.min.js"></script>'
-observable_d3 += '<script src="/static/d3-sankey.v0.12.3.min.js"></script>'
+observable_d3 = '<script src="' + get_static_url(filename='d3.v7.min.js') + '"></script>'
+observable_d3 += '<script src="' + get_static_url(filename='d3-chord.v3.min.js') + '"></script>'
+observable_d3 += '<script src="' + get_static_url(filename='d3-scale-chromatic.v1.min.js') + '"></script>'
+observable_d3 += '<script src="' + get_static_url(filename='d3-sankey.v0.12.3.min.js') + '"></script>'
 
 # Style for the tooltip of the Sankey & Chord diagram.
 diagram_tooltip_style = 'style="position:absolute; pointer-events:auto; background:#fff; '
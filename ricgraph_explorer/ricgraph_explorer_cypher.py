@@ -59,24 +59,33 @@
 # ########################################################################
 
 
-from typing import Tuple
+from time import perf_counter
+from typing import Tuple, Iterator
 from pandas import DataFrame
 from neo4j.graph import Node
 from ricgraph import (read_node,
                       get_personroot_node, get_all_neighbor_nodes,
                       ricgraph_database, ricgraph_databasename,
+                      create_ricgraph_read_session,
                       convert_cypher_recordslist_to_nodeslist,
                       extract_organization_abbreviation,
+                      get_organization_descendants,
                       ORGANIZATION_CATEGORY_ORGANIZATION,
+                      PERSON_CATEGORY_PERSON,
                       RICGRAPH_UNKNOWN,
                       cypher_print_resultsummary,
+                      cypher_execute_query, querystats_record,
                       check_valid_year,
                       QueryParams)
 from ricgraph_explorer_constants import (RICGRAPH_NODEINFO,
+                                         RICGRAPH_NODEINFO_INTERNAL,
                                          RICGRAPH_SYSTEMINFO,
-                                         MAX_ITEMS_TO_RETURN)
+                                         MAX_ITEMS_TO_RETURN,
+                                         ENRICH_CANDIDATES_PAGE_SIZE,
+                                         OVERLAP_MODE_MULTIPLESOURCE,
+                                         OVERLAP_MODE_SINGLESOURCE)
 from ricgraph_explorer_init import get_ricgraph_explorer_global
-from ricgraph_explorer_utils import get_global_list, get_global_dataframe
+from ricgraph_explorer_utils import get_global_list, get_global_dict
 
 
 def find_person_share_resouts_cypher(parent_node: Node | None,
@@ -132,12 +141,13 @@ def find_person_share_resouts_cypher(parent_node: Node | None,
 
     # Note that the RETURN (as in RETURN DISTINCT *) also has all intermediate results, such
     # as the common research results (in 'neighbor'). We don't use them at the moment.
-    records, _, _ = graph.execute_query(query_=cypher_query,
-                                        startnode_personroot_element_id=personroot_node.element_id,
-                                        category_want_list=category_want_list,
-                                        category_dontwant_list=category_dontwant_list,
-                                        max_nr_items=max_nr_items,
-                                        database_=ricgraph_databasename())
+    records, _, _ = cypher_execute_query(graph=graph,
+                                         query_=cypher_query,
+                                         startnode_personroot_element_id=personroot_node.element_id,
+                                         category_want_list=category_want_list,
+                                         category_dontwant_list=category_dontwant_list,
+                                         max_nr_items=max_nr_items,
+                                         database_=ricgraph_databasename())
     connected_persons = [record['neighbor_personroot'] for record in records]
     return connected_persons
 
@@ -190,11 +200,12 @@ def find_person_organization_collaborations_cypher(parent_node: Node | None,
     # collaborates with, very probably also the organizations this person works for.
     researchresult_category_active = get_global_list(ricgraph_info=RICGRAPH_NODEINFO,
                                                      item='researchresult_category_active')
-    records, _, _ = graph.execute_query(query_=cypher_query,
-                                        startnode_personroot_element_id=personroot_node.element_id,
-                                        researchresult_category_active=researchresult_category_active,
-                                        max_nr_items=max_nr_items,
-                                        database_=ricgraph_databasename())
+    records, _, _ = cypher_execute_query(graph=graph,
+                                         query_=cypher_query,
+                                         startnode_personroot_element_id=personroot_node.element_id,
+                                         researchresult_category_active=researchresult_category_active,
+                                         max_nr_items=max_nr_items,
+                                         database_=ricgraph_databasename())
 
     # Get the organizations from 'parent_node'.
     personroot_node = get_personroot_node(node=parent_node)
@@ -292,16 +303,104 @@ def find_organization_additional_info_cypher(parent_node: Node,
     if query_params['max_nr_items'] > 0:
         cypher_query += 'LIMIT $max_nr_items '
     # print(cypher_query)
-    records, _, _ = graph.execute_query(query_=cypher_query,
-                                        node_element_id=parent_node.element_id,
-                                        **query_params,
-                                        database_=ricgraph_databasename())
+    records, _, _ = cypher_execute_query(graph=graph,
+                                         query_=cypher_query,
+                                         node_element_id=parent_node.element_id,
+                                         **query_params,
+                                         database_=ricgraph_databasename())
     if len(records) == 0:
         return []
     else:
         return records
 
 
+def find_all_information_bulk_cypher(key_list: list,
+                                     name_want: list = None,
+                                     category_want: list = None,
+                                     year_first: str = '',
+                                     year_last: str = '',
+                                     use_personroot: bool = False,
+                                     max_nr_items: int = MAX_ITEMS_TO_RETURN) -> dict:
+    """Find all the neighbors for a list of keys, using one Cypher query.
+    This is the bulk version of get_all_neighbor_nodes() for a node that
+    is found with read_all_nodes(key=...).
+
+    :param key_list: the list of keys (the '_key' property) of the nodes.
+    :param name_want: only return neighbors where 'name' is in this list,
+      or [] for any name.
+    :param category_want: only return neighbors where 'category' is in this list,
+      or [] for any category.
+    :param year_first: The first year of the results.
+    :param year_last: The last year of the results.
+    :param use_personroot: if True, first go to the person-root node of
+      the node with a key, and return the neighbors of that person-root node
+      (as in api_person_all_information()).
+    :param max_nr_items: the maximum number of neighbors to return per key,
+      0 = all neighbors.
+    :return: A dict with a key in 'key_list' as key, and the list of neighbor
+      nodes as value. A key that is not found is not in the dict.
+    """
+    graph = get_ricgraph_explorer_global(name='graph')
+    if graph is None:
+        print('find_all_information_bulk_cypher(): Error: graph has not been initialized or opened.')
+        return {}
+    if name_want is None:
+        name_want = []
+    if category_want is None:
+        category_want = []
+    if (message := check_valid_year(year_first=year_first, year_last=year_last)) != '':
+        print(message)
+        return {}
+    if len(key_list) == 0:
+        return {}
+
+    # Prepare and execute Cypher query.
+    # Every key is looked up using the KeyIndex, and for every key
+    # we take the first node found, as read_all_nodes(key=...) does.
+    cypher_query = 'UNWIND $key_list AS key '
+    cypher_query += 'MATCH (node:RicgraphNode) '
+    cypher_query += 'WHERE node._key=key '
+    cypher_query += 'WITH key, head(collect(node)) AS node '
+    if use_personroot:
+        cypher_query += 'OPTIONAL MATCH (node)-[]->(personroot:RicgraphPersonRoot) '
+        cypher_query += 'WITH key, node, head(collect(personroot)) AS personroot '
+        cypher_query += 'WITH key, CASE WHEN node.name="person-root" THEN node '
+        cypher_query += 'ELSE personroot END AS node '
+        cypher_query += 'WHERE node IS NOT NULL '
+
+    clauses = []
+    if len(name_want) > 0:
+        clauses.append('neighbor.name IN $name_want')
+    if len(category_want) > 0:
+        clauses.append('neighbor.category IN $category_want')
+    if year_first != '':
+        clauses.append('neighbor.year >= $year_first')
+    if year_last != '':
+        clauses.append('neighbor.year <= $year_last')
+    cypher_query += 'OPTIONAL MATCH (node)-[]->(neighbor:RicgraphNode) '
+    if len(clauses) >= 1:
+        cypher_query += 'WHERE ' + ' AND '.join(clauses) + ' '
+    cypher_query += 'WITH key, collect(DISTINCT neighbor) AS neighbors '
+    if max_nr_items > 0:
+        cypher_query += 'RETURN key, neighbors[0..$max_nr_items] AS neighbors '
+    else:
+        cypher_query += 'RETURN key, neighbors '
+    # print(cypher_query)
+    records, _, _ = cypher_execute_query(graph=graph,
+                                         query_=cypher_query,
+                                         key_list=key_list,
+                                         name_want=name_want,
+                                         category_want=category_want,
+                                         year_first=year_first,
+                                         year_last=year_last,
+                                         max_nr_items=max_nr_items,
+                                         database_=ricgraph_databasename())
+    neighbors_per_key = {}
+    for record in records:
+        neighbors_per_key[record['key']] = record['neighbors']
+    return neighbors_per_key
+
+
 def find_collabs_cypher(query_params: QueryParams,
                         cypher_return_clause: str = '') -> list:
     """Find collaborations, starting from start_orgs,
@@ -328,8 +427,8 @@ def find_collabs_cypher(query_params: QueryParams,
       constructed in this function.
     :return: a list of nodes conforming to the cypher query, or [] if nothing found.
     """
-    orgs_with_hierarchies = get_global_dataframe(ricgraph_info=RICGRAPH_SYSTEMINFO,
-                                                 item='orgs_with_hierarchies')
+    organization_hierarchy = get_global_dict(ricgraph_info=RICGRAPH_NODEINFO_INTERNAL,
+                                             item='organization_hierarchy')
     researchresult_category_publication = get_global_list(ricgraph_info=RICGRAPH_SYSTEMINFO,
                                                           item='researchresult_category_publication')
     graph = get_ricgraph_explorer_global(name='graph')
@@ -388,19 +487,28 @@ def find_collabs_cypher(query_params: QueryParams,
     cypher_query += 'AND persroot1<>persroot2 '
     cypher_query += 'AND start_orgs<>collab_orgs '
 
-    org_abbr = ''
+    org_descendants = []
     if query_params['collab_orgs'] == '':
         # If we are to match any organization...
-        org_abbr = extract_organization_abbreviation(org_name=query_params['start_orgs'])
-        if orgs_with_hierarchies is None or orgs_with_hierarchies.empty:
-            print('find_collabs_cypher(): Error, you should have specified "orgs_with_hierarchies", exiting...')
+        if len(organization_hierarchy.get('top_level_organizations', {})) == 0:
+            print('find_collabs_cypher(): Error, you should have specified "organizations_with_hierarchies", exiting...')
             exit(1)
-        if org_abbr in orgs_with_hierarchies['org_abbreviation'].values:
+        # Only the sub-organizations of the top level organization of
+        # 'start_orgs' are excluded, the top level organization itself is not.
+        # These are the organizations whose name starts with the organization
+        # abbreviation of 'start_orgs', except organizations whose name
+        # starts with a longer abbreviation (e.g. 'UUX' for 'UU').
+        org_abbr = extract_organization_abbreviation(org_name=query_params['start_orgs'])
+        top_level_organizations = organization_hierarchy['top_level_organizations']
+        if org_abbr in top_level_organizations:
+            org_descendants = get_organization_descendants(organization_hierarchy=organization_hierarchy,
+                                                           org_name=top_level_organizations[org_abbr])
+        if len(org_descendants) > 0:
             # ... and 'start_organization' has sub-organizations (which is specified
-            # in orgs_with_hierarchies), do not match any (sub-)organizations of it in
+            # in the organization hierarchy), do not match any (sub-)organizations of it in
             # 'collab_orgs'.
             # Please also read the design decision at org_collaborations_diagram().
-            cypher_query += 'AND NOT collab_orgs.value STARTS WITH $org_abbr '
+            cypher_query += 'AND NOT collab_orgs.value IN $org_descendants '
     else:
         # We are to find collaborations limited to certain organization(s).
         if read_node(name='ORGANIZATION_NAME', value=query_params['collab_orgs']) is None:
@@ -416,10 +524,11 @@ def find_collabs_cypher(query_params: QueryParams,
 
     # This call returns a list of Records and not a list of Nodes, which
     # is logical since it needs to be able to store any type of result.
-    records, summary, _ = graph.execute_query(cypher_query,
-                                              org_abbr=org_abbr,
-                                              **query_params,
-                                              database_=ricgraph_databasename())
+    records, summary, _ = cypher_execute_query(graph=graph,
+                                               query_=cypher_query,
+                                               org_descendants=org_descendants,
+                                               **query_params,
+                                               database_=ricgraph_databasename())
     cypher_print_resultsummary(summary=summary,
                                print_cypher_query=False,
                                nr_results=len(records))
@@ -596,10 +705,11 @@ def create_researchresult_histogram_cypher(query_params: QueryParams) -> Tuple[d
 
     # This call returns a list of Records and not a list of Nodes, which
     # is logical since it needs to be able to store any type of result.
-    records, _, _ = graph.execute_query(query_=cypher_query,
-                                        #node_element_id=node.element_id,
-                                        **query_params,
-                                        database_=ricgraph_databasename())
+    records, _, _ = cypher_execute_query(graph=graph,
+                                         query_=cypher_query,
+                                         #node_element_id=node.element_id,
+                                         **query_params,
+                                         database_=ricgraph_databasename())
 
     name_histogram = {}
     category_histogram = {}
@@ -625,3 +735,368 @@ def create_researchresult_histogram_cypher(query_params: QueryParams) -> Tuple[d
 
     return (name_histogram, category_histogram,
             year_histogram, license_histogram, access_histogram)
+
+
+def overlap_items_cypher(parent_node: Node | None,
+                         node_filter: dict) -> Tuple[str, dict]:
+    """Get the first part of a Cypher query to find the items to
+    compute the overlap in source systems of. These are either the neighbors
+    of 'parent_node', or the nodes that match 'node_filter'.
+    The query part ends with the distinct items found in 'item'.
+
+    :param parent_node: the node of which the neighbors are the items, or None.
+    :param node_filter: if parent_node is None, the items are the nodes that
+      match this filter, a dict with 'name', 'category', 'value' and
+      'value_is_exact_match', similar to read_all_nodes().
+    :return: the Cypher query part and its parameters.
+    """
+    parameters = {}
+    if parent_node is not None:
+        cypher_query = 'MATCH (node:RicgraphNode)-[]->(item:RicgraphNode) '
+        if ricgraph_database() == 'neo4j':
+            cypher_query += 'WHERE elementId(node)=$node_element_id '
+        else:
+            cypher_query += 'WHERE id(node)=toInteger($node_element_id) '
+        parameters['node_element_id'] = parent_node.element_id
+    else:
+        clauses = []
+        cypher_query = 'MATCH (item:RicgraphNode) '
+        if node_filter['name'] != '':
+            clauses.append('item.name=$node_name')
+        if node_filter['category'] != '':
+            clauses.append('item.category=$node_category')
+        if node_filter['value'] != '':
+            if node_filter['value_is_exact_match']:
+                clauses.append('item.value=$node_value')
+            else:
+                # Case-insensitive search, the toLower() is inefficient.
+                clauses.append('toLower(item.value) CONTAINS $node_value_lowercase')
+        if len(clauses) >= 1:
+            cypher_query += 'WHERE ' + ' AND '.join(clauses) + ' '
+        parameters['node_name'] = node_filter['name']
+        parameters['node_category'] = node_filter['category']
+        parameters['node_value'] = node_filter['value']
+        parameters['node_value_lowercase'] = node_filter['value'].lower()
+    cypher_query += 'WITH DISTINCT item '
+    return cypher_query, parameters
+
+
+def find_overlap_in_source_systems_cypher(parent_node: Node | None,
+                                          node_filter: dict) -> list:
+    """Count the items in every (pair of) source system(s). The counting
+    is done in the graph database, only the counts are returned.
+    For documentation of the parameters, see overlap_items_cypher().
+
+    :param parent_node: see overlap_items_cypher().
+    :param node_filter: see overlap_items_cypher().
+    :return: a list of dicts with 'system1', 'system2', 'nr_sources' and
+      'nr_items': the number of items that are from both 'system1' and 'system2'
+      and that are from 'nr_sources' source systems in total.
+      For 'system1' equal to 'system2', this is the number of items
+      from 'system1' that are from 'nr_sources' source systems.
+    """
+    graph = get_ricgraph_explorer_global(name='graph')
+    if graph is None:
+        print('find_overlap_in_source_systems_cypher(): Error: graph has not been initialized or opened.')
+        return []
+
+    cypher_query, parameters = overlap_items_cypher(parent_node=parent_node,
+                                                    node_filter=node_filter)
+    cypher_query += 'WITH coalesce(item._source, []) AS sources '
+    cypher_query += 'WHERE size(sources) > 0 '
+    cypher_query += 'UNWIND sources AS system1 '
+    cypher_query += 'UNWIND sources AS system2 '
+    cypher_query += 'RETURN system1, system2, size(sources) AS nr_sources, COUNT(*) AS nr_items '
+    # print(cypher_query)
+
+    records, _, _ = cypher_execute_query(graph=graph,
+                                         query_=cypher_query,
+                                         **parameters,
+                                         database_=ricgraph_databasename())
+    overlap = [{'system1': record['system1'],
+                'system2': record['system2'],
+                'nr_sources': record['nr_sources'],
+                'nr_items': record['nr_items']} for record in records]
+    return overlap
+
+
+def find_overlap_in_source_systems_records_cypher(parent_node: Node | None,
+                                                  node_filter: dict,
+                                                  source_system: str,
+                                                  source_system2: str) -> list:
+    """Get the items that are from the source systems 'source_system' and
+    'source_system2'. The selection on source systems is done in the graph database.
+    For documentation of the parameters 'parent_node' and 'node_filter',
+    see overlap_items_cypher().
+
+    :param parent_node: see overlap_items_cypher().
+    :param node_filter: see overlap_items_cypher().
+    :param source_system: the first source system, or '' for all items.
+    :param source_system2: the second source system, or '' for all items from
+      'source_system', or OVERLAP_MODE_SINGLESOURCE for the items only from 'source_system',
+      or OVERLAP_MODE_MULTIPLESOURCE for the items from 'source_system' and
+      at least one other source system.
+    :return: the list of items found.
+    """
+    graph = get_ricgraph_explorer_global(name='graph')
+    if graph is None:
+        print('find_overlap_in_source_systems_records_cypher(): Error: graph has not been initialized or opened.')
+        return []
+
+    cypher_query, parameters = overlap_items_cypher(parent_node=parent_node,
+                                                    node_filter=node_filter)
+    if source_system != '':
+        cypher_query += 'WHERE $source_system IN item._source '
+        if source_system2 == OVERLAP_MODE_SINGLESOURCE:
+            cypher_query += 'AND size(item._source) = 1 '
+        elif source_system2 == OVERLAP_MODE_MULTIPLESOURCE:
+            cypher_query += 'AND size(item._source) > 1 '
+        elif source_system2 != '':
+            cypher_query += 'AND $source_system2 IN item._source '
+    cypher_query += 'RETURN item '
+    # print(cypher_query)
+
+    records, _, _ = cypher_execute_query(graph=graph,
+                                         query_=cypher_query,
+                                         **parameters,
+                                         source_system=source_system,
+                                         source_system2=source_system2,
+                                         database_=ricgraph_databasename())
+    items = [record['item'] for record in records]
+    return items
+
+
+# ##############################################################################
+# Streaming Cypher functions.
+# These functions do not return a list with all the results, but they are
+# generators that yield the nodes found one by one, as they arrive from the
+# graph database backend. They are used for large exports in the REST API,
+# where memory use should not depend on the number of results.
+# ##############################################################################
+def stream_cypher_query(cypher_query: str,
+                        result_item: str,
+                        **parameters) -> Iterator:
+    """Execute a Cypher query, and yield the results one by one.
+    A session is used instead of execute_query(), since execute_query()
+    reads all the results in memory before returning. It is a separate read
+    session, not the session of the request, since the request may do other
+    queries while the results are streamed.
+    The query has no time budget (see set_cypher_time_budget()), since the
+    results are produced as fast as the client reads them. If the client
+    disconnects, the web server closes this generator. Then the session is
+    closed, and the graph database backend discards the remaining results
+    and stops the query.
+
+    :param cypher_query: the Cypher query.
+    :param result_item: the name of the item in the RETURN clause to yield,
+      or '' to yield the complete record.
+    :param parameters: the parameters of the Cypher query.
+    :return: the nodes (or records) found, one by one.
+    """
+    session = create_ricgraph_read_session()
+    if session is None:
+        print('stream_cypher_query(): Error: no session for the graph database backend.')
+        return
+    start = perf_counter()
+    nr_rows = 0
+    try:
+        with session:
+            result = session.run(cypher_query, parameters)
+            for record in result:
+                nr_rows += 1
+                if result_item == '':
+                    yield record
+                else:
+                    yield record[result_item]
+        # session.close() is done automatically because of 'with'.
+    except GeneratorExit:
+        # The client has disconnected, session.close() has been done because of 'with'.
+        print('stream_cypher_query(): client has disconnected after '
+              + str(nr_rows) + ' rows, query stopped.')
+        raise
+    finally:
+        # The duration includes the time needed by the caller to process
+        # the results, since they are streamed.
+        querystats_record(cypher_query=cypher_query,
+                          caller='stream_cypher_query',
+                          duration=perf_counter() - start,
+                          nr_rows=nr_rows)
+    return
+
+
+def stream_all_neighbor_nodes_cypher(parent_node: Node,
+                                     name_want: list = None,
+                                     category_want: list = None,
+                                     year_first: str = '',
+                                     year_last: str = '') -> Iterator[Node]:
+    """Get all the neighbors of 'parent_node', one by one.
+    This is the streaming version of get_all_neighbor_nodes().
+
+    :param parent_node: the node we need neighbors from.
+    :param name_want: only return neighbors where 'name' is in this list,
+      or [] for any name.
+    :param category_want: only return neighbors where 'category' is in this list,
+      or [] for any category.
+    :param year_first: The first year of the results.
+    :param year_last: The last year of the results.
+    :return: the neighbor nodes found, one by one.
+    """
+    if name_want is None:
+        name_want = []
+    if category_want is None:
+        category_want = []
+
+    cypher_query = 'MATCH (node:RicgraphNode)-[]->(neighbor:RicgraphNode) '
+    if ricgraph_database() == 'neo4j':
+        cypher_query += 'WHERE elementId(node)=$node_element_id '
+    else:
+        cypher_query += 'WHERE id(node)=toInteger($node_element_id) '
+    if len(name_want) > 0:
+        cypher_query += 'AND neighbor.name IN $name_want '
+    if len(category_want) > 0:
+        cypher_query += 'AND neighbor.category IN $category_want '
+    if year_first != '':
+        cypher_query += 'AND neighbor.year >= $year_first '
+    if year_last != '':
+        cypher_query += 'AND neighbor.year <= $year_last '
+    cypher_query += 'RETURN DISTINCT neighbor '
+    # print(cypher_query)
+    yield from stream_cypher_query(cypher_query=cypher_query,
+                                   result_item='neighbor',
+                                   node_element_id=parent_node.element_id,
+                                   name_want=name_want,
+                                   category_want=category_want,
+                                   year_first=year_first,
+                                   year_last=year_last)
+    return
+
+
+def stream_organization_additional_info_cypher(parent_node: Node,
+                                               query_params: QueryParams) -> Iterator[Node]:
+    """Find additional information connected to a (sub-)organization, one by one.
+    This is the streaming version of find_organization_additional_info_nodes().
+    Contrary to that function, the results are not ordered on the number
+    of times they are found, because that would require reading all results
+    before the first one can be returned.
+
+    :param parent_node: the starting node for finding additional information.
+    :param query_params: parameters related to the query passed in the URL.
+    :return: the nodes found, one by one.
+    """
+    clauses = []
+    cypher_query = 'MATCH (node:RicgraphNode)'
+    cypher_query += '-[]->(neighbor:RicgraphPersonRoot)'
+    cypher_query += '-[]->(second_neighbor:RicgraphNode) '
+    if ricgraph_database() == 'neo4j':
+        cypher_query += 'WHERE elementId(node)=$node_element_id '
+    else:
+        cypher_query += 'WHERE id(node)=toInteger($node_element_id) '
+    if len(query_params['name_list']) > 0:
+        clauses.append('second_neighbor.name IN $name_list')
+    if len(query_params['category_list']) > 0:
+        clauses.append('second_neighbor.category IN $category_list')
+    if query_params['source_system'] != '':
+        clauses.append('NOT $source_system IN second_neighbor._source')
+    if query_params['year_first'] != '':
+        clauses.append('second_neighbor.year >= $year_first')
+    if query_params['year_last'] != '':
+        clauses.append('second_neighbor.year <= $year_last')
+    if len(clauses) >= 1:
+        cypher_query += 'AND ' + ' AND '.join(clauses) + ' '
+    cypher_query += 'RETURN DISTINCT second_neighbor '
+    # print(cypher_query)
+    yield from stream_cypher_query(cypher_query=cypher_query,
+                                   result_item='second_neighbor',
+                                   node_element_id=parent_node.element_id,
+                                   **query_params)
+    return
+
+
+def stream_enrich_candidates_cypher(query_params: QueryParams,
+                                    name_want: list = None,
+                                    category_want: list = None,
+                                    after_key: str = '') -> Iterator[dict]:
+    """Find the enrich candidates of all person-root nodes, one by one.
+    This is the set-based version of find_enrich_candidates_one_person():
+    a person-root node is an enrich candidate for source system
+    query_params['source_system'] if it has neighbors that are not
+    in that source system.
+    The person-root nodes are read in pages of ENRICH_CANDIDATES_PAGE_SIZE
+    nodes, ordered on their _key, with one Cypher query per page, so
+    there is no limit on the number of person-root nodes.
+
+    :param query_params: parameters related to the query passed in the URL.
+      Contains e.g. 'source_system', 'year_first', 'year_last', and
+      'max_nr_items': the maximum number of nodes in the lists returned, 0 = all.
+    :param name_want: only use neighbors where 'name' is in this list,
+      or [] for any name.
+    :param category_want: only use neighbors where 'category' is in this list,
+      or [] for any category.
+    :param after_key: only use person-root nodes with a _key after this one,
+      or '' to start at the first person-root node. This can be used to
+      continue with the next person-root node after the last one returned.
+    :return: dicts with 'personroot': the person-root node,
+      'person_nodes': the person nodes that are in the source system,
+      'enrich_nodes': the nodes that are not in the source system,
+      one by one.
+    """
+    if name_want is None:
+        name_want = []
+    if category_want is None:
+        category_want = []
+
+    cypher_query = 'MATCH (personroot:RicgraphPersonRoot) '
+    cypher_query += 'WHERE personroot._key > $last_key '
+    cypher_query += 'WITH personroot ORDER BY personroot._key LIMIT $page_size '
+    # OPTIONAL, since we need every person-root node to know where the next page starts.
+    cypher_query += 'OPTIONAL MATCH (personroot)-[]->(neighbor:RicgraphNode) '
+    clauses = []
+    if len(name_want) > 0:
+        clauses.append('neighbor.name IN $name_want')
+    if len(category_want) > 0:
+        clauses.append('neighbor.category IN $category_want')
+    if query_params['year_first'] != '':
+        clauses.append('neighbor.year >= $year_first')
+    if query_params['year_last'] != '':
+        clauses.append('neighbor.year <= $year_last')
+    if len(clauses) >= 1:
+        cypher_query += 'WHERE ' + ' AND '.join(clauses) + ' '
+    cypher_query += 'WITH personroot, '
+    cypher_query += 'COLLECT(DISTINCT CASE WHEN $source_system IN neighbor._source '
+    cypher_query += 'AND neighbor.category = $person_category THEN neighbor END) AS person_nodes, '
+    cypher_query += 'COLLECT(DISTINCT CASE WHEN NOT $source_system IN neighbor._source '
+    cypher_query += 'THEN neighbor END) AS enrich_nodes '
+    cypher_query += 'RETURN personroot, '
+    if query_params['max_nr_items'] > 0:
+        cypher_query += 'person_nodes[..$max_nr_items] AS person_nodes, '
+        cypher_query += 'enrich_nodes[..$max_nr_items] AS enrich_nodes '
+    else:
+        cypher_query += 'person_nodes, enrich_nodes '
+    cypher_query += 'ORDER BY personroot._key '
+    # print(cypher_query)
+
+    last_key = after_key
+    while True:
+        nr_personroots = 0
+        for record in stream_cypher_query(cypher_query=cypher_query,
+                                          result_item='',
+                                          last_key=last_key,
+                                          page_size=ENRICH_CANDIDATES_PAGE_SIZE,
+                                          name_want=name_want,
+                                          category_want=category_want,
+                                          year_first=query_params['year_first'],
+                                          year_last=query_params['year_last'],
+                                          source_system=query_params['source_system'],
+                                          person_category=PERSON_CATEGORY_PERSON,
+                                          max_nr_items=query_params['max_nr_items']):
+            nr_personroots += 1
+            last_key = record['personroot']['_key']
+            if len(record['enrich_nodes']) == 0:
+                # All neighbors are from 'source_system', nothing to report.
+                continue
+            yield {'personroot': record['personroot'],
+                   'person_nodes': record['person_nodes'],
+                   'enrich_nodes': record['enrich_nodes']}
+        if nr_personroots < ENRICH_CANDIDATES_PAGE_SIZE:
+            break
+    return
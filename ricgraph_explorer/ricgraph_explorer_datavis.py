@@ -56,14 +56,14 @@ from ricgraph import (datetimestamp,
                       write_text_to_file, write_dataframe_to_csv,
                       PageParams, QueryParams,
                       datestamp)
-from ricgraph_explorer_constants import (RICGRAPH_SYSTEMINFO,
+from ricgraph_explorer_constants import (RICGRAPH_NODEINFO_INTERNAL,
                                          ricgraph_reference, diagram_tooltip_style,
                                          observable_d3,
                                          chord_space_for_labels,
                                          sankey_pixels_per_link,
                                          sankey_min_height, sankey_max_height)
 from ricgraph_explorer_utils import (remove_hierarchical_orgs,
-                                     get_global_dataframe)
+                                     get_global_dict)
 from ricgraph_explorer_html import create_full_htmlpage
 from ricgraph_explorer_cypher import (find_collab_orgs_matrix,
                                       find_collab_orgs_persons_results)
@@ -410,8 +410,8 @@ def org_collaborations_diagram(page_params: PageParams,
     :return: the HTML produced (either full or body, see 'generate_full_html'),
       or '' if no HTML produced.
     """
-    orgs_with_hierarchies = get_global_dataframe(ricgraph_info=RICGRAPH_SYSTEMINFO,
-                                                 item='orgs_with_hierarchies')
+    organization_hierarchy = get_global_dict(ricgraph_info=RICGRAPH_NODEINFO_INTERNAL,
+                                             item='organization_hierarchy')
     print('-- org_collaborations_diagram(): start at ' + datetimestamp() + '.')
     if diagram_type != 'sankey' and diagram_type != 'chord':
         print('org_collaborations_diagram(): Error, unknown diagram type "' + diagram_type + '", exiting.')
@@ -423,11 +423,11 @@ def org_collaborations_diagram(page_params: PageParams,
 
     collabs_orgs = collabs_orgs_raw.copy(deep=True)
     if query_params['collab_orgs'] == '':
-        if orgs_with_hierarchies is None or orgs_with_hierarchies.empty:
-            print('org_collaborations_diagram(): Error, you should have specified "orgs_with_hierarchies", exiting...')
+        if len(organization_hierarchy.get('top_level_organizations', {})) == 0:
+            print('org_collaborations_diagram(): Error, you should have specified "organizations_with_hierarchies", exiting...')
             exit(1)
         collabs_orgs = remove_hierarchical_orgs(df=collabs_orgs,
-                                                orgs_with_hierarchies=orgs_with_hierarchies,
+                                                organization_hierarchy=organization_hierarchy,
                                                 org_to_keep=query_params['start_orgs'])
     if query_params['start_orgs'] == query_params['collab_orgs']:
         collabs_orgs = make_dataframe_square_symmetric(df=collabs_orgs)
@@ -70,10 +70,8 @@ from ricgraph import (get_personroot_node,
                       A_LARGE_NUMBER,
                       PERSON_CATEGORY_PERSON,
                       ORGANIZATION_CATEGORY_ORGANIZATION,
-                      COMPETENCE_CATEGORY_COMPETENCE,
-                      PERSON_NAME_PERSON_ROOT)
+                      COMPETENCE_CATEGORY_COMPETENCE)
 from ricgraph_explorer_constants import (RICGRAPH_NODEINFO,
-                                         MAX_NR_NODES_TO_ENRICH,
                                          DISCOVERER_MODE_DETAILS,
                                          TABLE_RESEARCH_OUTPUT_COLUMNS,
                                          TABLE_DETAIL_COLUMNS,
@@ -87,7 +85,10 @@ from ricgraph_explorer_html import (get_html_for_cardstart, get_html_for_cardend
                                     get_you_searched_for_card)
 from ricgraph_explorer_cypher import (find_organization_additional_info_cypher,
                                       find_person_organization_collaborations_cypher,
-                                      find_person_share_resouts_cypher)
+                                      find_person_share_resouts_cypher,
+                                      find_overlap_in_source_systems_cypher,
+                                      find_overlap_in_source_systems_records_cypher,
+                                      stream_enrich_candidates_cypher)
 from ricgraph_explorer_table import  (get_regular_table, get_tabbed_table,
                                       get_html_for_tablestart, get_html_for_tableend)
 
@@ -238,8 +239,9 @@ def find_enrich_candidates(parent_node: Node,
     It is built around 'person-root' nodes. For each person-root node (in case there are
     more than one) we check if we can enrich that node.
     In case this function is used to find _all_ enrichments in Ricgraph,
-    (then parent_node = None), a hard limit is used to break from the loop, since otherwise
-    it would take too much time.
+    (then parent_node = None), the enrich candidates are found for all person-root
+    nodes at once by stream_enrich_candidates_cypher(), and at most
+    query_params['max_nr_items'] of them are shown.
     We do not use 'name', 'category' and/or 'value' to get a list of nodes
     (as in e.g. find_overlap_in_source_systems()), because
     in that case we need to do an additional step to get these 'person-root' nodes.
@@ -254,34 +256,38 @@ def find_enrich_candidates(parent_node: Node,
                                           year_last=query_params['year_last'])
     html = ''
     if parent_node is None:
-        personroot_list = read_all_nodes(name=PERSON_NAME_PERSON_ROOT,
-                                         max_nr_nodes=query_params['max_nr_items'])
         personroot_node = None
+        enrich_candidates = stream_enrich_candidates_cypher(query_params=query_params)
         message = 'You have chosen to enrich <em>all</em> nodes in Ricgraph for source system "'
         message += query_params['source_system'] + '". '
-        message += 'However, that will take a long time. '
-        message += 'Ricgraph Explorer will find enrich candidates for at most '
-        message += str(MAX_NR_NODES_TO_ENRICH) + ' nodes. '
-        message += 'If you want to find more nodes to enrich, change the constant '
-        message += '<em>MAX_NR_NODES_TO_ENRICH</em> in file <em>ricgraph_explorer.py</em>.'
+        if query_params['max_nr_items'] > 0:
+            message += 'Ricgraph Explorer will show enrich candidates for at most '
+            message += str(query_params['max_nr_items']) + ' nodes. '
+        message += 'If you want to find all nodes to enrich, you can use the REST API call '
+        message += '<em>/stream/enrich</em>.'
         html += get_message(message=message, please_try_again=False)
     else:
         personroot_node = get_personroot_node(node=parent_node)
-        personroot_list = [personroot_node]
+        person_nodes, nodes_not_in_source_system = \
+            find_enrich_candidates_one_person(personroot=personroot_node,
+                                              query_params=query_params)
+        enrich_candidates = [{'personroot': personroot_node,
+                              'person_nodes': person_nodes,
+                              'enrich_nodes': nodes_not_in_source_system}]
 
     if page_params['discoverer_mode'] == DISCOVERER_MODE_DETAILS:
         table_columns = TABLE_DETAIL_COLUMNS
     else:
         table_columns = TABLE_RESEARCH_OUTPUT_COLUMNS
 
-    count = 1
+    count = 0
     something_found = False
-    for personroot in personroot_list:
-        if count > MAX_NR_NODES_TO_ENRICH:
+    for enrich_candidate in enrich_candidates:
+        if 0 < query_params['max_nr_items'] <= count:
             break
-        person_nodes, nodes_not_in_source_system = \
-            find_enrich_candidates_one_person(personroot=personroot,
-                                              query_params=query_params)
+        personroot = enrich_candidate['personroot']
+        person_nodes = enrich_candidate['person_nodes']
+        nodes_not_in_source_system = enrich_candidate['enrich_nodes']
         if len(nodes_not_in_source_system) == 0:
             # All neighbors are only from 'source_system', nothing to report.
             continue
@@ -572,11 +578,73 @@ def find_organization_additional_info(parent_node: Node | None,
     return html
 
 
+def get_overlap_parent_node_and_filter(node: Node,
+                                       overlap_mode: str,
+                                       caller: str) -> Tuple[Node | None, dict, str]:
+    """Determine the items to compute the overlap in source systems of.
+    These are the nodes that match 'node', or, if there are none, the nodes
+    with a value that contains the value of 'node' (as in a broad search).
+    If overlap_mode is OVERLAP_MODE_NEIGHBORNODE, these are the neighbors
+    of the (only) node found, or of its person-root node.
+    Only a few nodes are read to determine this, the items themselves are
+    not read.
+
+    :param node: the starting node for finding overlap.
+    :param overlap_mode: which overlap to compute, see find_overlap_in_source_systems().
+    :param caller: the name of the calling function, for the error messages.
+    :return: the node of which the neighbors are the items (or None if the
+      items are the nodes that match the filter), the filter, and an error
+      message, or '' if there is no error.
+    """
+    node_filter = {'name': node['name'],
+                   'category': node['category'],
+                   'value': node['value'],
+                   'value_is_exact_match': True}
+    # We read at most 2 nodes, that is enough to know if there are more than one.
+    nodes = read_all_nodes(name=node['name'],
+                           category=node['category'],
+                           value=node['value'],
+                           max_nr_nodes=2)
+    if len(nodes) == 0:
+        # Let's try again, assuming we did a broad search instead of an exact match search.
+        node_filter = {'name': '',
+                       'category': '',
+                       'value': node['value'],
+                       'value_is_exact_match': False}
+        nodes = read_all_nodes(value=node['value'],
+                               value_is_exact_match=False,
+                               max_nr_nodes=2)
+        if len(nodes) == 0:
+            return None, node_filter, 'Ricgraph Explorer could not find anything.'
+
+    if overlap_mode != OVERLAP_MODE_NEIGHBORNODE:
+        return None, node_filter, ''
+
+    # In this case, we would like to know the overlap of nodes neighboring the node
+    # we have just found. We can only do that if we have found only one node.
+    if len(nodes) > 1:
+        message = 'Ricgraph Explorer found too many nodes. It cannot compute the overlap '
+        message += 'of the neighbor nodes of more than one node in ' + caller + '().'
+        return None, node_filter, message
+
+    parent_node = nodes[0]
+    if parent_node['category'] == PERSON_CATEGORY_PERSON:
+        personroot = get_personroot_node(node=parent_node)
+        if personroot is None:
+            message = 'Ricgraph Explorer found no "person-root" '
+            message += 'node in ' + caller + '().'
+            return None, node_filter, message
+        parent_node = personroot
+    return parent_node, node_filter, ''
+
+
 def find_overlap_in_source_systems(node: Node,
                                    page_params: PageParams,
                                    query_params: QueryParams) -> str:
     """Get the overlap in items from source systems.
     This function is tightly connected to find_overlap_in_source_systems_records().
+    The overlap is computed in the graph database, only the counts
+    are returned, not the items themselves.
 
     :param node: the starting node for finding overlap.
     :param page_params: parameters related to the page passed in the URL.
@@ -590,58 +658,36 @@ def find_overlap_in_source_systems(node: Node,
     :return: HTML to be rendered.
     """
     html = ''
-    nodes = read_all_nodes(name=node['name'],
-                           category=node['category'],
-                           value=node['value'])
-    if len(nodes) == 0:
-        # Let's try again, assuming we did a broad search instead of an exact match search.
-        nodes = read_all_nodes(value=node['value'],
-                                value_is_exact_match=False)
-        if len(nodes) == 0:
-            return get_message(message='Ricgraph Explorer could not find anything.')
-
-    if page_params['overlap_mode'] == OVERLAP_MODE_NEIGHBORNODE:
-        # In this case, we would like to know the overlap of nodes neighboring the node
-        # we have just found. We can only do that if we have found only one node.
-        if len(nodes) > 1:
-            message = 'Ricgraph Explorer found too many nodes. It cannot compute the overlap '
-            message += 'of the neighbor nodes of more than one node in get_overlap_in_source_systems().'
-            return get_message(message=message)
-
-        parent_node = nodes[0]
-        if parent_node['category'] == PERSON_CATEGORY_PERSON:
-            personroot = get_personroot_node(node=parent_node)
-            if personroot is None:
-                message = 'Ricgraph Explorer found no "person-root" '
-                message += 'node in get_overlap_in_source_systems().'
-                return get_message(message=message)
-            neighbor_nodes = get_all_neighbor_nodes(node=personroot)
-        else:
-            neighbor_nodes = get_all_neighbor_nodes(node=parent_node)
-        nodes = neighbor_nodes.copy()
+    parent_node, node_filter, message = get_overlap_parent_node_and_filter(node=node,
+                                                                           overlap_mode=page_params['overlap_mode'],
+                                                                           caller='find_overlap_in_source_systems')
+    if message != '':
+        return get_message(message=message)
+    overlap = find_overlap_in_source_systems_cypher(parent_node=parent_node,
+                                                    node_filter=node_filter)
 
-    nr_total_recs = 0
     nr_recs_from_one_source = 0
     nr_recs_from_multiple_sources = 0
     recs_from_one_source = create_multidimensional_dict(1, int)
     recs_from_multiple_sources = create_multidimensional_dict(1, int)
     recs_from_multiple_sources_histogram = create_multidimensional_dict(2, int)
+    recs_per_nr_sources = create_multidimensional_dict(1, int)
 
-    # Determine the overlap in source systems.
-    for node in nodes:
-        sources = node['_source']
-        if len(sources) == 0:
-            continue
-        nr_total_recs += 1
-        if len(sources) == 1:
-            nr_recs_from_one_source += 1
-            recs_from_one_source[sources[0]] += 1
+    # Determine the overlap in source systems from the counts.
+    for count in overlap:
+        if count['nr_sources'] == 1:
+            nr_recs_from_one_source += count['nr_items']
+            recs_from_one_source[count['system1']] += count['nr_items']
             continue
-        nr_recs_from_multiple_sources += 1
-        for system1 in sources:
-            recs_from_multiple_sources[system1] += 1
-            for system2 in sources:
-                recs_from_multiple_sources_histogram[system1][system2] += 1
+        recs_from_multiple_sources_histogram[count['system1']][count['system2']] += count['nr_items']
+        if count['system1'] == count['system2']:
+            recs_from_multiple_sources[count['system1']] += count['nr_items']
+            recs_per_nr_sources[count['nr_sources']] += count['nr_items']
+    for nr_sources in recs_per_nr_sources:
+        # An item from 'nr_sources' source systems is counted once for
+        # each of these systems, so the sum over all systems can be divided.
+        nr_recs_from_multiple_sources += recs_per_nr_sources[nr_sources] // nr_sources
+    nr_total_recs = nr_recs_from_one_source + nr_recs_from_multiple_sources
 
     if nr_total_recs == 0:
         if page_params['overlap_mode'] == OVERLAP_MODE_NEIGHBORNODE:
@@ -845,62 +891,15 @@ def find_overlap_in_source_systems_records(node: Node,
         query_params['source_system'] = query_params['source_system2']
         query_params['source_system2'] = ''
 
-    result = read_all_nodes(name=node['name'],
-                           category=node['category'],
-                           value=node['value'])
-    if len(result) == 0:
-        # Let's try again, assuming we did a broad search instead of an exact match search.
-        result = read_all_nodes(value=node['value'],
-                               value_is_exact_match=False)
-        if len(result) == 0:
-            # No, we really didn't find anything.
-            message = 'Unexpected result in find_overlap_in_source_systems_records(): '
-            message += 'This node cannot be found in Ricgraph.'
-            return get_message(message=message)
-
-    if page_params['overlap_mode'] == OVERLAP_MODE_NEIGHBORNODE:
-        # In this case, we would like to know the overlap of nodes neighboring the node
-        # we have just found. We can only do that if we have found only one node.
-        if len(result) > 1:
-            message = 'Ricgraph Explorer found too many nodes. It cannot compute the overlap '
-            message += 'of the neighbor nodes of more than one node '
-            message += 'in find_overlap_in_source_systems_records().'
-            return get_message(message=message)
-
-        node = result[0]
-        if node['category'] == PERSON_CATEGORY_PERSON:
-            personroot = get_personroot_node(node)
-            if personroot is None:
-                message = 'Unexpected result in find_overlap_in_source_systems_records(): '
-                message += 'Ricgraph Explorer found no "person-root" node.'
-                return get_message(message=message)
-            neighbor_nodes = get_all_neighbor_nodes(node=personroot)
-        else:
-            neighbor_nodes = get_all_neighbor_nodes(node=node)
-        result = neighbor_nodes.copy()
-
-    relevant_result = []
-    for node in result:
-        sources = node['_source']
-        if query_params['source_system'] == '':
-            # Then system2 will also be '', see swap above.
-            relevant_result.append(node)
-            continue
-        if query_params['source_system2'] == '':
-            if query_params['source_system'] in sources:
-                relevant_result.append(node)
-                continue
-        if query_params['source_system2'] == OVERLAP_MODE_SINGLESOURCE:
-            if query_params['source_system'] in sources and len(sources) == 1:
-                relevant_result.append(node)
-                continue
-        if query_params['source_system2'] == OVERLAP_MODE_MULTIPLESOURCE:
-            if query_params['source_system'] in sources and len(sources) > 1:
-                relevant_result.append(node)
-                continue
-        if query_params['source_system'] in sources \
-           and query_params['source_system2'] in sources:
-            relevant_result.append(node)
+    parent_node, node_filter, message = get_overlap_parent_node_and_filter(node=node,
+                                                                           overlap_mode=page_params['overlap_mode'],
+                                                                           caller='find_overlap_in_source_systems_records')
+    if message != '':
+        return get_message(message=message)
+    relevant_result = find_overlap_in_source_systems_records_cypher(parent_node=parent_node,
+                                                                    node_filter=node_filter,
+                                                                    source_system=query_params['source_system'],
+                                                                    source_system2=query_params['source_system2'])
 
     if page_params['discoverer_mode'] == DISCOVERER_MODE_DETAILS:
         table_columns = TABLE_DETAIL_COLUMNS
@@ -58,7 +58,8 @@ from ricgraph_explorer_constants import (RICGRAPH_NODEINFO,
                                          button_style, button_width, button_width_half,
                                          font_family,
                                          form_button_on_one_line_flexspace_style,
-                                         boxedcard_button_width)
+                                         boxedcard_button_width,
+                                         get_static_url)
 from ricgraph_explorer_utils import get_global_str, get_global_list
 from ricgraph_explorer_cypher import create_researchresult_histogram_cypher
 from ricgraph_explorer_javascript import (get_spinner_javascript,
@@ -770,9 +771,9 @@ def create_full_htmlpage(body_html: str) -> str:
 
     for filename in js_map:
         js_text = Path(filename).read_text(encoding='utf-8')
-        filename_with_slash = '/' + filename
+        static_url = get_static_url(filename=filename.removeprefix('static/'))
         result_html = result_html.replace(
-            f'<script src="{filename_with_slash}"></script>',
+            f'<script src="{static_url}"></script>',
             f'<script>{js_text}</script>'
         )
 
@@ -0,0 +1,350 @@
+# ########################################################################
+#
+# Ricgraph - Research in context graph
+#
+# ########################################################################
+#
+# MIT License
+#
+# Copyright (c) 2026 Rik D.T. Janssen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# ########################################################################
+#
+# Ricgraph Explorer HTTP related functions.
+# For more information about Ricgraph and Ricgraph Explorer,
+# go to https://www.ricgraph.eu and https://docs.ricgraph.eu.
+#
+# ########################################################################
+#
+# Original version Rik D.T. Janssen, October 2026.
+#
+# ########################################################################
+
+
+from hashlib import sha256
+from gzip import compress as gzip_compress
+from threading import Lock
+from typing import Tuple
+from connexion import FlaskApp
+from flask import request, g, Response
+from ricgraph import (get_configfile_key, get_ricgraph_version,
+                      create_http_response, RicgraphQueryTimeout,
+                      HTTP_RESPONSE_QUERY_TOO_LARGE)
+from ricgraph_explorer_constants import (html_body_start, html_body_end,
+                                         HTTP_CACHE_MAX_AGE_DEFAULT,
+                                         HTTP_CACHE_EXCLUDED_PATHS,
+                                         STATIC_VERSIONED_MAX_AGE,
+                                         HTTP_COMPRESS_MIMETYPES,
+                                         HTTP_COMPRESS_MIN_SIZE)
+from ricgraph_explorer_init import get_ricgraph_explorer_snapshot_version
+from ricgraph_explorer_html import get_message, get_page_footer
+
+# Package 'brotli' is optional. If it is not installed, only gzip is used.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# The compressed static files, so that they are only compressed once.
+# The key is the path, ETag and encoding, the value the compressed file.
+_compressed_static_files = {}
+_compressed_static_files_lock = Lock()
+
+
+# ##############################################################################
+# Conditional GET (ETag) functions.
+# The content of Ricgraph only changes when it is harvested. Therefore, the
+# response to a request only depends on the harvest and on the URL parameters
+# of that request. We use that to compute a strong ETag for every response,
+# so that a client or reverse proxy that sends 'If-None-Match' gets
+# a '304 Not Modified' before we access the graph database.
+# ##############################################################################
+def get_http_cache_max_age() -> int:
+    """Get the value for 'max-age' in the 'Cache-Control' header.
+    It is read from the Ricgraph ini file, or, if it is not there,
+    HTTP_CACHE_MAX_AGE_DEFAULT.
+
+    :return: the max age in seconds.
+    """
+    max_age = get_configfile_key(section='Ricgraph_explorer',
+                                 key='ricgraph_explorer_http_cache_max_age')
+    if max_age == '':
+        return HTTP_CACHE_MAX_AGE_DEFAULT
+    if not max_age.isdigit():
+        print('get_http_cache_max_age(): Error, invalid value "' + max_age + '"')
+        print('  for "ricgraph_explorer_http_cache_max_age" in Ricgraph ini file,')
+        print('  using default value ' + str(HTTP_CACHE_MAX_AGE_DEFAULT) + '.')
+        return HTTP_CACHE_MAX_AGE_DEFAULT
+    return int(max_age)
+
+
+def get_harvest_fingerprint() -> str:
+    """Get a string that identifies the current harvest of Ricgraph.
+    It is the version of the snapshot the Ricgraph Explorer globals have
+    been computed from, so it changes after every harvest or change of
+    Ricgraph that writes a snapshot, also if the number of nodes and edges
+    stays the same. It does not access the graph database.
+    Note that if a worker has created the snapshot in memory, it has its
+    own version, so workers may have different fingerprints.
+
+    :return: the fingerprint, or '' if no snapshot has been loaded.
+    """
+    snapshot_version = get_ricgraph_explorer_snapshot_version()
+    if snapshot_version == '':
+        return ''
+    fingerprint = snapshot_version
+    fingerprint += '|' + get_ricgraph_version()
+    return fingerprint
+
+
+def get_normalized_request_parameters() -> str:
+    """Get the path and URL parameters of the current request in a
+    normalized form: parameters are sorted, values of a parameter
+    that occurs more than once are sorted, and empty values are removed.
+    This ensures that e.g. '?a=1&b=2' and '?b=2&a=1' give the same result.
+
+    :return: the normalized request parameters.
+    """
+    parameters = request.path
+    for key in sorted(request.args.keys()):
+        values = sorted([value for value in request.args.getlist(key) if value != ''])
+        if len(values) == 0:
+            continue
+        for value in values:
+            parameters += '|' + key + '=' + value
+    return parameters
+
+
+def compute_etag() -> str:
+    """Compute a strong ETag for the current request.
+
+    :return: the ETag (without quotes), or '' if no ETag can be computed.
+    """
+    if request.method not in ['GET', 'HEAD']:
+        return ''
+    if request.path in HTTP_CACHE_EXCLUDED_PATHS:
+        return ''
+    if request.endpoint is not None and request.endpoint.endswith('static'):
+        # Flask handles static files itself.
+        return ''
+    fingerprint = get_harvest_fingerprint()
+    if fingerprint == '':
+        return ''
+    etag_source = fingerprint + '#' + get_normalized_request_parameters()
+    return sha256(etag_source.encode('utf-8')).hexdigest()[:32]
+
+
+def http_cache_before_request() -> Response | None:
+    """Flask 'before_request' function. If the ETag that the client sends
+    in 'If-None-Match' equals the ETag of this request, we answer
+    with '304 Not Modified' without doing anything else.
+
+    :return: a 304 response, or None to continue handling the request.
+    """
+    g.ricgraph_etag = compute_etag()
+    if g.ricgraph_etag == '':
+        return None
+    if not request.if_none_match.contains_weak(g.ricgraph_etag):
+        return None
+    response = Response(status=304)
+    response.set_etag(g.ricgraph_etag)
+    response.headers['Cache-Control'] = 'public, max-age=' + str(get_http_cache_max_age())
+    return response
+
+
+def http_cache_after_request(response: Response) -> Response:
+    """Flask 'after_request' function. Add the ETag and 'Cache-Control'
+    headers to a response.
+
+    :param response: the response.
+    :return: the response with the headers added.
+    """
+    is_static = request.endpoint is not None and request.endpoint.endswith('static')
+    if is_static and request.args.get('v', '') != '' and response.status_code in [200, 304]:
+        # A static file with a version in its url, see get_static_url().
+        # If the file changes, its url changes, so it can be cached for a long time.
+        response.headers['Cache-Control'] = 'public, max-age=' + str(STATIC_VERSIONED_MAX_AGE) + ', immutable'
+        return response
+    if response.is_streamed and not is_static:
+        # A streamed response (e.g. NDJSON from the REST API) is sent before
+        # it is complete. If it fails part way, the client gets a truncated
+        # response without an error, which should not be cached.
+        response.headers['Cache-Control'] = 'no-store'
+        return response
+    etag = g.get('ricgraph_etag', '')
+    if etag == '' or response.status_code == 304:
+        return response
+    if response.status_code >= 300:
+        # Errors, redirects, etc. should not be cached.
+        response.headers['Cache-Control'] = 'no-store'
+        return response
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'public, max-age=' + str(get_http_cache_max_age())
+    return response
+
+
+def register_http_cache(ricgraph_explorer_app: FlaskApp) -> None:
+    """Register the conditional GET functions with Ricgraph Explorer.
+    They are called for every page and for every REST API call.
+
+    :param ricgraph_explorer_app: The FlaskApp ricgraph_explorer.
+    :return: None.
+    """
+    ricgraph_explorer_app.app.before_request(http_cache_before_request)
+    ricgraph_explorer_app.app.after_request(http_cache_after_request)
+    return
+
+
+# ##############################################################################
+# Response compression functions.
+# Pages, REST API responses and static files are compressed if the client
+# accepts it. This makes them a lot smaller, and thus faster to load.
+# Streaming responses are not compressed, since then they would not be
+# sent until they are complete.
+# ##############################################################################
+def get_http_compress_encoding() -> str:
+    """Get the compression to use for the response of the current request.
+    Brotli compresses better than gzip, so it is preferred if it is available.
+
+    :return: 'br', 'gzip', or '' for no compression.
+    """
+    if brotli is not None and 'br' in request.accept_encodings:
+        return 'br'
+    if 'gzip' in request.accept_encodings:
+        return 'gzip'
+    return ''
+
+
+def http_compress(data: bytes, encoding: str, quality: str = 'fast') -> bytes:
+    """Compress data.
+
+    :param data: the data.
+    :param encoding: 'br' or 'gzip'.
+    :param quality: 'fast' for pages (they are compressed for every request),
+      or 'best' for static files (they are only compressed once).
+    :return: the compressed data.
+    """
+    if encoding == 'br':
+        return brotli.compress(data, quality=5 if quality == 'fast' else 11)
+    return gzip_compress(data, compresslevel=6 if quality == 'fast' else 9)
+
+
+def http_compress_after_request(response: Response) -> Response:
+    """Flask 'after_request' function. Compress a response, if possible.
+
+    :param response: the response.
+    :return: the (compressed) response.
+    """
+    if response.status_code != 200 or request.method != 'GET':
+        return response
+    if 'Content-Encoding' in response.headers:
+        return response
+    if response.mimetype not in HTTP_COMPRESS_MIMETYPES:
+        return response
+    # The response depends on 'Accept-Encoding', also if it is not compressed.
+    response.vary.add('Accept-Encoding')
+    encoding = get_http_compress_encoding()
+    if encoding == '':
+        return response
+
+    is_static = request.endpoint is not None and request.endpoint.endswith('static')
+    if response.is_streamed and not is_static:
+        return response
+    if is_static:
+        # Flask sends static files directly from the file, read it.
+        response.direct_passthrough = False
+    data = response.get_data()
+    if len(data) < HTTP_COMPRESS_MIN_SIZE:
+        return response
+    etag, _ = response.get_etag()
+    if is_static and etag is not None:
+        key = request.path + '|' + etag + '|' + encoding
+        with _compressed_static_files_lock:
+            compressed = _compressed_static_files.get(key)
+        if compressed is None:
+            compressed = http_compress(data=data, encoding=encoding, quality='best')
+            with _compressed_static_files_lock:
+                _compressed_static_files[key] = compressed
+    else:
+        compressed = http_compress(data=data, encoding=encoding)
+
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    if etag is not None:
+        # The compressed response has the same content as the uncompressed
+        # response, but not the same bytes, so its ETag should be weak.
+        # 'If-None-Match' uses a weak comparison, so it still matches.
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def register_http_compression(ricgraph_explorer_app: FlaskApp) -> None:
+    """Register the response compression function with Ricgraph Explorer.
+    Flask calls the 'after_request' functions in the reverse order of
+    registration. This one should be called last, after the ETag has been set,
+    so register it before register_http_cache().
+
+    :param ricgraph_explorer_app: The FlaskApp ricgraph_explorer.
+    :return: None.
+    """
+    ricgraph_explorer_app.app.after_request(http_compress_after_request)
+    return
+
+
+# ##############################################################################
+# Query timeout functions.
+# Every query of a page or REST API call has a time budget, see
+# request_session_before_request() in ricgraph_explorer_init.py. If a query
+# does not finish in time, the graph database backend stops it, and
+# RicgraphQueryTimeout is raised. Then the user gets a "too large, please
+# narrow your query" result, instead of a page that takes forever.
+# ##############################################################################
+def query_timeout_errorhandler(error: RicgraphQueryTimeout) -> Tuple[dict, int] | Response:
+    """Flask error handler for RicgraphQueryTimeout.
+
+    :param error: the exception.
+    :return: a REST API response for a REST API call, otherwise an HTML page.
+    """
+    message = str(error)
+    message = message[0].upper() + message[1:] + '.'
+    # This response should not be cached, since the query
+    # may finish in time if the graph database backend is less busy.
+    g.ricgraph_etag = ''
+    if request.path.startswith('/api/'):
+        response, status = create_http_response(message=message,
+                                                http_status=HTTP_RESPONSE_QUERY_TOO_LARGE)
+        return response, status
+    html = html_body_start + get_message(message=message) + get_page_footer() + html_body_end
+    response = Response(response=html, status=HTTP_RESPONSE_QUERY_TOO_LARGE, mimetype='text/html')
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+def register_query_timeout(ricgraph_explorer_app: FlaskApp) -> None:
+    """Register the error handler for queries that take too long with Ricgraph Explorer.
+
+    :param ricgraph_explorer_app: The FlaskApp ricgraph_explorer.
+    :return: None.
+    """
+    ricgraph_explorer_app.app.register_error_handler(RicgraphQueryTimeout,
+                                                     query_timeout_errorhandler)
+    return
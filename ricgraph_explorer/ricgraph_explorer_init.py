@@ -42,14 +42,23 @@
 
 
 from os import path
-from json import loads
+from threading import Thread, Event
+from typing import Callable
 from connexion import FlaskApp
-from pandas import DataFrame
+from flask import request
 
-from ricgraph import (open_ricgraph, read_all_values_of_property,
+from ricgraph import (open_ricgraph,
+                      open_ricgraph_request_session, close_ricgraph_request_session,
+                      set_cypher_time_budget,
                       memcached_open_connection, memcached_check_available,
                       nodes_cache_key_id_type_size, nodes_cache_key_id_size,
-                      ricgraph_get_harvest_date,
+                      nodes_cache_key_id_empty,
+                      querystats_get, get_slow_query_threshold,
+                      read_current_ricgraph_snapshot, read_ricgraph_snapshot,
+                      create_ricgraph_snapshot_once, ricgraph_snapshot_is_current,
+                      get_ricgraph_snapshot_fingerprint,
+                      create_organization_hierarchy,
+                      organization_hierarchy_is_current,
                       ACCESS_ALL, LICENSE_ALL,
                       COMPETENCE_CATEGORY_ALL,
                       COMPETENCE_CATEGORY_COMPETENCE,
@@ -68,11 +77,9 @@ from ricgraph import (open_ricgraph, read_all_values_of_property,
                       get_ricgraph_ini_file,
                       get_ricgraph_version,
                       get_configfile_key,
-                      get_configfile_key_organizations_with_hierarchies,
                       get_ricgraph_properties_standard,
                       get_ricgraph_properties_additional,
                       get_ricgraph_properties_hidden,
-                      ricgraph_nr_nodes, ricgraph_nr_edges,
                       datetimestamp)
 
 from ricgraph_explorer_constants import (RICGRAPH_CACHEINFO,
@@ -98,6 +105,9 @@ from ricgraph_explorer_constants import (RICGRAPH_CACHEINFO,
                                          TABLE_ORGANIZATION_COLUMNS,
                                          TABLE_ID_COLUMNS,
                                          page_footer_general,
+                                         RELOAD_INTERVAL_DEFAULT,
+                                         QUERY_TIMEOUT_DEFAULT, PAGE_TIMEOUT_DEFAULT,
+                                         JOB_TIMEOUT_DEFAULT, QUERY_TIMEOUT_STREAM_PATHS,
                                          HOMEPAGE_INTRO_FILE, HOMEPAGE_OUTRO_FILE)
 
 
@@ -105,6 +115,19 @@ from ricgraph_explorer_constants import (RICGRAPH_CACHEINFO,
 # We need it to store global variables for the app context.
 _ricgraph_explorer_app = None
 
+# These globals are used by the watcher that reloads the Ricgraph Explorer
+# globals after a new harvest, see start_ricgraph_explorer_watcher().
+# The fingerprint of the data that the globals have been computed from.
+_ricgraph_explorer_fingerprint_loaded = {}
+# The fingerprint seen at the previous check, to find out if a harvest has finished.
+_ricgraph_explorer_fingerprint_last_seen = {}
+# The snapshot version that the globals have been computed from.
+_ricgraph_explorer_snapshot_version_loaded = ''
+# The time budgets for queries, read once from the ini file, see get_query_timeouts().
+_ricgraph_explorer_query_timeouts = {}
+# Functions to call after the globals have been reloaded, e.g. to empty caches.
+_ricgraph_explorer_reload_callbacks = []
+
 
 def store_ricgraph_explorer_app(app: FlaskApp) -> None:
     """Store the Ricgraph Explorer app in a global string. We
@@ -191,10 +214,16 @@ def collect_ricgraph_cacheinfo() -> None:
     else:
         cache_name = 'local cache'
 
+    # The query statistics are per worker, see ricgraph_querystats.py.
+    query_statistics = querystats_get()
     ricgraph_cacheinfo = {
         'cache_name': cache_name,
         'nr_items': str(nr_items),
         'size_kb': str(size_kb),
+        'nr_queries': str(sum(stats['nr_calls'] for stats in query_statistics)),
+        'nr_slow_queries': str(sum(stats['nr_slow'] for stats in query_statistics)),
+        'slow_query_threshold': str(get_slow_query_threshold()),
+        'query_statistics': query_statistics,
         'last_update': datetimestamp(seconds=True)
     }
     set_ricgraph_explorer_global(name=RICGRAPH_CACHEINFO,
@@ -202,22 +231,35 @@ def collect_ricgraph_cacheinfo() -> None:
     return
 
 
-def collect_ricgraph_harvestinfo() -> None:
+def collect_ricgraph_harvestinfo(snapshot: dict) -> None:
     """Collect information related to the harvest.
     Put it in a RICGRAPH_HARVESTINFO or RICGRAPH_HARVESTINFO_INTERNAL
     dict in 'ricgraph_explorer_app'.
 
+    :param snapshot: the Ricgraph snapshot, see read_current_ricgraph_snapshot().
     :return: None.
     """
-    # Read things from the graph database and store it in the app context.
+    set_ricgraph_explorer_globals(values=create_ricgraph_harvestinfo(snapshot=snapshot))
+    return
+
+
+def create_ricgraph_harvestinfo(snapshot: dict) -> dict:
+    """Create the information related to the harvest.
+
+    :param snapshot: the Ricgraph snapshot, see read_current_ricgraph_snapshot().
+    :return: a dict with RICGRAPH_HARVESTINFO and RICGRAPH_HARVESTINFO_INTERNAL
+      as keys, and their values as values.
+    """
+    # Read things from the Ricgraph snapshot and store it in the app context.
     # These are all constant in Ricgraph Explorer.
-    harvest_date = ricgraph_get_harvest_date()
+    property_values = snapshot.get('property_values', {})
+    harvest_date = snapshot.get('harvest_date', '')
     if harvest_date == '':
         print('The harvest date of Ricgraph is empty.')
     else:
         print('The harvest date of Ricgraph is ' + harvest_date + '.')
 
-    source_active = read_all_values_of_property('_source')
+    source_active = property_values.get('_source', [])
     # Remove source system SOURCE_RICGRAPH.
     source_active = [x for x in source_active if x != SOURCE_RICGRAPH]
     if len(source_active) == 0:
@@ -230,29 +272,39 @@ def collect_ricgraph_harvestinfo() -> None:
     source_active_datalist += '</datalist>'
 
     ricgraph_harvestinfo = {
-        'harvest_date': ricgraph_get_harvest_date(),
-        'nr_edges': str(ricgraph_nr_edges()),
-        'nr_nodes': str(ricgraph_nr_nodes()),
+        'harvest_date': harvest_date,
+        'nr_edges': str(snapshot.get('nr_edges', -1)),
+        'nr_nodes': str(snapshot.get('nr_nodes', -1)),
         'source_active': source_active,
+        'snapshot_version': snapshot.get('snapshot_version', ''),
         'last_update': datetimestamp(seconds=True)
     }
-    set_ricgraph_explorer_global(name=RICGRAPH_HARVESTINFO,
-                                 value=ricgraph_harvestinfo)
-    ricgraph_harvestinfo = {
+    ricgraph_harvestinfo_internal = {
         'source_active_datalist': source_active_datalist,
     }
-    set_ricgraph_explorer_global(name=RICGRAPH_HARVESTINFO_INTERNAL,
-                                 value=ricgraph_harvestinfo)
-    return
+    return {RICGRAPH_HARVESTINFO: ricgraph_harvestinfo,
+            RICGRAPH_HARVESTINFO_INTERNAL: ricgraph_harvestinfo_internal}
 
 
-def collect_ricgraph_nodeinfo() -> None:
+def collect_ricgraph_nodeinfo(snapshot: dict) -> None:
     """Collect information related to nodes.
     Put it in a RICGRAPH_NODEINFO or RICGRAPH_NODEINFO_INTERNAL
     dict in 'ricgraph_explorer_app'.
 
+    :param snapshot: the Ricgraph snapshot, see read_current_ricgraph_snapshot().
     :return: None.
     """
+    set_ricgraph_explorer_globals(values=create_ricgraph_nodeinfo(snapshot=snapshot))
+    return
+
+
+def create_ricgraph_nodeinfo(snapshot: dict) -> dict:
+    """Create the information related to nodes.
+
+    :param snapshot: the Ricgraph snapshot, see read_current_ricgraph_snapshot().
+    :return: a dict with RICGRAPH_NODEINFO and RICGRAPH_NODEINFO_INTERNAL
+      as keys, and their values as values.
+    """
     # Read a lot of things from the Ricgraph ini file.
     # These are all constant in Ricgraph Explorer.
     ricgraph_node_all_properties = list(get_ricgraph_properties_standard())
@@ -262,9 +314,10 @@ def collect_ricgraph_nodeinfo() -> None:
     ricgraph_node_all_properties.remove('_key')
     ricgraph_node_all_properties.insert(0, '_key')
 
-    # Read a lot of things from the graph database and store it in the app context.
+    # Read a lot of things from the Ricgraph snapshot and store it in the app context.
+    property_values = snapshot.get('property_values', {})
     # Fields related to property 'name' in a node.
-    name_active = read_all_values_of_property('name')
+    name_active = property_values.get('name', [])
     if len(name_active) == 0:
         print('Warning (possibly Error) in obtaining list with all property values for property "name".')
         print('Continuing with an empty list. This might give unexpected results.')
@@ -273,14 +326,14 @@ def collect_ricgraph_nodeinfo() -> None:
     for property_item in name_active:
         name_active_datalist += '<option value="' + property_item + '">'
     name_active_datalist += '</datalist>'
-    person_name_active = read_all_values_of_property('person_name')
+    person_name_active = property_values.get('person_name', [])
     if len(person_name_active) == 0:
         print('Warning (possibly Error) in obtaining list with all property values for property "person_name".')
         print('Continuing with an empty list. This might give unexpected results.')
         person_name_active = []
 
     # Fields related to property 'category' in a node.
-    category_active = read_all_values_of_property('category')
+    category_active = property_values.get('category', [])
     if len(category_active) == 0:
         print('Warning (possibly Error) in obtaining list with all property values for property "category".')
         print('Continuing with an empty list. This might give unexpected results.')
@@ -318,7 +371,7 @@ def collect_ricgraph_nodeinfo() -> None:
     category_active_datalist += '</datalist>'
 
     # Fields related to property 'year' in a node.
-    year_active = read_all_values_of_property('year')
+    year_active = property_values.get('year', [])
     # Remove RICGRAPH_UNKNOWN from year_active.
     # This is also done in ricgraph_explorer_cypher.py,
     # function create_researchresult_histogram_cypher().
@@ -332,8 +385,15 @@ def collect_ricgraph_nodeinfo() -> None:
         year_active_datalist += '<option value="' + property_item + '">'
     year_active_datalist += '</datalist>'
 
-    access_active = read_all_values_of_property('access')
-    license_active = read_all_values_of_property('license')
+    access_active = property_values.get('access', [])
+    license_active = property_values.get('license', [])
+
+    # The organization hierarchy depends on the data in Ricgraph and on
+    # the Ricgraph ini file, it is only created if the latter has changed.
+    organization_hierarchy = snapshot.get('organization_hierarchy', {})
+    if not organization_hierarchy_is_current(organization_hierarchy=organization_hierarchy):
+        print('The organization hierarchy in the Ricgraph snapshot is not current, creating it...')
+        organization_hierarchy = create_organization_hierarchy()
 
     # Check on the completeness of some lists.
     # The following three should be equal to RESEARCHRESULT_CATEGORY_ALL.
@@ -375,19 +435,17 @@ def collect_ricgraph_nodeinfo() -> None:
         'year_active': year_active,
         'last_update': datetimestamp(seconds=True)
     }
-    set_ricgraph_explorer_global(name=RICGRAPH_NODEINFO,
-                                 value=ricgraph_nodeinfo)
     ricgraph_nodeinfo_internal = {
         'category_active_datalist': category_active_datalist,
         'name_active_datalist': name_active_datalist,
+        'organization_hierarchy': organization_hierarchy,
         'researchresult_category_active_datalist': researchresult_category_active_datalist,
         'researchresult_category_publication_active_datalist': researchresult_category_active_datalist,
         'year_active_datalist': year_active_datalist,
         'last_update': datetimestamp(seconds=True)
     }
-    set_ricgraph_explorer_global(name=RICGRAPH_NODEINFO_INTERNAL,
-                                 value=ricgraph_nodeinfo_internal)
-    return
+    return {RICGRAPH_NODEINFO: ricgraph_nodeinfo,
+            RICGRAPH_NODEINFO_INTERNAL: ricgraph_nodeinfo_internal}
 
 
 def collect_ricgraph_systeminfo(ricgraph_explorer_app: FlaskApp,
@@ -405,13 +463,6 @@ def collect_ricgraph_systeminfo(ricgraph_explorer_app: FlaskApp,
     """
     # Read a lot of things from the Ricgraph ini file.
     # These are all constant in Ricgraph Explorer.
-    orgs_with_hierarchies = get_configfile_key_organizations_with_hierarchies()
-    if orgs_with_hierarchies is None:
-        orgs_with_hierarchies = DataFrame()
-    # Convert the DataFrame to a list of dicts, for ricgraph_systeminfo.
-    orgs_with_hierarchies_str = orgs_with_hierarchies.to_json(orient="records")
-    orgs_with_hierarchies_records = loads(orgs_with_hierarchies_str)
-
     discoverer_mode_default = get_configfile_key(section='Ricgraph_explorer',
                                                  key='ricgraph_explorer_display_results_mode')
     if discoverer_mode_default not in DISCOVERER_MODE_ALL:
@@ -452,7 +503,6 @@ def collect_ricgraph_systeminfo(ricgraph_explorer_app: FlaskApp,
         'homepage_intro_html': homepage_intro_html,
         'homepage_outro_html': homepage_outro_html,
         'max_items_to_return_restapi': MAX_ITEMS_TO_RETURN_RESTAPI,
-        'orgs_with_hierarchies': orgs_with_hierarchies_records,
         'origin_button_all': ORIGIN_BUTTON_ALL,
         'osl_profile_mode_all': OSL_PROFILE_MODE_ALL,
         'overlap_mode': OVERLAP_MODE_ALL,
@@ -502,15 +552,268 @@ def initialize_ricgraph_explorer(ricgraph_explorer_app: FlaskApp,
     memcached_open_connection()
     print(nodes_cache_key_id_type_size())
 
+    # Reading the snapshot is fast, computing it (if it is not current) is slow.
+    snapshot = read_current_ricgraph_snapshot()
     collect_ricgraph_cacheinfo()
-    collect_ricgraph_harvestinfo()
-    collect_ricgraph_nodeinfo()
+    collect_ricgraph_harvestinfo(snapshot=snapshot)
+    collect_ricgraph_nodeinfo(snapshot=snapshot)
     collect_ricgraph_systeminfo(ricgraph_explorer_app=ricgraph_explorer_app,
                                 runmode=runmode)
+    store_ricgraph_explorer_loaded_snapshot(snapshot=snapshot)
+    start_ricgraph_explorer_watcher()
     print('Done initializing Ricgraph Explorer.\n')
     return
 
 
+# ################################################
+# Ricgraph Explorer reload after a new harvest.
+# ################################################
+def get_reload_interval() -> int:
+    """Get the number of seconds between two checks for a new harvest.
+    It is read from the Ricgraph ini file, or, if it is not there,
+    RELOAD_INTERVAL_DEFAULT.
+
+    :return: the interval in seconds, 0 means: do not check.
+    """
+    interval = get_configfile_key(section='Ricgraph_explorer',
+                                  key='ricgraph_explorer_reload_interval')
+    if interval == '':
+        return RELOAD_INTERVAL_DEFAULT
+    if not interval.isdigit():
+        print('get_reload_interval(): Error, invalid value "' + interval + '"')
+        print('  for "ricgraph_explorer_reload_interval" in Ricgraph ini file,')
+        print('  using default value ' + str(RELOAD_INTERVAL_DEFAULT) + '.')
+        return RELOAD_INTERVAL_DEFAULT
+    return int(interval)
+
+
+def register_ricgraph_explorer_reload_callback(callback: Callable[[], None]) -> None:
+    """Register a function that is called after the Ricgraph Explorer globals
+    have been reloaded after a new harvest. Use it to empty caches that
+    contain results computed from the previous harvest.
+
+    :param callback: the function to call, it has no parameters.
+    :return: None.
+    """
+    global _ricgraph_explorer_reload_callbacks
+    if callback not in _ricgraph_explorer_reload_callbacks:
+        _ricgraph_explorer_reload_callbacks.append(callback)
+    return
+
+
+def store_ricgraph_explorer_loaded_snapshot(snapshot: dict) -> None:
+    """Remember from which snapshot the Ricgraph Explorer globals have been computed.
+
+    :param snapshot: the snapshot.
+    :return: None.
+    """
+    global _ricgraph_explorer_fingerprint_loaded
+    global _ricgraph_explorer_fingerprint_last_seen
+    global _ricgraph_explorer_snapshot_version_loaded
+
+    fingerprint = {'harvest_date': snapshot.get('harvest_date', ''),
+                   'nr_nodes': snapshot.get('nr_nodes', -1),
+                   'nr_edges': snapshot.get('nr_edges', -1)}
+    _ricgraph_explorer_fingerprint_loaded = fingerprint
+    _ricgraph_explorer_fingerprint_last_seen = fingerprint
+    _ricgraph_explorer_snapshot_version_loaded = snapshot.get('snapshot_version', '')
+    return
+
+
+def get_ricgraph_explorer_snapshot_version() -> str:
+    """Get the version of the snapshot from which the Ricgraph Explorer
+    globals have been computed. Every write of a snapshot (e.g. at the end
+    of every harvest) gives a new version.
+
+    :return: the version, or '' if no snapshot has been loaded.
+    """
+    return _ricgraph_explorer_snapshot_version_loaded
+
+
+def reload_ricgraph_explorer_globals(snapshot: dict) -> None:
+    """Reload the Ricgraph Explorer globals that depend on the data in Ricgraph.
+    All new values are computed first, and then they are set at once.
+    Then the caches are emptied.
+
+    :param snapshot: the snapshot to compute the globals from.
+    :return: None.
+    """
+    print('Reloading Ricgraph Explorer globals from snapshot '
+          + snapshot.get('snapshot_version', '') + '...')
+    values = create_ricgraph_harvestinfo(snapshot=snapshot)
+    values.update(create_ricgraph_nodeinfo(snapshot=snapshot))
+    set_ricgraph_explorer_globals(values=values)
+    store_ricgraph_explorer_loaded_snapshot(snapshot=snapshot)
+
+    # Node ids in the cache are not valid anymore after a new harvest.
+    nodes_cache_key_id_empty()
+    collect_ricgraph_cacheinfo()
+    for callback in _ricgraph_explorer_reload_callbacks:
+        callback()
+    print('Done reloading Ricgraph Explorer globals.')
+    return
+
+
+def check_ricgraph_explorer_reload() -> None:
+    """Check if Ricgraph has been harvested since the Ricgraph Explorer globals
+    have been computed, and if so, reload them.
+    The globals are reloaded if there is a new current snapshot (written at
+    the end of a harvest). If there is no such snapshot, they are only reloaded
+    if Ricgraph has not changed since the previous check, otherwise the
+    harvest is probably still running.
+
+    :return: None.
+    """
+    global _ricgraph_explorer_fingerprint_last_seen
+
+    fingerprint = get_ricgraph_snapshot_fingerprint()
+    snapshot = read_ricgraph_snapshot()
+    if ricgraph_snapshot_is_current(snapshot=snapshot, fingerprint=fingerprint) \
+       and snapshot['snapshot_version'] != _ricgraph_explorer_snapshot_version_loaded:
+        reload_ricgraph_explorer_globals(snapshot=snapshot)
+        return
+
+    if fingerprint == _ricgraph_explorer_fingerprint_loaded:
+        return
+    if fingerprint != _ricgraph_explorer_fingerprint_last_seen:
+        # Ricgraph is changing, wait until the next check.
+        _ricgraph_explorer_fingerprint_last_seen = fingerprint
+        return
+    # Only one gunicorn worker creates the snapshot, the others wait for it.
+    print('Ricgraph has changed, but there is no current snapshot, creating it...')
+    reload_ricgraph_explorer_globals(snapshot=create_ricgraph_snapshot_once(fingerprint=fingerprint))
+    return
+
+
+def ricgraph_explorer_watcher(interval: int, stop_event: Event) -> None:
+    """Check every 'interval' seconds if the Ricgraph Explorer globals
+    need to be reloaded. This function runs in a background thread, so
+    reloading is not done while handling a request.
+
+    :param interval: the number of seconds between two checks.
+    :param stop_event: the event to stop the watcher.
+    :return: None.
+    """
+    while not stop_event.wait(timeout=interval):
+        try:
+            check_ricgraph_explorer_reload()
+        except Exception as error:
+            # The watcher should never stop, e.g. if the graph database
+            # is restarted, the next check will probably succeed.
+            print('ricgraph_explorer_watcher(): Error, ' + str(error) + ', continuing.')
+    return
+
+
+def start_ricgraph_explorer_watcher() -> None:
+    """Start the watcher that reloads the Ricgraph Explorer globals
+    after a new harvest, so Ricgraph Explorer does not need to be restarted.
+
+    :return: None.
+    """
+    interval = get_reload_interval()
+    if interval == 0:
+        print('The Ricgraph Explorer reload watcher is disabled.')
+        return
+    stop_event = Event()
+    watcher = Thread(target=ricgraph_explorer_watcher,
+                     kwargs={'interval': interval, 'stop_event': stop_event},
+                     name='ricgraph_explorer_watcher',
+                     daemon=True)
+    watcher.start()
+    set_ricgraph_explorer_global(name='watcher_stop_event', value=stop_event)
+    print('Started the Ricgraph Explorer reload watcher, it checks every '
+          + str(interval) + ' seconds.')
+    return
+
+
+# ################################################
+# Ricgraph Explorer session for a request.
+# ################################################
+def get_query_timeout(key: str, default: int) -> int:
+    """Get a time budget for queries from the Ricgraph ini file, or, if it
+    is not there, 'default'. It is read from the ini file only once.
+
+    :param key: the key in the Ricgraph ini file.
+    :param default: the default value.
+    :return: the time budget in seconds, 0 means: no maximum.
+    """
+    global _ricgraph_explorer_query_timeouts
+
+    if key in _ricgraph_explorer_query_timeouts:
+        return _ricgraph_explorer_query_timeouts[key]
+    timeout = get_configfile_key(section='Ricgraph_explorer', key=key)
+    if timeout == '':
+        _ricgraph_explorer_query_timeouts[key] = default
+    elif not timeout.isdigit():
+        print('get_query_timeout(): Error, invalid value "' + timeout + '"')
+        print('  for "' + key + '" in Ricgraph ini file,')
+        print('  using default value ' + str(default) + '.')
+        _ricgraph_explorer_query_timeouts[key] = default
+    else:
+        _ricgraph_explorer_query_timeouts[key] = int(timeout)
+    return _ricgraph_explorer_query_timeouts[key]
+
+
+def get_query_timeouts(for_job: bool = False) -> dict:
+    """Get the time budgets for the queries of a request or a background job.
+
+    :param for_job: if True, get the time budgets for a background job.
+    :return: a dict with 'query_timeout' and 'page_timeout', see set_cypher_time_budget().
+    """
+    query_timeout = get_query_timeout(key='ricgraph_explorer_query_timeout',
+                                      default=QUERY_TIMEOUT_DEFAULT)
+    if for_job:
+        page_timeout = get_query_timeout(key='ricgraph_explorer_job_timeout',
+                                         default=JOB_TIMEOUT_DEFAULT)
+    else:
+        page_timeout = get_query_timeout(key='ricgraph_explorer_page_timeout',
+                                         default=PAGE_TIMEOUT_DEFAULT)
+    return {'query_timeout': query_timeout, 'page_timeout': page_timeout}
+
+
+def request_session_before_request() -> None:
+    """Flask 'before_request' function. Open a read session for this
+    request, so that all queries of this request use the same session,
+    instead of a new session for every query.
+    Ricgraph Explorer only reads from Ricgraph.
+    Also, set the time budget for the queries of this request.
+
+    :return: None, to continue handling the request.
+    """
+    open_ricgraph_request_session()
+    timeouts = get_query_timeouts()
+    for stream_path in QUERY_TIMEOUT_STREAM_PATHS:
+        if request.path.startswith(stream_path):
+            timeouts['page_timeout'] = 0
+            break
+    set_cypher_time_budget(**timeouts)
+    return None
+
+
+def request_session_teardown_request(exception: BaseException | None) -> None:
+    """Flask 'teardown_request' function. Close the read session of this request,
+    and remove its time budget.
+
+    :param exception: the exception that occurred while handling the request, if any.
+    :return: None.
+    """
+    close_ricgraph_request_session()
+    set_cypher_time_budget()
+    return
+
+
+def register_request_session(ricgraph_explorer_app: FlaskApp) -> None:
+    """Register the functions that open and close a read session for every
+    request with Ricgraph Explorer.
+
+    :param ricgraph_explorer_app: The FlaskApp ricgraph_explorer.
+    :return: None.
+    """
+    ricgraph_explorer_app.app.before_request(request_session_before_request)
+    ricgraph_explorer_app.app.teardown_request(request_session_teardown_request)
+    return
+
+
 def set_ricgraph_explorer_global(name: str, value) -> None:
     """Set a global variable in the app context.
     This is required, otherwise we don't have them if we e.g. do
@@ -529,6 +832,25 @@ def set_ricgraph_explorer_global(name: str, value) -> None:
     return
 
 
+def set_ricgraph_explorer_globals(values: dict) -> None:
+    """Set several global variables in the app context at once.
+    This is done with one update() of the app config. Note that this is
+    not atomic: every single global is replaced at once, so a request never
+    sees a partially computed value, but a request that reads several
+    globals while a reload is in progress may see some old and some new values.
+
+    :param values: a dict with the names of the globals as keys,
+      and their values as values.
+    :return: None.
+    """
+    current_app = retrieve_ricgraph_explorer_app()
+    if current_app is None:
+        return
+    with current_app.app.app_context():
+        current_app.app.config.update(values)
+    return
+
+
 def get_ricgraph_explorer_global(name: str):
     """Get a global variable from the app context.
 
@@ -71,11 +71,44 @@ def get_spinner_javascript() -> str:
     return javascript
 
 
+def get_job_progress_javascript(status_url: str,
+                                poll_interval: int) -> str:
+    """JavaScript to check regularly if a background job has finished.
+    If it has, the page is reloaded, which will show the result of the job.
+
+    :param status_url: the url to get the status of the job.
+    :param poll_interval: the number of milliseconds between two checks.
+    :return: HTML to be rendered.
+    """
+    javascript = f'''
+                 <script>
+                 function checkJobStatus() {{
+                   fetch("{status_url}", {{cache: "no-store"}})
+                     .then(response => response.json())
+                     .then(job => {{
+                       if (job.status === "finished") {{
+                         window.location.reload();
+                         return;
+                       }}
+                       document.getElementById("ricgraph_job_status").textContent = job.message;
+                       if (job.status !== "failed") {{
+                         setTimeout(checkJobStatus, {poll_interval});
+                       }}
+                     }})
+                     .catch(() => setTimeout(checkJobStatus, {poll_interval}));
+                 }}
+                 setTimeout(checkJobStatus, {poll_interval});
+                 </script>
+                 '''
+    return javascript
+
+
 def get_regular_table_javascript(table_id: str,
                                  len_nodes_list: int,
                                  max_nr_table_rows: int) -> str:
     """Create a paginated HTML table for all nodes in the list.
-    This JavaScript code is for the pagination of the table.
+    This JavaScript code initializes the pagination of the table.
+    The functions for the pagination are in static/ricgraph_explorer.js.
 
     :param table_id: the table id to use.
     :param len_nodes_list: the length of the list of nodes to put in the table.
@@ -87,57 +120,6 @@ def get_regular_table_javascript(table_id: str,
                  // Initialize currentPage and totalPages for all tables
                  currentPage['{table_id}'] = 1; 
                  totalPages['{table_id}'] = Math.ceil({len_nodes_list} / {max_nr_table_rows});
-                 function showPage(page, tableId) {{
-                     page = parseInt(page);
-                     if (page < 1 || page > totalPages[tableId]) return;
-
-                     // Update table visibility
-                     document.querySelectorAll(`.table-${{tableId}}-page-${{currentPage[tableId]}}`)
-                           .forEach(tr => tr.style.display = 'none');
-                     document.querySelectorAll(`.table-${{tableId}}-page-${{page}}`)
-                           .forEach(tr => tr.style.display = '');
-
-                     currentPage[tableId] = page;
-                     updatePagination(tableId);
-                 }}
-                 function updatePagination(tableId) {{
-                     const buttons = document.querySelectorAll(`.page-num-${{tableId}}`);
-                     const total = totalPages[tableId];
-                     let start = 1;
-                     if (total > 5) {{
-                         if (currentPage[tableId] <= 3) {{
-                             start = 1;
-                         }} else if (currentPage[tableId] >= total - 2) {{
-                             start = total - 4;
-                         }} else {{
-                             start = currentPage[tableId] - 2;
-                         }}
-                     }}
-                     buttons.forEach((btn, index) => {{
-                         const pageNum = start + index;
-                         if (btn) {{
-                             btn.textContent = pageNum;
-                             btn.onclick = function() {{ showPage(pageNum, tableId); }};
-                             btn.classList.toggle('uu-yellow', pageNum === currentPage[tableId]);
-                             btn.style.display = pageNum <= total ? '' : 'none';
-                         }}
-                     }});
-                     const ellipsisLeft = document.querySelector(`.ellipsis-left-${{tableId}}`);
-                     const ellipsisRight = document.querySelector(`.ellipsis-right-${{tableId}}`);
-                     if (ellipsisLeft) ellipsisLeft.style.display = start > 1 ? '' : 'none';
-                     if (ellipsisRight) 
-                        ellipsisRight.style.display = (start + buttons.length - 1) < total ? '' : 'none';
-                     const firstButton = document.querySelector(`a[onclick="showPage(1, '${{tableId}}')"]`);
-                     const prevButton = document.querySelector(`a[onclick=
-                                        "showPage(currentPage['${{tableId}}']-1, '${{tableId}}')"]`);
-                     const nextButton = document.querySelector(`a[onclick=
-                                        "showPage(currentPage['${{tableId}}']+1, '${{tableId}}')"]`);
-                     const lastButton = document.querySelector(`a[onclick="showPage(${{total}}, '${{tableId}}')"]`);
-                     if (firstButton) firstButton.classList.toggle('w3-disabled', currentPage[tableId] === 1);
-                     if (prevButton) prevButton.classList.toggle('w3-disabled', currentPage[tableId] === 1);
-                     if (nextButton) nextButton.classList.toggle('w3-disabled', currentPage[tableId] === total);
-                     if (lastButton) lastButton.classList.toggle('w3-disabled', currentPage[tableId] === total);
-                 }}
                  document.addEventListener('DOMContentLoaded', () => {{
                      {f'updatePagination("{table_id}");'}
                  }});
@@ -146,96 +128,6 @@ def get_regular_table_javascript(table_id: str,
     return javascript
 
 
-# This code is inspired by https://www.w3schools.com/w3css/w3css_tabulators.asp.
-def get_tabbed_table_javascript(table_id: str) -> str:
-    """JavaScript to create an HTML table with tabs for all nodes in the list.
-    This code creates the tabs.
-
-    :param table_id: table_id of the table.
-    :return: HTML to be rendered.
-    """
-    javascript = f"""
-                 <script>
-                 function openTab_{table_id}(evt, tabName, table_id) {{
-                   var i, x, tablinks;
-                   x = document.getElementsByClassName("tabitem");
-                   for (i = 0; i < x.length; i++) {{
-                     if (x[i].className.split(' ').indexOf(table_id) != -1) {{
-                       x[i].style.display = "none";
-                     }}
-                   }}
-                   tablinks = document.getElementsByClassName("tablink");
-                   for (i = 0; i < x.length; i++) {{
-                     if (tablinks[i].className.split(' ').indexOf(table_id) != -1) {{
-                       tablinks[i].className = tablinks[i].className.replace(" uu-orange", "");
-                     }}
-                   }}
-                   document.getElementById(tabName).style.display = "block";
-                   evt.currentTarget.className += " uu-orange";
-                 }}
-                 </script>
-                 """
-    return javascript
-
-
-def get_html_for_tableend_javascript(table_filename: str) -> str:
-    """This JavaScript code is to export the table with the given tableId as a CSV file.
-    Only maxRows are exported (as a kind of safety not to be able to export everything).
-    Note that the table is exported as it is shown on the webpage.
-
-    :param table_filename: the filename of the resulting csv download file.
-    :return: HTML to be rendered.
-    """
-    javascript = f'''
-                 <script>
-                 function exportTableToCSV(tableId, maxRows, tableHeader) {{
-                     const rows = document.querySelectorAll(`#${{tableId}} tr`);
-                     const rowsToExport = [];
-                     // Always include the header row (first row), then up to (maxRows) rows total (header + data)
-                     for (let i = 0; i < rows.length && i <= maxRows; i++) {{
-                         rowsToExport.push(rows[i]);
-                     }}
-                     // For each row, get all cells (th or td), and for each cell:
-                     // - Replace any double quotes with two double quotes (CSV escaping).
-                     // - Enclose every cell value in double quotes.
-                     // Join each cell in a row with commas, and join rows with newlines.
-                     // Add tableHeader as first line, followed by the correct number
-                     // of commas.
-                     const columnCount = rowsToExport.length > 0 ? rowsToExport[0].children.length : 1;
-                     const paddedHeader = '"' + String(tableHeader).replace(/"/g, '""') + '"' +
-                       ','.repeat(Math.max(0, columnCount - 1));
-                     const csvContent = paddedHeader + '\\n' +
-                       Array.from(rowsToExport).map(row =>
-                         Array.from(row.children).map(cell => {{
-                             const link = cell.querySelector('a');
-                             const linkText = link ? link.innerText.trim() : '';
-                             // If the cell content is "url_main link" or "url_other link",
-                             // substitute the contents with the actual link.
-                             const cellValue =
-                                 link && (linkText === 'url_main link' || linkText === 'url_other link')
-                                     ? link.href
-                                     : cell.innerText;
-                             // Never export cell contents that start with
-                             // "Click for history" (i.e. the _history column).
-                             const exportValue = cellValue.trim().startsWith('Click for history') ? '' : cellValue;
-                             return '"' + exportValue.replace(/"/g, '""') + '"';
-                         }}).join(',')
-                     ).join('\\n');
-                     const blob = new Blob([csvContent], {{type: 'text/csv'}});
-                     // Create a hidden <a> element to trigger the download.
-                     const link = document.createElement('a');
-                     link.href = URL.createObjectURL(blob);
-                     link.download = '{table_filename}';
-                     document.body.appendChild(link);
-                     link.click();
-                     document.body.removeChild(link);
-                     URL.revokeObjectURL(link.href);
-                 }}
-                 </script>
-                 '''
-    return javascript
-
-
 def get_html_for_histogram_javascript(histogram_json: str,
                                       histogram_width: int = 0,
                                       histogram_mode: str = HISTOGRAM_MODE_COUNTS,
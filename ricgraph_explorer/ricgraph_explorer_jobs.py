@@ -0,0 +1,513 @@
+# ########################################################################
+#
+# Ricgraph - Research in context graph
+#
+# ########################################################################
+#
+# MIT License
+#
+# Copyright (c) 2026 Rik D.T. Janssen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# ########################################################################
+#
+# Ricgraph Explorer background job functions.
+# Some pages may take minutes to compute (e.g. collaborations or the open
+# science dashboard of a large organization). If they are computed while
+# handling the request, the worker is busy for that time, and a reverse
+# proxy may time out. Instead, these pages are run as a background job
+# in a thread pool with a bounded number of threads. The browser gets a
+# page that checks regularly if the job has finished, and then shows the
+# result. Results are stored in files, so they can be shown by every
+# worker, and the next request for the same page (with the same harvest)
+# gets the result immediately.
+# For more information about Ricgraph and Ricgraph Explorer,
+# go to https://www.ricgraph.eu and https://docs.ricgraph.eu.
+#
+# ########################################################################
+#
+# Original version Rik D.T. Janssen, October 2026.
+#
+# ########################################################################
+
+
+from os import (path, makedirs, listdir, remove, replace, getpid, kill,
+                link, stat, geteuid)
+from stat import S_ISDIR, S_IMODE
+from time import time
+from re import fullmatch
+from json import load, dump, JSONDecodeError
+from hashlib import sha256
+from functools import wraps
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from flask import Blueprint, request, g, url_for, jsonify, Response
+from ricgraph import (get_configfile_key, get_ricgraph_ini_file,
+                      datetimestamp, HTTP_RESPONSE_OK,
+                      open_ricgraph_request_session, close_ricgraph_request_session,
+                      set_cypher_time_budget)
+from ricgraph_explorer_constants import (html_body_start, html_body_end,
+                                         spinner_style,
+                                         JOBS_MAX_NR_JOBS_DEFAULT,
+                                         JOBS_DIRECTORY_DEFAULT,
+                                         JOBS_MAX_AGE,
+                                         JOBS_POLL_INTERVAL)
+from ricgraph_explorer_init import retrieve_ricgraph_explorer_app, get_query_timeouts
+from ricgraph_explorer_http import (get_harvest_fingerprint,
+                                    get_normalized_request_parameters)
+from ricgraph_explorer_html import (get_html_for_cardstart, get_html_for_cardend,
+                                    get_message, get_page_footer)
+from ricgraph_explorer_javascript import get_job_progress_javascript
+
+
+_jobstatus_bp = Blueprint(name='jobstatus', import_name=__name__)
+
+# The thread pool that runs the jobs, and the settings read once from the ini file.
+_jobs_executor = None
+_jobs_lock = Lock()
+_jobs_max_nr_jobs = None
+_jobs_directory = None
+
+
+def get_jobs_max_nr_jobs() -> int:
+    """Get the number of jobs that are run at the same time.
+    It is read from the Ricgraph ini file, or, if it is not there,
+    JOBS_MAX_NR_JOBS_DEFAULT.
+
+    :return: the number of jobs, 0 means: do not use background jobs.
+    """
+    global _jobs_max_nr_jobs
+
+    if _jobs_max_nr_jobs is not None:
+        return _jobs_max_nr_jobs
+    max_nr_jobs = get_configfile_key(section='Ricgraph_explorer',
+                                     key='ricgraph_explorer_max_nr_jobs')
+    if max_nr_jobs == '':
+        _jobs_max_nr_jobs = JOBS_MAX_NR_JOBS_DEFAULT
+    elif not max_nr_jobs.isdigit():
+        print('get_jobs_max_nr_jobs(): Error, invalid value "' + max_nr_jobs + '"')
+        print('  for "ricgraph_explorer_max_nr_jobs" in Ricgraph ini file,')
+        print('  using default value ' + str(JOBS_MAX_NR_JOBS_DEFAULT) + '.')
+        _jobs_max_nr_jobs = JOBS_MAX_NR_JOBS_DEFAULT
+    else:
+        _jobs_max_nr_jobs = int(max_nr_jobs)
+    return _jobs_max_nr_jobs
+
+
+def get_jobs_directory() -> str:
+    """Get the directory where the results of jobs are stored, and
+    create it if it does not exist.
+    It is read from the Ricgraph ini file, or, if it is not there,
+    it is JOBS_DIRECTORY_DEFAULT in the same directory as the Ricgraph ini file.
+    The results of jobs are served as they are, so the directory is only
+    used if it is owned by us and if nobody else has access to it.
+
+    :return: the directory, or '' if it cannot be created or used.
+    """
+    global _jobs_directory
+
+    if _jobs_directory is not None:
+        return _jobs_directory
+    jobs_directory = get_configfile_key(section='Ricgraph_explorer',
+                                        key='ricgraph_explorer_jobs_directory')
+    if jobs_directory == '':
+        jobs_directory = path.join(path.dirname(get_ricgraph_ini_file()), JOBS_DIRECTORY_DEFAULT)
+    try:
+        makedirs(jobs_directory, mode=0o700, exist_ok=True)
+        jobs_directory_stat = stat(jobs_directory)
+    except OSError:
+        print('get_jobs_directory(): Error, could not create directory "' + jobs_directory + '",')
+        print('  pages will not be run as background jobs.')
+        jobs_directory = ''
+    else:
+        if not S_ISDIR(jobs_directory_stat.st_mode) \
+           or jobs_directory_stat.st_uid != geteuid() \
+           or S_IMODE(jobs_directory_stat.st_mode) & 0o077 != 0:
+            print('get_jobs_directory(): Error, directory "' + jobs_directory + '" is not owned by')
+            print('  this user, or others have access to it (it should have permissions 700),')
+            print('  pages will not be run as background jobs.')
+            jobs_directory = ''
+    _jobs_directory = jobs_directory
+    return _jobs_directory
+
+
+def get_jobs_executor() -> ThreadPoolExecutor | None:
+    """Get the thread pool that runs the jobs, and create it if it does not exist.
+
+    :return: the thread pool, or None if background jobs are not used.
+    """
+    global _jobs_executor
+
+    with _jobs_lock:
+        if _jobs_executor is not None:
+            return _jobs_executor
+        if get_jobs_max_nr_jobs() == 0 or get_jobs_directory() == '':
+            return None
+        _jobs_executor = ThreadPoolExecutor(max_workers=get_jobs_max_nr_jobs(),
+                                            thread_name_prefix='ricgraph_explorer_job')
+    return _jobs_executor
+
+
+def compute_job_id() -> str:
+    """Compute the job id for the current request. It only depends on the
+    harvest and on the URL parameters, so the same page gets the same job id
+    until the next harvest.
+
+    :return: the job id, or '' if no job id can be computed.
+    """
+    fingerprint = get_harvest_fingerprint()
+    if fingerprint == '':
+        return ''
+    job_source = 'job#' + fingerprint + '#' + get_normalized_request_parameters()
+    return sha256(job_source.encode('utf-8')).hexdigest()
+
+
+def get_job_filename(job_id: str, extension: str) -> str:
+    """Get the filename of a file of a job.
+
+    :param job_id: the job id.
+    :param extension: '.json' for the status, '.html' for the result.
+    :return: the filename.
+    """
+    return path.join(get_jobs_directory(), job_id + extension)
+
+
+def read_job_status(job_id: str) -> dict:
+    """Read the status of a job.
+
+    :param job_id: the job id.
+    :return: the status, or an empty dict if there is no job with this job id.
+    """
+    try:
+        with open(get_job_filename(job_id=job_id, extension='.json')) as fd:
+            job_status = load(fp=fd)
+    except (OSError, JSONDecodeError):
+        return {}
+    if not isinstance(job_status, dict):
+        return {}
+    return job_status
+
+
+def write_job_status(job_id: str, job_status: dict) -> None:
+    """Write the status of a job. The file is written to a temporary file
+    first, and then renamed, so that a partially written status is never read.
+
+    :param job_id: the job id.
+    :param job_status: the status.
+    :return: None.
+    """
+    filename = get_job_filename(job_id=job_id, extension='.json')
+    temp_filename = filename + '.' + str(getpid()) + '.tmp'
+    try:
+        with open(temp_filename, 'w') as fd:
+            dump(obj=job_status, fp=fd)
+        replace(temp_filename, filename)
+    except OSError:
+        print('write_job_status(): Error, could not write file "' + filename + '".')
+    return
+
+
+def remove_job(job_id: str) -> None:
+    """Remove the status and the result of a job.
+
+    :param job_id: the job id.
+    :return: None.
+    """
+    for extension in ['.json', '.html']:
+        filename = get_job_filename(job_id=job_id, extension=extension)
+        if path.isfile(filename):
+            try:
+                remove(filename)
+            except OSError:
+                pass
+    return
+
+
+def remove_old_jobs() -> None:
+    """Remove the files of jobs that are older than JOBS_MAX_AGE.
+
+    :return: None.
+    """
+    jobs_directory = get_jobs_directory()
+    oldest = time() - JOBS_MAX_AGE
+    for filename in listdir(jobs_directory):
+        filename = path.join(jobs_directory, filename)
+        try:
+            if path.getmtime(filename) < oldest:
+                remove(filename)
+        except OSError:
+            # Probably removed by another worker.
+            continue
+    return
+
+
+def job_is_active(job_status: dict) -> bool:
+    """Determine if a job is waiting to be run or running. This is only
+    the case if the worker that runs it still exists, e.g. it might have
+    been stopped by gunicorn.
+
+    :param job_status: the status of the job.
+    :return: True if it is active, otherwise False.
+    """
+    if job_status.get('status') not in ['queued', 'running']:
+        return False
+    try:
+        kill(job_status.get('pid', 0), 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OverflowError):
+        pass
+    return True
+
+
+def get_job_message(job_status: dict) -> str:
+    """Get a message for the user about the status of a job.
+
+    :param job_status: the status of the job.
+    :return: the message.
+    """
+    status = job_status.get('status', '')
+    if status == 'queued':
+        return 'Waiting for other pages to finish...'
+    if status == 'running':
+        seconds = int(time() - job_status.get('started_time', time()))
+        return 'Computing this page, running for ' + str(seconds) + ' seconds...'
+    if status == 'finished':
+        return 'Done.'
+    if status == 'failed':
+        return 'Computing this page failed: ' + job_status.get('error', '') + '.'
+    return 'Unknown job.'
+
+
+def run_job(job_id: str,
+            page_function: Callable[..., str],
+            request_path: str,
+            base_url: str,
+            query_string: bytes) -> None:
+    """Run a job: compute a page and store the result.
+    This function runs in a thread of the thread pool, so there is no request.
+    Therefore, the page is computed in a new request context for the
+    same URL as the request that submitted the job.
+
+    :param job_id: the job id.
+    :param page_function: the function that computes the page.
+    :param request_path: the path of the request.
+    :param base_url: the base url of the request.
+    :param query_string: the query string of the request.
+    :return: None.
+    """
+    job_status = read_job_status(job_id=job_id)
+    job_status['status'] = 'running'
+    job_status['started'] = datetimestamp(seconds=True)
+    job_status['started_time'] = time()
+    write_job_status(job_id=job_id, job_status=job_status)
+
+    flask_app = retrieve_ricgraph_explorer_app().app
+    filename = get_job_filename(job_id=job_id, extension='.html')
+    temp_filename = filename + '.' + str(getpid()) + '.tmp'
+    # Use one session for all queries of this job, as for a request.
+    # A job may take longer than a request, so it has its own time budget.
+    open_ricgraph_request_session()
+    set_cypher_time_budget(**get_query_timeouts(for_job=True))
+    try:
+        with flask_app.test_request_context(path=request_path,
+                                            base_url=base_url,
+                                            query_string=query_string):
+            # Jobs do not need an admission slot, see limit_concurrency().
+            g.ricgraph_job_id = job_id
+            html = page_function()
+        with open(temp_filename, 'w') as fd:
+            fd.write(html)
+        replace(temp_filename, filename)
+    except Exception as error:
+        print('run_job(): Error, job for "' + request_path + '" failed: ' + str(error) + '.')
+        job_status['status'] = 'failed'
+        job_status['error'] = str(error)
+        write_job_status(job_id=job_id, job_status=job_status)
+        return
+    finally:
+        close_ricgraph_request_session()
+        set_cypher_time_budget()
+
+    job_status['status'] = 'finished'
+    job_status['finished'] = datetimestamp(seconds=True)
+    write_job_status(job_id=job_id, job_status=job_status)
+    return
+
+
+def submit_job(job_id: str, page_function: Callable[..., str]) -> None:
+    """Submit a job for the current request. If another worker has
+    submitted the same job at the same time, nothing is done.
+
+    :param job_id: the job id.
+    :param page_function: the function that computes the page.
+    :return: None.
+    """
+    remove_old_jobs()
+    job_status = {'job_id': job_id,
+                  'status': 'queued',
+                  'url': request.full_path,
+                  'pid': getpid(),
+                  'submitted': datetimestamp(seconds=True)}
+    # The status is written to a temporary file first, and then linked to
+    # the status file. link() fails if the status file exists, so only one
+    # worker submits the job, and a status file is never read while it is
+    # being written.
+    filename = get_job_filename(job_id=job_id, extension='.json')
+    temp_filename = filename + '.' + str(getpid()) + '.tmp'
+    try:
+        with open(temp_filename, 'w') as fd:
+            dump(obj=job_status, fp=fd)
+        link(temp_filename, filename)
+    except FileExistsError:
+        return
+    except OSError:
+        print('submit_job(): Error, could not create status of job for "' + request.full_path + '".')
+        return
+    finally:
+        try:
+            remove(temp_filename)
+        except OSError:
+            pass
+
+    get_jobs_executor().submit(run_job,
+                               job_id=job_id,
+                               page_function=page_function,
+                               request_path=request.path,
+                               base_url=request.url_root,
+                               query_string=request.query_string)
+    return
+
+
+def read_job_result(job_id: str) -> str | None:
+    """Read the result of a job.
+
+    :param job_id: the job id.
+    :return: the HTML, or None if the job has not finished.
+    """
+    if read_job_status(job_id=job_id).get('status') != 'finished':
+        return None
+    try:
+        with open(get_job_filename(job_id=job_id, extension='.html')) as fd:
+            return fd.read()
+    except OSError:
+        return None
+
+
+def get_job_progress_page(job_id: str, job_status: dict) -> Response:
+    """Get the page that is shown while a job is waiting or running.
+    It checks regularly if the job has finished. It should not be cached.
+
+    :param job_id: the job id.
+    :param job_status: the status of the job.
+    :return: the response.
+    """
+    html = html_body_start
+    html += spinner_style
+    html += get_html_for_cardstart()
+    html += '<p><span class="ricgraph_spinner"></span>'
+    html += '<span id="ricgraph_job_status" style="margin-left:10px;">'
+    html += get_job_message(job_status=job_status) + '</span></p>'
+    html += 'This page may take (very) long to compute. It will be shown as soon as it is ready. '
+    html += 'You may also leave this page and return to it later.'
+    html += get_html_for_cardend()
+    html += get_job_progress_javascript(status_url=url_for('jobstatus.jobstatus', job_id=job_id),
+                                        poll_interval=JOBS_POLL_INTERVAL)
+    html += get_page_footer() + html_body_end
+
+    # This page should not get an ETag, see ricgraph_explorer_http.py.
+    g.ricgraph_etag = ''
+    response = Response(response=html, status=HTTP_RESPONSE_OK, mimetype='text/html')
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+def run_as_job(view_modes: list = None) -> Callable:
+    """Decorator for a page function that may take long. The page is
+    computed in a background job, and a page that checks regularly if the
+    job has finished is returned. If the job has finished, its result is returned.
+    The page function should return HTML (not a redirect).
+    Use it between the route decorator and the page function, e.g.:
+    @_collabsresultpage_bp.route(rule='/collabsresultpage/', methods=['GET'])
+    @run_as_job()
+    def collabsresultpage() -> str:
+
+    :param view_modes: if specified, only run the page as a job if the url
+      parameter 'view_mode' is one of these.
+    :return: the decorator.
+    """
+    def decorator(page_function: Callable[..., str]) -> Callable:
+        @wraps(page_function)
+        def wrapper() -> str | Response:
+            if view_modes is not None and request.args.get('view_mode', '') not in view_modes:
+                return page_function()
+            if get_jobs_executor() is None:
+                return page_function()
+            job_id = compute_job_id()
+            if job_id == '':
+                return page_function()
+
+            result = read_job_result(job_id=job_id)
+            if result is not None:
+                return result
+            job_status = read_job_status(job_id=job_id)
+            if job_status.get('status') == 'failed':
+                # Remove it, so that reloading the page will try again.
+                # This page should not get an ETag, see ricgraph_explorer_http.py.
+                remove_job(job_id=job_id)
+                g.ricgraph_etag = ''
+                return html_body_start + get_message(message=get_job_message(job_status=job_status)) \
+                       + get_page_footer() + html_body_end
+            if not job_is_active(job_status=job_status):
+                remove_job(job_id=job_id)
+                submit_job(job_id=job_id, page_function=page_function)
+                job_status = read_job_status(job_id=job_id)
+            return get_job_progress_page(job_id=job_id, job_status=job_status)
+        return wrapper
+    return decorator
+
+
+@_jobstatus_bp.route(rule='/jobstatus/', methods=['GET'])
+def jobstatus() -> Response:
+    """Ricgraph Explorer entry, this 'page' only uses URL parameters.
+    Get the status of a background job, as JSON.
+
+    Possible url parameters are:
+    - job_id: the job id.
+
+    :return: the status of the job, with a message for the user.
+    """
+    job_id = request.args.get('job_id', '')
+    if fullmatch(pattern=r'[0-9a-f]{64}', string=job_id) is None \
+       or get_jobs_directory() == '':
+        job_status = {}
+    else:
+        job_status = read_job_status(job_id=job_id)
+    if len(job_status) == 0:
+        job_status = {'error': 'unknown job'}
+    status = job_status.get('status', 'failed')
+    if status in ['queued', 'running'] and not job_is_active(job_status=job_status):
+        status = 'failed'
+        job_status['error'] = 'the job has been stopped'
+    response = jsonify({'status': status,
+                        'message': get_job_message(job_status=job_status | {'status': status})})
+    response.headers['Cache-Control'] = 'no-store'
+    return response
@@ -67,6 +67,9 @@ from ricgraph_explorer_html import (get_html_for_cardstart, get_html_for_cardend
                                     compute_histogramcards,
                                     get_histogramcards, get_html_for_histogramcard,
                                     get_html_for_yearcard, get_html_for_facetcard)
+from ricgraph_explorer_jobs import run_as_job
+from ricgraph_explorer_admission import limit_concurrency
+from ricgraph_explorer_templates import cache_fragment
 
 
 _oslpage_bp = Blueprint(name='oslpage', import_name=__name__)
@@ -75,6 +78,7 @@ _osdashboardresultpage_bp = Blueprint(name='osdashboardresultpage', import_name=
 
 
 @_oslpage_bp.route(rule='/oslpage/', methods=['GET'])
+@cache_fragment
 def oslpage() -> str:
     """Ricgraph Explorer entry, this 'page' does not have any url parameters.
     Probably, in the future, it should have.
@@ -282,10 +286,13 @@ def osprofileresultpage() -> str:
 
 
 @_osdashboardresultpage_bp.route(rule='/osdashboardresultpage/', methods=['GET'])
+@run_as_job()
+@limit_concurrency(cost_class='expensive')
 def osdashboardresultpage() -> str:
     """Ricgraph Explorer entry, this 'page' only uses URL parameters.
     Find the open science dashboard of a (sub-)organization based on
     URL parameters passed.
+    This page is run as a background job, see run_as_job().
 
     :return: HTML to be rendered.
     """
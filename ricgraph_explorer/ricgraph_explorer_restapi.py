@@ -44,8 +44,9 @@
 # ########################################################################
 
 
-from typing import Tuple
-from flask import Blueprint
+from typing import Tuple, Iterator
+from json import dumps
+from flask import Blueprint, Response, stream_with_context
 from ricgraph import (create_http_response, HTTP_RESPONSE_OK,
                       HTTP_RESPONSE_NOTHING_FOUND, HTTP_RESPONSE_INVALID_SEARCH,
                       read_all_nodes, get_all_neighbor_nodes,
@@ -59,18 +60,24 @@ from ricgraph_explorer_constants import (RICGRAPH_CACHEINFO,
                                          RICGRAPH_HARVESTINFO,
                                          RICGRAPH_NODEINFO,
                                          RICGRAPH_GLOBAL_ALL,
-                                         html_preamble,
+                                         html_preamble, get_static_url,
                                          MAX_ITEMS_TO_RETURN_RESTAPI,
+                                         MAX_KEYS_BULK_RESTAPI,
                                          SEARCH_STRING_MIN_LENGTH)
 from ricgraph_explorer_init import (get_ricgraph_explorer_global,
                                     collect_ricgraph_cacheinfo)
 from ricgraph_explorer_utils import get_global_list
-from ricgraph_explorer_cypher import find_organization_additional_info_nodes
+from ricgraph_explorer_cypher import (find_organization_additional_info_nodes,
+                                      find_all_information_bulk_cypher,
+                                      stream_all_neighbor_nodes_cypher,
+                                      stream_organization_additional_info_cypher,
+                                      stream_enrich_candidates_cypher)
 from ricgraph_explorer_graphdb import (convert_nodes_to_list_of_dict,
                                        find_person_share_resouts_cypher,
                                        find_person_organization_collaborations_cypher,
                                        find_enrich_candidates_one_person)
 from ricgraph_explorer_datavis import org_collaborations_diagram
+from ricgraph_explorer_admission import limit_concurrency
 
 
 _restapidocpage_bp = Blueprint(name='restapidocpage', import_name=__name__)
@@ -88,7 +95,7 @@ def restapidocpage() -> str:
     html += '<html>'
     html += '<head>'
     html += html_preamble
-    html += '<script type="module" src="/static/rapidoc-min.js"></script>'
+    html += '<script type="module" src="' + get_static_url(filename='rapidoc-min.js') + '"></script>'
     html += '<title>Ricgraph REST API</title>'
     html += '</head>'
     html += """<body>
@@ -231,6 +238,7 @@ def api_person_share_researchresults(key: str = '',
     return response, status
 
 
+@limit_concurrency(cost_class='expensive')
 def api_person_collaborating_organizations(key: str = '',
                                            max_nr_items: str = str(MAX_ITEMS_TO_RETURN_RESTAPI)):
     """REST API Find persons that share any share research result types with this person.
@@ -470,6 +478,7 @@ def api_organization_information_persons_results(key: str = '',
     return response, status
 
 
+@limit_concurrency(cost_class='expensive')
 def api_organization_enrich(key: str = '',
                             name_want: list = None,
                             category_want: list = None,
@@ -561,6 +570,7 @@ def api_organization_enrich(key: str = '',
     return response, status
 
 
+@limit_concurrency(cost_class='expensive')
 def api_explore_collaborations(start_organization: str = '',
                                collaborating_organization: str = '',
                                researchresult_category: list = None) -> Tuple[dict, int]:
@@ -776,6 +786,91 @@ def api_all_information_general(key: str = '',
     return response, status
 
 
+@limit_concurrency(cost_class='expensive')
+def api_bulk_all_information(body: dict) -> Tuple[dict, int]:
+    """REST API Show all information related to a list of nodes.
+    This is the bulk version of api_person_all_information() and
+    api_all_information_general(): all keys are resolved using one
+    Cypher query.
+
+    :param body: the JSON body of the POST request, a dict with
+      'keys' (required), and 'name_want', 'category_want', 'year_first',
+      'year_last', 'use_personroot' and 'max_nr_items' (optional).
+    :return: An HTTP response (as dict, to be translated to JSON)
+      and an HTTP response code.
+    """
+    key_list = body.get('keys', [])
+    name_want = body.get('name_want', [])
+    category_want = body.get('category_want', [])
+    year_first = body.get('year_first', '')
+    year_last = body.get('year_last', '')
+    use_personroot = body.get('use_personroot', False)
+    max_nr_items = str(body.get('max_nr_items', MAX_ITEMS_TO_RETURN_RESTAPI))
+
+    # Remove empty and duplicate keys, but keep the order.
+    key_list = list(dict.fromkeys([key for key in key_list if key != '']))
+    if len(key_list) == 0:
+        response, status = create_http_response(message='You have not specified any search key',
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    if len(key_list) > MAX_KEYS_BULK_RESTAPI:
+        message = 'You have specified ' + str(len(key_list)) + ' keys, '
+        message += 'at most ' + str(MAX_KEYS_BULK_RESTAPI) + ' are allowed'
+        response, status = create_http_response(message=message,
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    name_active = get_global_list(ricgraph_info=RICGRAPH_NODEINFO,
+                                  item='name_active')
+    category_active = get_global_list(ricgraph_info=RICGRAPH_NODEINFO,
+                                      item='category_active')
+    if len(result := list(set(name_want) - set(name_active))) > 0:
+        response, status = create_http_response(message='You have not specified a valid name_want: '
+                                                        + str(result) + '".',
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    if len(result := list(set(category_want) - set(category_active))) > 0:
+        response, status = create_http_response(message='You have not specified a valid category_want: '
+                                                        + str(result) + '".',
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    if (message := check_valid_year(year_first=year_first, year_last=year_last)) != '':
+        response, status = create_http_response(message=message,
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    max_items = get_max_nr_items(max_nr_items=max_nr_items)
+    neighbors_per_key = find_all_information_bulk_cypher(key_list=key_list,
+                                                         name_want=name_want,
+                                                         category_want=category_want,
+                                                         year_first=year_first,
+                                                         year_last=year_last,
+                                                         use_personroot=use_personroot,
+                                                         max_nr_items=max_items)
+    if len(neighbors_per_key) == 0:
+        response, status = create_http_response(message='Nothing found',
+                                                http_status=HTTP_RESPONSE_NOTHING_FOUND)
+        return response, status
+
+    # Return the results in the order of the keys passed.
+    result_list = []
+    nr_keys_found = 0
+    for key in key_list:
+        if key in neighbors_per_key:
+            nr_keys_found += 1
+            key_result_list = convert_nodes_to_list_of_dict(neighbors_per_key[key],
+                                                            max_nr_items=max_items)
+        else:
+            key_result_list = []
+        result_list.append({'key': key,
+                            'count': len(key_result_list),
+                            'results': key_result_list})
+    message = str(nr_keys_found) + ' of ' + str(len(key_list)) + ' keys found'
+    response, status = create_http_response(result_list=result_list,
+                                            message=message,
+                                            http_status=HTTP_RESPONSE_OK)
+    return response, status
+
+
+@limit_concurrency(cost_class='expensive')
 def api_get_all_personroot_nodes(key: str = '',
                                  max_nr_items: str = str(MAX_ITEMS_TO_RETURN_RESTAPI)):
     """REST API Get all the person-root nodes of a node.
@@ -808,6 +903,7 @@ def api_get_all_personroot_nodes(key: str = '',
     return response, status
 
 
+@limit_concurrency(cost_class='expensive')
 def api_get_all_neighbor_nodes(key: str = '',
                                name_want: list = None,
                                name_dontwant: list = None,
@@ -892,6 +988,237 @@ def api_get_all_neighbor_nodes(key: str = '',
     return response, status
 
 
+# ##############################################################################
+# Streaming REST API functions.
+# These return NDJSON (newline-delimited JSON, https://github.com/ndjson/ndjson-spec):
+# every line is the JSON of one node, in the same format as the 'results'
+# of the other REST API calls. The nodes are sent to the client as soon as they
+# arrive from the graph database, so memory use does not depend on the number
+# of results. There is no 'meta' section, and there is no maximum number of items.
+# ##############################################################################
+def create_ndjson_response(nodes: Iterator) -> Response:
+    """Create a streaming NDJSON HTTP response.
+    It does not get an ETag and is not cached, see http_cache_after_request().
+
+    :param nodes: the nodes to return, as an iterator (e.g. a generator).
+    :return: An HTTP response that streams the nodes.
+    """
+    field_order = get_global_list(ricgraph_info=RICGRAPH_NODEINFO,
+                                  item='ricgraph_node_all_properties')
+
+    def generate_ndjson_lines():
+        for node in nodes:
+            result = {}
+            for item in field_order:
+                result[item] = node.get(item, '')
+            yield dumps(result) + '\n'
+
+    return Response(stream_with_context(generate_ndjson_lines()),
+                    status=HTTP_RESPONSE_OK,
+                    mimetype='application/x-ndjson')
+
+
+@limit_concurrency(cost_class='export')
+def api_stream_get_all_neighbor_nodes(key: str = '',
+                                      name_want: list = None,
+                                      category_want: list = None,
+                                      year_first: str = '',
+                                      year_last: str = ''):
+    """REST API Get all the neighbor nodes of a node, as streaming NDJSON.
+
+    :param key: key of the node(s) to find.
+    :param name_want: a list containing several node names, indicating
+      that we want all neighbor nodes where the property 'name' equals
+      one of the names in the list 'name_want'
+      (e.g. ['ORCID', 'ISNI', 'FULL_NAME']).
+      If empty (empty string), return all nodes.
+    :param category_want: similar to 'name_want', but now for the property 'category'.
+    :param year_first: The first year of the results.
+    :param year_last: The last year of the results.
+    :return: An HTTP response that streams NDJSON, or on error an HTTP response
+      (as dict, to be translated to JSON) and an HTTP response code.
+    """
+    if name_want is None:
+        name_want = []
+    if category_want is None:
+        category_want = []
+
+    if key == '':
+        response, status = create_http_response(message='You have not specified a search key',
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    name_active = get_global_list(ricgraph_info=RICGRAPH_NODEINFO,
+                                  item='name_active')
+    category_active = get_global_list(ricgraph_info=RICGRAPH_NODEINFO,
+                                      item='category_active')
+    if len(result := list(set(name_want) - set(name_active))) > 0:
+        response, status = create_http_response(message='You have not specified a valid name_want: '
+                                                        + str(result) + '".',
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    if len(result := list(set(category_want) - set(category_active))) > 0:
+        response, status = create_http_response(message='You have not specified a valid category_want: '
+                                                        + str(result) + '".',
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    if (message := check_valid_year(year_first=year_first, year_last=year_last)) != '':
+        response, status = create_http_response(message=message,
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    nodes = read_all_nodes(key=key, max_nr_nodes=1)
+    if len(nodes) == 0:
+        response, status = create_http_response(message='Nothing found',
+                                                http_status=HTTP_RESPONSE_NOTHING_FOUND)
+        return response, status
+    neighbor_nodes = stream_all_neighbor_nodes_cypher(parent_node=nodes[0],
+                                                      name_want=name_want,
+                                                      category_want=category_want,
+                                                      year_first=year_first,
+                                                      year_last=year_last)
+    return create_ndjson_response(nodes=neighbor_nodes)
+
+
+@limit_concurrency(cost_class='export')
+def api_stream_organization_information_persons_results(key: str = '',
+                                                        name_want: list = None,
+                                                        category_want: list = None,
+                                                        year_first: str = '',
+                                                        year_last: str = ''):
+    """REST API Find any information from persons or their results in this organization,
+    as streaming NDJSON.
+
+    :param key: key of the node(s) to find.
+    :param name_want: as in api_organization_information_persons_results().
+    :param category_want: as in api_organization_information_persons_results().
+    :param year_first: The first year of the results.
+    :param year_last: The last year of the results.
+    :return: An HTTP response that streams NDJSON, or on error an HTTP response
+      (as dict, to be translated to JSON) and an HTTP response code.
+    """
+    if name_want is None:
+        name_want = []
+    if category_want is None:
+        category_want = []
+
+    if key == '':
+        response, status = create_http_response(message='You have not specified a search key',
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    name_active = get_global_list(ricgraph_info=RICGRAPH_NODEINFO,
+                                  item='name_active')
+    category_active = get_global_list(ricgraph_info=RICGRAPH_NODEINFO,
+                                      item='category_active')
+    if len(result := list(set(name_want) - set(name_active))) > 0:
+        response, status = create_http_response(message='You have not specified a valid name_want: '
+                                                        + str(result) + '".',
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    if len(result := list(set(category_want) - set(category_active))) > 0:
+        response, status = create_http_response(message='You have not specified a valid category_want: '
+                                                        + str(result) + '".',
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    if (message := check_valid_year(year_first=year_first, year_last=year_last)) != '':
+        response, status = create_http_response(message=message,
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    nodes = read_all_nodes(key=key, max_nr_nodes=1)
+    if len(nodes) == 0:
+        response, status = create_http_response(message='Nothing found',
+                                                http_status=HTTP_RESPONSE_NOTHING_FOUND)
+        return response, status
+
+    query_params = create_empty_query_params()
+    query_params['name_list'] = name_want
+    query_params['category_list'] = category_want
+    query_params['year_first'] = year_first
+    query_params['year_last'] = year_last
+    result_nodes = stream_organization_additional_info_cypher(parent_node=nodes[0],
+                                                              query_params=query_params)
+    return create_ndjson_response(nodes=result_nodes)
+
+
+@limit_concurrency(cost_class='export')
+def api_stream_enrich(source_system: str = '',
+                      name_want: list = None,
+                      category_want: list = None,
+                      year_first: str = '',
+                      year_last: str = '',
+                      after_key: str = ''):
+    """REST API Find information harvested from other source systems,
+    not present in this source system, for all persons, as streaming NDJSON.
+    Every line contains one person-root node, with its 'person_identifying_nodes'
+    and 'person_enrich_nodes', as in api_person_enrich().
+
+    :param source_system: the source system to find enrichments for.
+    :param name_want: as in api_person_enrich().
+    :param category_want: as in api_person_enrich().
+    :param year_first: The first year of the results.
+    :param year_last: The last year of the results.
+    :param after_key: only return person-root nodes with a _key after this one,
+      to continue a previous call that has been interrupted.
+    :return: An HTTP response that streams NDJSON, or on error an HTTP response
+      (as dict, to be translated to JSON) and an HTTP response code.
+    """
+    # This implements view_mode = 'view_regular_table_person_enrich_source_system'
+    # for all person-root nodes. See function find_enrich_candidates().
+    if name_want is None:
+        name_want = []
+    if category_want is None:
+        category_want = []
+
+    name_active = get_global_list(ricgraph_info=RICGRAPH_NODEINFO,
+                                  item='name_active')
+    category_active = get_global_list(ricgraph_info=RICGRAPH_NODEINFO,
+                                      item='category_active')
+    source_active = get_global_list(ricgraph_info=RICGRAPH_HARVESTINFO,
+                                    item='source_active')
+    if len(result := list(set(name_want) - set(name_active))) > 0:
+        response, status = create_http_response(message='You have not specified a valid name_want: '
+                                                        + str(result) + '".',
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    if len(result := list(set(category_want) - set(category_active))) > 0:
+        response, status = create_http_response(message='You have not specified a valid category_want: '
+                                                        + str(result) + '".',
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    if source_system == '':
+        response, status = create_http_response(message='You have not specified a source system',
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    if source_system not in source_active:
+        response, status = create_http_response(message='You have not specified a valid source system "'
+                                                        + source_system + '".',
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+    if (message := check_valid_year(year_first=year_first, year_last=year_last)) != '':
+        response, status = create_http_response(message=message,
+                                                http_status=HTTP_RESPONSE_INVALID_SEARCH)
+        return response, status
+
+    query_params = create_empty_query_params()
+    query_params['source_system'] = source_system
+    query_params['year_first'] = year_first
+    query_params['year_last'] = year_last
+    query_params['max_nr_items'] = 0
+    enrich_candidates = stream_enrich_candidates_cypher(query_params=query_params,
+                                                        name_want=name_want,
+                                                        category_want=category_want,
+                                                        after_key=after_key)
+
+    def generate_ndjson_lines():
+        for enrich_candidate in enrich_candidates:
+            result = {'person_root': convert_nodes_to_list_of_dict([enrich_candidate['personroot']])[0],
+                      'person_identifying_nodes': convert_nodes_to_list_of_dict(enrich_candidate['person_nodes']),
+                      'person_enrich_nodes': convert_nodes_to_list_of_dict(enrich_candidate['enrich_nodes'])}
+            yield dumps(result) + '\n'
+
+    return Response(stream_with_context(generate_ndjson_lines()),
+                    status=HTTP_RESPONSE_OK,
+                    mimetype='application/x-ndjson')
+
+
 def api_get_ricgraph_info(ricgraph_info: str = '') -> Tuple[dict, int]:
     """REST API Get information about Ricgraph.
 
@@ -53,6 +53,7 @@
 # ########################################################################
 
 
+from typing import Iterator
 from urllib.parse import urlencode
 from math import ceil, floor
 from json import dumps
@@ -68,7 +69,6 @@ from ricgraph import (nodes_cache_key_id_create,
                       PERSON_CATEGORY_PERSON,
                       COMPETENCE_CATEGORY_COMPETENCE,
                       PERSON_NAME_PERSON_ROOT,
-                      RICGRAPH_UNKNOWN,
                       PageParams, QueryParams,
                       create_empty_page_params,
                       create_empty_query_params,
@@ -83,8 +83,8 @@ from ricgraph_explorer_html import (get_html_for_cardstart, get_html_for_cardend
                                     compute_histogramcards,
                                     get_histogramcards,
                                     get_html_for_yearcard, get_html_for_facetcard)
-from ricgraph_explorer_javascript import (get_regular_table_javascript, get_tabbed_table_javascript,
-                                          get_html_for_tableend_javascript)
+from ricgraph_explorer_javascript import get_regular_table_javascript
+from ricgraph_explorer_templates import stream_template_fragment
 
 
 def view_personal_information(nodes_list: list,
@@ -242,6 +242,29 @@ def get_regular_table(nodes_list: list,
     :param table_columns: a list of columns to show in the table.
     :return: HTML to be rendered.
     """
+    return ''.join(stream_regular_table(nodes_list=nodes_list,
+                                        page_params=page_params,
+                                        query_params=query_params,
+                                        table_header=table_header,
+                                        table_columns=table_columns))
+
+
+def stream_regular_table(nodes_list: list,
+                         page_params: PageParams,
+                         query_params: QueryParams,
+                         table_header: str = '',
+                         table_columns: list = None) -> Iterator[str]:
+    """Create a paginated HTML table for all nodes in the list, in parts.
+    Use it with stream_html_page() to send a large table to the browser
+    while it is being rendered.
+
+    :param nodes_list: the nodes to create a table from.
+    :param page_params: parameters related to the page passed in the URL.
+    :param query_params: parameters related to the query passed in the URL.
+    :param table_header: the HTML to show above the table.
+    :param table_columns: a list of columns to show in the table.
+    :return: an iterator that returns the HTML to be rendered in parts.
+    """
     table_id = create_unique_string(length=12)
     table_html = get_regular_table_worker(nodes_list=nodes_list,
                                           page_params=page_params,
@@ -250,6 +273,7 @@ def get_regular_table(nodes_list: list,
                                           table_header=table_header,
                                           table_columns=table_columns)
 
+    # Note that get_regular_table_worker() may have shortened nodes_list.
     max_nr_items = query_params['max_nr_items']
     if max_nr_items == 0:
         max_nr_items = A_LARGE_NUMBER
@@ -261,7 +285,11 @@ def get_regular_table(nodes_list: list,
     javascript = get_regular_table_javascript(table_id=table_id,
                                               len_nodes_list=len_nodes_list,
                                               max_nr_table_rows=max_nr_table_rows)
-    return javascript + table_html
+    yield javascript
+    if isinstance(table_html, str):
+        yield table_html
+    else:
+        yield from table_html
 
 
 def get_regular_table_worker(nodes_list: list,
@@ -269,9 +297,11 @@ def get_regular_table_worker(nodes_list: list,
                              query_params: QueryParams,
                              table_id: str = '',
                              table_header: str = '',
-                             table_columns: list = None) -> str:
+                             table_columns: list = None) -> str | Iterator[str]:
     """Create an HTML table for all nodes in the list.
-    Here the real work is done.
+    Here the real work is done. The table is rendered with template
+    'regular_table.html', while it is being sent to the browser,
+    so this function only prepares the rendering.
 
     :param nodes_list: the nodes to create a table from.
     :param page_params: parameters related to the page passed in the URL.
@@ -279,7 +309,8 @@ def get_regular_table_worker(nodes_list: list,
     :param table_id: the id of the table, required for pagination.
     :param table_header: the HTML to show above the table.
     :param table_columns: a list of columns to show in the table.
-    :return: HTML to be rendered.
+    :return: HTML to be rendered if there is nothing to show, otherwise
+      an iterator that returns the HTML to be rendered in parts.
     """
     if table_columns is None:
         if page_params['discoverer_mode'] == DISCOVERER_MODE_DETAILS:
@@ -321,7 +352,7 @@ def get_regular_table_worker(nodes_list: list,
     # Clean the URL to be passed in the 'value' field of the table.
     # Seeing from where we have come here, this URL may have any parameters in it,
     # but to continue we only need to pass a few URL parameters.
-    # key, name, value will be set in get_html_for_tablerow().
+    # key, name, value will be set in get_regular_table_rows().
     page_params_cleaned = create_empty_page_params()
     page_params_cleaned['discoverer_mode'] = page_params['discoverer_mode']
     page_params_cleaned['max_nr_table_rows'] = page_params['max_nr_table_rows']
@@ -330,38 +361,59 @@ def get_regular_table_worker(nodes_list: list,
     query_params_cleaned = create_empty_query_params()
     query_params_cleaned['max_nr_items'] = query_params['max_nr_items']
 
-    html = get_html_for_cardstart()
-    html += '<span style="float:left;">' + table_header + '</span>'
-    html += '<span style="float:right;">' + nr_rows_in_table_message + '</span>'
-    html += '<div id="' + table_id + '-container">'     # <div> ends below [A].
-    html += get_html_for_tablestart()
-    html += '<thead>'
-    html += get_html_for_tableheader(table_columns=table_columns)
-    html += '</thead>'
-    html += '<tbody>'
-    for count, node in enumerate(nodes_list):
-        table_page_num = floor(count / max_nr_table_rows) + 1
-        html += get_html_for_tablerow(node=node,
-                                      page_params=page_params_cleaned,
-                                      query_params=query_params_cleaned,
-                                      table_id=table_id,
-                                      table_columns=table_columns,
-                                      table_page_num=table_page_num)
-        key = node['_key']
-        nodes_cache_key_id_create(key=key, elementid=node.element_id)
+    total_pages = ceil(len_nodes_list / max_nr_table_rows)
+    rows = get_regular_table_rows(nodes_list=nodes_list,
+                                  page_params=page_params_cleaned,
+                                  query_params=query_params_cleaned,
+                                  max_nr_table_rows=max_nr_table_rows)
+    return stream_template_fragment(template_name='regular_table.html',
+                                    cardstart=get_html_for_cardstart(),
+                                    cardend=get_html_for_cardend(),
+                                    table_id=table_id,
+                                    table_header=table_header,
+                                    table_columns=table_columns,
+                                    nr_rows_in_table_message=nr_rows_in_table_message,
+                                    table_start=get_html_for_tablestart(),
+                                    table_end=get_html_for_tableend(table_id=table_id,
+                                                                    table_header=table_header),
+                                    pagination=create_table_pagination(total_pages, table_id),
+                                    rows=rows)
+
+
+def get_regular_table_rows(nodes_list: list,
+                           page_params: PageParams,
+                           query_params: QueryParams,
+                           max_nr_table_rows: int) -> Iterator[dict]:
+    """Get the values for the rows of a regular table that cannot be
+    computed in template 'regular_table.html'. The values are computed
+    while the table is being rendered.
 
-    html += '</tbody>'
-    html += get_html_for_tableend(table_id=table_id,
-                                  table_header=table_header)
-    html += '</div>'        # Ends </div> from above [A].
-    html += nr_rows_in_table_message
+    :param nodes_list: the nodes to create a table from.
+    :param page_params: parameters related to the page passed in the URL.
+    :param query_params: parameters related to the query passed in the URL.
+    :param max_nr_table_rows: the number of rows on a page of the table.
+    :return: an iterator that returns for every node a dict with the node,
+      the page number of the table for the node, and the url and text
+      for the 'value' column.
+    """
+    optionspage_url = url_for('optionspage')
+    for count, node in enumerate(nodes_list):
+        if node['name'] == 'FULL_NAME' or node['name'] == 'FULL_NAME_ASCII':
+            value_text = get_valuepart_from_ricgraph_value(node['value']) + ' ['
+            value_text += get_additionalpart_from_ricgraph_value(node['value']) + ']'
+        else:
+            value_text = node['value']
 
-    total_pages = ceil(len_nodes_list / max_nr_table_rows)
-    pagination_html = create_table_pagination(total_pages, table_id)
-    html += '<div class="w3-center" id="' + table_id + '-pagination-container">'
-    html += pagination_html + '</div>'
-    html += get_html_for_cardend()
-    return html
+        query_params['key'] = create_ricgraph_key(name=node['name'], value=node['value'])
+        query_params['name'] = node['name']
+        query_params['value'] = node['value']
+        url_parameters = merge_and_remove_empty(page_params=page_params,
+                                                query_params=query_params)
+        nodes_cache_key_id_create(key=node['_key'], elementid=node.element_id)
+        yield {'node': node,
+               'page_num': floor(count / max_nr_table_rows) + 1,
+               'value_url': optionspage_url + '?' + urlencode(url_parameters),
+               'value_text': value_text}
 
 
 def get_faceted_table(parent_node: Node,
@@ -497,7 +549,7 @@ def get_tabbed_table(nodes_list: list,
             first_iteration = False
         else:
             tab_names_html += ''
-        tab_names_html += f'" onclick="openTab_{table_id}(event,\'{tab_name}\',\'{table_id}\')">{tab_text}</button>'
+        tab_names_html += f'" onclick="openTab(event,\'{tab_name}\',\'{table_id}\')">{tab_text}</button>'
     tab_names_html += '</div>'
 
     first_iteration = True
@@ -525,8 +577,6 @@ def get_tabbed_table(nodes_list: list,
         tab_contents_html += table
         tab_contents_html += '</div>'
 
-    tab_javascript = get_tabbed_table_javascript(table_id=table_id)
-
     # Divide space between panels and table.
     html = '<div class="w3-row-padding w3-stretch" >'
     html += '<div class="w3-col s12 m3">'
@@ -542,7 +592,7 @@ def get_tabbed_table(nodes_list: list,
     html += get_html_for_cardstart()
     html += '<span style="float:left;">' + table_header + '</span>'
     html += '<span style="float:right;">' + nr_rows_in_table_message + '</span>'
-    html += tab_names_html + tab_contents_html + tab_javascript
+    html += tab_names_html + tab_contents_html
     html += nr_rows_in_table_message
     html += get_html_for_cardend()
     html += '</div>'
@@ -563,114 +613,6 @@ def get_html_for_tablestart() -> str:
     return html
 
 
-def get_html_for_tableheader(table_columns: list = None) -> str:
-    """Get the HTML required for the header of an HTML table.
-
-    :param table_columns: a list of columns to show in the table.
-    :return: HTML to be rendered.
-    """
-    if table_columns is None:
-        table_columns = []
-    html = '<tr class="uu-yellow">'
-    for column in table_columns:
-        if column == 'value':
-            html += '<th class=sorttable_alpha">' + column + '</th>'
-        elif column in ['url_main', 'url_other', '_source', '_history']:
-            html += '<th class="sorttable_nosort">' + column + '</th>'
-        else:
-            html += '<th>' + column + '</th>'
-    html += '</tr>'
-    return html
-
-
-def get_html_for_tablerow(node: Node,
-                          page_params: PageParams,
-                          query_params: QueryParams,
-                          table_id: str = '',
-                          table_columns: list = None,
-                          table_page_num: int = 1) -> str:
-    """Get the HTML required for a row of an HTML table.
-
-    :param node: the node to show in the table.
-    :param page_params: parameters related to the page passed in the URL.
-    :param query_params: parameters related to the query passed in the URL.
-    :param table_id: the id of the table, required for pagination.
-    :param table_columns: a list of columns to show in the table.
-    :param table_page_num: the page number of the table.
-    :return: HTML to be rendered.
-    """
-    if table_columns is None:
-        table_columns = []
-
-    # Show only the first page initially.
-    display_style = '' if table_page_num == 1 else 'display: none;'
-    html = '<tr class="table-' + table_id + '-page-' + str(table_page_num) + ' '
-    html += 'item" style="' + display_style + '">'
-
-    for column in table_columns:
-        if column == 'value':
-            key = create_ricgraph_key(name=node['name'], value=node['value'])
-            if node['name'] == 'FULL_NAME' or node['name'] == 'FULL_NAME_ASCII':
-                value = get_valuepart_from_ricgraph_value(node['value']) + ' ['
-                value += get_additionalpart_from_ricgraph_value(node['value']) + ']'
-            else:
-                value = node['value']
-
-            query_params['key'] = key
-            query_params['name'] = node['name']
-            query_params['value'] = node['value']
-            url_parameters = merge_and_remove_empty(page_params=page_params,
-                                                    query_params=query_params)
-            html += '<td><a href=' + url_for('optionspage') + '?'
-            html += urlencode(url_parameters) + '>'
-            html += value + '</a></td>'
-        elif column in ['url_main', 'url_other']:
-            if node[column] == RICGRAPH_UNKNOWN:
-                html += '<td></td>'
-            else:
-                html += '<td><a href=' + node[column] + ' target="_blank">'
-                html += column + ' link</a></td>'
-        elif column in ['_history', '_source']:
-            if isinstance(node[column], str):
-                html += '<td>' + node[column] + '</td>'
-            else:
-                if column == '_history':
-                    html += '<td><details><summary>Click for history</summary><ul>'
-                    html += '<li>Node labels: ' + str(list(node.labels)) + '</li>'
-                else:
-                    html += '<td><ul>'
-                for item in node[column]:
-                    html += '<li>' + item + '</li>'
-                if column == '_history':
-                    html += '</ul></details></td>'
-                else:
-                    html += '</ul></td>'
-        elif column == 'comment':
-            if isinstance(node[column], str):
-                if node[column] == RICGRAPH_UNKNOWN:
-                    html += '<td><ul>'
-                else:
-                    html += '<td width=30%>' + node[column] + '</td>'
-            else:
-                if node['name'] == PERSON_NAME_PERSON_ROOT \
-                        and isinstance(node[column], list):
-                    # If this is a person-root node, we put the FULL_NAME(s) in the comment column,
-                    # for easier browsing.
-                    html += '<td><ul>'
-                    for cached_name in node[column]:
-                        html += '<li>' + cached_name + '</li>'
-                    html += '</ul></td>'
-                else:
-                    html += '<td width=30%>' + str(node[column]) + '</td>'
-        else:
-            if node[column] == RICGRAPH_UNKNOWN:
-                html += '<td></td>'
-            else:
-                html += '<td>' + node[column] + '</td>'
-    html += '</tr>'
-    return html
-
-
 def get_html_for_tableend(table_id: str = '',
                           table_header: str = '') -> str:
     """Get the HTML required for the end of an HTML table.
@@ -687,8 +629,10 @@ def get_html_for_tableend(table_id: str = '',
 
     # The (json.)dumps() is required, since table_header may contain all kinds of
     # characters (e.g. (, ), ", ') that can confuse the JavaScript.
+    # exportTableToCSV() is in static/ricgraph_explorer.js.
+    table_filename = datestamp() + '-ricgraph-export-' + table_id + '.csv'
     onclick = f"exportTableToCSV('{table_id}-container', {MAX_ROWS_TO_EXPORT},"
-    onclick += f"{dumps(table_header)}); return false;"
+    onclick += f"{dumps(table_header)}, '{table_filename}'); return false;"
 
     html += f'''
             <div style="float:right;">
@@ -696,7 +640,4 @@ def get_html_for_tableend(table_id: str = '',
                    Export table to CSV file, at most {MAX_ROWS_TO_EXPORT} rows.</a>
             </div>
             '''
-
-    table_filename = datestamp() + '-ricgraph-export-' + table_id + '.csv'
-    javascript = get_html_for_tableend_javascript(table_filename=table_filename)
-    return javascript + html
+    return html
@@ -0,0 +1,185 @@
+# ########################################################################
+#
+# Ricgraph - Research in context graph
+#
+# ########################################################################
+#
+# MIT License
+#
+# Copyright (c) 2026 Rik D.T. Janssen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# ########################################################################
+#
+# Ricgraph Explorer template and fragment cache functions.
+# Large parts of HTML (such as a table with many rows) are rendered
+# with a template in the 'templates' folder. Templates are compiled once,
+# and then rendered (or streamed to the browser while they are being
+# rendered) for every request.
+# Parts of HTML that only depend on their parameters and on the harvest
+# (such as a search form) are stored in a fragment cache, so that they
+# are not generated again for every request. The fragment cache is
+# emptied after a new harvest.
+# Note that the fragment cache is per Ricgraph Explorer worker.
+# For more information about Ricgraph and Ricgraph Explorer,
+# go to https://www.ricgraph.eu and https://docs.ricgraph.eu.
+#
+# ########################################################################
+#
+# Original version Rik D.T. Janssen, October 2026.
+#
+# ########################################################################
+
+
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from typing import Callable, Iterator
+from jinja2 import Environment, FileSystemLoader
+from flask import Response, stream_with_context
+from ricgraph import RICGRAPH_UNKNOWN, PERSON_NAME_PERSON_ROOT
+from ricgraph_explorer_constants import (TEMPLATES_DIRECTORY, TEMPLATE_STREAM_BUFFER_SIZE,
+                                         FRAGMENT_CACHE_MAX_SIZE)
+from ricgraph_explorer_init import register_ricgraph_explorer_reload_callback
+
+
+# The template environment, created once, see get_template_environment().
+_template_environment = None
+_template_environment_lock = Lock()
+
+# The fragment cache, see cache_fragment().
+_fragment_cache = OrderedDict()
+_fragment_cache_lock = Lock()
+
+
+def get_template_environment() -> Environment:
+    """Get the environment to render templates. A template is
+    compiled the first time it is used, after that the compiled
+    template is used.
+    Values are not escaped, since this is not done anywhere else
+    in Ricgraph Explorer.
+
+    :return: the template environment.
+    """
+    global _template_environment
+
+    with _template_environment_lock:
+        if _template_environment is not None:
+            return _template_environment
+        environment = Environment(loader=FileSystemLoader(searchpath=TEMPLATES_DIRECTORY),
+                                  autoescape=False,
+                                  trim_blocks=True,
+                                  lstrip_blocks=True,
+                                  auto_reload=False)
+        environment.tests['list'] = lambda value: isinstance(value, list)
+        environment.globals['RICGRAPH_UNKNOWN'] = RICGRAPH_UNKNOWN
+        environment.globals['PERSON_NAME_PERSON_ROOT'] = PERSON_NAME_PERSON_ROOT
+        _template_environment = environment
+        return _template_environment
+
+
+def render_template_fragment(template_name: str, **context) -> str:
+    """Render a template in the 'templates' folder.
+
+    :param template_name: the name of the template.
+    :param context: the variables to use in the template.
+    :return: HTML to be rendered.
+    """
+    template = get_template_environment().get_template(name=template_name)
+    return template.render(**context)
+
+
+def stream_template_fragment(template_name: str, **context) -> Iterator[str]:
+    """Render a template in the 'templates' folder, in parts, so that
+    the parts can be sent to the browser while the rest is being rendered.
+
+    :param template_name: the name of the template.
+    :param context: the variables to use in the template.
+    :return: an iterator that returns the HTML in parts.
+    """
+    template = get_template_environment().get_template(name=template_name)
+    stream = template.stream(**context)
+    stream.enable_buffering(size=TEMPLATE_STREAM_BUFFER_SIZE)
+    return stream
+
+
+def stream_html_page(fragments: list) -> Response:
+    """Create a response that sends a page to the browser while it is
+    being rendered. This is used for pages with large tables, so that
+    the browser can start showing the page before the last row is rendered.
+
+    :param fragments: the parts of the page, in order. Every part is
+      either HTML, or an iterator that returns HTML in parts, such as
+      from stream_template_fragment().
+    :return: the streaming response.
+    """
+    def generate_page():
+        for fragment in fragments:
+            if isinstance(fragment, str):
+                yield fragment
+            else:
+                yield from fragment
+
+    return Response(stream_with_context(generate_page()), mimetype='text/html')
+
+
+def cache_fragment(func: Callable) -> Callable:
+    """Decorator to store the HTML returned by a function in the fragment cache.
+    The next time the function is called with the same parameters, the HTML
+    is taken from the cache. Only use it for functions whose result only
+    depends on their parameters and on the harvest, since the cache is
+    emptied after a new harvest, see empty_fragment_cache().
+    If the cache has FRAGMENT_CACHE_MAX_SIZE fragments, the least recently used
+    fragment is removed.
+
+    :param func: the function, it should return HTML.
+    :return: the decorated function.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = func.__module__ + '.' + func.__qualname__ + repr(args) + repr(sorted(kwargs.items()))
+        with _fragment_cache_lock:
+            if key in _fragment_cache:
+                _fragment_cache.move_to_end(key)
+                return _fragment_cache[key]
+
+        html = func(*args, **kwargs)
+        with _fragment_cache_lock:
+            _fragment_cache[key] = html
+            _fragment_cache.move_to_end(key)
+            while len(_fragment_cache) > FRAGMENT_CACHE_MAX_SIZE:
+                _fragment_cache.popitem(last=False)
+        return html
+
+    return wrapper
+
+
+def empty_fragment_cache() -> None:
+    """Empty the fragment cache.
+
+    :return: None.
+    """
+    with _fragment_cache_lock:
+        _fragment_cache.clear()
+    return
+
+
+# The fragments contain HTML computed from the previous harvest.
+register_ricgraph_explorer_reload_callback(callback=empty_fragment_cache)
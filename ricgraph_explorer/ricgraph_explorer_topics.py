@@ -45,11 +45,13 @@ from flask import Blueprint
 from ricgraph_explorer_constants import html_body_start, html_body_end
 from ricgraph_explorer_html import (get_html_for_cardstart, get_html_for_cardend,
                                     get_page_title, get_page_footer)
+from ricgraph_explorer_templates import cache_fragment
 
 _topicspage_bp = Blueprint(name='topicspage', import_name=__name__)
 
 
 @_topicspage_bp.route(rule='/topicspage/', methods=['GET'])
+@cache_fragment
 def topicspage() -> str:
     """Ricgraph Explorer entry, this 'page' does not have any parameters.
     The Topics page.
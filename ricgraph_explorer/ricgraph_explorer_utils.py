@@ -95,6 +95,24 @@ def get_global_str(ricgraph_info: str, item: str) -> str:
     return value
 
 
+def get_global_dict(ricgraph_info: str, item: str) -> dict:
+    """Safely retrieve an entry from a Ricgraph info structure.
+    A dict return value is expected.
+
+    :param ricgraph_info: The Ricgraph info structure.
+    :param item: The element in that structure.
+    :return: the value of the dict, or {} if it does not exist.
+    """
+    if ricgraph_info == RICGRAPH_CACHEINFO:
+        # First update the information about the cache.
+        collect_ricgraph_cacheinfo()
+    info = get_ricgraph_explorer_global(name=ricgraph_info)
+    if info is None:
+        return {}
+    value = info.get(item, {})
+    return value
+
+
 def get_global_dataframe(ricgraph_info: str, item: str) -> DataFrame | None:
     """Safely retrieve an entry from a Ricgraph info structure.
     A DataFrame return value is expected.
@@ -359,89 +377,82 @@ def merge_and_remove_empty(page_params: PageParams,
 # DataFrame related functions for diagrams.
 # ##############################################################################
 def remove_hierarchical_orgs(df: DataFrame | None,
-                             orgs_with_hierarchies: DataFrame,
+                             organization_hierarchy: dict,
                              org_to_keep: str) -> DataFrame | None:
     """
     This function removes hierarchical orgs from a DataFrame, leaving the
-    top level organization only, for the organizations in orgs_with_hierarchies,
+    top level organization only, for the organizations in organization_hierarchy,
     except for org_to_keep (it will be kept).
     This is useful if you specifically query for 'org_to_keep'.
+    A row or column is removed if its name starts with the organization
+    abbreviation of a top level organization in organization_hierarchy,
+    unless it starts with the name of that top level organization. For
+    the organization abbreviation of org_to_keep, it is only kept if it
+    starts with org_to_keep. Names of top level organizations usually do not
+    start with their abbreviation (e.g. 'Utrecht University' and 'UU'), so
+    they are kept.
+    Note that this can be done because all (sub-)organizations of a person
+    are linked to that person in the graph.
+    This means that the column of the top level organization contains
+    counts for its sub-organizations. So the sub-organizations can be removed
+    without loosing data.
 
     :param df: DataFrame.
-    :param orgs_with_hierarchies: DataFrame with hierarchical orgs.
+    :param organization_hierarchy: the organization hierarchy,
+      see create_organization_hierarchy().
     :param org_to_keep: if the row and column name starts with
-      an element of this list or with this string, do NOT remove it.
-      For now, this function only works for str, not list.
+      this string, do NOT remove it.
     :return: modified DataFrame, or None on error.
     """
-    org_keep_abbr = extract_organization_abbreviation(org_name=org_to_keep)
-
-    # No need to check for df is None, will be done in remove_one_hierarchical_org().
-    df = remove_one_hierarchical_org(df=df,
-                                     orgs_to_keep=org_to_keep,
-                                     orgs_to_drop_pattern=org_keep_abbr)
     if df is None or df.empty:
+        print('remove_hierarchical_orgs(): Error, DataFrame is empty.')
         return None
 
-    if orgs_with_hierarchies is None or df.empty:
-        # Nothing more to be done.
-        return df
-
-    for row in orgs_with_hierarchies.itertuples(index=False):
-        org_abbr = str(row.org_abbreviation)
-        orgs_name = str(row.org_fullname)
+    # The key is the start of the names to remove (an organization abbreviation),
+    # the value is the list of starts of the names that should not be removed.
+    org_keep_abbr = extract_organization_abbreviation(org_name=org_to_keep)
+    orgs_to_drop = {org_keep_abbr: [org_to_keep]}
+    top_level_organizations = organization_hierarchy.get('top_level_organizations', {})
+    for org_abbr, top_level_org in top_level_organizations.items():
         if org_abbr == org_keep_abbr:
             # Already done.
             continue
-        df = remove_one_hierarchical_org(df=df,
-                                         orgs_to_keep=orgs_name,
-                                         orgs_to_drop_pattern=org_abbr)
-        if df is None or df.empty:
-            return None
-    return df
-
-
-def remove_one_hierarchical_org(df: DataFrame | None,
-                                orgs_to_keep: str | list,
-                                orgs_to_drop_pattern: str) -> DataFrame | None:
-    """
-    Remove rows and columns from DataFrame whose
-    index or column starts with orgs_to_drop_pattern,
-    except for organizations that are in orgs_to_keep.
-    Note that this can be done because all (sub-)organizations of a person
-    are linked to that person in the graph.
-    This means that the column of the top level organization contains
-    counts for its sub-organizations. So the sub-organizations can be removed
-    without loosing data.
+        orgs_to_drop.setdefault(org_abbr, []).append(top_level_org)
 
-    :param df: DataFrame.
-    :param orgs_to_drop_pattern: a string pattern that is matched
-      to index and column name, if it starts with this string, remove it.
-    :param orgs_to_keep: if the index and column name starts with
-      an element of this list or with this string, do NOT remove it.
-    :return: modified DataFrame, or None on error.
-    """
-    if df is None or df.empty:
-        print('remove_one_hierarchical_org(): Error, DataFrame is empty.')
+    rows_to_keep = hierarchical_orgs_to_keep(names=df.index, orgs_to_drop=orgs_to_drop)
+    cols_to_keep = hierarchical_orgs_to_keep(names=df.columns, orgs_to_drop=orgs_to_drop)
+    result = df.loc[rows_to_keep, cols_to_keep]
+    if result.empty:
         return None
+    return result
 
-    # Define keep-check() functions based on orgs_to_keep type.
-    if isinstance(orgs_to_keep, str):
-        def should_keep(name):
-            return name.startswith(orgs_to_keep)
-    elif isinstance(orgs_to_keep, list):
-        def should_keep(name):
-            return name in orgs_to_keep
-    else:
-        print('remove_one_hierarchical_org(): Error, unknown type for parameter "orgs_to_keep".')
-        return None
 
-    # Find rows and columns to drop
-    rows_to_drop = [idx for idx in df.index
-                    if idx.startswith(orgs_to_drop_pattern) and not should_keep(idx)]
-    cols_to_drop = [col for col in df.columns
-                    if col.startswith(orgs_to_drop_pattern) and not should_keep(col)]
+def hierarchical_orgs_to_keep(names, orgs_to_drop: dict) -> list:
+    """Determine which names (of rows or columns) to keep, for
+    remove_hierarchical_orgs(). A name is removed if it starts with
+    a key of orgs_to_drop, and it does not start with one of the values
+    of that key. To find the keys a name starts with, all the starts of
+    the name are looked up in orgs_to_drop, instead of comparing the name to
+    every key, since orgs_to_drop may be large.
 
-    df_copy = df.copy(deep=True)
-    result = df_copy.drop(index=rows_to_drop, columns=cols_to_drop)
-    return result
+    :param names: the names, e.g. the index or the columns of a DataFrame.
+    :param orgs_to_drop: see remove_hierarchical_orgs().
+    :return: a list with, for every name, True if it should be kept, otherwise False.
+    """
+    if len(orgs_to_drop) == 0:
+        return [True] * len(names)
+    min_length = min(len(org_abbr) for org_abbr in orgs_to_drop)
+    max_length = max(len(org_abbr) for org_abbr in orgs_to_drop)
+    keep = []
+    for name in names:
+        name = str(name)
+        keep_name = True
+        for length in range(min_length, min(max_length, len(name)) + 1):
+            orgs_to_keep = orgs_to_drop.get(name[:length])
+            if orgs_to_keep is None:
+                continue
+            if not any(name.startswith(org_to_keep) for org_to_keep in orgs_to_keep):
+                keep_name = False
+                break
+        keep.append(keep_name)
+    return keep
@@ -0,0 +1,136 @@
+/*
+ * Ricgraph Explorer JavaScript functions.
+ * These functions are the same on every page, so they are in this file,
+ * which is included on every page, see 'html_body_start' in
+ * ricgraph_explorer_constants.py. Its url contains a version, so browsers
+ * may cache it for a long time. JavaScript that depends on the contents
+ * of a page is in ricgraph_explorer_javascript.py.
+ * For more information about Ricgraph and Ricgraph Explorer,
+ * go to https://www.ricgraph.eu and https://docs.ricgraph.eu.
+ *
+ * Original version Rik D.T. Janssen, October 2026.
+ */
+
+// Pagination of a table, see get_regular_table_javascript().
+// The global arrays currentPage and totalPages are defined in 'html_body_start',
+// and initialized for every table in get_regular_table_javascript().
+function showPage(page, tableId) {
+    page = parseInt(page);
+    if (page < 1 || page > totalPages[tableId]) return;
+
+    // Update table visibility
+    document.querySelectorAll(`.table-${tableId}-page-${currentPage[tableId]}`)
+          .forEach(tr => tr.style.display = 'none');
+    document.querySelectorAll(`.table-${tableId}-page-${page}`)
+          .forEach(tr => tr.style.display = '');
+
+    currentPage[tableId] = page;
+    updatePagination(tableId);
+}
+
+function updatePagination(tableId) {
+    const buttons = document.querySelectorAll(`.page-num-${tableId}`);
+    const total = totalPages[tableId];
+    let start = 1;
+    if (total > 5) {
+        if (currentPage[tableId] <= 3) {
+            start = 1;
+        } else if (currentPage[tableId] >= total - 2) {
+            start = total - 4;
+        } else {
+            start = currentPage[tableId] - 2;
+        }
+    }
+    buttons.forEach((btn, index) => {
+        const pageNum = start + index;
+        if (btn) {
+            btn.textContent = pageNum;
+            btn.onclick = function() { showPage(pageNum, tableId); };
+            btn.classList.toggle('uu-yellow', pageNum === currentPage[tableId]);
+            btn.style.display = pageNum <= total ? '' : 'none';
+        }
+    });
+    const ellipsisLeft = document.querySelector(`.ellipsis-left-${tableId}`);
+    const ellipsisRight = document.querySelector(`.ellipsis-right-${tableId}`);
+    if (ellipsisLeft) ellipsisLeft.style.display = start > 1 ? '' : 'none';
+    if (ellipsisRight)
+       ellipsisRight.style.display = (start + buttons.length - 1) < total ? '' : 'none';
+    const firstButton = document.querySelector(`a[onclick="showPage(1, '${tableId}')"]`);
+    const prevButton = document.querySelector(`a[onclick=
+                       "showPage(currentPage['${tableId}']-1, '${tableId}')"]`);
+    const nextButton = document.querySelector(`a[onclick=
+                       "showPage(currentPage['${tableId}']+1, '${tableId}')"]`);
+    const lastButton = document.querySelector(`a[onclick="showPage(${total}, '${tableId}')"]`);
+    if (firstButton) firstButton.classList.toggle('w3-disabled', currentPage[tableId] === 1);
+    if (prevButton) prevButton.classList.toggle('w3-disabled', currentPage[tableId] === 1);
+    if (nextButton) nextButton.classList.toggle('w3-disabled', currentPage[tableId] === total);
+    if (lastButton) lastButton.classList.toggle('w3-disabled', currentPage[tableId] === total);
+}
+
+// Tabs of a tabbed table, see get_tabbed_table().
+// This code is inspired by https://www.w3schools.com/w3css/w3css_tabulators.asp.
+function openTab(evt, tabName, table_id) {
+  var i, x, tablinks;
+  x = document.getElementsByClassName("tabitem");
+  for (i = 0; i < x.length; i++) {
+    if (x[i].className.split(' ').indexOf(table_id) != -1) {
+      x[i].style.display = "none";
+    }
+  }
+  tablinks = document.getElementsByClassName("tablink");
+  for (i = 0; i < x.length; i++) {
+    if (tablinks[i].className.split(' ').indexOf(table_id) != -1) {
+      tablinks[i].className = tablinks[i].className.replace(" uu-orange", "");
+    }
+  }
+  document.getElementById(tabName).style.display = "block";
+  evt.currentTarget.className += " uu-orange";
+}
+
+// Export the table with the given tableId as a CSV file with name fileName,
+// see get_html_for_tableend().
+// Only maxRows are exported (as a kind of safety not to be able to export everything).
+// Note that the table is exported as it is shown on the webpage.
+function exportTableToCSV(tableId, maxRows, tableHeader, fileName) {
+    const rows = document.querySelectorAll(`#${tableId} tr`);
+    const rowsToExport = [];
+    // Always include the header row (first row), then up to (maxRows) rows total (header + data)
+    for (let i = 0; i < rows.length && i <= maxRows; i++) {
+        rowsToExport.push(rows[i]);
+    }
+    // For each row, get all cells (th or td), and for each cell:
+    // - Replace any double quotes with two double quotes (CSV escaping).
+    // - Enclose every cell value in double quotes.
+    // Join each cell in a row with commas, and join rows with newlines.
+    // Add tableHeader as first line, followed by the correct number
+    // of commas.
+    const columnCount = rowsToExport.length > 0 ? rowsToExport[0].children.length : 1;
+    const paddedHeader = '"' + String(tableHeader).replace(/"/g, '""') + '"' +
+      ','.repeat(Math.max(0, columnCount - 1));
+    const csvContent = paddedHeader + '\n' +
+      Array.from(rowsToExport).map(row =>
+        Array.from(row.children).map(cell => {
+            const link = cell.querySelector('a');
+            const linkText = link ? link.innerText.trim() : '';
+            // If the cell content is "url_main link" or "url_other link",
+            // substitute the contents with the actual link.
+            const cellValue =
+                link && (linkText === 'url_main link' || linkText === 'url_other link')
+                    ? link.href
+                    : cell.innerText;
+            // Never export cell contents that start with
+            // "Click for history" (i.e. the _history column).
+            const exportValue = cellValue.trim().startsWith('Click for history') ? '' : cellValue;
+            return '"' + exportValue.replace(/"/g, '""') + '"';
+        }).join(',')
+    ).join('\n');
+    const blob = new Blob([csvContent], {type: 'text/csv'});
+    // Create a hidden <a> element to trigger the download.
+    const link = document.createElement('a');
+    link.href = URL.createObjectURL(blob);
+    link.download = fileName;
+    document.body.appendChild(link);
+    link.click();
+    document.body.removeChild(link);
+    URL.revokeObjectURL(link.href);
+}